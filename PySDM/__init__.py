@@ -25,6 +25,8 @@ PySDM test-suite built using [pytest](https://docs.pytest.org/) is located in th
 from pkg_resources import DistributionNotFound, VersionConflict, get_distribution
 
 from .builder import Builder
+from .domain_decomposition import DomainDecomposition
+from .ensemble_runner import EnsembleRunner
 from .formulae import Formulae
 from .particulator import Particulator
 
@@ -3,10 +3,12 @@ logic around `PySDM.attributes.impl.attribute.Attribute` - the parent class for
 """
 
 
-class Attribute:
+class Attribute:  # pylint: disable=too-many-instance-attributes
     def __init__(self, builder, name, dtype=float, n_vector_components=0):
         self.particulator = builder.particulator
         self.timestamp: int = 0
+        # see `PySDM.impl.change_tracker.ChangeTracker`
+        self.full_update_epoch: int = 0
         self.data = None
         self.dtype = dtype
         self.n_vector_components = n_vector_components
@@ -10,8 +10,14 @@ class DerivedAttribute(Attribute):
         assert len(dependencies) > 0
         super().__init__(builder, name)
         self.dependencies = dependencies
+        self.epoch = 0
+        # see `PySDM.attributes.impl.fused_chain.FusedChain`
+        self.fused_chain = None
 
     def update(self):
+        if self.fused_chain is not None:
+            self.fused_chain.update()
+            return
         for dependency in self.dependencies:
             dependency.update()
         dependencies_timestamp = sum(
@@ -19,10 +25,36 @@ class DerivedAttribute(Attribute):
         )
         if self.timestamp < dependencies_timestamp:
             self.timestamp = dependencies_timestamp
-            self.recalculate()
+            tracker = getattr(self.particulator.attributes, "change_tracker", None)
+            if tracker is None:
+                self.recalculate()
+            else:
+                if max(
+                    dependency.full_update_epoch for dependency in self.dependencies
+                ) > self.epoch or not self.recalculate_modified_since(
+                    tracker.droplet_epoch, self.epoch
+                ):
+                    self.recalculate()
+                    self.full_update_epoch = tracker.epoch
+                self.epoch = tracker.epoch
 
     def recalculate(self):
         raise NotImplementedError()
 
+    def recalculate_modified_since(
+        self, droplet_epoch, epoch  # pylint: disable=unused-argument
+    ) -> bool:
+        """recomputes values only for droplets with `droplet_epoch` greater than `epoch`
+        (see `PySDM.impl.change_tracker.ChangeTracker`) returning `True`, or returns
+        `False` if not supported (to be overridden by attributes that are per-droplet
+        functions of their dependencies only)"""
+        return False
+
+    def link(self):
+        """returns a `PySDM.attributes.impl.fused_chain.Link` describing the attribute
+        as a per-droplet function of its dependencies or `None` if not expressible as such
+        (to be overridden by attributes which can be evaluated within fused chains)"""
+        return None
+
     def mark_updated(self):
         raise AssertionError()
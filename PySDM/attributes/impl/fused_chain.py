@@ -0,0 +1,170 @@
+"""
+fused evaluation of chains of derived attributes (enabled with
+ `PySDM.particulator.Particulator.attribute_chain_fusion`): derived attributes which
+ are per-droplet functions of their dependencies describe themselves with a `Link`,
+ and requesting any of them evaluates all its stale ancestors expressible as links
+ in a single backend pass (e.g., radius and terminal velocity from volume); with the
+ "transient" variant, intermediate links not requested by any dynamic, product or
+ non-fusable attribute are kept in registers only (and allocated on first direct access)
+"""
+from collections import namedtuple
+
+from .derived_attribute import DerivedAttribute
+
+
+class Link(namedtuple("Link", ("operation", "arguments", "parameters"))):
+    """describes a derived attribute as a per-droplet `operation` (one of the keys
+    of the backend fused-chain syntax) of its dependencies (`arguments`) and of
+    `parameters` (scalars or storages, e.g. lookup tables, passed to the kernel)"""
+
+    __slots__ = ()
+
+
+def _link(attribute):
+    if not isinstance(attribute, DerivedAttribute):
+        return None
+    return attribute.link()
+
+
+class FusedChain:
+    def __init__(self, leaf, *, idx, transient=()):
+        self.leaf = leaf
+        self.idx = idx
+        self.members = []
+        self.inputs = []
+        self.links = {}
+        self.__visit(leaf)
+        self.outputs = [
+            member
+            for member in self.members
+            if member is leaf or member.name not in transient
+        ]
+        self.key = (
+            tuple(
+                (link.operation, tuple(self.__ref(arg) for arg in link.arguments))
+                for link in self.links.values()
+            ),
+            tuple(self.members.index(output) for output in self.outputs),
+            len(self.inputs),
+        )
+
+    def __visit(self, attribute):
+        if attribute in self.members or attribute in self.inputs:
+            return
+        link = _link(attribute)
+        if link is None:
+            self.inputs.append(attribute)
+            return
+        assert set(link.arguments) == set(attribute.dependencies)
+        for argument in link.arguments:
+            self.__visit(argument)
+        self.members.append(attribute)
+        self.links[attribute] = link
+
+    def __ref(self, attribute):
+        if attribute in self.inputs:
+            return "in", self.inputs.index(attribute)
+        return "v", self.members.index(attribute)
+
+    def parameters(self):
+        """names of kernel arguments: inputs, link parameters and outputs"""
+        return (
+            tuple(f"in_{i}" for i in range(len(self.inputs)))
+            + tuple(
+                f"p_{i}"
+                for i in range(
+                    sum(len(link.parameters) for link in self.links.values())
+                )
+            )
+            + tuple(f"out_{i}" for i in range(len(self.outputs)))
+        )
+
+    def statements(self, syntax):
+        """per-droplet statements (indexed with `i`) evaluating all members into
+        variables `v_<k>` and storing the outputs, rendered with the backend `syntax`
+        (format strings with `{out}`, positional arguments and `{p<n>}` parameters)"""
+        statements = []
+        n_params = 0
+        for k, (member, link) in enumerate(self.links.items()):
+            assert member is self.members[k]
+            arguments = []
+            for argument in link.arguments:
+                kind, index = self.__ref(argument)
+                arguments.append(f"in_{index}[i]" if kind == "in" else f"v_{index}")
+            params = {f"p{n}": f"p_{n_params + n}" for n in range(len(link.parameters))}
+            n_params += len(link.parameters)
+            statements.append(
+                syntax[link.operation].format(*arguments, out=f"v_{k}", **params)
+            )
+        for n, output in enumerate(self.outputs):
+            statements.append(
+                syntax["store"].format(
+                    out=f"out_{n}[i]", value=f"v_{self.members.index(output)}"
+                )
+            )
+        return statements
+
+    def arguments(self):
+        """input storages, link parameters and output storages (to be passed to
+        the kernel in the order of `parameters()`)"""
+        return (
+            tuple(attribute.data for attribute in self.inputs)
+            + tuple(param for link in self.links.values() for param in link.parameters)
+            + tuple(output.data for output in self.outputs)
+        )
+
+    def __timestamps(self):
+        timestamps = {}
+        for member in self.members:
+            timestamps[member] = sum(
+                timestamps.get(dependency, dependency.timestamp)
+                for dependency in member.dependencies
+            )
+        return timestamps
+
+    def update(self):
+        for attribute in self.inputs:
+            attribute.update()
+        timestamps = self.__timestamps()
+        if self.leaf.data is not None and self.leaf.timestamp >= timestamps[self.leaf]:
+            return
+        if self.leaf.data is None:
+            self.leaf.allocate(self.idx)
+        self.leaf.particulator.backend.fused_chain(self)
+        self.mark_evaluated(timestamps)
+
+    def mark_evaluated(self, timestamps=None):
+        """to be called after the outputs were evaluated (e.g., within a kernel
+        modifying the inputs, after marking the latter as updated)"""
+        timestamps = timestamps or self.__timestamps()
+        tracker = getattr(self.leaf.particulator.attributes, "change_tracker", None)
+        for output in self.outputs:
+            output.timestamp = timestamps[output]
+            if tracker is not None:
+                output.full_update_epoch = max(
+                    attribute.full_update_epoch for attribute in self.inputs
+                )
+                output.epoch = tracker.epoch
+
+
+def fuse_chains(attributes, *, idx, requested=(), transient_intermediates=False):
+    """equips all derived attributes expressible as a `Link` with a `FusedChain`
+    and returns the names of (unallocated) transient intermediates"""
+    fusable = {
+        name for name, attribute in attributes.items() if _link(attribute) is not None
+    }
+    transient = set()
+    if transient_intermediates:
+        for name in fusable - set(requested):
+            dependents = [
+                other
+                for other in attributes.values()
+                if attributes[name] in getattr(other, "dependencies", ())
+            ]
+            if all(dependent.name in fusable for dependent in dependents):
+                transient.add(name)
+    for name in fusable:
+        attributes[name].fused_chain = FusedChain(
+            attributes[name], idx=idx, transient=transient
+        )
+    return transient
@@ -2,6 +2,7 @@
 particle wet radius (calculated from the volume)
 """
 from PySDM.attributes.impl.derived_attribute import DerivedAttribute
+from PySDM.attributes.impl.fused_chain import Link
 
 
 class Area(DerivedAttribute):
@@ -15,3 +16,6 @@ class Area(DerivedAttribute):
         self.data.product(self.volume.get(), 1 / self.formulae.constants.PI_4_3)
         self.data **= 2 / 3
         self.data *= self.formulae.constants.PI_4_3 * 3
+
+    def link(self):
+        return Link("area", (self.volume,), ())
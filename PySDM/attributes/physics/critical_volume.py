@@ -2,6 +2,7 @@
 critical wet volume (kappa-Koehler, computed using actual temperature)
 """
 from PySDM.attributes.impl.derived_attribute import DerivedAttribute
+from PySDM.attributes.impl.fused_chain import Link
 
 
 class CriticalVolume(DerivedAttribute):
@@ -41,3 +42,6 @@ class WetToCriticalVolumeRatio(DerivedAttribute):
     def recalculate(self):
         self.data.idx = self.volume.data.idx
         self.data.ratio(self.volume.get(), self.critical_volume.get())
+
+    def link(self):
+        return Link("ratio", (self.volume, self.critical_volume), ())
@@ -2,6 +2,7 @@
 particle dry radius computed from dry volume
 """
 from PySDM.attributes.impl.derived_attribute import DerivedAttribute
+from PySDM.attributes.impl.fused_chain import Link
 
 
 class DryRadius(DerivedAttribute):
@@ -13,3 +14,6 @@ class DryRadius(DerivedAttribute):
     def recalculate(self):
         self.data.product(self.volume_dry.get(), 1 / self.formulae.constants.PI_4_3)
         self.data **= 1 / 3
+
+    def link(self):
+        return Link("radius", (self.volume_dry,), ())
@@ -3,6 +3,7 @@ particle dry volume (subject to evolution due to collisions or aqueous chemistry
 """
 from PySDM.attributes.impl.derived_attribute import DerivedAttribute
 from PySDM.attributes.impl.extensive_attribute import ExtensiveAttribute
+from PySDM.attributes.impl.fused_chain import Link
 
 
 class DryVolumeDynamic(DerivedAttribute):
@@ -40,3 +41,6 @@ class OrganicFraction(DerivedAttribute):
 
     def recalculate(self):
         self.data.ratio(self.volume_dry_org.get(), self.volume_dry.get())
+
+    def link(self):
+        return Link("ratio", (self.volume_dry_org, self.volume_dry), ())
@@ -5,6 +5,7 @@ kappa-Koehler hygroscopicity representation:
 """
 from ..impl.derived_attribute import DerivedAttribute
 from ..impl.extensive_attribute import ExtensiveAttribute
+from ..impl.fused_chain import Link
 
 
 class KappaTimesDryVolume(ExtensiveAttribute):
@@ -21,3 +22,6 @@ class Kappa(DerivedAttribute):
 
     def recalculate(self):
         self.data.ratio(self.kappa_times_dry_volume.get(), self.dry_volume.get())
+
+    def link(self):
+        return Link("ratio", (self.kappa_times_dry_volume, self.dry_volume), ())
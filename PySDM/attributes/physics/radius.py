@@ -2,6 +2,7 @@
 particle wet radius (calculated from the volume)
 """
 from PySDM.attributes.impl.derived_attribute import DerivedAttribute
+from PySDM.attributes.impl.fused_chain import Link
 
 
 class Radius(DerivedAttribute):
@@ -14,3 +15,16 @@ class Radius(DerivedAttribute):
         self.data.idx = self.volume.data.idx
         self.data.product(self.volume.get(), 1 / self.formulae.constants.PI_4_3)
         self.data **= 1 / 3
+
+    def recalculate_modified_since(self, droplet_epoch, epoch):
+        self.data.idx = self.volume.data.idx
+        self.particulator.backend.radius_modified_since(
+            radius=self.data,
+            volume=self.volume.get(),
+            droplet_epoch=droplet_epoch,
+            epoch=epoch,
+        )
+        return True
+
+    def link(self):
+        return Link("radius", (self.volume,), ())
@@ -1,8 +1,12 @@
 """
-particle terminal velocity (used for collision probability and particle displacement)
+particle terminal velocity (used for collision probability and particle displacement),
+ by default evaluated for all particles upon each change of radius; when a relative
+ tolerance `rtol` is set (see `PySDM.builder.Builder.set_terminal_velocity()`), only
+ particles whose radius changed by more than `rtol` since their last update are recomputed
 """
 from PySDM.attributes.impl.derived_attribute import DerivedAttribute
-from PySDM.dynamics.terminal_velocity import Interpolation
+from PySDM.attributes.impl.fused_chain import Link
+from PySDM.dynamics.terminal_velocity import Interpolation, LookupTable
 
 
 class TerminalVelocity(DerivedAttribute):
@@ -11,7 +15,47 @@ class TerminalVelocity(DerivedAttribute):
         dependencies = [self.radius]
         super().__init__(builder, name="terminal velocity", dependencies=dependencies)
 
-        self.approximation = Interpolation(builder.particulator)
+        params = {"approximation": Interpolation, "rtol": None}
+        params.update(builder.terminal_velocity_params)
+        self.approximation = params["approximation"](particulator=builder.particulator)
+        self.rtol = params["rtol"]
+        self.droplet_history = {}
+        if self.rtol is not None:
+            assert isinstance(self.approximation, LookupTable)
+            self.droplet_history["radius"] = builder.particulator.Storage.empty(
+                builder.particulator.n_sd, dtype=float
+            )
+            self.droplet_history["radius"].fill(-1.0)
 
     def recalculate(self):
-        self.approximation(self.data, self.radius.get())
+        if self.rtol is None:
+            self.approximation(self.data, self.radius.get())
+        else:
+            self.approximation(
+                self.data,
+                self.radius.get(),
+                radius_at_update=self.droplet_history["radius"],
+                rtol=self.rtol,
+            )
+
+    def recalculate_modified_since(self, droplet_epoch, epoch):
+        if self.rtol is not None or not isinstance(self.approximation, LookupTable):
+            return False
+        self.approximation.modified_since(
+            self.data, self.radius.get(), droplet_epoch=droplet_epoch, epoch=epoch
+        )
+        return True
+
+    def link(self):
+        if self.rtol is not None or not isinstance(self.approximation, LookupTable):
+            return None
+        return Link(
+            "interpolation",
+            (self.radius,),
+            (
+                self.approximation.factor,
+                self.approximation.a,
+                self.approximation.b,
+                len(self.approximation.a),
+            ),
+        )
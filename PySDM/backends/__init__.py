@@ -54,20 +54,27 @@ else:
 
     from PySDM.backends.impl_common.random_common import (  # pylint: disable=ungrouped-imports
         RandomCommon,
+        substream_seed,
     )
     from PySDM.backends.thrust_rtc import ThrustRTC  # pylint: disable=ungrouped-imports
 
     ThrustRTC.ENABLE = False
 
     class Random(RandomCommon):  # pylint: disable=too-few-public-methods
-        def __init__(self, size, seed):
-            super().__init__(size, seed)
-            self.generator = np.random.default_rng(seed)
+        def __init__(self, size, seed, stream=0):
+            super().__init__(size, seed, stream)
+            self.generator = np.random.default_rng(substream_seed(seed, stream))
 
         def __call__(self, storage):
             # pylint: disable=unsupported-assignment-operation
             storage.data.ndarray[:] = self.generator.uniform(0, 1, storage.shape)
 
+        def get_state(self):
+            return self.generator.bit_generator.state
+
+        def set_state(self, state):
+            self.generator.bit_generator.state = state
+
     ThrustRTC.Random = Random
 
 CPU = Numba
@@ -0,0 +1,44 @@
+"""
+classification of bin edges used for locating the bin of a given value
+ in spectral moment calculations: uniformly and logarithmically spaced edges
+ allow for O(1) lookup, other increasing edges are bisected, while for non-increasing
+ edges (for which no value falls into any bin) a linear scan is retained
+"""
+import numpy as np
+
+LINEAR_SCAN, BISECTION, UNIFORM, LOGARITHMIC = 0, 1, 2, 3
+
+
+def _is_equispaced(values, rtol):
+    widths = np.diff(values)
+    return np.all(np.abs(widths - widths.mean()) <= rtol * abs(widths.mean()))
+
+
+def bin_lookup_parameters(edges, rtol=1e-6):
+    """returns a tuple `(scheme, origin, inverse_width)` where, for the uniform and
+    logarithmic schemes, the bin number is estimated as
+    `(x - origin) * inverse_width` or `(log(x) - origin) * inverse_width`, respectively
+    (the estimate is subsequently corrected against the edges, hence the tolerance
+    used in detection only affects performance and not the result)"""
+    edges = np.asarray(edges, dtype=float)
+    if (
+        len(edges) < 2
+        or not np.all(np.isfinite(edges))
+        or not np.all(np.diff(edges) > 0)
+    ):
+        return LINEAR_SCAN, 0.0, 0.0
+    if _is_equispaced(edges, rtol):
+        return (
+            UNIFORM,
+            float(edges[0]),
+            float((len(edges) - 1) / (edges[-1] - edges[0])),
+        )
+    if edges[0] > 0:
+        log_edges = np.log(edges)
+        if _is_equispaced(log_edges, rtol):
+            return (
+                LOGARITHMIC,
+                float(log_edges[0]),
+                float((len(edges) - 1) / (log_edges[-1] - log_edges[0])),
+            )
+    return BISECTION, 0.0, 0.0
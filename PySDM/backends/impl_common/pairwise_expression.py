@@ -0,0 +1,211 @@
+"""
+declarative counterpart of chains of `PairwiseStorage` operations: expressions
+ built from pair reductions of particle attributes (`sum`, `max`, `min`, `distance`,
+ `multiply`), values of pairwise storages, constants and arithmetic operators are
+ grouped into a `PairwisePipeline` which backends compile into a single loop over
+ pairs evaluating all expressions without intermediate storages, e.g.:
+```
+E = PairwiseExpression
+pipeline = PairwisePipeline(
+    {
+        "sum_of_volumes": E.sum("volume"),
+        "reduced_volume": E.divide_if_not_zero(
+            E.multiply("volume"), E.ref("sum_of_volumes")
+        ),
+    },
+    outputs=("reduced_volume",),
+)
+backend.pairwise_pipeline(
+    pipeline,
+    outputs={"reduced_volume": pairwise_storage},
+    attributes={"volume": particulator.attributes["volume"]},
+    pairwise={},
+    is_first_in_pair=is_first_in_pair,
+)
+```
+"""
+import numbers
+
+PAIR_REDUCTIONS = ("sum", "max", "min", "distance", "multiply")
+BINARY_OPERATORS = {"add": "+", "sub": "-", "mul": "*", "truediv": "/"}
+
+
+class PairwiseExpression:
+    def __init__(self, operation, *args):
+        self.operation = operation
+        self.args = args
+
+    @staticmethod
+    def _wrap(value):
+        if isinstance(value, PairwiseExpression):
+            return value
+        if isinstance(value, numbers.Real):
+            return PairwiseExpression("constant", float(value))
+        raise TypeError(f"unsupported operand: {value!r}")
+
+    @staticmethod
+    def sum(attribute):
+        return PairwiseExpression("sum", attribute)
+
+    @staticmethod
+    def max(attribute):
+        return PairwiseExpression("max", attribute)
+
+    @staticmethod
+    def min(attribute):
+        return PairwiseExpression("min", attribute)
+
+    @staticmethod
+    def distance(attribute):
+        return PairwiseExpression("distance", attribute)
+
+    @staticmethod
+    def multiply(attribute):
+        return PairwiseExpression("multiply", attribute)
+
+    @staticmethod
+    def pairwise(name):
+        """value of a pairwise storage passed in `pairwise` (possibly also an output)"""
+        return PairwiseExpression("pairwise", name)
+
+    @staticmethod
+    def ref(name):
+        """value of an expression defined earlier in the pipeline"""
+        return PairwiseExpression("ref", name)
+
+    @staticmethod
+    def divide_if_not_zero(dividend, divisor):
+        return PairwiseExpression(
+            "divide_if_not_zero",
+            PairwiseExpression._wrap(dividend),
+            PairwiseExpression._wrap(divisor),
+        )
+
+    def __pow__(self, exponent):
+        assert isinstance(exponent, numbers.Real)
+        return PairwiseExpression("power", self, float(exponent))
+
+    def __neg__(self):
+        return PairwiseExpression("mul", PairwiseExpression._wrap(-1), self)
+
+    def _binary(self, operation, other, reflected=False):
+        operands = (self, PairwiseExpression._wrap(other))
+        return PairwiseExpression(
+            operation, *(operands[::-1] if reflected else operands)
+        )
+
+    def __add__(self, other):
+        return self._binary("add", other)
+
+    def __radd__(self, other):
+        return self._binary("add", other, reflected=True)
+
+    def __sub__(self, other):
+        return self._binary("sub", other)
+
+    def __rsub__(self, other):
+        return self._binary("sub", other, reflected=True)
+
+    def __mul__(self, other):
+        return self._binary("mul", other)
+
+    def __rmul__(self, other):
+        return self._binary("mul", other, reflected=True)
+
+    def __truediv__(self, other):
+        return self._binary("truediv", other)
+
+    def __rtruediv__(self, other):
+        return self._binary("truediv", other, reflected=True)
+
+    def __repr__(self):
+        return f"{self.operation}{self.args!r}"
+
+    def leaves(self, operations):
+        """names referenced by the leaves of given operation types"""
+        if self.operation in operations:
+            return {self.args[0]}
+        result = set()
+        for arg in self.args:
+            if isinstance(arg, PairwiseExpression):
+                result |= arg.leaves(operations)
+        return result
+
+    def render(self, syntax, names):
+        """source code of the expression in a language defined by `syntax`,
+        with `names` mapping attributes, pairwise storages and references
+        to variable names in the generated code"""
+        if self.operation == "constant":
+            return repr(self.args[0])
+        if self.operation in ("ref", "pairwise"):
+            return names[self.operation][self.args[0]]
+        if self.operation in PAIR_REDUCTIONS:
+            data = names["attribute"][self.args[0]]
+            return syntax[self.operation].format(
+                a=f"{data}[idx[j]]", b=f"{data}[idx[j + 1]]"
+            )
+        args = [
+            arg.render(syntax, names) if isinstance(arg, PairwiseExpression) else arg
+            for arg in self.args
+        ]
+        if self.operation in BINARY_OPERATORS:
+            return f"({args[0]} {BINARY_OPERATORS[self.operation]} {args[1]})"
+        return syntax[self.operation].format(*args)
+
+
+class PairwisePipeline:  # pylint: disable=too-few-public-methods
+    def __init__(self, expressions: dict, outputs: tuple = None):
+        """`expressions` is an ordered mapping of names to expressions (each may
+        reference the preceding ones with `PairwiseExpression.ref`), the values of
+        those listed in `outputs` (all by default) are stored in pairwise storages"""
+        self.expressions = dict(expressions)
+        self.outputs = tuple(outputs or self.expressions.keys())
+        for name in self.outputs:
+            assert name in self.expressions
+        self.attributes = set()
+        self.pairwise = set()
+        for name, expression in self.expressions.items():
+            refs = expression.leaves(("ref",))
+            assert refs <= set(self.expressions)
+            assert name not in refs
+            self.attributes |= expression.leaves(PAIR_REDUCTIONS)
+            self.pairwise |= expression.leaves(("pairwise",))
+        assert len(self.attributes) > 0
+        self.attributes = tuple(sorted(self.attributes))
+        self.pairwise = tuple(sorted(self.pairwise))
+        self.key = repr((tuple(self.expressions.items()), self.outputs))
+
+    def parameters(self):
+        """names of the arguments of the generated code (after `is_first_in_pair`,
+        `idx` and `length`): outputs, attributes and pairwise inputs"""
+        return (
+            tuple(f"out_{k}" for k in range(len(self.outputs)))
+            + tuple(f"attr_{k}" for k in range(len(self.attributes)))
+            + tuple(f"pair_{k}" for k in range(len(self.pairwise)))
+        )
+
+    def statements(self, syntax):
+        """sequence of `(variable, source)` tuples evaluating the pipeline
+        for a pair with `j` denoting index of its first element and `s` the slot
+        in pairwise storages, followed by `(output, variable)` assignments"""
+        names = {
+            "attribute": {name: f"attr_{k}" for k, name in enumerate(self.attributes)},
+            "pairwise": {name: f"pair_{k}[s]" for k, name in enumerate(self.pairwise)},
+            "ref": {name: f"v_{k}" for k, name in enumerate(self.expressions)},
+        }
+        result = [
+            (names["ref"][name], expression.render(syntax, names))
+            for name, expression in self.expressions.items()
+        ]
+        result += [
+            (f"out_{k}[s]", names["ref"][name]) for k, name in enumerate(self.outputs)
+        ]
+        return result
+
+    def arguments(self, *, outputs, attributes, pairwise):
+        """storages in the order of `parameters()`"""
+        return (
+            tuple(outputs[name] for name in self.outputs)
+            + tuple(attributes[name] for name in self.attributes)
+            + tuple(pairwise[name] for name in self.pairwise)
+        )
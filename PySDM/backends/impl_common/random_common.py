@@ -1,10 +1,19 @@
 """
 common base class for random number generation abstraction layer
 """
+import numpy as np
+
+
+def substream_seed(seed: int, stream: int) -> int:
+    """seed of an independent substream (the seed itself for the default stream)"""
+    if stream == 0:
+        return seed
+    return int(np.random.SeedSequence((seed, stream)).generate_state(1, np.uint32)[0])
 
 
 class RandomCommon:  # pylint: disable=too-few-public-methods
-    def __init__(self, size: int, seed: int):
+    def __init__(self, size: int, seed: int, stream: int = 0):
         assert isinstance(size, int)
         assert isinstance(seed, int)
+        assert isinstance(stream, int) and stream >= 0
         self.size = size
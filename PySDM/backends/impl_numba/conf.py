@@ -13,6 +13,9 @@ JIT_FLAGS = {
     "cache": False,  # https://github.com/numba/numba/issues/2956
 }
 
+# see PySDM.backends.impl_numba.jit_cache
+JIT_CACHE_DIR = os.environ.get("PYSDM_JIT_CACHE_DIR", None)
+
 try:
     numba.parfors.parfor.ensure_parallel_support()
 except numba.core.errors.UnsupportedParforsError:
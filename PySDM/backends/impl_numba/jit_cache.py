@@ -0,0 +1,209 @@
+"""
+opt-in persistent on-disk cache of JIT-compiled code, enabled by setting the
+ `PYSDM_JIT_CACHE_DIR` environment variable (read into `conf.JIT_CACHE_DIR`).
+ Numba's own cache (`cache=True`) cannot be used for the backend kernels as these
+ are closures over formulae (whose pickled form differs from process to process,
+ see https://github.com/numba/numba/issues/2956) and as the formulae themselves are
+ compiled from `exec`-generated source; here, the cache index key is instead
+ composed of the bytecode and of a deterministic digest of closure variables
+ (formulae choices, constants, fastmath flag and source of the called formulae),
+ while the generated formulae source is stored in content-addressed files
+"""
+import hashlib
+import os
+import sys
+import types
+
+import numpy as np
+from numba.core import types as numba_types
+from numba.core.caching import (
+    CompileResultCacheImpl,
+    FunctionCache,
+    _CacheLocator,
+    _SourceFileBackedLocatorMixin,
+)
+from numba.core.dispatcher import Dispatcher
+from numba.core.typing import signature
+
+from PySDM.backends.impl_numba import conf
+
+_MAX_DEPTH = 16
+_IGNORED_FIELDS = ("default_random_seed",)  # not used in compiled code
+_SIMPLE_TYPES = (bool, int, float, complex, str, bytes, type(None), np.generic)
+
+
+class _Unkeyable(Exception):
+    pass
+
+
+def _code_key(code):
+    return (
+        code.co_filename,
+        code.co_name,
+        code.co_code,
+        code.co_names,
+        tuple(
+            _code_key(const) if isinstance(const, types.CodeType) else repr(const)
+            for const in code.co_consts
+        ),
+    )
+
+
+def stable_key(obj, depth=0):  # pylint: disable=too-many-return-statements
+    """returns a picklable description of `obj` which is identical for
+    objects which are equivalent from the standpoint of JIT compilation"""
+    if depth > _MAX_DEPTH:
+        raise _Unkeyable()
+    depth += 1
+    if isinstance(obj, _SIMPLE_TYPES):
+        return type(obj).__name__, repr(obj)
+    if isinstance(obj, Dispatcher):
+        return (
+            "dispatcher",
+            stable_key(obj.py_func, depth),
+            repr(sorted(obj.targetoptions.items())),
+        )
+    if isinstance(obj, types.FunctionType):
+        return (
+            "function",
+            obj.__module__,
+            obj.__qualname__,
+            _code_key(obj.__code__),
+            tuple(
+                stable_key(cell.cell_contents, depth) for cell in obj.__closure__ or ()
+            ),
+        )
+    if isinstance(obj, (types.BuiltinFunctionType, type)):
+        return "named", obj.__module__, obj.__qualname__
+    if isinstance(obj, types.ModuleType):
+        return "module", obj.__name__
+    if isinstance(obj, np.ufunc):
+        return "ufunc", obj.__name__, repr(obj.types)
+    if isinstance(obj, np.ndarray):
+        return "ndarray", obj.dtype.str, obj.shape, hashlib.sha256(obj).hexdigest()
+    if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+        return (
+            type(obj).__name__,
+            tuple(
+                (field, stable_key(value, depth))
+                for field, value in zip(obj._fields, obj)
+                if field not in _IGNORED_FIELDS
+            ),
+        )
+    if isinstance(obj, (tuple, list)):
+        return (
+            type(obj).__name__,
+            tuple(stable_key(item, depth) for item in obj),
+        )
+    if isinstance(obj, dict):
+        return "dict", tuple((k, stable_key(obj[k], depth)) for k in sorted(obj))
+    if isinstance(obj, types.SimpleNamespace) or hasattr(obj, "__dict__"):
+        return (
+            type(obj).__qualname__,
+            stable_key(
+                {k: v for k, v in vars(obj).items() if not k.startswith("__")}, depth
+            ),
+        )
+    raise _Unkeyable()
+
+
+class _Locator(_SourceFileBackedLocatorMixin, _CacheLocator):
+    def __init__(self, py_func, py_file):
+        self._py_file = py_file
+        self._lineno = py_func.__code__.co_firstlineno
+        self._cache_path = os.path.join(
+            conf.JIT_CACHE_DIR, self.get_suitable_cache_subpath(py_file)
+        )
+
+    def get_cache_path(self):
+        return self._cache_path
+
+
+class _CacheImpl(CompileResultCacheImpl):
+    _locator_classes = [_Locator]
+
+
+class _FunctionCache(FunctionCache):
+    _impl_class = _CacheImpl
+
+    def __init__(self, py_func, closure_key):
+        super().__init__(py_func)
+        self.__key = hashlib.sha256(repr(closure_key).encode()).hexdigest()
+
+    def _index_key(self, sig, codegen):
+        return _signature_key(sig), codegen.magic_tuple(), self.__key
+
+    def load_overload(self, sig, target_context):
+        cres = super().load_overload(sig, target_context)
+        if cres is not None:
+            # dispatcher-typed arguments in the stored signature refer to
+            # (unpickled) copies of the dispatchers passed at compile time
+            cres = cres._replace(signature=signature(cres.signature.return_type, *sig))
+        return cres
+
+
+def _signature_key(sig):
+    return tuple(
+        stable_key(arg.dispatcher) if isinstance(arg, numba_types.Dispatcher) else arg
+        for arg in sig
+    )
+
+
+def enabled():
+    return conf.JIT_CACHE_DIR is not None
+
+
+def enable(dispatcher):
+    """equips a Numba dispatcher with the on-disk cache (if enabled and if
+    the dispatcher's closure can be deterministically keyed)"""
+    if (
+        not enabled()
+        or not isinstance(dispatcher, Dispatcher)
+        or isinstance(
+            dispatcher._cache, _FunctionCache
+        )  # pylint: disable=protected-access
+    ):
+        return dispatcher
+    try:
+        cache = _FunctionCache(dispatcher.py_func, stable_key(dispatcher.py_func))
+    except (_Unkeyable, RuntimeError, TypeError, ValueError):
+        return dispatcher
+    dispatcher._cache = cache  # pylint: disable=protected-access
+    return dispatcher
+
+
+def enable_all(obj):
+    """equips all dispatchers found among instance and class attributes of `obj`
+    (or among the globals of a module) as well as in the modules defining its classes"""
+    members = list(vars(obj).values())
+    if not isinstance(obj, types.ModuleType):
+        for cls in type(obj).__mro__:
+            members += vars(cls).values()
+            members += vars(sys.modules[cls.__module__]).values()
+    for member in members:
+        enable(getattr(member, "__func__", member))
+
+
+def exec_source(source: str, *, comment: str, namespace: dict):
+    """executes `source` as a module backed by a content-addressed file in the cache
+    directory (so that functions defined therein can be cached) and returns
+    the module namespace"""
+    content = f"# {comment}\n{source}"
+    digest = hashlib.sha256(content.encode()).hexdigest()
+    name = f"_pysdm_jit_cache_{digest}"
+    if name not in sys.modules:
+        path = os.path.join(conf.JIT_CACHE_DIR, "sources", f"{name}.py")
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                file.write(content)
+            os.replace(tmp_path, path)
+        module = types.ModuleType(name)
+        module.__file__ = path
+        module.__dict__.update(namespace)
+        exec(  # pylint: disable=exec-used
+            compile(content, path, "exec"), module.__dict__
+        )
+        sys.modules[name] = module
+    return sys.modules[name].__dict__
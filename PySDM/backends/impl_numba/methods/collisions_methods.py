@@ -2,16 +2,29 @@
 CPU implementation of backend methods for particle collisions
 """
 # pylint: disable=too-many-lines
+import re
+
 import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_common.storage_utils import StorageBase
+from PySDM.backends.impl_numba import conf, jit_cache
 from PySDM.backends.impl_numba.atomic_operations import atomic_add
+from PySDM.backends.impl_numba.methods.pair_methods import PAIRWISE_PIPELINE_SYNTAX
+from PySDM.backends.impl_numba.methods.physics_methods import FUSED_CHAIN_SYNTAX
+from PySDM.backends.impl_numba.methods.terminal_velocity_methods import interpolate
+from PySDM.backends.impl_numba.random import philox_key, philox_uniform_pair
 from PySDM.backends.impl_numba.storage import Storage
 from PySDM.backends.impl_numba.warnings import warn
 
 
+def _chain_local_names(code, n):
+    """prefixes the variable names used in the code of the `n`-th fused chain
+    so that names of different chains do not clash within a single kernel"""
+    return re.sub(r"\b(in|out|p|v)_(\d+)\b", f"c{n}_\\1_\\2", code)
+
+
 @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def pair_indices(i, idx, is_first_in_pair, prob_like):
     """given permutation array `idx` and `is_first_in_pair` flag array,
@@ -297,6 +310,7 @@ def ll82_Nr(  # pylint: disable=too-many-arguments,unused-argument
 class CollisionsMethods(BackendMethods):
     def __init__(self):  # pylint: disable=too-many-statements,too-many-locals
         BackendMethods.__init__(self)
+        self._adaptive_sdm_cell_local_bodies = {}
 
         _break_up = break_up_while if self.formulae.handle_all_breakups else break_up
 
@@ -634,9 +648,14 @@ class CollisionsMethods(BackendMethods):
         )
 
     @staticmethod
-    # @numba.njit(**conf.JIT_FLAGS)  # note: as of Numba 0.51, np.dot() does not support ints
+    @numba.njit(**conf.JIT_FLAGS)
     def __cell_id_body(cell_id, cell_origin, strides):
-        cell_id[:] = np.dot(strides, cell_origin)
+        n_dims = cell_origin.shape[0]
+        for i in numba.prange(len(cell_id)):  # pylint: disable=not-an-iterable
+            cid = 0
+            for dim in range(n_dims):
+                cid += cell_origin[dim, i] * strides[0, dim]
+            cell_id[i] = cid
 
     def cell_id(self, cell_id, cell_origin, strides):
         return self.__cell_id_body(cell_id.data, cell_origin.data, strides.data)
@@ -690,6 +709,245 @@ class CollisionsMethods(BackendMethods):
             is_first_in_pair=is_first_in_pair.indicator.data,
         )
 
+    def _make_adaptive_sdm_cell_local_body(self, pipeline, chains):
+        """generates and JIT-compiles a loop over cells, each advancing its own
+        adaptive sequence of SDM substeps (with collision kernel evaluated from
+        the pipeline and the derived attributes it uses re-evaluated with the chains
+        for each coalesced droplet)"""
+        statements = pipeline.statements(PAIRWISE_PIPELINE_SYNTAX)
+        kernel = dict(statements)[f"out_{pipeline.outputs.index('kernel')}[s]"]
+        newline = "\n" + 20 * " "
+        kernel_statements = newline.join(
+            f"{var} = {value}" for var, value in statements[: len(pipeline.expressions)]
+        )
+        chain_parameters = []
+        chain_statements = []
+        for n, chain in enumerate(chains):
+            chain_parameters += [
+                _chain_local_names(name, n) for name in chain.parameters()
+            ]
+            chain_statements += [
+                _chain_local_names(statement, n)
+                for statement in chain.statements(FUSED_CHAIN_SYNTAX)
+            ]
+        parameters = ", ".join(
+            (
+                "cell_start",
+                "idx",
+                "multiplicity",
+                "attributes",
+                "gamma",
+                "healthy",
+                "coalescence_rate",
+                "collision_rate",
+                "collision_rate_deficit",
+                "stats_n_substep",
+                "stats_dt_min",
+                "droplet_epoch",
+                "epoch",
+                "dt",
+                "dv",
+                "dt_min",
+                "dt_max",
+                "key0",
+                "key1",
+                "counter",
+            )
+            + pipeline.parameters()[len(pipeline.outputs) :]
+            + tuple(chain_parameters)
+        )
+        source = f"""
+def make_adaptive_sdm_cell_local_body(
+    coalesce, philox_uniform_pair, phys_radius, phys_area, interpolate
+):
+    def adaptive_sdm_cell_local_body({parameters}):
+        ctr = np.uint64(counter)
+        for c in numba.prange(len(cell_start) - 1):
+            start = cell_start[c]
+            end = cell_start[c + 1]
+            dt_left = dt
+            substep = np.uint64(0)
+            while dt_left > 0 and end - start > 1:
+                for i in range(end - 1, start, -1):
+                    u01, _ = philox_uniform_pair(
+                        np.uint64(i), substep, ctr, np.uint64(0), key0, key1
+                    )
+                    r = start + int(u01 * (i - start + 1))
+                    idx[i], idx[r] = idx[r], idx[i]
+                sd_num = end - start
+                norm = dt / dv[c] * sd_num * (sd_num - 1) / 2 / (sd_num // 2)
+                dt_todo = min(dt_left, dt_max)
+                for j in range(start, end - 1, 2):
+                    if multiplicity[idx[j]] < multiplicity[idx[j + 1]]:
+                        idx[j], idx[j + 1] = idx[j + 1], idx[j]
+                    {kernel_statements}
+                    prob = multiplicity[idx[j]] * {kernel} * norm
+                    gamma[j // 2] = prob
+                    if prob > 0:
+                        prop = multiplicity[idx[j]] // multiplicity[idx[j + 1]]
+                        dt_optimal = max(dt * prop / prob, dt_min)
+                        dt_todo = min(dt_todo, dt_optimal)
+                        stats_dt_min[c] = min(stats_dt_min[c], dt_optimal)
+                for j in range(start, end - 1, 2):
+                    if gamma[j // 2] == 0:
+                        continue
+                    _, u01 = philox_uniform_pair(
+                        np.uint64(j), substep, ctr, np.uint64(0), key0, key1
+                    )
+                    first = idx[j]
+                    second = idx[j + 1]
+                    g_full = int(np.ceil(gamma[j // 2] * dt_todo / dt - u01))
+                    g = min(g_full, multiplicity[first] // multiplicity[second])
+                    collision_rate[c] += g * multiplicity[second]
+                    collision_rate_deficit[c] += (g_full - g) * multiplicity[second]
+                    gamma[j // 2] = g
+                    if g == 0:
+                        continue
+                    coalesce(
+                        j // 2,
+                        first,
+                        second,
+                        c,
+                        multiplicity,
+                        gamma,
+                        attributes,
+                        coalescence_rate,
+                    )
+                    if multiplicity[first] == 0:
+                        healthy[0] = 0
+                    if epoch > 0:
+                        droplet_epoch[first] = epoch
+                        droplet_epoch[second] = epoch
+                    for i in (first, second):
+                        {(newline + 4 * " ").join(chain_statements) or "pass"}
+                dt_left -= dt_todo
+                stats_n_substep[c] += 1
+                substep += np.uint64(1)
+                i = start
+                while i < end:
+                    if multiplicity[idx[i]] == 0:
+                        end -= 1
+                        idx[i], idx[end] = idx[end], idx[i]
+                    else:
+                        i += 1
+
+    return adaptive_sdm_cell_local_body
+"""
+        namespace = {"numba": numba, "np": np}
+        if jit_cache.enabled():
+            namespace = jit_cache.exec_source(
+                source, comment="cell-local adaptive SDM", namespace=namespace
+            )
+        else:
+            exec(source, namespace)  # pylint: disable=exec-used
+        return jit_cache.enable(
+            numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})(
+                namespace["make_adaptive_sdm_cell_local_body"](
+                    coalesce,
+                    philox_uniform_pair,
+                    self.formulae.trivia.radius,
+                    self.formulae.trivia.area,
+                    interpolate,
+                )
+            )
+        )
+
+    # pylint: disable=too-many-arguments,too-many-locals
+    def adaptive_sdm_cell_local(
+        self,
+        *,
+        pipeline,
+        kernel_attributes,
+        chains,
+        multiplicity,
+        idx,
+        attributes,
+        cell_start,
+        gamma,
+        healthy,
+        coalescence_rate,
+        collision_rate,
+        collision_rate_deficit,
+        stats_n_substep,
+        stats_dt_min,
+        droplet_epoch,
+        epoch,
+        dt,
+        dv,
+        dt_range,
+        seed,
+        stream,
+        counter,
+    ):
+        """performs a whole timestep of adaptive coalescence with each cell (of
+        `cell_start`, with identity cell permutation) advancing its own substep loop
+        (shuffle, pairing, probabilities, gamma and coalescence) within a single
+        kernel (using the per-cell volumes `dv`); the collision kernel is the
+        `kernel` output of `pipeline` evaluated with `kernel_attributes`, while
+        derived attributes among them are kept up to date for coalesced droplets
+        using `chains`
+        (see `PySDM.attributes.impl.fused_chain.FusedChain`); random numbers come
+        from a counter-based generator keyed with `seed` and `stream` and indexed
+        with the slot, substep and `counter`"""
+        key = (pipeline.key, tuple(chain.key for chain in chains))
+        body = self._adaptive_sdm_cell_local_bodies.get(key)
+        if body is None:
+            body = self._make_adaptive_sdm_cell_local_body(pipeline, chains)
+            self._adaptive_sdm_cell_local_bodies[key] = body
+        body(
+            cell_start.data,
+            idx.data,
+            multiplicity.data,
+            attributes.data,
+            gamma.data,
+            healthy.data,
+            coalescence_rate.data,
+            collision_rate.data,
+            collision_rate_deficit.data,
+            stats_n_substep.data,
+            stats_dt_min.data,
+            droplet_epoch.data,
+            epoch,
+            dt,
+            dv.data,
+            dt_range[0],
+            dt_range[1],
+            *philox_key(seed, stream),
+            counter,
+            *(kernel_attributes[name].data for name in pipeline.attributes),
+            *(
+                argument.data if isinstance(argument, StorageBase) else argument
+                for chain in chains
+                for argument in chain.arguments()
+            ),
+        )
+
+    @staticmethod
+    @numba.njit(**conf.JIT_FLAGS)
+    def __record_pair_changes_body(
+        *, droplet_epoch, epoch, gamma, idx, length, is_first_in_pair
+    ):
+        for i in numba.prange(length // 2):  # pylint: disable=not-an-iterable
+            j, k, skip_pair = pair_indices(i, idx, is_first_in_pair, gamma)
+            if skip_pair:
+                continue
+            droplet_epoch[j] = epoch
+            droplet_epoch[k] = epoch
+
+    def record_pair_changes(
+        self, *, droplet_epoch, epoch, gamma, idx, is_first_in_pair
+    ):
+        """stamps both droplets of each pair with non-zero `gamma` (i.e., the ones
+        possibly modified by coalescence or breakup) with the given `epoch`"""
+        self.__record_pair_changes_body(
+            droplet_epoch=droplet_epoch.data,
+            epoch=epoch,
+            gamma=gamma.data,
+            idx=idx.data,
+            length=len(idx),
+            is_first_in_pair=is_first_in_pair.indicator.data,
+        )
+
     def collision_coalescence_breakup(
         self,
         *,
@@ -1023,7 +1281,16 @@ class CollisionsMethods(BackendMethods):
         )
 
     @staticmethod
-    def make_cell_caretaker(idx_shape, idx_dtype, cell_start_len, scheme="default"):
+    def make_cell_caretaker(
+        idx_shape, idx_dtype, cell_start_len, scheme="default", max_migrated=0.05
+    ):
+        """returns a callable updating `idx` and `cell_start` so that super-droplets
+        are sorted by cell; with `scheme="incremental"`, super-droplets which are
+        not in the `cell_start`-delimited segment of their cell (e.g., those which
+        migrated since last call) are moved in place (patching segment boundaries),
+        with a fallback to counting sort if they make up more than `max_migrated`
+        fraction of all super-droplets (or if `cell_start` is not a valid partition)"""
+
         class CellCaretaker:  # pylint: disable=too-few-public-methods
             def __init__(self, idx_shape, idx_dtype, cell_start_len, scheme):
                 if scheme == "default":
@@ -1032,8 +1299,13 @@ class CollisionsMethods(BackendMethods):
                     else:
                         scheme = "counting_sort"
                 self.scheme = scheme
-                if scheme in ("counting_sort", "counting_sort_parallel"):
+                if scheme in ("counting_sort", "counting_sort_parallel", "incremental"):
                     self.tmp_idx = Storage.empty(idx_shape, idx_dtype)
+                if scheme == "incremental":
+                    self.migration_counts = Storage.empty(
+                        (2, cell_start_len), dtype=int
+                    )
+                    self.n_migrated = -1
                 if scheme == "counting_sort_parallel":
                     self.cell_starts = Storage.empty(
                         (
@@ -1045,7 +1317,28 @@ class CollisionsMethods(BackendMethods):
 
             def __call__(self, cell_id, cell_idx, cell_start, idx):
                 length = len(idx)
-                if self.scheme == "counting_sort":
+                if self.scheme == "incremental":
+                    self.n_migrated = CollisionsMethods._incremental_update_cell_start(
+                        self.tmp_idx.data,
+                        idx.data,
+                        cell_id.data,
+                        cell_idx.data,
+                        length,
+                        cell_start.data,
+                        self.migration_counts.data,
+                        int(max_migrated * length),
+                    )
+                    if self.n_migrated >= 0:
+                        return
+                    CollisionsMethods._counting_sort_by_cell_id_and_update_cell_start(
+                        self.tmp_idx.data,
+                        idx.data,
+                        cell_id.data,
+                        cell_idx.data,
+                        length,
+                        cell_start.data,
+                    )
+                elif self.scheme == "counting_sort":
                     CollisionsMethods._counting_sort_by_cell_id_and_update_cell_start(
                         self.tmp_idx.data,
                         idx.data,
@@ -1130,6 +1423,92 @@ class CollisionsMethods(BackendMethods):
             cell_end[cell_idx[cell_id[idx[i]]]] -= 1
             new_idx[cell_end[cell_idx[cell_id[idx[i]]]]] = idx[i]
 
+    @staticmethod
+    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+    # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+    def _incremental_update_cell_start(
+        moving, idx, cell_id, cell_idx, length, cell_start, counts, max_migrated
+    ):
+        """returns the number of super-droplets moved between cells,
+        or -1 if counting sort is needed instead (nothing is modified then)"""
+        n_cell = len(cell_start) - 1
+        if cell_start[0] != 0 or cell_start[n_cell] != length:
+            return -1
+        for c in range(n_cell):
+            if cell_start[c + 1] < cell_start[c]:
+                return -1
+
+        # counting super-droplets leaving (n_out) and entering (n_in) each cell
+        n_out = counts[0, :]
+        n_in = counts[1, :]
+        n_out[:] = 0
+        n_in[:] = 0
+        n_migrated = 0
+        for c in range(n_cell):
+            for i in range(cell_start[c], cell_start[c + 1]):
+                key = cell_idx[cell_id[idx[i]]]
+                if key != c:
+                    n_out[c] += 1
+                    n_in[key] += 1
+                    n_migrated += 1
+            if n_migrated > max_migrated:
+                return -1
+        if n_migrated == 0:
+            return 0
+
+        # moving the migrants out of their segments (leaving stayers at the front)
+        j = 0
+        for c in range(n_cell):
+            if n_out[c] == 0:
+                continue
+            lo = cell_start[c]
+            hi = cell_start[c + 1]
+            while lo < hi:
+                if cell_idx[cell_id[idx[lo]]] == c:
+                    lo += 1
+                else:
+                    hi -= 1
+                    moving[j] = idx[lo]
+                    j += 1
+                    idx[lo] = idx[hi]
+
+        # new segment boundaries (n_out reused for the numbers of stayers)
+        for c in range(n_cell):
+            n_out[c] = cell_start[c + 1] - cell_start[c] - n_out[c]
+        n_stay = n_out
+        new_start = n_in
+        shift = 0
+        for c in range(n_cell):
+            incoming = n_in[c]
+            new_start[c] = cell_start[c] + shift
+            shift += incoming + n_stay[c] - (cell_start[c + 1] - cell_start[c])
+
+        # relocating blocks of stayers: leftwards first (in forward order),
+        #  then rightwards (in reverse order), moving at most |shift| elements each
+        for c in range(n_cell):
+            src, dst, k = cell_start[c], new_start[c], n_stay[c]
+            if dst < src:
+                d = min(k, src - dst)
+                for i in range(d):
+                    idx[dst + i] = idx[src + k - d + i]
+        for c in range(n_cell - 1, -1, -1):
+            src, dst, k = cell_start[c], new_start[c], n_stay[c]
+            if dst > src:
+                d = min(k, dst - src)
+                for i in range(d):
+                    idx[dst + k - d + i] = idx[src + i]
+
+        # filling the gaps with migrants
+        for c in range(n_cell):
+            cell_start[c] = new_start[c] + n_stay[c]
+        for i in range(n_migrated):
+            key = cell_idx[cell_id[moving[i]]]
+            idx[cell_start[key]] = moving[i]
+            cell_start[key] += 1
+        for c in range(n_cell):
+            cell_start[c] = new_start[c]
+        return n_migrated
+
     @staticmethod
     @numba.njit(**conf.JIT_FLAGS)
     # pylint: disable=too-many-arguments
@@ -1,14 +1,17 @@
 """
 CPU implementation of backend methods for water condensation/evaporation
 """
+# pylint: disable=too-many-lines
 import math
+import time
 from functools import lru_cache
 
 import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
+from PySDM.backends.impl_numba.atomic_operations import atomic_add
 from PySDM.backends.impl_numba.toms748 import toms748_solve
 from PySDM.backends.impl_numba.warnings import warn
 
@@ -35,17 +38,25 @@ class CondensationMethods(BackendMethods):
         pqv,
         kappa,
         f_org,
+        dx_ratio_last,
+        n_iters_last,
         rtol_x,
         rtol_thd,
         timestep,
         counters,
         cell_order,
+        work_queue,
         RH_max,
+        mean_iterations,
+        substep_history,
         success,
         cell_id,
     ):
         n_threads = min(numba.get_num_threads(), n_cell)
-        CondensationMethods._condensation(
+        thread_busy_time = np.empty(n_threads)
+        CondensationMethods.make_condensation_driver(
+            parallel=conf.JIT_FLAGS["parallel"] and n_threads > 1, timed=work_queue
+        )(
             solver=solver,
             n_threads=n_threads,
             n_cell=n_cell,
@@ -58,12 +69,14 @@ class CondensationMethods(BackendMethods):
             rhod=rhod.data,
             thd=thd.data,
             qv=qv.data,
-            dv_mean=dv,
+            dv_mean=np.full(n_cell, dv) if np.isscalar(dv) else dv,
             prhod=prhod.data,
             pthd=pthd.data,
             pqv=pqv.data,
             kappa=kappa.data,
             f_org=f_org.data,
+            dx_ratio_last=dx_ratio_last.data,
+            n_iters_last=n_iters_last.data,
             rtol_x=rtol_x,
             rtol_thd=rtol_thd,
             timestep=timestep,
@@ -72,95 +85,147 @@ class CondensationMethods(BackendMethods):
             counter_n_deactivating=counters["n_deactivating"].data,
             counter_n_ripening=counters["n_ripening"].data,
             cell_order=cell_order,
+            work_queue=work_queue,
+            thread_busy_time=thread_busy_time,
             RH_max=RH_max.data,
+            mean_iterations=mean_iterations.data,
+            substep_history=tuple(
+                substep_history[key].data
+                for key in (
+                    "error_ratio",
+                    "error_ratio_prev",
+                    "n_substeps",
+                    "dthd_dt",
+                    "dqv_dt",
+                    "n_predicted",
+                )
+            ),
             success=success.data,
         )
+        return thread_busy_time if work_queue else None
 
     @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"cache": False}})
-    def _condensation(
-        *,
-        solver,
-        n_threads,
-        n_cell,
-        cell_start_arg,
-        v,
-        v_cr,
-        n,
-        vdry,
-        idx,
-        rhod,
-        thd,
-        qv,
-        dv_mean,
-        prhod,
-        pthd,
-        pqv,
-        kappa,
-        f_org,
-        rtol_x,
-        rtol_thd,
-        timestep,
-        counter_n_substeps,
-        counter_n_activating,
-        counter_n_deactivating,
-        counter_n_ripening,
-        cell_order,
-        RH_max,
-        success,
-    ):
-        # pylint: disable=too-many-locals
-        for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
-            for i in range(thread_id, n_cell, n_threads):
-                cell_id = cell_order[i]
-
-                cell_start = cell_start_arg[cell_id]
-                cell_end = cell_start_arg[cell_id + 1]
-                n_sd_in_cell = cell_end - cell_start
-                if n_sd_in_cell == 0:
-                    continue
+    @lru_cache()
+    def make_condensation_driver(parallel, timed):
+        """returns the loop over cells (threaded if `parallel`); the serial variant
+        is used for single-thread runs in which the solver may use threads within a cell;
+        per-thread busy time is measured (in object mode) only if `timed`
+        """
 
-                dthd_dt = (pthd[cell_id] - thd[cell_id]) / timestep
-                dqv_dt = (pqv[cell_id] - qv[cell_id]) / timestep
-                rhod_mean = (prhod[cell_id] + rhod[cell_id]) / 2
-                md = rhod_mean * dv_mean
+        @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": parallel, "cache": False}})
+        def condensation_driver(
+            *,
+            solver,
+            n_threads,
+            n_cell,
+            cell_start_arg,
+            v,
+            v_cr,
+            n,
+            vdry,
+            idx,
+            rhod,
+            thd,
+            qv,
+            dv_mean,
+            prhod,
+            pthd,
+            pqv,
+            kappa,
+            f_org,
+            dx_ratio_last,
+            n_iters_last,
+            rtol_x,
+            rtol_thd,
+            timestep,
+            counter_n_substeps,
+            counter_n_activating,
+            counter_n_deactivating,
+            counter_n_ripening,
+            cell_order,
+            work_queue,
+            thread_busy_time,
+            RH_max,
+            mean_iterations,
+            substep_history,
+            success,
+        ):
+            # pylint: disable=too-many-locals,too-many-statements
+            next_cell = np.zeros(1, dtype=np.int64)
+            for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+                start = 0.0
+                if timed:
+                    with numba.objmode(start="float64"):
+                        start = time.perf_counter()
+                i = thread_id - n_threads
+                while True:
+                    if work_queue:
+                        i = atomic_add(next_cell, 0, 1)
+                    else:
+                        i += n_threads
+                    if i >= n_cell:
+                        break
+                    cell_id = cell_order[i]
 
-                (
-                    success_in_cell,
-                    qv_new,
-                    thd_new,
-                    substeps_hint,
-                    n_activating,
-                    n_deactivating,
-                    n_ripening,
-                    RH_max_in_cell,
-                ) = solver(
-                    v,
-                    v_cr,
-                    n,
-                    vdry,
-                    idx[cell_start:cell_end],
-                    kappa,
-                    f_org,
-                    thd[cell_id],
-                    qv[cell_id],
-                    dthd_dt,
-                    dqv_dt,
-                    md,
-                    rhod_mean,
-                    rtol_x,
-                    rtol_thd,
-                    timestep,
-                    counter_n_substeps[cell_id],
-                )
-                counter_n_substeps[cell_id] = substeps_hint
-                counter_n_activating[cell_id] = n_activating
-                counter_n_deactivating[cell_id] = n_deactivating
-                counter_n_ripening[cell_id] = n_ripening
-                RH_max[cell_id] = RH_max_in_cell
-                success[cell_id] = success_in_cell
-                pqv[cell_id] = qv_new
-                pthd[cell_id] = thd_new
+                    cell_start = cell_start_arg[cell_id]
+                    cell_end = cell_start_arg[cell_id + 1]
+                    n_sd_in_cell = cell_end - cell_start
+                    if n_sd_in_cell == 0:
+                        continue
+
+                    dthd_dt = (pthd[cell_id] - thd[cell_id]) / timestep
+                    dqv_dt = (pqv[cell_id] - qv[cell_id]) / timestep
+                    rhod_mean = (prhod[cell_id] + rhod[cell_id]) / 2
+                    md = rhod_mean * dv_mean[cell_id]
+
+                    (
+                        success_in_cell,
+                        qv_new,
+                        thd_new,
+                        substeps_hint,
+                        n_activating,
+                        n_deactivating,
+                        n_ripening,
+                        RH_max_in_cell,
+                        mean_iterations_in_cell,
+                    ) = solver(
+                        v,
+                        v_cr,
+                        n,
+                        vdry,
+                        idx[cell_start:cell_end],
+                        kappa,
+                        f_org,
+                        dx_ratio_last,
+                        n_iters_last,
+                        thd[cell_id],
+                        qv[cell_id],
+                        dthd_dt,
+                        dqv_dt,
+                        md,
+                        rhod_mean,
+                        rtol_x,
+                        rtol_thd,
+                        timestep,
+                        counter_n_substeps[cell_id],
+                        substep_history,
+                        cell_id,
+                    )
+                    counter_n_substeps[cell_id] = substeps_hint
+                    counter_n_activating[cell_id] = n_activating
+                    counter_n_deactivating[cell_id] = n_deactivating
+                    counter_n_ripening[cell_id] = n_ripening
+                    RH_max[cell_id] = RH_max_in_cell
+                    mean_iterations[cell_id] = mean_iterations_in_cell
+                    success[cell_id] = success_in_cell
+                    pqv[cell_id] = qv_new
+                    pthd[cell_id] = thd_new
+                if timed:
+                    with numba.objmode(stop="float64"):
+                        stop = time.perf_counter()
+                    thread_busy_time[thread_id] = stop - start
+
+        return condensation_driver
 
     @staticmethod
     def make_adapt_substeps(
@@ -188,7 +253,7 @@ class CondensationMethods(BackendMethods):
                             "thd",
                             thd,
                         ),
-                        return_value=(0, False),
+                        return_value=(0, False, np.nan),
                     )
                 thd_new_long, success = step_fake(args, timestep, n_substeps)
                 if success:
@@ -196,12 +261,16 @@ class CondensationMethods(BackendMethods):
                 n_substeps *= multiplier
             for burnout in range(fuse + 1):
                 if burnout == fuse:
-                    return warn("burnout (short)", __file__, return_value=(0, False))
+                    return warn(
+                        "burnout (short)", __file__, return_value=(0, False, np.nan)
+                    )
                 thd_new_short, success = step_fake(
                     args, timestep, n_substeps * multiplier
                 )
                 if not success:
-                    return warn("short failed", __file__, return_value=(0, False))
+                    return warn(
+                        "short failed", __file__, return_value=(0, False, np.nan)
+                    )
                 dthd_long = thd_new_long - thd
                 dthd_short = thd_new_short - thd
                 error_estimate = np.abs(dthd_long - multiplier * dthd_short)
@@ -211,16 +280,74 @@ class CondensationMethods(BackendMethods):
                 n_substeps *= multiplier
                 if n_substeps > n_substeps_max:
                     break
-            return np.minimum(n_substeps_max, n_substeps), success
+            return (
+                np.minimum(n_substeps_max, n_substeps),
+                success,
+                error_estimate / rtol_thd / np.abs(thd),
+            )
 
         return adapt_substeps
 
+    @staticmethod
+    def make_predict_substeps(
+        *,
+        jit_flags,
+        timestep,
+        dt_range,
+        safety=0.8,
+        k_i=0.15,
+        k_p=0.2,
+        max_tendency_change=0.05,
+        max_predicted=8,
+    ):
+        """returns a PI-type controller predicting the number of substeps from
+        the error estimates (relative to tolerance) of the last two trial integrations
+        (see `make_adapt_substeps()`) and the ratio of current to then-recorded
+        theta and water vapour tendencies; zero is returned if the prediction is
+        rejected (no record, tendencies changed by more than `max_tendency_change`,
+        or `max_predicted` consecutive predictions made since the last trials)"""
+        if dt_range[1] > timestep:
+            dt_range = (dt_range[0], timestep)
+        n_substeps_max = math.floor(timestep / dt_range[0])
+        n_substeps_min = math.ceil(timestep / dt_range[1])
+
+        @numba.njit(**jit_flags)
+        def predict_substeps(  # pylint: disable=too-many-arguments
+            dthd_dt,
+            dqv_dt,
+            n_substeps_last,
+            error_ratio,
+            error_ratio_prev,
+            dthd_dt_last,
+            dqv_dt_last,
+            n_predicted,
+        ):
+            if n_substeps_last <= 0 or n_predicted >= max_predicted:
+                return 0
+            if not 0 <= error_ratio <= 1:
+                return 0
+            growth = 1.0
+            for now, then in ((dthd_dt, dthd_dt_last), (dqv_dt, dqv_dt_last)):
+                if abs(now - then) > max_tendency_change * abs(then):
+                    return 0
+                if then != 0:
+                    growth = max(growth, abs(now / then))
+            if error_ratio == 0:
+                return n_substeps_min
+            factor = (growth * error_ratio / safety) ** k_i
+            if error_ratio_prev > 0:
+                factor *= (error_ratio / error_ratio_prev) ** k_p
+            n_substeps = math.ceil(n_substeps_last * factor)
+            return min(n_substeps_max, max(n_substeps_min, n_substeps))
+
+        return predict_substeps
+
     @staticmethod
     def make_step_fake(jit_flags, step_impl):
         @numba.njit(**jit_flags)
         def step_fake(args, dt, n_substeps):
             dt /= n_substeps
-            _, thd_new, _, _, _, _, success = step_impl(*args, dt, 1, True)
+            _, thd_new, _, _, _, _, success, _ = step_impl(*args, dt, 1, True)
             return thd_new, success
 
         return step_fake
@@ -258,6 +385,8 @@ class CondensationMethods(BackendMethods):
             cell_idx,
             kappa,
             f_org,
+            dx_ratio_last,
+            n_iters_last,
             thd,
             qv,
             dthd_dt_pred,
@@ -273,6 +402,7 @@ class CondensationMethods(BackendMethods):
             ml_old = calculate_ml_old(v, n, cell_idx)
             count_activating, count_deactivating, count_ripening = 0, 0, 0
             RH_max = 0
+            count_iterations, count_solved = 0, 0
             success = True
             for _ in range(n_substeps):
                 # note: no example yet showing that the trapezoidal scheme brings any improvement
@@ -293,6 +423,8 @@ class CondensationMethods(BackendMethods):
                     n_activating,
                     n_deactivating,
                     n_ripening,
+                    n_iterations,
+                    n_solved,
                 ) = calculate_ml_new(
                     timestep,
                     fake,
@@ -306,6 +438,8 @@ class CondensationMethods(BackendMethods):
                     cell_idx,
                     kappa,
                     f_org,
+                    dx_ratio_last,
+                    n_iters_last,
                     lv,
                     pvs,
                     DTp,
@@ -325,6 +459,8 @@ class CondensationMethods(BackendMethods):
                 count_deactivating += n_deactivating
                 count_ripening += n_ripening
                 RH_max = max(RH_max, RH)
+                count_iterations += n_iterations
+                count_solved += n_solved
                 success = success and success_within_substep
             return (
                 qv,
@@ -334,6 +470,7 @@ class CondensationMethods(BackendMethods):
                 count_ripening,
                 RH_max,
                 success,
+                count_iterations / count_solved if count_solved > 0 else 0.0,
             )
 
         return step_impl
@@ -350,6 +487,38 @@ class CondensationMethods(BackendMethods):
 
         return calculate_ml_old
 
+    @staticmethod
+    def make_warm_start_bracket(*, jit_flags, minfun, warm_start):
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def warm_start_bracket(  # pylint: disable=too-many-arguments
+            args, x_old, x_insane, dx_old, dx_ratio_last, n_iters_last, rtol_x
+        ):
+            """seeds a tight bracket around the root guessed by scaling the explicit
+            increment estimate `dx_old` with the ratio of the last accepted (implicit)
+            increment to its explicit estimate (if recorded, i.e., `n_iters_last > 0`);
+            returns a flag telling if the bracket was found, the bracket with function
+            values at its ends, and the number of function evaluations taken"""
+            if not warm_start or n_iters_last <= 0:
+                return False, x_old, x_old, 0.0, 0.0, 0
+            dx_guess = dx_old * dx_ratio_last
+            guess = x_old + dx_guess
+            f_guess = minfun(guess, *args)
+            if f_guess == 0:
+                return True, guess, guess, f_guess, f_guess, 1
+            half_width = max(abs(dx_guess) / 8, rtol_x * abs(guess))
+            if f_guess > 0:
+                other = guess + half_width
+            else:
+                other = max(x_insane, guess - half_width)
+            f_other = minfun(other, *args)
+            if not f_guess * f_other < 0:
+                return False, x_old, x_old, 0.0, 0.0, 2
+            if guess < other:
+                return True, guess, other, f_guess, f_other, 2
+            return True, other, guess, f_other, f_guess, 2
+
+        return warm_start_bracket
+
     @staticmethod
     def make_calculate_ml_new(  # pylint: disable=too-many-statements,too-many-locals
         *,
@@ -369,6 +538,7 @@ class CondensationMethods(BackendMethods):
         max_iters,
         RH_rtol,
         const,
+        warm_start,
     ):
         @numba.njit(**jit_flags)
         def minfun(  # pylint: disable=too-many-arguments
@@ -385,6 +555,10 @@ class CondensationMethods(BackendMethods):
             r_dr_dt = phys_r_dr_dt(RH_eq, temperature, RH, lv, pvs, D, K)
             return x_old - x_new + timestep * dx_dt(x_new, r_dr_dt)
 
+        warm_start_bracket = CondensationMethods.make_warm_start_bracket(
+            jit_flags=jit_flags, minfun=minfun, warm_start=warm_start
+        )
+
         @numba.njit(**jit_flags)
         def calculate_ml_new(  # pylint: disable=too-many-arguments,too-many-statements,too-many-locals
             timestep,
@@ -399,6 +573,8 @@ class CondensationMethods(BackendMethods):
             cell_idx,
             kappa,
             f_org,
+            dx_ratio_last,
+            n_iters_last,
             lv,
             pvs,
             DTp,
@@ -409,6 +585,8 @@ class CondensationMethods(BackendMethods):
             n_activating = 0
             n_deactivating = 0
             n_activated_and_growing = 0
+            n_iterations = 0
+            n_solved = 0
             success = True
             lambdaK = phys_lambdaK(T, p)
             lambdaD = phys_lambdaD(DTp, T)
@@ -443,13 +621,25 @@ class CondensationMethods(BackendMethods):
                     dx_old = 0.0
                 if dx_old == 0:
                     x_new = x_old
+                    if not fake:
+                        n_iters_last[drop] = 0
                 else:
-                    a = x_old
-                    b = max(x_insane, a + dx_old)
-                    fa = minfun(a, *args)
-                    fb = minfun(b, *args)
-
+                    warm, a, b, fa, fb, iters = warm_start_bracket(
+                        args,
+                        x_old,
+                        x_insane,
+                        dx_old,
+                        dx_ratio_last[drop],
+                        n_iters_last[drop],
+                        rtol_x,
+                    )
                     counter = 0
+                    if not warm:
+                        a = x_old
+                        b = max(x_insane, a + dx_old)
+                        fa = minfun(a, *args)
+                        fb = minfun(b, *args)
+                        iters += 2
                     while not fa * fb < 0:
                         counter += 1
                         if counter > max_iters:
@@ -478,6 +668,7 @@ class CondensationMethods(BackendMethods):
                             break
                         b = max(x_insane, a + math.ldexp(dx_old, counter))
                         fb = minfun(b, *args)
+                        iters += 1
 
                     if not success:
                         break
@@ -502,8 +693,14 @@ class CondensationMethods(BackendMethods):
                                 warn("TOMS failed", __file__)
                             success = False
                             break
+                        iters += iters_taken
                     else:
-                        x_new = x_old
+                        x_new = a
+                    n_iterations += iters
+                    n_solved += 1
+                    if not fake:
+                        dx_ratio_last[drop] = (x_new - x_old) / dx_old
+                        n_iters_last[drop] = iters
 
                 v_new = volume_of_x(x_new)
                 result += n[drop] * v_new * const.rho_w
@@ -516,7 +713,330 @@ class CondensationMethods(BackendMethods):
                         n_deactivating += n[drop]
                     v[drop] = v_new
             n_ripening = n_activated_and_growing if n_deactivating > 0 else 0
-            return result, success, n_activating, n_deactivating, n_ripening
+            return (
+                result,
+                success,
+                n_activating,
+                n_deactivating,
+                n_ripening,
+                n_iterations,
+                n_solved,
+            )
+
+        return calculate_ml_new
+
+    @staticmethod
+    def make_calculate_ml_new_lane_parallel(  # pylint: disable=too-many-statements,too-many-locals
+        *,
+        jit_flags,
+        dx_dt,
+        volume_of_x,
+        x,
+        phys_r_dr_dt,
+        phys_RH_eq,
+        phys_sigma,
+        radius,
+        phys_lambdaK,
+        phys_lambdaD,
+        phys_dk_D,
+        phys_dk_K,
+        within_tolerance,
+        max_iters,
+        RH_rtol,
+        const,
+        warm_start,
+    ):
+        """variant of `make_calculate_ml_new()` in which all super-droplets in a cell
+        are advanced together: the implicit-scheme roots are bracketed and then sought
+        with Anderson-Bjorck regula falsi iterations, each iteration being a single
+        branch-light pass over arrays of droplets ("lanes") with lanes that are already
+        bracketed (or converged) masked out; the passes are run in parallel if compiled
+        with `jit_flags["parallel"]` (i.e., for single-cell runs); roots agree with those
+        of the droplet-by-droplet TOMS748 loop to within `rtol_x`"""
+
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def minfun(  # pylint: disable=too-many-arguments
+            x_new, x_old, timestep, kappa, f_org, rd3, temperature, RH, lv, pvs, D, K
+        ):
+            volume = volume_of_x(x_new)
+            RH_eq = phys_RH_eq(
+                radius(volume),
+                temperature,
+                kappa,
+                rd3,
+                phys_sigma(temperature, volume, const.PI_4_3 * rd3, f_org),
+            )
+            r_dr_dt = phys_r_dr_dt(RH_eq, temperature, RH, lv, pvs, D, K)
+            return x_old - x_new + timestep * dx_dt(x_new, r_dr_dt)
+
+        warm_start_bracket = CondensationMethods.make_warm_start_bracket(
+            jit_flags=jit_flags, minfun=minfun, warm_start=warm_start
+        )
+
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def bracket_collapsed(a, b, fa, fb, rtol):
+            return (
+                within_tolerance(abs(b - a), min(abs(a), abs(b)), rtol)
+                or fa == 0
+                or fb == 0
+            )
+
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def root_in_bracket(a, b, fa, fb):
+            if fa == 0:
+                return a
+            if fb == 0:
+                return b
+            return (a + b) / 2
+
+        # lane states and rows of the per-lane work array
+        idle, bracketing, iterating, failed = 0, 1, 2, 3
+        x_old, x_new, rd3, Dr, Kr, dx_old, a, b, fa, fb = range(10)
+
+        @numba.njit(**jit_flags)
+        def calculate_ml_new(  # pylint: disable=too-many-arguments,too-many-statements,too-many-locals
+            timestep,
+            fake,
+            T,
+            p,
+            RH,
+            v,
+            v_cr,
+            n,
+            vdry,
+            cell_idx,
+            kappa,
+            f_org,
+            dx_ratio_last,
+            n_iters_last,
+            lv,
+            pvs,
+            DTp,
+            KTp,
+            rtol_x,
+        ):  # pylint: disable=too-many-branches
+            n_sd = len(cell_idx)
+            lambdaK = phys_lambdaK(T, p)
+            lambdaD = phys_lambdaD(DTp, T)
+
+            lane = np.empty((10, n_sd))
+            state = np.full(n_sd, idle, dtype=np.int8)
+            side = np.zeros(n_sd, dtype=np.int8)
+            iters = np.zeros(n_sd, dtype=np.int64)
+
+            # pylint: disable=not-an-iterable
+            for i in numba.prange(n_sd):
+                drop = cell_idx[i]
+                if v[drop] < 0:
+                    continue
+                lane[x_old, i] = x(v[drop])
+                lane[x_new, i] = lane[x_old, i]
+                lane[dx_old, i] = 0
+                r_old = radius(v[drop])
+                lane[rd3, i] = vdry[drop] / const.PI_4_3
+                sgm = phys_sigma(T, v[drop], vdry[drop], f_org[drop])
+                RH_eq = phys_RH_eq(r_old, T, kappa[drop], lane[rd3, i], sgm)
+                if within_tolerance(np.abs(RH - RH_eq), RH, RH_rtol):
+                    continue
+                lane[Dr, i] = phys_dk_D(DTp, r_old, lambdaD)
+                lane[Kr, i] = phys_dk_K(KTp, r_old, lambdaK)
+                lane[dx_old, i] = timestep * dx_dt(
+                    lane[x_old, i],
+                    phys_r_dr_dt(RH_eq, T, RH, lv, pvs, lane[Dr, i], lane[Kr, i]),
+                )
+                if lane[dx_old, i] == 0:
+                    continue
+                args = (
+                    lane[x_old, i],
+                    timestep,
+                    kappa[drop],
+                    f_org[drop],
+                    lane[rd3, i],
+                    T,
+                    RH,
+                    lv,
+                    pvs,
+                    lane[Dr, i],
+                    lane[Kr, i],
+                )
+                warm, lo, hi, f_lo, f_hi, n_evals = warm_start_bracket(
+                    args,
+                    lane[x_old, i],
+                    x(vdry[drop] / 100),
+                    lane[dx_old, i],
+                    dx_ratio_last[drop],
+                    n_iters_last[drop],
+                    rtol_x,
+                )
+                iters[i] = n_evals
+                if not warm:
+                    lo = lane[x_old, i]
+                    hi = max(x(vdry[drop] / 100), lo + lane[dx_old, i])
+                    f_lo = minfun(lo, *args)
+                    f_hi = minfun(hi, *args)
+                    iters[i] += 2
+                elif lo == hi:
+                    lane[x_new, i] = lo
+                    continue
+                lane[a, i], lane[b, i], lane[fa, i], lane[fb, i] = lo, hi, f_lo, f_hi
+                state[i] = iterating if f_lo * f_hi < 0 else bracketing
+
+            for counter in range(1, max_iters + 2):
+                n_bracketing = 0
+                for i in numba.prange(n_sd):
+                    if state[i] != bracketing:
+                        continue
+                    if counter > max_iters:
+                        state[i] = failed
+                        continue
+                    drop = cell_idx[i]
+                    lane[b, i] = max(
+                        x(vdry[drop] / 100),
+                        lane[a, i] + math.ldexp(lane[dx_old, i], counter),
+                    )
+                    lane[fb, i] = minfun(
+                        lane[b, i],
+                        lane[x_old, i],
+                        timestep,
+                        kappa[drop],
+                        f_org[drop],
+                        lane[rd3, i],
+                        T,
+                        RH,
+                        lv,
+                        pvs,
+                        lane[Dr, i],
+                        lane[Kr, i],
+                    )
+                    iters[i] += 1
+                    if lane[fa, i] * lane[fb, i] < 0:
+                        state[i] = iterating
+                    else:
+                        n_bracketing += 1
+                if n_bracketing == 0:
+                    break
+
+            n_iterating = 0
+            for i in numba.prange(n_sd):
+                if state[i] != iterating:
+                    continue
+                if lane[a, i] > lane[b, i]:
+                    lane[a, i], lane[b, i] = lane[b, i], lane[a, i]
+                    lane[fa, i], lane[fb, i] = lane[fb, i], lane[fa, i]
+                if bracket_collapsed(
+                    lane[a, i], lane[b, i], lane[fa, i], lane[fb, i], rtol_x
+                ):
+                    lane[x_new, i] = root_in_bracket(
+                        lane[a, i], lane[b, i], lane[fa, i], lane[fb, i]
+                    )
+                    state[i] = idle
+                else:
+                    n_iterating += 1
+
+            for _ in range(max_iters):
+                if n_iterating == 0:
+                    break
+                n_iterating = 0
+                for i in numba.prange(n_sd):
+                    if state[i] != iterating:
+                        continue
+                    c = (lane[a, i] * lane[fb, i] - lane[b, i] * lane[fa, i]) / (
+                        lane[fb, i] - lane[fa, i]
+                    )
+                    if not lane[a, i] < c < lane[b, i]:
+                        c = (lane[a, i] + lane[b, i]) / 2
+                    # minimal step (as in Brent's method) lets the bracket collapse
+                    #  once one of its ends is close to the root
+                    min_step = rtol_x * min(abs(lane[a, i]), abs(lane[b, i])) / 2
+                    c = min(max(c, lane[a, i] + min_step), lane[b, i] - min_step)
+                    drop = cell_idx[i]
+                    fc = minfun(
+                        c,
+                        lane[x_old, i],
+                        timestep,
+                        kappa[drop],
+                        f_org[drop],
+                        lane[rd3, i],
+                        T,
+                        RH,
+                        lv,
+                        pvs,
+                        lane[Dr, i],
+                        lane[Kr, i],
+                    )
+                    iters[i] += 1
+                    # Anderson-Bjorck scaling of the retained end
+                    if fc * lane[fa, i] > 0:
+                        if side[i] == -1:
+                            scale = 1 - fc / lane[fa, i]
+                            lane[fb, i] *= scale if scale > 0 else 0.5
+                        lane[a, i], lane[fa, i] = c, fc
+                        side[i] = -1
+                    else:
+                        if side[i] == 1:
+                            scale = 1 - fc / lane[fb, i]
+                            lane[fa, i] *= scale if scale > 0 else 0.5
+                        lane[b, i], lane[fb, i] = c, fc
+                        side[i] = 1
+                    if bracket_collapsed(
+                        lane[a, i], lane[b, i], lane[fa, i], lane[fb, i], rtol_x
+                    ):
+                        lane[x_new, i] = root_in_bracket(
+                            lane[a, i], lane[b, i], lane[fa, i], lane[fb, i]
+                        )
+                        state[i] = idle
+                    else:
+                        n_iterating += 1
+
+            n_failed = 0
+            for i in numba.prange(n_sd):
+                if state[i] != idle:
+                    n_failed += 1
+            if n_failed > 0:
+                if not fake:
+                    warn("lane-parallel solver failed to converge", __file__)
+                return 0.0, False, 0, 0, 0, 0, 0
+
+            result = 0.0
+            n_activating = 0
+            n_deactivating = 0
+            n_activated_and_growing = 0
+            n_iterations = 0
+            n_solved = 0
+            for i in numba.prange(n_sd):
+                drop = cell_idx[i]
+                if v[drop] < 0:
+                    continue
+                v_new = volume_of_x(lane[x_new, i])
+                result += n[drop] * v_new * const.rho_w
+                if lane[dx_old, i] != 0:
+                    n_iterations += iters[i]
+                    n_solved += 1
+                if not fake:
+                    if lane[dx_old, i] != 0:
+                        dx_ratio_last[drop] = (lane[x_new, i] - lane[x_old, i]) / lane[
+                            dx_old, i
+                        ]
+                        n_iters_last[drop] = iters[i]
+                    else:
+                        n_iters_last[drop] = 0
+                    if v_new > v_cr[drop] and v_new > v[drop]:
+                        n_activated_and_growing += n[drop]
+                    if v_new > v_cr[drop] > v[drop]:
+                        n_activating += n[drop]
+                    if v_new < v_cr[drop] < v[drop]:
+                        n_deactivating += n[drop]
+                    v[drop] = v_new
+            n_ripening = n_activated_and_growing if n_deactivating > 0 else 0
+            return (
+                result,
+                True,
+                n_activating,
+                n_deactivating,
+                n_ripening,
+                n_iterations,
+                n_solved,
+            )
 
         return calculate_ml_new
 
@@ -532,8 +1052,11 @@ class CondensationMethods(BackendMethods):
         multiplier,
         RH_rtol,
         max_iters,
+        lane_parallel=False,
+        warm_start=False,
+        predict_substeps=False,
     ):
-        return CondensationMethods.make_condensation_solver_impl(
+        solver = CondensationMethods.make_condensation_solver_impl(
             fastmath=self.formulae.fastmath,
             phys_pvs_C=self.formulae.saturation_vapour_pressure.pvs_Celsius,
             phys_lv=self.formulae.latent_heat.lv,
@@ -563,7 +1086,13 @@ class CondensationMethods(BackendMethods):
             RH_rtol=RH_rtol,
             max_iters=max_iters,
             const=self.formulae.constants,
+            lane_parallel=lane_parallel,
+            # threads are used within a cell only if there is no parallelism over cells
+            lane_threads=lane_parallel and n_cell == 1,
+            warm_start=warm_start,
+            predict=predict_substeps,
         )
+        return jit_cache.enable(solver)
 
     @staticmethod
     @lru_cache()
@@ -598,6 +1127,10 @@ class CondensationMethods(BackendMethods):
         RH_rtol,
         max_iters,
         const,
+        lane_parallel,
+        lane_threads,
+        warm_start,
+        predict,
     ):
         # pylint: disable=too-many-locals
         jit_flags = {
@@ -606,8 +1139,15 @@ class CondensationMethods(BackendMethods):
         }
 
         calculate_ml_old = CondensationMethods.make_calculate_ml_old(jit_flags, const)
-        calculate_ml_new = CondensationMethods.make_calculate_ml_new(
-            jit_flags=jit_flags,
+        calculate_ml_new = (
+            CondensationMethods.make_calculate_ml_new_lane_parallel
+            if lane_parallel
+            else CondensationMethods.make_calculate_ml_new
+        )(
+            jit_flags={
+                **jit_flags,
+                "parallel": lane_threads and conf.JIT_FLAGS["parallel"],
+            },
             dx_dt=dx_dt,
             volume_of_x=volume,
             x=x,
@@ -623,6 +1163,7 @@ class CondensationMethods(BackendMethods):
             max_iters=max_iters,
             RH_rtol=RH_rtol,
             const=const,
+            warm_start=warm_start,
         )
         step_impl = CondensationMethods.make_step_impl(
             jit_flags=jit_flags,
@@ -648,6 +1189,11 @@ class CondensationMethods(BackendMethods):
             multiplier=multiplier,
             within_tolerance=within_tolerance,
         )
+        predict_substeps = CondensationMethods.make_predict_substeps(
+            jit_flags=jit_flags,
+            timestep=timestep,
+            dt_range=dt_range,
+        )
         step = CondensationMethods.make_step(jit_flags, step_impl)
 
         @numba.njit(**jit_flags)
@@ -659,6 +1205,8 @@ class CondensationMethods(BackendMethods):
             cell_idx,
             kappa,
             f_org,
+            dx_ratio_last,
+            n_iters_last,
             thd,
             qv,
             dthd_dt,
@@ -669,6 +1217,8 @@ class CondensationMethods(BackendMethods):
             rtol_thd,
             timestep,
             n_substeps,
+            substep_history,
+            cell_id,
         ):
             args = (
                 v,
@@ -678,6 +1228,8 @@ class CondensationMethods(BackendMethods):
                 cell_idx,
                 kappa,
                 f_org,
+                dx_ratio_last,
+                n_iters_last,
                 thd,
                 qv,
                 dthd_dt,
@@ -688,7 +1240,41 @@ class CondensationMethods(BackendMethods):
             )
             success = True
             if adaptive:
-                n_substeps, success = adapt_substeps(args, n_substeps, thd, rtol_thd)
+                (
+                    error_ratio,
+                    error_ratio_prev,
+                    n_substeps_last,
+                    dthd_dt_last,
+                    dqv_dt_last,
+                    n_predicted,
+                ) = substep_history
+                n_substeps_predicted = (
+                    predict_substeps(
+                        dthd_dt,
+                        dqv_dt,
+                        n_substeps_last[cell_id],
+                        error_ratio[cell_id],
+                        error_ratio_prev[cell_id],
+                        dthd_dt_last[cell_id],
+                        dqv_dt_last[cell_id],
+                        n_predicted[cell_id],
+                    )
+                    if predict
+                    else 0
+                )
+                if n_substeps_predicted > 0:
+                    n_substeps = n_substeps_predicted
+                    n_predicted[cell_id] += 1
+                else:
+                    n_substeps, success, error_ratio_new = adapt_substeps(
+                        args, n_substeps, thd, rtol_thd
+                    )
+                    error_ratio_prev[cell_id] = error_ratio[cell_id]
+                    error_ratio[cell_id] = error_ratio_new
+                    n_substeps_last[cell_id] = n_substeps
+                    dthd_dt_last[cell_id] = dthd_dt
+                    dqv_dt_last[cell_id] = dqv_dt
+                    n_predicted[cell_id] = 0
             if success:
                 (
                     qv,
@@ -698,9 +1284,11 @@ class CondensationMethods(BackendMethods):
                     n_ripening,
                     RH_max,
                     success,
+                    mean_iterations,
                 ) = step(args, timestep, n_substeps)
             else:
                 n_activating, n_deactivating, n_ripening, RH_max = -1, -1, -1, -1
+                mean_iterations = -1.0
             return (
                 success,
                 qv,
@@ -710,6 +1298,7 @@ class CondensationMethods(BackendMethods):
                 n_deactivating,
                 n_ripening,
                 RH_max,
+                mean_iterations,
             )
 
         return solve
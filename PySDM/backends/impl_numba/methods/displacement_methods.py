@@ -2,6 +2,7 @@
 CPU implementation of backend methods for particle displacement (advection and sedimentation)
 """
 import numba
+import numpy as np
 
 from PySDM.backends.impl_numba import conf
 
@@ -21,6 +22,76 @@ def calculate_displacement_body_common(
 
 
 class DisplacementMethods(BackendMethods):
+    def __init__(self):
+        BackendMethods.__init__(self)
+        scheme = self.formulae.particle_advection.displacement
+
+        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+        def displacement_with_local_substeps_body(
+            courant,
+            courant_strides,
+            grid,
+            cell_origin,
+            position_in_cell,
+            displacement,
+            idx,
+            length,
+            cell_id,
+            n_substeps_field,
+            n_substeps,
+            enable_sedimentation,
+            terminal_velocity,
+            dt_over_dz,
+            precipitation_counting_level_index,
+        ):
+            n_dims = len(courant)
+            for i in numba.prange(length):  # pylint: disable=not-an-iterable
+                droplet = idx[i]
+                n = n_substeps_field[cell_id[droplet]]
+                sedimentation_courant = 0.0
+                if enable_sedimentation:
+                    sedimentation_courant = terminal_velocity[droplet] * dt_over_dz
+                    n = max(n, int(np.ceil(abs(sedimentation_courant))))
+                n_substeps[droplet] = n
+                for _ in range(n):
+                    for dim in range(n_dims):
+                        # Arakawa-C grid
+                        _l = 0
+                        for k in range(n_dims):
+                            _l += cell_origin[k, droplet] * courant_strides[dim, k]
+                        _r = _l + courant_strides[dim, dim]
+                        displacement[dim, droplet] = scheme(
+                            position_in_cell[dim, droplet],
+                            courant[dim][_l] / n,
+                            courant[dim][_r] / n,
+                        )
+                    displacement[n_dims - 1, droplet] -= sedimentation_courant / n
+                    for dim in range(n_dims):
+                        position_in_cell[dim, droplet] += displacement[dim, droplet]
+                    position_within_column = (
+                        cell_origin[n_dims - 1, droplet]
+                        + position_in_cell[n_dims - 1, droplet]
+                    )
+                    if (
+                        position_within_column < 0
+                        or position_within_column > grid[n_dims - 1]
+                        or enable_sedimentation
+                        and displacement[n_dims - 1, droplet] < 0
+                        and position_within_column < precipitation_counting_level_index
+                    ):
+                        break  # left for flag_precipitated() & flag_out_of_column()
+                    for dim in range(n_dims):
+                        floor_of_position = np.floor(position_in_cell[dim, droplet])
+                        position_in_cell[dim, droplet] -= floor_of_position
+                        cell_origin[dim, droplet] = (
+                            cell_origin[dim, droplet] + int(floor_of_position)
+                        ) % grid[dim]
+
+        self.displacement_with_local_substeps_body = (
+            displacement_with_local_substeps_body
+        )
+
     @staticmethod
     @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
     # pylint: disable=too-many-arguments
@@ -142,6 +213,54 @@ class DisplacementMethods(BackendMethods):
         else:
             raise NotImplementedError()
 
+    # pylint: disable=too-many-arguments
+    def displacement_with_local_substeps(
+        self,
+        *,
+        courant,
+        grid,
+        cell_origin,
+        position_in_cell,
+        displacement,
+        idx,
+        length,
+        cell_id,
+        n_substeps_field,
+        n_substeps,
+        enable_sedimentation,
+        terminal_velocity,
+        dt_over_dz,
+        precipitation_counting_level_index,
+    ):
+        """advects (and sediments) each super-droplet with its own number of substeps
+        (`n_substeps_field` value for the cell it starts in, increased so that
+        the sedimentation Courant number per substep does not exceed one), storing
+        the counts in `n_substeps`; droplets leaving the column or crossing
+        the precipitation-counting level stop there (to be flagged subsequently)"""
+        self.displacement_with_local_substeps_body(
+            tuple(component.data.reshape(-1) for component in courant),
+            np.array(
+                [
+                    np.array(component.data.strides) // component.data.itemsize
+                    for component in courant
+                ],
+                dtype=np.int64,
+            ),
+            grid.data,
+            cell_origin.data,
+            position_in_cell.data,
+            displacement.data,
+            idx.data,
+            length,
+            cell_id.data,
+            n_substeps_field.data,
+            n_substeps.data,
+            enable_sedimentation,
+            terminal_velocity.data,
+            dt_over_dz,
+            precipitation_counting_level_index,
+        )
+
     @staticmethod
     @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
     # pylint: disable=too-many-arguments
@@ -38,7 +38,7 @@ class FreezingMethods(BackendMethods):
 
         @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
         def freeze_singular_body(
-            attributes, temperature, relative_humidity, cell, thaw
+            attributes, temperature, relative_humidity, cell, thaw, droplet_epoch, epoch
         ):
             n_sd = len(attributes.freezing_temperature)
             for i in numba.prange(n_sd):  # pylint: disable=not-an-iterable
@@ -48,6 +48,8 @@ class FreezingMethods(BackendMethods):
                     attributes.wet_volume[i], temperature[cell[i]]
                 ):
                     _thaw(attributes.wet_volume, i)
+                    if epoch > 0:
+                        droplet_epoch[i] = epoch
                 elif (
                     unfrozen_and_saturated(
                         attributes.wet_volume[i], relative_humidity[cell[i]]
@@ -55,6 +57,8 @@ class FreezingMethods(BackendMethods):
                     and temperature[cell[i]] <= attributes.freezing_temperature[i]
                 ):
                     _freeze(attributes.wet_volume, i)
+                    if epoch > 0:
+                        droplet_epoch[i] = epoch
 
         self.freeze_singular_body = freeze_singular_body
 
@@ -72,7 +76,10 @@ class FreezingMethods(BackendMethods):
             record_freezing_temperature,
             freezing_temperature,
             thaw,
+            droplet_epoch,
+            epoch,
         ):
+            # pylint: disable=too-many-locals
             n_sd = len(attributes.wet_volume)
             for i in numba.prange(n_sd):  # pylint: disable=not-an-iterable
                 if attributes.immersed_surface_area[i] == 0:
@@ -82,6 +89,8 @@ class FreezingMethods(BackendMethods):
                     attributes.wet_volume[i], temperature[cell_id]
                 ):
                     _thaw(attributes.wet_volume, i)
+                    if epoch > 0:
+                        droplet_epoch[i] = epoch
                 elif unfrozen_and_saturated(
                     attributes.wet_volume[i], relative_humidity[cell_id]
                 ):
@@ -92,14 +101,32 @@ class FreezingMethods(BackendMethods):
                     )
                     if rand[i] < prob:
                         _freeze(attributes.wet_volume, i)
+                        if epoch > 0:
+                            droplet_epoch[i] = epoch
                         # if record_freezing_temperature:
                         #     freezing_temperature[i] = temperature[cell_id]
 
         self.freeze_time_dependent_body = freeze_time_dependent_body
 
+    @staticmethod
+    def __droplet_epoch_data(droplet_epoch):
+        if droplet_epoch is None:
+            return np.empty(0, dtype=np.int64)
+        return droplet_epoch.data
+
     def freeze_singular(
-        self, *, attributes, temperature, relative_humidity, cell, thaw: bool
+        self,
+        *,
+        attributes,
+        temperature,
+        relative_humidity,
+        cell,
+        thaw: bool,
+        droplet_epoch=None,
+        epoch=0,
     ):
+        """if `epoch` is non-zero, stamps modified droplets in `droplet_epoch`
+        (see `PySDM.impl.change_tracker.ChangeTracker`)"""
         self.freeze_singular_body(
             SingularAttributes(
                 freezing_temperature=attributes.freezing_temperature.data,
@@ -109,6 +136,8 @@ class FreezingMethods(BackendMethods):
             relative_humidity.data,
             cell.data,
             thaw=thaw,
+            droplet_epoch=self.__droplet_epoch_data(droplet_epoch),
+            epoch=epoch,
         )
 
     def freeze_time_dependent(
@@ -123,7 +152,9 @@ class FreezingMethods(BackendMethods):
         relative_humidity,
         record_freezing_temperature,
         freezing_temperature,
-        thaw: bool
+        thaw: bool,
+        droplet_epoch=None,
+        epoch=0,
     ):
         self.freeze_time_dependent_body(
             rand.data,
@@ -141,4 +172,6 @@ class FreezingMethods(BackendMethods):
                 freezing_temperature.data if record_freezing_temperature else None
             ),
             thaw=thaw,
+            droplet_epoch=self.__droplet_epoch_data(droplet_epoch),
+            epoch=epoch,
         )
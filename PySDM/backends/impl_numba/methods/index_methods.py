@@ -2,6 +2,7 @@
 CPU implementation of shuffling and sorting backend methods
 """
 import numba
+import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
 from PySDM.backends.impl_numba import conf
@@ -29,6 +30,23 @@ class IndexMethods(BackendMethods):
                 j = int(cell_start[c] + u01[i] * (cell_start[c + 1] - cell_start[c]))
                 idx[i], idx[j] = idx[j], idx[i]
 
+    @staticmethod
+    @numba.njit(**conf.JIT_FLAGS)
+    def _permute_in_place(data, tmp, permutation, length):
+        for row in range(data.shape[0]):
+            tmp[:] = data[row, :]
+            for i in numba.prange(length):  # pylint: disable=not-an-iterable
+                data[row, i] = tmp[permutation[i]]
+
+    @staticmethod
+    def permute_in_place(data, permutation, length):
+        """reorders `data` (along the last dimension) so that, for `i < length`,
+        `data[..., i]` becomes the former `data[..., permutation[i]]`"""
+        array = data.data.reshape(-1, data.data.shape[-1])
+        IndexMethods._permute_in_place(
+            array, np.empty(array.shape[1], dtype=array.dtype), permutation.data, length
+        )
+
     @staticmethod
     def sort_by_key(idx, attr):
         idx.data[:] = attr.data.argsort(kind="stable")[::-1]
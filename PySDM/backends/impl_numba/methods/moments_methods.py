@@ -2,12 +2,44 @@
 CPU implementation of moment calculation backend methods
 """
 import numba
+import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_common.bin_lookup import BISECTION, LINEAR_SCAN, LOGARITHMIC
 from PySDM.backends.impl_numba import conf
 from PySDM.backends.impl_numba.atomic_operations import atomic_add
 
 
+@numba.njit(**{**conf.JIT_FLAGS, "parallel": False})
+def bin_index(x, x_bins, scheme, origin, inverse_width):
+    """returns the index k of the bin for which `x_bins[k] <= x < x_bins[k+1]`
+    or -1 if there is no such bin, see `PySDM.backends.impl_common.bin_lookup`"""
+    n_bins = x_bins.shape[0] - 1
+    if scheme == LINEAR_SCAN:
+        for k in range(n_bins):
+            if x_bins[k] <= x < x_bins[k + 1]:
+                return k
+        return -1
+    if not x_bins[0] <= x < x_bins[n_bins]:
+        return -1
+    if scheme == BISECTION:
+        low, high = 0, n_bins
+        while high - low > 1:
+            mid = (low + high) // 2
+            if x < x_bins[mid]:
+                high = mid
+            else:
+                low = mid
+        return low
+    y = np.log(x) if scheme == LOGARITHMIC else x
+    k = min(max(int((y - origin) * inverse_width), 0), n_bins - 1)
+    while x < x_bins[k]:
+        k -= 1
+    while x >= x_bins[k + 1]:
+        k += 1
+    return k
+
+
 class MomentsMethods(BackendMethods):
     @staticmethod
     @numba.njit(**conf.JIT_FLAGS)
@@ -91,6 +123,110 @@ class MomentsMethods(BackendMethods):
             skip_division_by_m0=skip_division_by_m0,
         )
 
+    @staticmethod
+    @numba.njit(**conf.JIT_FLAGS)
+    def fused_moments_body(
+        *,
+        moment_0,
+        moments,
+        multiplicity,
+        attributes,
+        cell_id,
+        idx,
+        length,
+        attr_index,
+        ranks,
+        x_index,
+        min_x,
+        max_x,
+        weighting_index,
+        weighting_ranks,
+        skip_division_by_m0,
+    ):
+        # pylint: disable=too-many-locals
+        moment_0[:, :] = 0
+        moments[:, :] = 0
+        for idx_i in numba.prange(length):  # pylint: disable=not-an-iterable
+            i = idx[idx_i]
+            for k in range(ranks.shape[0]):
+                if min_x[k] <= attributes[x_index[k]][i] < max_x[k]:
+                    weight = (
+                        multiplicity[i]
+                        * attributes[weighting_index[k]][i] ** weighting_ranks[k]
+                    )
+                    atomic_add(moment_0, (k, cell_id[i]), weight)
+                    atomic_add(
+                        moments,
+                        (k, cell_id[i]),
+                        weight * attributes[attr_index[k]][i] ** ranks[k],
+                    )
+        for k in range(ranks.shape[0]):
+            if not skip_division_by_m0[k]:
+                for c_id in range(moment_0.shape[1]):
+                    moments[k, c_id] = (
+                        moments[k, c_id] / moment_0[k, c_id]
+                        if moment_0[k, c_id] != 0
+                        else 0
+                    )
+
+    def fused_moments(  # pylint: disable=too-many-locals
+        self,
+        *,
+        moment_0,
+        moments,
+        multiplicity,
+        attributes,
+        cell_id,
+        idx,
+        length,
+        attr_index,
+        ranks,
+        x_index,
+        min_x,
+        max_x,
+        weighting_index,
+        weighting_ranks,
+        skip_division_by_m0,
+    ):
+        assert moment_0.shape == moments.shape
+        assert moments.shape[0] == ranks.shape[0]
+        if len({numba.typeof(attr.data) for attr in attributes}) != 1:
+            for k in range(ranks.shape[0]):
+                self.moments(
+                    moment_0=moment_0[k, :],
+                    moments=moments[k : k + 1],
+                    multiplicity=multiplicity,
+                    attr_data=attributes[attr_index[k]],
+                    cell_id=cell_id,
+                    idx=idx,
+                    length=length,
+                    ranks=self.Storage.from_ndarray(ranks[k : k + 1]),
+                    min_x=min_x[k],
+                    max_x=max_x[k],
+                    x_attr=attributes[x_index[k]],
+                    weighting_attribute=attributes[weighting_index[k]],
+                    weighting_rank=weighting_ranks[k],
+                    skip_division_by_m0=skip_division_by_m0[k],
+                )
+            return
+        MomentsMethods.fused_moments_body(
+            moment_0=moment_0.data,
+            moments=moments.data,
+            multiplicity=multiplicity.data,
+            attributes=tuple(attr.data for attr in attributes),
+            cell_id=cell_id.data,
+            idx=idx.data,
+            length=length,
+            attr_index=attr_index,
+            ranks=ranks,
+            x_index=x_index,
+            min_x=min_x,
+            max_x=max_x,
+            weighting_index=weighting_index,
+            weighting_ranks=weighting_ranks,
+            skip_division_by_m0=skip_division_by_m0,
+        )
+
     @staticmethod
     @numba.njit(**conf.JIT_FLAGS)
     def spectrum_moments_body(
@@ -102,41 +238,44 @@ class MomentsMethods(BackendMethods):
         cell_id,
         idx,
         length,
-        rank,
+        ranks,
         x_bins,
+        x_bins_lookup,
         x_attr,
         weighting_attribute,
         weighting_rank,
     ):
         # pylint: disable=too-many-locals
+        n_bins = x_bins.shape[0] - 1
         moment_0[:, :] = 0
         moments[:, :] = 0
         for idx_i in numba.prange(length):  # pylint: disable=not-an-iterable
             i = idx[idx_i]
-            for k in range(x_bins.shape[0] - 1):
-                if x_bins[k] <= x_attr[i] < x_bins[k + 1]:
-                    atomic_add(
-                        moment_0,
-                        (k, cell_id[i]),
-                        multiplicity[i] * weighting_attribute[i] ** weighting_rank,
-                    )
+            k = bin_index(x_attr[i], x_bins, *x_bins_lookup)
+            if k != -1:
+                atomic_add(
+                    moment_0,
+                    (k, cell_id[i]),
+                    multiplicity[i] * weighting_attribute[i] ** weighting_rank,
+                )
+                for r in range(ranks.shape[0]):
                     atomic_add(
                         moments,
-                        (k, cell_id[i]),
+                        (r * n_bins + k, cell_id[i]),
                         (
                             multiplicity[i]
                             * weighting_attribute[i] ** weighting_rank
-                            * attr_data[i] ** rank
+                            * attr_data[i] ** ranks[r]
                         ),
                     )
-                    break
         for c_id in range(moment_0.shape[1]):
-            for k in range(x_bins.shape[0] - 1):
-                moments[k, c_id] = (
-                    moments[k, c_id] / moment_0[k, c_id]
-                    if moment_0[k, c_id] != 0
-                    else 0
-                )
+            for k in range(n_bins):
+                for r in range(ranks.shape[0]):
+                    moments[r * n_bins + k, c_id] = (
+                        moments[r * n_bins + k, c_id] / moment_0[k, c_id]
+                        if moment_0[k, c_id] != 0
+                        else 0
+                    )
 
     @staticmethod
     def spectrum_moments(
@@ -148,14 +287,18 @@ class MomentsMethods(BackendMethods):
         cell_id,
         idx,
         length,
-        rank,
+        ranks,
         x_bins,
+        x_bins_lookup,
         x_attr,
         weighting_attribute,
         weighting_rank,
     ):
-        assert moments.shape[0] == x_bins.shape[0] - 1
-        assert moment_0.shape == moments.shape
+        assert moment_0.shape[0] == x_bins.shape[0] - 1
+        assert moments.shape == (
+            ranks.shape[0] * moment_0.shape[0],
+            moment_0.shape[1],
+        )
         return MomentsMethods.spectrum_moments_body(
             moment_0=moment_0.data,
             moments=moments.data,
@@ -164,8 +307,13 @@ class MomentsMethods(BackendMethods):
             cell_id=cell_id.data,
             idx=idx.data,
             length=length,
-            rank=rank,
+            ranks=ranks.data,
             x_bins=x_bins.data,
+            x_bins_lookup=(
+                int(x_bins_lookup[0]),
+                float(x_bins_lookup[1]),
+                float(x_bins_lookup[2]),
+            ),
             x_attr=x_attr.data,
             weighting_attribute=weighting_attribute.data,
             weighting_rank=weighting_rank,
@@ -5,10 +5,22 @@ import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
+
+PAIRWISE_PIPELINE_SYNTAX = {
+    "sum": "({a} + {b})",
+    "max": "max({a}, {b})",
+    "min": "min({a}, {b})",
+    "distance": "abs({a} - {b})",
+    "multiply": "({a} * {b})",
+    "power": "({0} ** {1})",
+    "divide_if_not_zero": "(({0} / {1}) if {1} != 0 else {0})",
+}
 
 
 class PairMethods(BackendMethods):
+    _pairwise_pipeline_bodies = {}
+
     @staticmethod
     @numba.njit(**conf.JIT_FLAGS)
     def distance_pair_body(data_out, data_in, is_first_in_pair, idx, length):
@@ -155,3 +167,125 @@ class PairMethods(BackendMethods):
             idx.data,
             len(idx),
         )
+
+    @staticmethod
+    @numba.njit(**conf.JIT_FLAGS)
+    # pylint: disable=too-many-arguments,too-many-locals
+    def interpolate_pair_table_body(
+        data_out,
+        table,
+        size,
+        log_x_min,
+        d_log_x,
+        data_in,
+        is_first_in_pair,
+        idx,
+        length,
+    ):
+        data_out[:] = 0
+        x_min = np.exp(log_x_min)
+        for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
+            if is_first_in_pair[i]:
+                x_hi = max(data_in[idx[i]], data_in[idx[i + 1]], x_min)
+                x_lo = max(min(data_in[idx[i]], data_in[idx[i + 1]]), x_min)
+                f_hi = min((np.log(x_hi) - log_x_min) / d_log_x, size - 1)
+                f_lo = min((np.log(x_lo) - log_x_min) / d_log_x, size - 1)
+                j_hi = min(int(f_hi), size - 2)
+                j_lo = min(int(f_lo), size - 2)
+                t_hi = f_hi - j_hi
+                t_lo = f_lo - j_lo
+                k = j_hi * size + j_lo
+                if j_hi == j_lo:  # linear within the lower triangle of a diagonal cell
+                    data_out[i // 2] = (
+                        table[k]
+                        + t_hi * (table[k + size] - table[k])
+                        + t_lo * (table[k + size + 1] - table[k + size])
+                    )
+                else:
+                    data_out[i // 2] = (1 - t_hi) * (
+                        (1 - t_lo) * table[k] + t_lo * table[k + 1]
+                    ) + t_hi * (
+                        (1 - t_lo) * table[k + size] + t_lo * table[k + size + 1]
+                    )
+
+    @staticmethod
+    # pylint: disable=too-many-arguments
+    def interpolate_pair_table(
+        *, output, table, log_x_range, data_in, is_first_in_pair
+    ):
+        """bilinear interpolation (in logarithms of the larger and of the smaller
+        value in a pair) from a square table of a symmetric function defined on
+        a uniform grid spanning `log_x_range` (values outside are clamped)"""
+        size = int(np.sqrt(len(table)))
+        return PairMethods.interpolate_pair_table_body(
+            output.data,
+            table.data,
+            size,
+            log_x_range[0],
+            (log_x_range[1] - log_x_range[0]) / (size - 1),
+            data_in.data,
+            is_first_in_pair.indicator.data,
+            data_in.idx.data,
+            len(data_in.idx),
+        )
+
+    @staticmethod
+    def _make_pairwise_pipeline_body(pipeline):
+        """generates and JIT-compiles a loop over output slots evaluating all
+        expressions of the pipeline for the pair (if any) associated with a slot"""
+        parameters = ", ".join(
+            ("is_first_in_pair", "idx", "length") + pipeline.parameters()
+        )
+        statements = pipeline.statements(PAIRWISE_PIPELINE_SYNTAX)
+        zeros = [
+            f"{output} = 0" for output, _ in statements[len(pipeline.expressions) :]
+        ]
+        newline = "\n" + 12 * " "
+        assignments = newline.join(f"{var} = {value}" for var, value in statements)
+        source = f"""
+def pairwise_pipeline_body({parameters}):
+    for s in numba.prange(out_0.shape[0]):
+        j = 2 * s
+        if j + 1 < length and is_first_in_pair[j]:
+            {assignments}
+        elif j + 2 < length and is_first_in_pair[j + 1]:
+            j += 1
+            {assignments}
+        else:
+            {newline.join(zeros)}
+"""
+        namespace = {"numba": numba, "np": np}
+        if jit_cache.enabled():
+            namespace = jit_cache.exec_source(
+                source, comment="pairwise pipeline", namespace=namespace
+            )
+        else:
+            exec(source, namespace)  # pylint: disable=exec-used
+        return jit_cache.enable(
+            numba.njit(**conf.JIT_FLAGS)(namespace["pairwise_pipeline_body"])
+        )
+
+    @staticmethod
+    # pylint: disable=too-many-arguments
+    def pairwise_pipeline(pipeline, *, outputs, attributes, pairwise, is_first_in_pair):
+        """evaluates all expressions of a
+        `PySDM.backends.impl_common.pairwise_expression.PairwisePipeline` in a single
+        pass over pairs storing the `pipeline.outputs` in `outputs` (zero for slots
+        not associated with any pair); `attributes` and `pairwise` map names used
+        in the expressions to (indexed) particle-attribute and pairwise storages"""
+        body = PairMethods._pairwise_pipeline_bodies.get(pipeline.key)
+        if body is None:
+            body = PairMethods._make_pairwise_pipeline_body(pipeline)
+            PairMethods._pairwise_pipeline_bodies[pipeline.key] = body
+        idx = next(iter(attributes.values())).idx
+        body(
+            is_first_in_pair.indicator.data,
+            idx.data,
+            len(idx),
+            *(
+                storage.data
+                for storage in pipeline.arguments(
+                    outputs=outputs, attributes=attributes, pairwise=pairwise
+                )
+            ),
+        )
@@ -5,7 +5,17 @@ import numba
 from numba import prange
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_common.storage_utils import StorageBase
+from PySDM.backends.impl_numba import conf, jit_cache
+from PySDM.backends.impl_numba.methods.terminal_velocity_methods import interpolate
+
+FUSED_CHAIN_SYNTAX = {
+    "radius": "{out} = phys_radius({0})",
+    "area": "{out} = phys_area(phys_radius({0}))",
+    "ratio": "{out} = {0} / {1}",
+    "interpolation": "{out} = interpolate({0}, {p0}, {p1}, {p2})",
+    "store": "{out} = {value}",
+}
 
 
 class PhysicsMethods(BackendMethods):
@@ -19,6 +29,7 @@ class PhysicsMethods(BackendMethods):
         explicit_euler = self.formulae.trivia.explicit_euler
         phys_sigma = self.formulae.surface_tension.sigma
         phys_volume = self.formulae.trivia.volume
+        phys_radius = self.formulae.trivia.radius
         phys_r_cr = self.formulae.hygroscopicity.r_cr
         const = self.formulae.constants
 
@@ -43,6 +54,14 @@ class PhysicsMethods(BackendMethods):
 
         self.critical_volume_body = critical_volume
 
+        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        def radius_modified_since_body(*, radius, volume, droplet_epoch, epoch):
+            for i in prange(len(radius)):  # pylint: disable=not-an-iterable
+                if droplet_epoch[i] > epoch:
+                    radius[i] = phys_radius(volume[i])
+
+        self.radius_modified_since_body = radius_modified_since_body
+
         @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
         def temperature_pressure_RH_body(*, rhod, thd, qv, T, p, RH):
             for i in prange(T.shape[0]):  # pylint: disable=not-an-iterable
@@ -73,12 +92,21 @@ class PhysicsMethods(BackendMethods):
                 a_w_ice_out[i] = pvi / pvs
 
         self.a_w_ice_body = a_w_ice_body
+        self._fused_chain_bodies = {}
 
     def temperature_pressure_RH(self, *, rhod, thd, qv, T, p, RH):
         self.temperature_pressure_RH_body(
             rhod=rhod.data, thd=thd.data, qv=qv.data, T=T.data, p=p.data, RH=RH.data
         )
 
+    def radius_modified_since(self, *, radius, volume, droplet_epoch, epoch):
+        self.radius_modified_since_body(
+            radius=radius.data,
+            volume=volume.data,
+            droplet_epoch=droplet_epoch.data,
+            epoch=epoch,
+        )
+
     def terminal_velocity(self, *, values, radius, k1, k2, k3, r1, r2):
         self.terminal_velocity_body(
             values=values, radius=radius, k1=k1, k2=k2, k3=k3, r1=r1, r2=r2
@@ -106,3 +134,44 @@ class PhysicsMethods(BackendMethods):
             qv_in=qv.data,
             a_w_ice_out=a_w_ice.data,
         )
+
+    def _make_fused_chain_body(self, chain):
+        """generates and JIT-compiles a loop over droplets evaluating all links of
+        the chain (formulae are passed through a closure so that the generated
+        source does not depend on the constants)"""
+        newline = "\n" + 12 * " "
+        source = f"""
+def make_fused_chain_body(phys_radius, phys_area, interpolate):
+    def fused_chain_body({", ".join(chain.parameters())}):
+        for i in numba.prange(len(out_0)):
+            {newline.join(chain.statements(FUSED_CHAIN_SYNTAX))}
+    return fused_chain_body
+"""
+        namespace = {"numba": numba}
+        if jit_cache.enabled():
+            namespace = jit_cache.exec_source(
+                source, comment="fused attribute chain", namespace=namespace
+            )
+        else:
+            exec(source, namespace)  # pylint: disable=exec-used
+        return jit_cache.enable(
+            numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})(
+                namespace["make_fused_chain_body"](
+                    self.formulae.trivia.radius, self.formulae.trivia.area, interpolate
+                )
+            )
+        )
+
+    def fused_chain(self, chain):
+        """evaluates all links of a `PySDM.attributes.impl.fused_chain.FusedChain`
+        in a single pass over droplets"""
+        body = self._fused_chain_bodies.get(chain.key)
+        if body is None:
+            body = self._make_fused_chain_body(chain)
+            self._fused_chain_bodies[chain.key] = body
+        body(
+            *(
+                argument.data if isinstance(argument, StorageBase) else argument
+                for argument in chain.arguments()
+            )
+        )
@@ -7,6 +7,19 @@ from PySDM.backends.impl_common.backend_methods import BackendMethods
 from PySDM.backends.impl_numba import conf
 
 
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def interpolate(radius, factor, b, c):
+    """linear interpolation in a table of values `b` (and slopes `c`) tabulated with
+    radius spacing of `1/factor`, returning the last value beyond the table"""
+    if radius < 0:
+        return 0
+    position = factor * radius
+    r_id = int(position)
+    if r_id >= len(b) - 1:
+        return b[-1]
+    return b[r_id] + (position - r_id) / factor * c[r_id]
+
+
 class TerminalVelocityMethods(BackendMethods):
     @staticmethod
     @numba.njit(**conf.JIT_FLAGS)
@@ -52,12 +65,56 @@ class TerminalVelocityMethods(BackendMethods):
     @numba.njit(**conf.JIT_FLAGS)
     def interpolation_body(output, radius, factor, b, c):
         for i in numba.prange(len(radius)):  # pylint: disable=not-an-iterable
-            if radius[i] < 0:
-                output[i] = 0
-            else:
-                r_id = int(factor * radius[i])
-                r_rest = ((factor * radius[i]) % 1) / factor
-                output[i] = b[r_id] + r_rest * c[r_id]
+            output[i] = interpolate(radius[i], factor, b, c)
 
     def interpolation(self, *, output, radius, factor, b, c):
         return self.interpolation_body(output.data, radius.data, factor, b.data, c.data)
+
+    @staticmethod
+    @numba.njit(**conf.JIT_FLAGS)
+    # pylint: disable=too-many-arguments
+    def interpolation_where_changed_body(
+        output, radius, factor, b, c, radius_at_update, rtol
+    ):
+        for i in numba.prange(len(radius)):  # pylint: disable=not-an-iterable
+            if radius_at_update[i] < 0 or abs(
+                radius[i] - radius_at_update[i]
+            ) > rtol * abs(radius_at_update[i]):
+                radius_at_update[i] = radius[i]
+                output[i] = interpolate(radius[i], factor, b, c)
+
+    def interpolation_where_changed(
+        self, *, output, radius, factor, b, c, radius_at_update, rtol
+    ):
+        return self.interpolation_where_changed_body(
+            output.data,
+            radius.data,
+            factor,
+            b.data,
+            c.data,
+            radius_at_update.data,
+            rtol,
+        )
+
+    @staticmethod
+    @numba.njit(**conf.JIT_FLAGS)
+    # pylint: disable=too-many-arguments
+    def interpolation_modified_since_body(
+        output, radius, factor, b, c, droplet_epoch, epoch
+    ):
+        for i in numba.prange(len(radius)):  # pylint: disable=not-an-iterable
+            if droplet_epoch[i] > epoch:
+                output[i] = interpolate(radius[i], factor, b, c)
+
+    def interpolation_modified_since(
+        self, *, output, radius, factor, b, c, droplet_epoch, epoch
+    ):
+        return self.interpolation_modified_since_body(
+            output.data,
+            radius.data,
+            factor,
+            b.data,
+            c.data,
+            droplet_epoch.data,
+            epoch,
+        )
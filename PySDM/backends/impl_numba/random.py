@@ -1,18 +1,107 @@
 """
-random number generator class for Numba backend
+random number generator classes for Numba backend: `Random` wrapping NumPy's
+default generator, and `CounterBasedRandom` (Philox4x32-10, see
+[Salmon et al. 2011](https://doi.org/10.1145/2063384.2063405)) which fills
+storages in place from multiple threads with each value being a function of the
+seed, the substream, the call count and the position in the storage only
+(hence identical sequences regardless of the number of threads)
 """
+import numba
 import numpy as np
 
-from ..impl_common.random_common import RandomCommon
+from ..impl_common.random_common import RandomCommon, substream_seed
+from . import conf
 
 #  TIP: can be called asynchronously
 #  TIP: sometimes only half array is needed
 
+_MASK = np.uint64(0xFFFFFFFF)
+_SHIFT = np.uint64(32)
+_PHILOX_M = (np.uint64(0xD2511F53), np.uint64(0xCD9E8D57))
+_PHILOX_W = (np.uint64(0x9E3779B9), np.uint64(0xBB67AE85))
+_PHILOX_ROUNDS = 10
+
+
+@numba.njit(**{**conf.JIT_FLAGS, "parallel": False, "fastmath": False})
+def philox4x32(c0, c1, c2, c3, k0, k1):
+    """Philox4x32-10 bijection (uint32 words held in uint64 variables)"""
+    for _ in range(_PHILOX_ROUNDS):
+        p0 = _PHILOX_M[0] * c0
+        p1 = _PHILOX_M[1] * c2
+        c0, c1, c2, c3 = (
+            ((p1 >> _SHIFT) ^ c1 ^ k0) & _MASK,
+            p1 & _MASK,
+            ((p0 >> _SHIFT) ^ c3 ^ k1) & _MASK,
+            p0 & _MASK,
+        )
+        k0 = (k0 + _PHILOX_W[0]) & _MASK
+        k1 = (k1 + _PHILOX_W[1]) & _MASK
+    return c0, c1, c2, c3
+
+
+@numba.njit(**{**conf.JIT_FLAGS, "parallel": False, "fastmath": False})
+def philox_uniform_pair(c0, c1, c2, c3, k0, k1):
+    """two uniform [0, 1) values of 53-bit resolution from a single Philox block"""
+    r0, r1, r2, r3 = philox4x32(c0, c1, c2, c3, k0, k1)
+    return (
+        ((r0 >> np.uint64(5)) * 67108864.0 + (r1 >> np.uint64(6))) / 9007199254740992.0,
+        ((r2 >> np.uint64(5)) * 67108864.0 + (r3 >> np.uint64(6))) / 9007199254740992.0,
+    )
+
+
+def philox_key(seed, stream):
+    """Philox key (two uint32 words) of a given seed and substream"""
+    key = np.random.SeedSequence(seed, spawn_key=(stream,)).generate_state(2, np.uint32)
+    return np.uint64(key[0]), np.uint64(key[1])
+
+
+@numba.njit(**{**conf.JIT_FLAGS, "fastmath": False})
+def _philox_uniform(out, key0, key1, counter):
+    """fills `out` with uniform [0, 1) values of 53-bit resolution, two per
+    Philox block; block `i` of call `counter` uses the counter `(i, counter)`"""
+    n_blocks = (len(out) + 1) // 2
+    ctr2 = np.uint64(counter) & _MASK
+    ctr3 = np.uint64(counter) >> _SHIFT
+    for i in numba.prange(n_blocks):  # pylint: disable=not-an-iterable
+        block = np.uint64(i)
+        u0, u1 = philox_uniform_pair(
+            block & _MASK, block >> _SHIFT, ctr2, ctr3, key0, key1
+        )
+        out[2 * i] = u0
+        if 2 * i + 1 < len(out):
+            out[2 * i + 1] = u1
+
 
 class Random(RandomCommon):  # pylint: disable=too-few-public-methods
-    def __init__(self, size, seed):
-        super().__init__(size, seed)
-        self.generator = np.random.default_rng(seed)
+    def __init__(self, size, seed, stream=0):
+        super().__init__(size, seed, stream)
+        self.generator = np.random.default_rng(substream_seed(seed, stream))
 
     def __call__(self, storage):
-        storage.data[:] = self.generator.uniform(0, 1, storage.shape)
+        if storage.data.dtype == np.float64 and storage.data.flags.c_contiguous:
+            self.generator.random(out=storage.data)
+        else:
+            storage.data[:] = self.generator.uniform(0, 1, storage.shape)
+
+    def get_state(self):
+        return self.generator.bit_generator.state
+
+    def set_state(self, state):
+        self.generator.bit_generator.state = state
+
+
+class CounterBasedRandom(RandomCommon):  # pylint: disable=too-few-public-methods
+    def __init__(self, size, seed, stream=0):
+        super().__init__(size, seed, stream)
+        self.key = philox_key(seed, stream)
+        self.counter = 0
+
+    def __call__(self, storage):
+        _philox_uniform(storage.data, *self.key, self.counter)
+        self.counter += 1
+
+    def get_state(self):
+        return {"counter": self.counter}
+
+    def set_state(self, state):
+        self.counter = int(state["counter"])
@@ -24,9 +24,20 @@ def patch_particulator(particulator):
 
 
 def _condensation(
-    particulator, *, rtol_x, rtol_thd, counters, RH_max, success, cell_order
+    particulator,
+    *,
+    rtol_x,
+    rtol_thd,
+    counters,
+    RH_max,
+    mean_iterations,
+    success,
+    cell_order,
+    work_queue,
+    droplet_history,
+    substep_history,
 ):
-    func = Numba._condensation
+    func = Numba.make_condensation_driver(parallel=False, timed=False)
     if not numba.config.DISABLE_JIT:  # pylint: disable=no-member
         func = func.py_func
     func(
@@ -42,12 +53,14 @@ def _condensation(
         rhod=particulator.environment["rhod"].data,
         thd=particulator.environment["thd"].data,
         qv=particulator.environment["qv"].data,
-        dv_mean=particulator.environment.dv,
+        dv_mean=np.broadcast_to(particulator.environment.dv, particulator.mesh.n_cell),
         prhod=particulator.environment.get_predicted("rhod").data,
         pthd=particulator.environment.get_predicted("thd").data,
         pqv=particulator.environment.get_predicted("qv").data,
         kappa=particulator.attributes["kappa"].data,
         f_org=particulator.attributes["dry volume organic fraction"].data,
+        dx_ratio_last=droplet_history["dx_ratio"].data,
+        n_iters_last=droplet_history["n_iters"].data,
         rtol_x=rtol_x,
         rtol_thd=rtol_thd,
         timestep=particulator.dt,
@@ -56,7 +69,11 @@ def _condensation(
         counter_n_deactivating=counters["n_deactivating"],
         counter_n_ripening=counters["n_ripening"],
         cell_order=cell_order,
+        work_queue=work_queue,
+        thread_busy_time=np.empty(1),
         RH_max=RH_max.data,
+        mean_iterations=mean_iterations.data,
+        substep_history=substep_history,
         success=success.data,
     )
 
@@ -174,6 +191,8 @@ def _make_solve(formulae):  # pylint: disable=too-many-statements,too-many-local
         cell_idx,
         kappa,
         f_org,
+        _dx_ratio_last,
+        _n_iters_last,
         thd,
         qv,
         dthd_dt,
@@ -184,6 +203,8 @@ def _make_solve(formulae):  # pylint: disable=too-many-statements,too-many-local
         ___,
         dt,
         ____,
+        _substep_history,
+        _cell_id,
     ):
         n_sd_in_cell = len(cell_idx)
         y0 = np.empty(n_sd_in_cell + idx_x)
@@ -223,6 +244,16 @@ def _make_solve(formulae):  # pylint: disable=too-many-statements,too-many-local
             m_new += n[cell_idx[i]] * v_new * rho_w
             v[cell_idx[i]] = v_new
 
-        return integ.success, qt - m_new / m_d_mean, y1[idx_thd], 1, 1, 1, 1, np.nan
+        return (
+            integ.success,
+            qt - m_new / m_d_mean,
+            y1[idx_thd],
+            1,
+            1,
+            1,
+            1,
+            np.nan,
+            np.nan,
+        )
 
     return solve
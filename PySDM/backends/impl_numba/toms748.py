@@ -12,15 +12,20 @@ from sys import float_info
 import numba
 from numpy import nan
 
-from PySDM.backends.impl_numba.conf import JIT_FLAGS
+from PySDM.backends.impl_numba.conf import JIT_CACHE_DIR, JIT_FLAGS
 from PySDM.backends.impl_numba.warnings import warn
 
 float_info_epsilon = float_info.epsilon
 float_info_max = float_info.max
 float_info_min = float_info.min
 
+# inlining the functions taking function-typed arguments lets the callers be stored
+#  in the on-disk cache (see PySDM.backends.impl_numba.jit_cache) at the price of
+#  longer compilation, hence it is only done with the cache enabled
+inline = "always" if JIT_CACHE_DIR is not None else "never"
 
-@numba.njit(**{**JIT_FLAGS, **{"parallel": False, "cache": False}})
+
+@numba.njit(**{**JIT_FLAGS, **{"parallel": False, "cache": False, "inline": inline}})
 def bracket(f, args, a, b, c, fa, fb):
     tol = float_info_epsilon * 2
     if (b - a) < 2 * tol * a:
@@ -106,12 +111,12 @@ def cubic_interpolate(a, b, d, e, fa, fb, fd, fe):
     return c
 
 
-@numba.njit(**{**JIT_FLAGS, **{"parallel": False}})
+@numba.njit(**{**JIT_FLAGS, **{"parallel": False, "inline": inline}})
 def tol_check(a, b, rtol, within_tolerance):
     return within_tolerance(abs(a - b), min(abs(a), abs(b)), rtol)
 
 
-@numba.njit(**{**JIT_FLAGS, **{"parallel": False}})
+@numba.njit(**{**JIT_FLAGS, **{"parallel": False, "inline": inline}})
 def toms748_solve(f, args, ax, bx, fax, fbx, rtol, max_iter, within_tolerance):
     count = max_iter
     mu = 0.5
@@ -335,6 +335,24 @@ class CollisionsMethods(
             ),
         )
 
+        self.__record_pair_changes_body = trtc.For(
+            param_names=("droplet_epoch", "epoch", "gamma", "idx", "is_first_in_pair"),
+            name_iter="i",
+            body=f"""
+            {COMMONS}
+            int64_t _j[1] = {{}};
+            int64_t _k[1] = {{}};
+            auto skip_pair = Commons::pair_indices(i, _j, _k, idx, is_first_in_pair, gamma);
+            if (skip_pair) {{
+                return;
+            }}
+            droplet_epoch[_j[0]] = epoch;
+            droplet_epoch[_k[0]] = epoch;
+            """.replace(
+                "real_type", self._get_c_type()
+            ),
+        )
+
         self.__collision_coalescence_breakup_body = trtc.For(
             param_names=(
                 "multiplicity",
@@ -674,6 +692,9 @@ class CollisionsMethods(
             i = len(dt_left)
         return cell_start[i]
 
+    def adaptive_sdm_cell_local(self, **kwargs):
+        raise NotImplementedError()
+
     # pylint: disable=unused-argument
     @nice_thrust(**NICE_THRUST_FLAGS)
     def scale_prob_for_adaptive_sdm_gamma(
@@ -773,6 +794,23 @@ class CollisionsMethods(
             ),
         )
 
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def record_pair_changes(
+        self, *, droplet_epoch, epoch, gamma, idx, is_first_in_pair
+    ):
+        if len(idx) < 2:
+            return
+        self.__record_pair_changes_body.launch_n(
+            n=len(idx) // 2,
+            args=(
+                droplet_epoch.data,
+                trtc.DVInt64(epoch),
+                gamma.data,
+                idx.data,
+                is_first_in_pair.indicator.data,
+            ),
+        )
+
     @nice_thrust(**NICE_THRUST_FLAGS)
     def collision_coalescence_breakup(  # pylint: disable=unused-argument,too-many-locals
         self,
@@ -3,6 +3,8 @@ GPU implementation of backend methods for water condensation/evaporation
 """
 from typing import Dict, Optional
 
+import numpy as np
+
 from PySDM.backends.impl_common.storage_utils import StorageBase
 from PySDM.backends.impl_thrust_rtc.bisection import BISECTION
 from PySDM.backends.impl_thrust_rtc.conf import NICE_THRUST_FLAGS
@@ -29,6 +31,7 @@ class CondensationMethods(
         self.dthd_dt_pred: Optional[StorageBase] = None
         self.dqv_dt_pred: Optional[StorageBase] = None
         self.rhod_mean: Optional[StorageBase] = None
+        self.dv_mean: Optional[StorageBase] = None
         self.vars: Optional[Dict[str, StorageBase]] = None
         const = self.formulae.constants
 
@@ -288,7 +291,7 @@ class CondensationMethods(
             "i",
             f"""
             auto dml_dt = (ml_new[i] - ml_old[i]) / dt;
-            auto dqv_dt_corr = - dml_dt / (rhod_mean[i] * dv_mean);
+            auto dqv_dt_corr = - dml_dt / (rhod_mean[i] * dv_mean[i]);
             auto dthd_dt_corr = {phys.state_variable_triplet.dthd_dt.c_inline(
                 rhod='rhod_mean[i]', thd='thd[i]', T='T[i]', dqv_dt='dqv_dt_corr', lv='lv[i]')};
 
@@ -326,12 +329,17 @@ class CondensationMethods(
         pqv,
         kappa,
         f_org,
+        dx_ratio_last,
+        n_iters_last,
         rtol_x,
         rtol_thd,
         timestep,
         counters,
         cell_order,
+        work_queue,
         RH_max,
+        mean_iterations,
+        substep_history,
         success,
         cell_id,
     ):
@@ -341,7 +349,7 @@ class CondensationMethods(
             counters["n_substeps"][:] = 1  # TODO #527
 
         n_substeps = counters["n_substeps"][0]
-        dv_mean = dv
+        self.dv_mean.upload(np.broadcast_to(dv, (n_cell,)))
 
         success[:] = True  # TODO #588
         dvfloat = self._get_floating_point
@@ -409,7 +417,7 @@ class CondensationMethods(
                     dvfloat(timestep),
                     self.ml_new.data,
                     self.ml_old.data,
-                    dvfloat(dv_mean),
+                    self.dv_mean.data,
                     self.vars["T"],
                     self.vars["lv"],
                 ),
@@ -427,6 +435,9 @@ class CondensationMethods(
         multiplier,
         RH_rtol,
         max_iters,
+        lane_parallel=False,  # pylint: disable=unused-argument
+        warm_start=False,  # pylint: disable=unused-argument
+        predict_substeps=False,  # pylint: disable=unused-argument
     ):
         self.adaptive = adaptive
         self.RH_rtol = RH_rtol
@@ -437,6 +448,7 @@ class CondensationMethods(
         self.dthd_dt_pred = self.Storage.empty(shape=n_cell, dtype=self._get_np_dtype())
         self.dqv_dt_pred = self.Storage.empty(shape=n_cell, dtype=self._get_np_dtype())
         self.rhod_mean = self.Storage.empty(shape=n_cell, dtype=self._get_np_dtype())
+        self.dv_mean = self.Storage.empty(shape=n_cell, dtype=self._get_np_dtype())
         self.vars = {
             key: self.Storage.empty(shape=n_cell, dtype=self._get_np_dtype()).data
             for key in CondensationMethods.keys
@@ -107,6 +107,9 @@ class DisplacementMethods(ThrustRTCBackendMethods):
             ),
         )
 
+    def displacement_with_local_substeps(self, **kwargs):
+        raise NotImplementedError()
+
     @nice_thrust(**NICE_THRUST_FLAGS)
     def flag_precipitated(  # pylint: disable=unused-argument
         self,
@@ -25,6 +25,8 @@ class FreezingMethods(ThrustRTCBackendMethods):
                 "relative_humidity",
                 "thaw",
                 "temperature",
+                "droplet_epoch",
+                "epoch",
             ),
             name_iter="i",
             body=f"""
@@ -36,6 +38,9 @@ class FreezingMethods(ThrustRTCBackendMethods):
                     temperature="temperature[cell[i]]"
                 )}) {{
                     wet_volume[i] = -1 * wet_volume[i] * {const.rho_i} / {const.rho_w};
+                    if (epoch > 0) {{
+                        droplet_epoch[i] = epoch;
+                    }}
                 }} else if ({self.formulae.trivia.unfrozen_and_saturated.c_inline(
                         volume="wet_volume[i]",
                         relative_humidity="relative_humidity[cell[i]]"
@@ -48,6 +53,9 @@ class FreezingMethods(ThrustRTCBackendMethods):
                     );
                     if (rand[i] < prob) {{
                         wet_volume[i] = -1 * wet_volume[i] * {const.rho_w} / {const.rho_i};
+                        if (epoch > 0) {{
+                            droplet_epoch[i] = epoch;
+                        }}
                     }}
                 }}
             """.replace(
@@ -63,6 +71,8 @@ class FreezingMethods(ThrustRTCBackendMethods):
                 "relative_humidity",
                 "cell",
                 "thaw",
+                "droplet_epoch",
+                "epoch",
             ),
             name_iter="i",
             body=f"""
@@ -74,6 +84,9 @@ class FreezingMethods(ThrustRTCBackendMethods):
                     temperature="temperature[cell[i]]"
                 )}) {{
                     wet_volume[i] = -1 * wet_volume[i] * {const.rho_i} / {const.rho_w};
+                    if (epoch > 0) {{
+                        droplet_epoch[i] = epoch;
+                    }}
                 }} else if (
                     {self.formulae.trivia.unfrozen_and_saturated.c_inline(
                         volume="wet_volume[i]",
@@ -81,15 +94,31 @@ class FreezingMethods(ThrustRTCBackendMethods):
                     )} && temperature[cell[i]] <= freezing_temperature[i]
                 ) {{
                     wet_volume[i] = -1 * wet_volume[i] * {const.rho_w} / {const.rho_i};
+                    if (epoch > 0) {{
+                        droplet_epoch[i] = epoch;
+                    }}
                 }}
             """.replace(
                 "real_type", self._get_c_type()
             ),
         )
 
+    def __droplet_epoch_data(self, droplet_epoch):
+        if droplet_epoch is None:
+            return self.Storage.empty(1, dtype=int).data
+        return droplet_epoch.data
+
     @nice_thrust(**NICE_THRUST_FLAGS)
     def freeze_singular(
-        self, *, attributes, temperature, relative_humidity, cell, thaw
+        self,
+        *,
+        attributes,
+        temperature,
+        relative_humidity,
+        cell,
+        thaw,
+        droplet_epoch=None,
+        epoch=0,
     ):
         n_sd = len(attributes.freezing_temperature)
         self.freeze_singular_body.launch_n(
@@ -101,6 +130,8 @@ class FreezingMethods(ThrustRTCBackendMethods):
                 relative_humidity.data,
                 cell.data,
                 trtc.DVBool(thaw),
+                self.__droplet_epoch_data(droplet_epoch),
+                trtc.DVInt64(epoch),
             ),
         )
 
@@ -118,6 +149,8 @@ class FreezingMethods(ThrustRTCBackendMethods):
         record_freezing_temperature,
         freezing_temperature,
         thaw,
+        droplet_epoch=None,
+        epoch=0,
     ):
         n_sd = len(attributes.immersed_surface_area)
         self.freeze_time_dependent_body.launch_n(
@@ -132,5 +165,7 @@ class FreezingMethods(ThrustRTCBackendMethods):
                 relative_humidity.data,
                 trtc.DVBool(thaw),
                 temperature.data,
+                self.__droplet_epoch_data(droplet_epoch),
+                trtc.DVInt64(epoch),
             ),
         )
@@ -53,6 +53,35 @@ class IndexMethods(ThrustRTCBackendMethods):
             cell_start.size() - 1, [cell_start, u01, idx]
         )
 
+    __permute_in_place_body = trtc.For(
+        param_names=("data", "tmp", "permutation", "n", "length"),
+        name_iter="k",
+        body="""
+        auto i = k % n;
+        if (i < length) {
+            data[k] = tmp[k - i + permutation[i]];
+        }
+        """,
+    )
+
+    @staticmethod
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def permute_in_place(data, permutation, length):
+        if data.data is None:
+            return
+        tmp, _, _ = data._get_empty_data(data.shape, data.dtype)
+        trtc.Copy(data.data, tmp)
+        IndexMethods.__permute_in_place_body.launch_n(
+            data.data.size(),
+            (
+                data.data,
+                tmp,
+                permutation.data,
+                trtc.DVInt64(data.shape[-1]),
+                trtc.DVInt64(length),
+            ),
+        )
+
     @staticmethod
     @nice_thrust(**NICE_THRUST_FLAGS)
     def sort_by_key(idx, attr):
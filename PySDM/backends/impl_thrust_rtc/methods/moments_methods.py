@@ -1,6 +1,7 @@
 """
 GPU implementation of moment calculation backend methods
 """
+from PySDM.backends.impl_common.bin_lookup import BISECTION, LINEAR_SCAN, LOGARITHMIC
 from PySDM.backends.impl_thrust_rtc.conf import NICE_THRUST_FLAGS
 from PySDM.backends.impl_thrust_rtc.nice_thrust import nice_thrust
 
@@ -57,6 +58,76 @@ class MomentsMethods(ThrustRTCBackendMethods):
         """,
         )
 
+        self.__fused_moments_stack = trtc.For(
+            ("stacked", "attr_data", "offset"),
+            "i",
+            """
+            stacked[offset + i] = (real_type)(attr_data[i]);
+        """.replace(
+                "real_type", self._get_c_type()
+            ),
+        )
+
+        self.__fused_moments_body_0 = trtc.For(
+            (
+                "idx",
+                "attributes",
+                "n_sd",
+                "moment_0",
+                "moments",
+                "cell_id",
+                "n",
+                "n_specs",
+                "n_cell",
+                "attr_index",
+                "ranks",
+                "x_index",
+                "min_x",
+                "max_x",
+                "weighting_index",
+                "weighting_ranks",
+            ),
+            "fake_i",
+            """
+            auto i = idx[fake_i];
+            for (auto k = 0; k < n_specs; k+=1) {
+                auto x = attributes[n_sd * x_index[k] + i];
+                if (min_x[k] <= x && x < max_x[k]) {
+                    auto weight = n[i] * pow(
+                        attributes[n_sd * weighting_index[k] + i],
+                        (real_type)(weighting_ranks[k])
+                    );
+                    auto value = weight * pow(
+                        attributes[n_sd * attr_index[k] + i],
+                        (real_type)(ranks[k])
+                    );
+                    atomicAdd((real_type*)&moment_0[n_cell * k + cell_id[i]], (real_type)(weight));
+                    atomicAdd((real_type*)&moments[n_cell * k + cell_id[i]], (real_type)(value));
+                }
+            }
+        """.replace(
+                "real_type", self._get_c_type()
+            ),
+        )
+
+        self.__fused_moments_body_1 = trtc.For(
+            ("n_specs", "n_cell", "moments", "moment_0", "skip_division_by_m0"),
+            "c_id",
+            """
+            for (auto k = 0; k < n_specs; k+=1) {
+                auto i = n_cell * k + c_id;
+                if (skip_division_by_m0[k] == false) {
+                    if (moment_0[i] == 0) {
+                        moments[i] = 0;
+                    }
+                    else {
+                        moments[i] = moments[i] / moment_0[i];
+                    }
+                }
+            }
+        """,
+        )
+
         self.__spectrum_moments_body_0 = trtc.For(
             (
                 "idx",
@@ -67,37 +138,88 @@ class MomentsMethods(ThrustRTCBackendMethods):
                 "n",
                 "x_bins",
                 "n_bins",
+                "scheme",
+                "origin",
+                "inverse_width",
                 "moments",
-                "rank",
+                "ranks",
+                "n_ranks",
                 "n_sd",
                 "n_cell",
             ),
             "fake_i",
-            """
+            f"""
             auto i = idx[fake_i];
-            for (auto k = 0; k < n_bins; k+=1) {
-                if (x_bins[k] <= x_attr[i] and x_attr[i] < x_bins[k + 1]) {
-                    atomicAdd((real_type*)&moment_0[n_cell * k + cell_id[i]], (real_type)(n[i]));
-                    auto value = n[i] * pow((real_type)(attr_data[i]), (real_type)(rank));
-                    atomicAdd((real_type*) &moments[n_cell * k + cell_id[i]], value);
-                    break;
-                }
-            }
+            auto x = x_attr[i];
+            auto k = (int64_t)(-1);
+            if (scheme == {LINEAR_SCAN}) {{
+                for (auto j = 0; j < n_bins; j+=1) {{
+                    if (x_bins[j] <= x && x < x_bins[j + 1]) {{
+                        k = j;
+                        break;
+                    }}
+                }}
+            }}
+            else if (x_bins[0] <= x && x < x_bins[n_bins]) {{
+                if (scheme == {BISECTION}) {{
+                    auto low = (int64_t)(0);
+                    auto high = (int64_t)(n_bins);
+                    while (high - low > 1) {{
+                        auto mid = (low + high) >> 1;
+                        if (x < x_bins[mid]) {{
+                            high = mid;
+                        }}
+                        else {{
+                            low = mid;
+                        }}
+                    }}
+                    k = low;
+                }}
+                else {{
+                    auto y = (real_type)(x);
+                    if (scheme == {LOGARITHMIC}) {{
+                        y = log(y);
+                    }}
+                    k = (int64_t)((y - origin) * inverse_width);
+                    if (k < 0) {{
+                        k = 0;
+                    }}
+                    if (k > n_bins - 1) {{
+                        k = n_bins - 1;
+                    }}
+                    while (x < x_bins[k]) {{
+                        k -= 1;
+                    }}
+                    while (x >= x_bins[k + 1]) {{
+                        k += 1;
+                    }}
+                }}
+            }}
+            if (k != -1) {{
+                atomicAdd((real_type*)&moment_0[n_cell * k + cell_id[i]], (real_type)(n[i]));
+                for (auto r = 0; r < n_ranks; r+=1) {{
+                    auto value = n[i] * pow((real_type)(attr_data[i]), (real_type)(ranks[r]));
+                    atomicAdd((real_type*) &moments[n_cell * (n_bins * r + k) + cell_id[i]], value);
+                }}
+            }}
         """.replace(
                 "real_type", self._get_c_type()
             ),
         )
 
         self.__spectrum_moments_body_1 = trtc.For(
-            ("n_bins", "moments", "moment_0", "n_cell"),
+            ("n_bins", "n_ranks", "moments", "moment_0", "n_cell"),
             "i",
             """
             for (auto k = 0; k < n_bins; k+=1) {
-                if (moment_0[n_cell * k + i] == 0) {
-                    moments[n_cell * k  + i] = 0;
-                }
-                else {
-                    moments[n_cell * k + i] = moments[n_cell * k + i] / moment_0[n_cell * k + i];
+                for (auto r = 0; r < n_ranks; r+=1) {
+                    auto j = n_cell * (n_bins * r + k) + i;
+                    if (moment_0[n_cell * k + i] == 0) {
+                        moments[j] = 0;
+                    }
+                    else {
+                        moments[j] = moments[j] / moment_0[n_cell * k + i];
+                    }
                 }
             }
         """,
@@ -167,6 +289,74 @@ class MomentsMethods(ThrustRTCBackendMethods):
                 moment_0.shape[0], (n_ranks, moments.data, moment_0.data, n_cell)
             )
 
+    # pylint: disable=too-many-locals
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def fused_moments(
+        self,
+        *,
+        moment_0,
+        moments,
+        multiplicity,
+        attributes,
+        cell_id,
+        idx,
+        length,
+        attr_index,
+        ranks,
+        x_index,
+        min_x,
+        max_x,
+        weighting_index,
+        weighting_ranks,
+        skip_division_by_m0,
+    ):
+        assert moment_0.shape == moments.shape
+        assert moments.shape[0] == ranks.shape[0]
+        self.ensure_floating_point(moment_0)
+        self.ensure_floating_point(moments)
+
+        n_sd = attributes[0].shape[0]
+        stacked = self.Storage.empty((len(attributes) * n_sd,), dtype=float)
+        for i, attr in enumerate(attributes):
+            self.__fused_moments_stack.launch_n(
+                n_sd, (stacked.data, attr.data, trtc.DVInt64(i * n_sd))
+            )
+
+        moments[:] = 0
+        moment_0[:] = 0
+
+        self.__fused_moments_body_0.launch_n(
+            length,
+            (
+                idx.data,
+                stacked.data,
+                trtc.DVInt64(n_sd),
+                moment_0.data,
+                moments.data,
+                cell_id.data,
+                multiplicity.data,
+                trtc.DVInt64(ranks.shape[0]),
+                trtc.DVInt64(moments.shape[1]),
+                self.Storage.from_ndarray(attr_index).data,
+                self.Storage.from_ndarray(ranks).data,
+                self.Storage.from_ndarray(x_index).data,
+                self.Storage.from_ndarray(min_x).data,
+                self.Storage.from_ndarray(max_x).data,
+                self.Storage.from_ndarray(weighting_index).data,
+                self.Storage.from_ndarray(weighting_ranks).data,
+            ),
+        )
+        self.__fused_moments_body_1.launch_n(
+            moments.shape[1],
+            (
+                trtc.DVInt64(ranks.shape[0]),
+                trtc.DVInt64(moments.shape[1]),
+                moments.data,
+                moment_0.data,
+                self.Storage.from_ndarray(skip_division_by_m0).data,
+            ),
+        )
+
     # TODO #684
     # pylint: disable=unused-argument,too-many-locals
     @nice_thrust(**NICE_THRUST_FLAGS)
@@ -180,14 +370,18 @@ class MomentsMethods(ThrustRTCBackendMethods):
         cell_id,
         idx,
         length,
-        rank,
+        ranks,
         x_bins,
+        x_bins_lookup,
         x_attr,
         weighting_attribute,
         weighting_rank,
     ):
-        assert moments.shape[0] == x_bins.shape[0] - 1
-        assert moment_0.shape == moments.shape
+        assert moment_0.shape[0] == x_bins.shape[0] - 1
+        assert moments.shape == (
+            ranks.shape[0] * moment_0.shape[0],
+            moment_0.shape[1],
+        )
         if weighting_rank != 0:
             raise NotImplementedError()
 
@@ -196,7 +390,7 @@ class MomentsMethods(ThrustRTCBackendMethods):
 
         n_cell = trtc.DVInt64(moments.shape[1])
         n_sd = trtc.DVInt64(moments.shape[0])
-        d_rank = trtc.DVInt64(rank)
+        n_ranks = trtc.DVInt64(ranks.shape[0])
         n_bins = trtc.DVInt64(len(x_bins) - 1)
 
         moments[:] = 0
@@ -213,13 +407,17 @@ class MomentsMethods(ThrustRTCBackendMethods):
                 multiplicity.data,
                 x_bins.data,
                 n_bins,
+                trtc.DVInt64(x_bins_lookup[0]),
+                self._get_floating_point(x_bins_lookup[1]),
+                self._get_floating_point(x_bins_lookup[2]),
                 moments.data,
-                d_rank,
+                ranks.data,
+                n_ranks,
                 n_sd,
                 n_cell,
             ),
         )
 
         self.__spectrum_moments_body_1.launch_n(
-            moment_0.shape[1], (n_bins, moments.data, moment_0.data, n_cell)
+            moment_0.shape[1], (n_bins, n_ranks, moments.data, moment_0.data, n_cell)
         )
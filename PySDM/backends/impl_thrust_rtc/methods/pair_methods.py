@@ -1,14 +1,28 @@
 """
 GPU implementation of pairwise operations backend methods
 """
+import numpy as np
+
 from PySDM.backends.impl_thrust_rtc.conf import NICE_THRUST_FLAGS
 from PySDM.backends.impl_thrust_rtc.nice_thrust import nice_thrust
 
 from ..conf import trtc
 from ..methods.thrust_rtc_backend_methods import ThrustRTCBackendMethods
 
+PAIRWISE_PIPELINE_SYNTAX = {
+    "sum": "({a} + {b})",
+    "max": "max({a}, {b})",
+    "min": "min({a}, {b})",
+    "distance": "abs({a} - {b})",
+    "multiply": "({a} * {b})",
+    "power": "pow((real_type)({0}), (real_type)({1}))",
+    "divide_if_not_zero": "({0} / ({1} + ({1} == 0)))",
+}
+
 
 class PairMethods(ThrustRTCBackendMethods):
+    _pairwise_pipeline_bodies = {}
+
     __distance_pair_body = trtc.For(
         param_names=("data_out", "data_in", "is_first_in_pair"),
         name_iter="i",
@@ -204,3 +218,121 @@ class PairMethods(ThrustRTCBackendMethods):
                 idx.data,
             ),
         )
+
+    __interpolate_pair_table_body = trtc.For(
+        param_names=(
+            "data_out",
+            "table",
+            "size",
+            "log_x_min",
+            "d_log_x",
+            "perm_in",
+            "is_first_in_pair",
+        ),
+        name_iter="i",
+        body="""
+        if (is_first_in_pair[i]) {
+            auto x_min = exp(log_x_min);
+            auto x_hi = max(max(perm_in[i], perm_in[i + 1]), x_min);
+            auto x_lo = max(min(perm_in[i], perm_in[i + 1]), x_min);
+            auto f_hi = (log(x_hi) - log_x_min) / d_log_x;
+            auto f_lo = (log(x_lo) - log_x_min) / d_log_x;
+            if (f_hi > size - 1) {
+                f_hi = size - 1;
+            }
+            if (f_lo > size - 1) {
+                f_lo = size - 1;
+            }
+            auto j_hi = min((int64_t)(f_hi), size - 2);
+            auto j_lo = min((int64_t)(f_lo), size - 2);
+            auto t_hi = f_hi - j_hi;
+            auto t_lo = f_lo - j_lo;
+            auto k = j_hi * size + j_lo;
+            auto v00 = table[k];
+            auto v01 = table[k + 1];
+            auto v10 = table[k + size];
+            auto v11 = table[k + size + 1];
+            if (j_hi == j_lo) {
+                data_out[(int64_t)(i/2)] = v00 + t_hi * (v10 - v00) + t_lo * (v11 - v10);
+            }
+            else {
+                data_out[(int64_t)(i/2)] = (1 - t_hi) * ((1 - t_lo) * v00 + t_lo * v01) + t_hi * ((1 - t_lo) * v10 + t_lo * v11);
+            }
+        }
+        """,
+    )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    # pylint: disable=too-many-arguments
+    def interpolate_pair_table(
+        self, *, output, table, log_x_range, data_in, is_first_in_pair
+    ):
+        size = int(np.sqrt(len(table)))
+        perm_in = trtc.DVPermutation(data_in.data, data_in.idx.data)
+        trtc.Fill(output.data, trtc.DVDouble(0))
+        PairMethods.__interpolate_pair_table_body.launch_n(
+            len(data_in.idx),
+            (
+                output.data,
+                table.data,
+                trtc.DVInt64(size),
+                self._get_floating_point(log_x_range[0]),
+                self._get_floating_point(
+                    (log_x_range[1] - log_x_range[0]) / (size - 1)
+                ),
+                perm_in,
+                is_first_in_pair.indicator.data,
+            ),
+        )
+
+    def _make_pairwise_pipeline_body(self, pipeline):
+        statements = pipeline.statements(PAIRWISE_PIPELINE_SYNTAX)
+        zeros = [
+            f"{output} = 0;" for output, _ in statements[len(pipeline.expressions) :]
+        ]
+        assignments = [
+            f"{'' if var.startswith('out_') else 'auto '}{var} = {value};"
+            for var, value in statements
+        ]
+        newline = "\n" + 12 * " "
+        return trtc.For(
+            param_names=("is_first_in_pair", "idx", "length") + pipeline.parameters(),
+            name_iter="s",
+            body=f"""
+        auto j = 2 * s;
+        if (j + 1 < length && is_first_in_pair[j]) {{
+            {newline.join(assignments)}
+        }}
+        else if (j + 2 < length && is_first_in_pair[j + 1]) {{
+            j += 1;
+            {newline.join(assignments)}
+        }}
+        else {{
+            {newline.join(zeros)}
+        }}
+        """.replace(
+                "real_type", self._get_c_type()
+            ),
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    # pylint: disable=too-many-arguments
+    def pairwise_pipeline(
+        self, pipeline, *, outputs, attributes, pairwise, is_first_in_pair
+    ):
+        key = (pipeline.key, self._get_c_type())
+        body = PairMethods._pairwise_pipeline_bodies.get(key)
+        if body is None:
+            body = self._make_pairwise_pipeline_body(pipeline)
+            PairMethods._pairwise_pipeline_bodies[key] = body
+        idx = next(iter(attributes.values())).idx
+        arguments = pipeline.arguments(
+            outputs=outputs, attributes=attributes, pairwise=pairwise
+        )
+        if len(arguments[0]) == 0:
+            return
+        body.launch_n(
+            len(arguments[0]),
+            (is_first_in_pair.indicator.data, idx.data, trtc.DVInt64(len(idx)))
+            + tuple(storage.data for storage in arguments),
+        )
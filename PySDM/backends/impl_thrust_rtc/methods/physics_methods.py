@@ -1,6 +1,7 @@
 """
 GPU implementation of backend methods wrapping basic physics formulae
 """
+from PySDM.backends.impl_common.storage_utils import StorageBase
 from PySDM.backends.impl_thrust_rtc.conf import NICE_THRUST_FLAGS
 from PySDM.backends.impl_thrust_rtc.nice_thrust import nice_thrust
 
@@ -31,6 +32,18 @@ class PhysicsMethods(ThrustRTCBackendMethods):
             ),
         )
 
+        self.__radius_modified_since_body = trtc.For(
+            ("radius", "volume", "droplet_epoch", "epoch"),
+            "i",
+            f"""
+            if (droplet_epoch[i] > epoch) {{
+                radius[i] = {phys.trivia.radius.c_inline(volume="volume[i]")};
+            }}
+        """.replace(
+                "real_type", self._get_c_type()
+            ),
+        )
+
         self.__explicit_euler_body = trtc.For(
             ("y", "dt", "dy_dt"),
             "i",
@@ -80,6 +93,30 @@ class PhysicsMethods(ThrustRTCBackendMethods):
             ),
         )
 
+        radius = phys.trivia.radius.c_inline(volume="arg_0")
+        area = phys.trivia.area.c_inline(radius=radius)
+        self._fused_chain_syntax = {
+            "radius": "real_type {out} = " + radius.replace("arg_0", "{0}") + ";",
+            "area": "real_type {out} = " + area.replace("arg_0", "{0}") + ";",
+            "ratio": "real_type {out} = {0} / {1};",
+            "interpolation": """
+            real_type {out} = 0;
+            if ({0} >= 0) {{
+                auto {out}_x = {p0} * {0};
+                auto {out}_id = (int64_t)({out}_x);
+                if ({out}_id >= {p3} - 1) {{
+                    {out} = {p1}[{p3} - 1];
+                }}
+                else {{
+                    auto {out}_dr = ({out}_x - {out}_id) / {p0};
+                    {out} = {p1}[{out}_id] + {out}_dr * {p2}[{out}_id];
+                }}
+            }}
+            """,
+            "store": "{out} = {value};",
+        }
+        self._fused_chain_bodies = {}
+
     @nice_thrust(**NICE_THRUST_FLAGS)
     def critical_volume(self, *, v_cr, kappa, f_org, v_dry, v_wet, T, cell):
         self.__critical_volume_body.launch_n(
@@ -101,6 +138,13 @@ class PhysicsMethods(ThrustRTCBackendMethods):
             T.shape[0], (rhod.data, thd.data, qv.data, T.data, p.data, RH.data)
         )
 
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def radius_modified_since(self, *, radius, volume, droplet_epoch, epoch):
+        self.__radius_modified_since_body.launch_n(
+            radius.shape[0],
+            (radius.data, volume.data, droplet_epoch.data, trtc.DVInt64(epoch)),
+        )
+
     @nice_thrust(**NICE_THRUST_FLAGS)
     def terminal_velocity(self, *, values, radius, k1, k2, k3, r1, r2):
         k1 = self._get_floating_point(k1)
@@ -117,3 +161,33 @@ class PhysicsMethods(ThrustRTCBackendMethods):
         dt = self._get_floating_point(dt)
         dy_dt = self._get_floating_point(dy_dt)
         self.__explicit_euler_body.launch_n(y.shape[0], (y.data, dt, dy_dt))
+
+    def _make_fused_chain_body(self, chain):
+        newline = "\n" + 12 * " "
+        return trtc.For(
+            param_names=chain.parameters(),
+            name_iter="i",
+            body=f"""
+            {newline.join(chain.statements(self._fused_chain_syntax))}
+        """.replace(
+                "real_type", self._get_c_type()
+            ),
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def fused_chain(self, chain):
+        """evaluates all links of a `PySDM.attributes.impl.fused_chain.FusedChain`
+        in a single pass over droplets"""
+        body = self._fused_chain_bodies.get(chain.key)
+        if body is None:
+            body = self._make_fused_chain_body(chain)
+            self._fused_chain_bodies[chain.key] = body
+        arguments = []
+        for argument in chain.arguments():
+            if isinstance(argument, StorageBase):
+                arguments.append(argument.data)
+            elif isinstance(argument, int):
+                arguments.append(trtc.DVInt64(argument))
+            else:
+                arguments.append(self._get_floating_point(argument))
+        body.launch_n(chain.leaf.data.shape[0], arguments)
@@ -65,15 +65,66 @@ class TerminalVelocityMethods(ThrustRTCBackendMethods):
             ),
         )
 
-        # TODO #599 r<0
+        interpolate = """
+            if (radius[i] < 0) {
+                output[i] = 0;
+            }
+            else {
+                auto r_id = (int64_t)(factor * radius[i]);
+                if (r_id >= n_nodes - 1) {
+                    output[i] = a[n_nodes - 1];
+                }
+                else {
+                    auto r_rest = (factor * radius[i] - r_id) / factor;
+                    output[i] = a[r_id] + r_rest * b[r_id];
+                }
+            }
+        """
+
         self.__interpolation_body = trtc.For(
-            ("output", "radius", "factor", "a", "b"),
+            ("output", "radius", "factor", "a", "b", "n_nodes"), "i", interpolate
+        )
+
+        self.__interpolation_where_changed_body = trtc.For(
+            (
+                "output",
+                "radius",
+                "factor",
+                "a",
+                "b",
+                "n_nodes",
+                "radius_at_update",
+                "rtol",
+            ),
             "i",
             """
-            auto r_id = (int64_t)(factor * radius[i]);
-            auto r_rest = (factor * radius[i] - r_id) / factor;
-            output[i] = a[r_id] + r_rest * b[r_id];
-            """,
+            auto r_old = radius_at_update[i];
+            if (r_old >= 0 && abs(radius[i] - r_old) <= rtol * abs(r_old)) {
+                return;
+            }
+            radius_at_update[i] = radius[i];
+            """
+            + interpolate,
+        )
+
+        self.__interpolation_modified_since_body = trtc.For(
+            (
+                "output",
+                "radius",
+                "factor",
+                "a",
+                "b",
+                "n_nodes",
+                "droplet_epoch",
+                "epoch",
+            ),
+            "i",
+            """
+            if (droplet_epoch[i] <= epoch) {
+                return;
+            }
+            """
+            + interpolate,
         )
 
     def linear_collection_efficiency(
@@ -124,5 +175,49 @@ class TerminalVelocityMethods(ThrustRTCBackendMethods):
     def interpolation(self, *, output, radius, factor, b, c):
         factor_device = trtc.DVInt64(factor)
         self.__interpolation_body.launch_n(
-            len(radius), (output.data, radius.data, factor_device, b.data, c.data)
+            len(radius),
+            (
+                output.data,
+                radius.data,
+                factor_device,
+                b.data,
+                c.data,
+                trtc.DVInt64(len(b)),
+            ),
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def interpolation_where_changed(
+        self, *, output, radius, factor, b, c, radius_at_update, rtol
+    ):
+        self.__interpolation_where_changed_body.launch_n(
+            len(radius),
+            (
+                output.data,
+                radius.data,
+                trtc.DVInt64(factor),
+                b.data,
+                c.data,
+                trtc.DVInt64(len(b)),
+                radius_at_update.data,
+                self._get_floating_point(rtol),
+            ),
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def interpolation_modified_since(
+        self, *, output, radius, factor, b, c, droplet_epoch, epoch
+    ):
+        self.__interpolation_modified_since_body.launch_n(
+            len(radius),
+            (
+                output.data,
+                radius.data,
+                trtc.DVInt64(factor),
+                b.data,
+                c.data,
+                trtc.DVInt64(len(b)),
+                droplet_epoch.data,
+                trtc.DVInt64(epoch),
+            ),
         )
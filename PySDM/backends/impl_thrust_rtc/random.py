@@ -4,7 +4,7 @@ random number generator class for ThrustRTC backend (using CURandRTC)
 from PySDM.backends.impl_thrust_rtc.conf import NICE_THRUST_FLAGS
 from PySDM.backends.impl_thrust_rtc.nice_thrust import nice_thrust
 
-from ..impl_common.random_common import RandomCommon
+from ..impl_common.random_common import RandomCommon, substream_seed
 from .conf import rndrtc, trtc
 
 #  TIP: sometimes only half array is needed
@@ -27,11 +27,11 @@ class Random(RandomCommon):  # pylint: disable=too-few-public-methods
         """,
     )
 
-    def __init__(self, size, seed):
-        super().__init__(size, seed)
+    def __init__(self, size, seed, stream=0):
+        super().__init__(size, seed, stream)
         rng = rndrtc.DVRNG()
         self.generator = trtc.device_vector("RNGState", size)
-        dseed = trtc.DVInt64(seed)
+        dseed = trtc.DVInt64(substream_seed(seed, stream))
         Random.__urand_init_rng_state_body.launch_n(size, [rng, self.generator, dseed])
 
     @nice_thrust(**NICE_THRUST_FLAGS)
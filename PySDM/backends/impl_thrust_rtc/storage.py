@@ -284,6 +284,7 @@ def make_storage_class(BACKEND):  # pylint: disable=too-many-statements
 
     class Storage(StorageBase):
         FLOAT = BACKEND._get_np_dtype()
+        ACCUMULATOR = FLOAT
         INT = np.int64
         BOOL = np.bool_
 
@@ -1,7 +1,9 @@
 """
 Multi-threaded CPU backend using LLVM-powered just-in-time compilation
 """
+import numpy as np
 
+from PySDM.backends.impl_numba import jit_cache, storage_impl
 from PySDM.backends.impl_numba.methods.chemistry_methods import ChemistryMethods
 from PySDM.backends.impl_numba.methods.collisions_methods import CollisionsMethods
 from PySDM.backends.impl_numba.methods.condensation_methods import CondensationMethods
@@ -14,8 +16,10 @@ from PySDM.backends.impl_numba.methods.physics_methods import PhysicsMethods
 from PySDM.backends.impl_numba.methods.terminal_velocity_methods import (
     TerminalVelocityMethods,
 )
+from PySDM.backends.impl_numba.random import CounterBasedRandom
 from PySDM.backends.impl_numba.random import Random as ImportedRandom
 from PySDM.backends.impl_numba.storage import Storage as ImportedStorage
+from PySDM.backends.impl_numba.storage import make_storage_class
 from PySDM.formulae import Formulae
 
 
@@ -36,10 +40,14 @@ class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
 
     default_croupier = "local"
 
-    def __init__(self, formulae=None, double_precision=True):
-        if not double_precision:
-            raise NotImplementedError()
+    def __init__(
+        self, formulae=None, double_precision=True, counter_based_random=False
+    ):
         self.formulae = formulae or Formulae()
+        if not double_precision:
+            self.Storage = make_storage_class(np.float32)
+        if counter_based_random:
+            self.Random = CounterBasedRandom
         CollisionsMethods.__init__(self)
         PairMethods.__init__(self)
         IndexMethods.__init__(self)
@@ -50,3 +58,5 @@ class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
         FreezingMethods.__init__(self)
         DisplacementMethods.__init__(self)
         TerminalVelocityMethods.__init__(self)
+        jit_cache.enable_all(self)
+        jit_cache.enable_all(storage_impl)
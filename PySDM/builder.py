@@ -9,12 +9,15 @@ from PySDM.attributes.impl.mapper import get_class as attr_class
 from PySDM.attributes.numerics.cell_id import CellID
 from PySDM.attributes.physics.multiplicities import Multiplicities
 from PySDM.attributes.physics.volume import Volume
+from PySDM.impl.moments_batch import MomentsBatch
 from PySDM.impl.particle_attributes_factory import ParticleAttributesFactory
+from PySDM.impl.snapshot import Snapshot
 from PySDM.impl.wall_timer import WallTimer
 from PySDM.initialisation.discretise_multiplicities import (  # TODO #324
     discretise_multiplicities,
 )
 from PySDM.particulator import Particulator
+from PySDM.products.impl.moment_product import MomentProduct
 
 
 class Builder:
@@ -29,16 +32,37 @@ class Builder:
         }
         self.aerosol_radius_threshold = 0
         self.condensation_params = None
+        self.terminal_velocity_params = {}
+        self.requested_attributes = set()
 
     def _set_condensation_parameters(self, **kwargs):
         self.condensation_params = kwargs
 
+    def set_terminal_velocity(self, *, approximation=None, rtol=None):
+        """sets the terminal velocity `approximation` class (defaults to
+        `PySDM.dynamics.terminal_velocity.Interpolation`) and the relative radius change
+        `rtol` below which the `terminal velocity` attribute is not recomputed
+        (by default, all particles are updated whenever radius changes)"""
+        if "terminal velocity" in self.req_attr:
+            raise AssertionError("terminal velocity attribute has already been created")
+        if approximation is not None:
+            self.terminal_velocity_params["approximation"] = approximation
+        self.terminal_velocity_params["rtol"] = rtol
+
     def set_environment(self, environment):
         if self.particulator.environment is not None:
             raise AssertionError("environment has already been set")
         self.particulator.environment = environment
         self.particulator.environment.register(self)
 
+    def set_profiler(self, profiler):
+        if self.particulator.profiler is not None:
+            raise AssertionError("profiler has already been set")
+        if self.particulator.attributes is not None:
+            raise AssertionError("profiler has to be set before building particulator")
+        self.particulator.profiler = profiler
+        self.particulator.profiler.register(self)
+
     def add_dynamic(self, dynamic):
         assert self.particulator.environment is not None
         key = get_key(dynamic)
@@ -59,14 +83,17 @@ class Builder:
         self.particulator.products[product.name] = product
 
     def get_attribute(self, attribute_name):
-        self.request_attribute(attribute_name)
+        """to be used by attributes for accessing their dependencies (which, unlike
+        attributes passed to `request_attribute()`, are not recorded as requested)"""
+        if attribute_name not in self.req_attr:
+            self.req_attr[attribute_name] = attr_class(
+                attribute_name, self.particulator.dynamics, self.formulae
+            )(self)
         return self.req_attr[attribute_name]
 
     def request_attribute(self, attribute, variant=None):
-        if attribute not in self.req_attr:
-            self.req_attr[attribute] = attr_class(
-                attribute, self.particulator.dynamics, self.formulae
-            )(self)
+        self.get_attribute(attribute)
+        self.requested_attributes.add(attribute)
         if variant is not None:
             assert variant == self.req_attr[attribute]
 
@@ -96,16 +123,41 @@ class Builder:
                 )
             )
         attributes["n"] = int_caster(attributes["n"])
-        if self.particulator.mesh.dimension == 0:
+        if self.particulator.mesh.dimension == 0 and "cell id" not in attributes:
             attributes["cell id"] = np.zeros_like(attributes["n"], dtype=np.int64)
-        self.particulator.attributes = ParticleAttributesFactory.attributes(
-            self.particulator, self.req_attr, attributes
-        )
+        with self.particulator.profiled():
+            self.particulator.attributes = ParticleAttributesFactory.attributes(
+                self.particulator,
+                self.req_attr,
+                attributes,
+                requested=self.requested_attributes,
+            )
         self.particulator.recalculate_cell_id()
+        self.particulator.moments_batch = MomentsBatch(self.particulator)
+        for product in self.particulator.products.values():
+            if isinstance(product, MomentProduct):
+                for params in product.requested_moments():
+                    self.particulator.moments_batch.register(
+                        self.particulator.moments_batch.make_spec(**params)
+                    )
 
         for key in self.particulator.dynamics:
-            self.particulator.timers[key] = WallTimer()
+            self.particulator.timers[key] = (
+                WallTimer()
+                if self.particulator.profiler is None
+                else self.particulator.profiler.timer(key)
+            )
+
+        return self.particulator
 
+    def restore(self, path, products: tuple = ()):
+        """builds the particulator using attribute values from a file written with
+        `PySDM.particulator.Particulator.checkpoint()` and resumes its complete state
+        (the builder is expected to be set up with the same environment and dynamics
+        as the one used to create the checkpointed particulator)"""
+        snapshot = Snapshot(path)
+        self.build(attributes=snapshot.particles["attributes"], products=products)
+        snapshot.restore(self.particulator)
         return self.particulator
 
 
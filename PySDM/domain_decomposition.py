@@ -0,0 +1,325 @@
+"""
+domain decomposition of two-dimensional (e.g., `PySDM.environments.kinematic_2d.Kinematic2D`)
+ simulations into slabs along the first (horizontal, periodic) dimension, each slab handled
+ by a separate particulator run in a separate process; slab meshes are extended with halo
+ columns into which super-droplets leaving a slab are moved by displacement (assuming
+ Courant numbers not exceeding unity) and from which they are then migrated, together with
+ all their attributes, to the neighbouring slabs through pipes right after displacement
+ (hence before any other dynamics of the timestep is run); field products are gathered
+ from all slabs while other products are reduced across slabs with user-supplied functions;
+ Eulerian advection (`PySDM.dynamics.eulerian_advection.EulerianAdvection`) is not
+ supported as exchanging halos of the Eulerian fields would require a halo matching
+ the stencil of the advection solver
+"""
+import multiprocessing
+import queue
+
+import numpy as np
+
+from PySDM.impl.mesh import Mesh
+from PySDM.initialisation.discretise_multiplicities import discretise_multiplicities
+
+_SIDES = ("left", "right")
+
+
+class Slab:  # pylint: disable=too-many-instance-attributes
+    def __init__(self, *, index: int, n_slab: int, grid: tuple, size: tuple, halo=1):
+        """`grid` and `size` refer to the whole domain, the slab spans columns
+        from `start` to `stop` (exclusive) of the whole-domain grid"""
+        widths = [len(part) for part in np.array_split(np.arange(grid[0]), n_slab)]
+        if min(widths) < halo:
+            raise ValueError(f"slabs narrower than the halo ({halo}) for {n_slab=}")
+        self.index = index
+        self.n_slab = n_slab
+        self.halo = halo
+        self.global_grid = tuple(grid)
+        self.start = sum(widths[:index])
+        self.stop = self.start + widths[index]
+        self.n_x = self.stop - self.start
+        self.grid = (self.n_x + 2 * halo, *grid[1:])
+        self.size = (size[0] / grid[0] * self.grid[0], *size[1:])
+
+    def __columns(self, extra=0):
+        return np.arange(self.start - self.halo, self.stop + self.halo + extra)
+
+    def scalar_field(self, field: np.ndarray):
+        """returns the slab part (incl. halo) of a whole-domain scalar field"""
+        return np.take(field, self.__columns(), axis=0, mode="wrap")
+
+    def vector_field(self, components: tuple):
+        """returns the slab part (incl. halo) of a whole-domain Arakawa-C staggered
+        vector field (e.g., the Courant field passed to `Displacement`)"""
+        return tuple(
+            np.take(component[:-1], self.__columns(extra=1), axis=0, mode="wrap")
+            if dim == 0
+            else self.scalar_field(component)
+            for dim, component in enumerate(components)
+        )
+
+    def interior(self, field: np.ndarray):
+        """returns the part of a slab field without the halo"""
+        return field[self.halo : self.halo + self.n_x]
+
+    def to_global(self, cell_origin_x):
+        return (cell_origin_x - self.halo + self.start) % self.global_grid[0]
+
+    def to_local(self, cell_origin_x):
+        return (cell_origin_x - self.start) % self.global_grid[0] + self.halo
+
+    def select_attributes(self, attributes: dict, n_sd: int):
+        """returns attributes of the super-droplets (out of the whole-domain ones)
+        located within the slab, padded with zero-multiplicity entries up to `n_sd`
+        (spare storage for super-droplets migrating into the slab)"""
+        cell_origin = attributes["cell origin"]
+        mask = (self.start <= cell_origin[0]) & (cell_origin[0] < self.stop)
+        n_in_slab = np.count_nonzero(mask)
+        if n_in_slab > n_sd:
+            raise ValueError(f"{n_in_slab} super-droplets in slab exceed {n_sd=}")
+
+        selected = {}
+        for key, value in attributes.items():
+            if key == "cell id":
+                continue
+            value = np.asarray(value)
+            selected[key] = np.zeros((*value.shape[:-1], n_sd), dtype=value.dtype)
+            selected[key][..., :n_in_slab] = value[..., mask]
+        selected["n"] = np.zeros(n_sd, dtype=np.int64)
+        selected["n"][:n_in_slab] = discretise_multiplicities(
+            np.asarray(attributes["n"])[mask]
+        )
+        selected["cell origin"][0, :n_in_slab] = self.to_local(cell_origin[0, mask])
+        selected["cell origin"][0, n_in_slab:] = self.halo
+        selected["cell id"] = np.dot(
+            Mesh(self.grid, self.size).strides, selected["cell origin"]
+        ).ravel()
+        return selected
+
+
+def _particulator(simulation):
+    return getattr(simulation, "particulator", simulation)
+
+
+def _send_leaving(state, slab, outboxes):
+    """sends super-droplets located in the halo to the neighbours, returns
+    storage indices of the remaining ones"""
+    attributes = state["attributes"]
+    idx = state["idx"][: state["idx length"]]
+    cell_origin_x = attributes["cell origin"][0, idx]
+    leaving = {
+        "left": cell_origin_x < slab.halo,
+        "right": cell_origin_x >= slab.halo + slab.n_x,
+    }
+    for side in _SIDES:
+        particles = {
+            key: value[..., idx[leaving[side]]]
+            for key, value in attributes.items()
+            if key != "cell id"
+        }
+        particles["cell origin"][0] = slab.to_global(particles["cell origin"][0])
+        outboxes[side].put(particles)
+    return idx[~(leaving["left"] | leaving["right"])]
+
+
+def _insert_incoming(state, slab, remaining, incoming):
+    """writes the incoming super-droplets into free storage slots"""
+    n_incoming = sum(len(particles["n"]) for particles in incoming)
+    occupied = np.zeros(len(state["idx"]), dtype=bool)
+    occupied[remaining] = True
+    free = np.flatnonzero(~occupied)[:n_incoming]
+    if len(free) < n_incoming:
+        raise ValueError(
+            f"no storage left for super-droplets migrating into slab {slab.index}"
+            " (increase n_sd)"
+        )
+    slots = np.split(free, np.cumsum([len(p["n"]) for p in incoming])[:-1])
+    for particles, where in zip(incoming, slots):
+        for key, value in particles.items():
+            state["attributes"][key][..., where] = value
+        state["attributes"]["cell origin"][0, where] = slab.to_local(
+            particles["cell origin"][0]
+        )
+
+    idx = np.concatenate((remaining, free))
+    state["idx"][:] = len(state["idx"])
+    state["idx"][: len(idx)] = idx
+    state["idx length"] = state["valid n_sd"] = len(idx)
+    state["sorted"] = False
+
+
+def _migrate(particulator, slab, inboxes, outboxes):
+    """sends super-droplets which left the slab to the neighbours, receives theirs
+    and inserts the incoming super-droplets into free storage slots"""
+    particulator.attributes.sanitize()
+    state = particulator.attributes.get_state()
+    remaining = _send_leaving(state, slab, outboxes)
+    incoming = [inboxes[side].get() for side in _SIDES]
+    if len(remaining) == state["idx length"] and not any(
+        len(particles["n"]) for particles in incoming
+    ):
+        return
+    _insert_incoming(state, slab, remaining, incoming)
+    particulator.attributes.set_state(state)
+    particulator.recalculate_cell_id()
+
+
+class _MigratingDisplacement:
+    """`PySDM.dynamics.displacement.Displacement` followed by migration of the
+    super-droplets which left the slab, so that no super-droplet located in the halo
+    takes part in the dynamics run afterwards within the same timestep"""
+
+    def __init__(self, displacement, migrate):
+        self.displacement = displacement
+        self.migrate = migrate
+
+    def __call__(self):
+        self.displacement()
+        self.migrate()
+
+    def __getattr__(self, name):
+        return getattr(self.displacement, name)
+
+
+def _products(particulator, slab):
+    """returns product values (with fields stripped of the halo) flagged as fields
+    or not (i.e., whether to be gathered from all slabs)"""
+    output = {}
+    for name, product in particulator.products.items():
+        value = np.asarray(product.get())
+        is_field = value.shape[: len(slab.grid)] == slab.grid
+        output[name] = (
+            slab.interior(value).copy() if is_field else value.copy(),
+            is_field,
+        )
+    return output
+
+
+def _run_slab(
+    simulation_factory, settings, slab, output_steps, inboxes, outboxes, results
+):  # pylint: disable=too-many-arguments
+    try:
+        particulator = _particulator(simulation_factory(settings, slab))
+        if "EulerianAdvection" in particulator.dynamics:
+            raise NotImplementedError(
+                "EulerianAdvection is not supported with domain decomposition"
+            )
+        particulator.attributes.invalidate()  # removing the zero-multiplicity padding
+        particulator.attributes.sanitize()
+        if "Displacement" in particulator.dynamics:
+            particulator.dynamics["Displacement"] = _MigratingDisplacement(
+                particulator.dynamics["Displacement"],
+                lambda: _migrate(particulator, slab, inboxes, outboxes),
+            )
+        for i, step in enumerate(output_steps):
+            while particulator.n_steps < step:
+                particulator.run(1)
+            results.put((slab.index, i, _products(particulator, slab)))
+    except Exception as exception:  # pylint: disable=broad-except
+        results.put((slab.index, None, exception))
+
+
+class DomainDecomposition:  # pylint: disable=too-few-public-methods
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        simulation_factory: callable,
+        settings,
+        n_slab: int,
+        grid: tuple,
+        size: tuple,
+        output_steps: [list, tuple, np.ndarray],
+        halo: int = 1,
+        reductions: dict = None,
+        mp_context=None,
+    ):
+        """`simulation_factory(settings, slab)` is expected to return (an object with)
+        a ready-to-run particulator set up on the slab mesh (`slab.grid`, `slab.size`),
+        with attributes obtained using `slab.select_attributes()` and with the Courant
+        field obtained using `slab.vector_field()`; the factory and settings have
+        to be picklable, see also `PySDM.ensemble_runner.EnsembleRunner`;
+        `reductions` maps names of products which are not fields to functions
+        (e.g., `np.sum`, `np.mean`) called as `reduction(values, axis=0)` with the
+        values from all slabs stacked along the first axis"""
+        self.simulation_factory = simulation_factory
+        self.settings = settings
+        self.reductions = reductions or {}
+        self.slabs = tuple(
+            Slab(index=index, n_slab=n_slab, grid=grid, size=size, halo=halo)
+            for index in range(n_slab)
+        )
+        self.output_steps = tuple(int(step) for step in output_steps)
+        if len(self.output_steps) == 0 or np.any(np.diff((0, *self.output_steps)) < 0):
+            raise ValueError("output_steps must be a non-empty non-decreasing sequence")
+        self.mp_context = mp_context or multiprocessing.get_context("spawn")
+
+    def run(self):
+        """runs all slabs and returns a dictionary of product values (with fields
+        gathered from all slabs) with arrays of shape `(len(output_steps), ...)`"""
+        n_slab = len(self.slabs)
+        inboxes = [
+            {side: self.mp_context.Queue() for side in _SIDES} for _ in self.slabs
+        ]
+        results = self.mp_context.Queue()
+        processes = [
+            self.mp_context.Process(
+                target=_run_slab,
+                args=(
+                    self.simulation_factory,
+                    self.settings,
+                    slab,
+                    self.output_steps,
+                    inboxes[slab.index],
+                    {
+                        "left": inboxes[(slab.index - 1) % n_slab]["right"],
+                        "right": inboxes[(slab.index + 1) % n_slab]["left"],
+                    },
+                    results,
+                ),
+                daemon=True,
+            )
+            for slab in self.slabs
+        ]
+        for process in processes:
+            process.start()
+
+        outputs = [[None] * n_slab for _ in self.output_steps]
+        completed = False
+        try:
+            for _ in range(n_slab * len(self.output_steps)):
+                slab_index, output_index, output = self.__receive(results, processes)
+                if output_index is None:
+                    raise output
+                outputs[output_index][slab_index] = output
+            completed = True
+        finally:
+            for process in processes:
+                if not completed:
+                    process.terminate()
+                process.join()
+
+        return {
+            name: np.stack([self.__gather(name, output) for output in outputs])
+            for name in outputs[0][0]
+        }
+
+    def __gather(self, name, output):
+        values = [slab_output[name][0] for slab_output in output]
+        if output[0][name][1]:
+            return np.concatenate(values)
+        if name not in self.reductions:
+            raise ValueError(
+                f"product '{name}' is not a field, a reduction across slabs"
+                " has to be specified in `reductions` (e.g., np.sum or np.mean)"
+            )
+        return self.reductions[name](np.stack(values), axis=0)
+
+    @staticmethod
+    def __receive(results, processes):
+        while True:
+            try:
+                return results.get(timeout=1)
+            except queue.Empty as exception:
+                for process in processes:
+                    if process.exitcode not in (None, 0):
+                        raise RuntimeError(
+                            f"slab process exited with code {process.exitcode}"
+                        ) from exception
@@ -1,6 +1,10 @@
 """
 See Low & List 1982
 """
+from PySDM.backends.impl_common.pairwise_expression import (
+    PairwiseExpression,
+    PairwisePipeline,
+)
 
 
 class LowList1982Nf:
@@ -13,6 +17,7 @@ class LowList1982Nf:
         self.ll82_tmp = {}
         self.sum_of_volumes = None
         self.const = None
+        self.pipeline = None
 
     def register(self, builder):
         self.particulator = builder.particulator
@@ -23,7 +28,7 @@ class LowList1982Nf:
         builder.request_attribute("radius")
         builder.request_attribute("volume")
         builder.request_attribute("terminal velocity")
-        for key in ("Sc", "St", "tmp", "tmp2", "CKE", "We", "W2", "ds", "dl", "dcoal"):
+        for key in ("St", "CKE", "We", "W2", "ds", "dl", "dcoal"):
             self.arrays[key] = self.particulator.PairwiseStorage.empty(
                 self.particulator.n_sd // 2, dtype=float
             )
@@ -32,52 +37,40 @@ class LowList1982Nf:
                 self.particulator.n_sd // 2, dtype=float
             )
 
-    def __call__(self, nf, frag_size, u01, is_first_in_pair):
-        self.sum_of_volumes.sum(
-            self.particulator.attributes["volume"], is_first_in_pair
-        )
-        self.arrays["ds"].min(self.particulator.attributes["radius"], is_first_in_pair)
-        self.arrays["ds"] *= 2
-        self.arrays["dl"].max(self.particulator.attributes["radius"], is_first_in_pair)
-        self.arrays["dl"] *= 2
-        self.arrays["dcoal"].sum(
-            self.particulator.attributes["volume"], is_first_in_pair
-        )
-
-        self.arrays["dcoal"] /= self.const.PI / 6
-        self.arrays["dcoal"] **= 1 / 3
-
-        # compute the surface energy, CKE, & dimensionless numbers
-        self.arrays["Sc"].sum(self.particulator.attributes["volume"], is_first_in_pair)
-        self.arrays["Sc"] **= 2 / 3
-        self.arrays["Sc"] *= (
-            self.const.PI * self.const.sgm_w * (6 / self.const.PI) ** (2 / 3)
+        # the surface energy, CKE, & dimensionless numbers
+        E = PairwiseExpression
+        self.pipeline = PairwisePipeline(
+            {
+                "sum_of_volumes": E.sum("volume"),
+                "ds": E.min("radius") * 2,
+                "dl": E.max("radius") * 2,
+                "dcoal": (E.ref("sum_of_volumes") / (self.const.PI / 6)) ** (1 / 3),
+                "Sc": E.ref("sum_of_volumes") ** (2 / 3)
+                * (self.const.PI * self.const.sgm_w * (6 / self.const.PI) ** (2 / 3)),
+                "St": (E.ref("ds") ** 2 + E.ref("dl") ** 2)
+                * (self.const.PI * self.const.sgm_w),
+                "CKE": E.divide_if_not_zero(
+                    E.multiply("volume"), E.ref("sum_of_volumes")
+                )
+                * E.distance("terminal velocity") ** 2
+                * (self.const.rho_w / 2),
+                "We": E.divide_if_not_zero(E.ref("CKE"), E.ref("Sc")),
+                "W2": E.divide_if_not_zero(E.ref("CKE"), E.ref("St")),
+            },
+            outputs=("sum_of_volumes", "ds", "dl", "dcoal", "St", "CKE", "We", "W2"),
         )
-        self.arrays["St"].min(self.particulator.attributes["radius"], is_first_in_pair)
-        self.arrays["St"] *= 2
-        self.arrays["St"] **= 2
-        self.arrays["tmp"].max(self.particulator.attributes["radius"], is_first_in_pair)
-        self.arrays["tmp"] *= 2
-        self.arrays["tmp"] **= 2
-        self.arrays["St"] += self.arrays["tmp"]
-        self.arrays["St"] *= self.const.PI * self.const.sgm_w
 
-        self.arrays["tmp"].sum(self.particulator.attributes["volume"], is_first_in_pair)
-        self.arrays["tmp2"].distance(
-            self.particulator.attributes["terminal velocity"], is_first_in_pair
-        )
-        self.arrays["tmp2"] **= 2
-        self.arrays["CKE"].multiply(
-            self.particulator.attributes["volume"], is_first_in_pair
+    def __call__(self, nf, frag_size, u01, is_first_in_pair):
+        self.particulator.backend.pairwise_pipeline(
+            self.pipeline,
+            outputs={"sum_of_volumes": self.sum_of_volumes, **self.arrays},
+            attributes={
+                attr: self.particulator.attributes[attr]
+                for attr in ("volume", "radius", "terminal velocity")
+            },
+            pairwise={},
+            is_first_in_pair=is_first_in_pair,
         )
-        self.arrays["CKE"].divide_if_not_zero(self.arrays["tmp"])
-        self.arrays["CKE"] *= self.arrays["tmp2"]
-        self.arrays["CKE"] *= self.const.rho_w / 2
-
-        self.arrays["We"].fill(self.arrays["CKE"])
-        self.arrays["W2"].fill(self.arrays["CKE"])
-        self.arrays["We"].divide_if_not_zero(self.arrays["Sc"])
-        self.arrays["W2"].divide_if_not_zero(self.arrays["St"])
 
         for key in ("Rf", "Rs", "Rd"):
             self.ll82_tmp[key] *= 0.0
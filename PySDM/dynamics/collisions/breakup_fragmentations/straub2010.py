@@ -1,6 +1,10 @@
 """
 See Straub et al 2010
 """
+from PySDM.backends.impl_common.pairwise_expression import (
+    PairwiseExpression,
+    PairwisePipeline,
+)
 from PySDM.physics.constants import si
 
 
@@ -15,6 +19,7 @@ class Straub2010Nf:
         self.max_size = None
         self.sum_of_volumes = None
         self.const = None
+        self.pipeline = None
 
     def register(self, builder):
         self.particulator = builder.particulator
@@ -28,7 +33,7 @@ class Straub2010Nf:
         builder.request_attribute("radius")
         builder.request_attribute("volume")
         builder.request_attribute("terminal velocity")
-        for key in ("Sc", "tmp", "tmp2", "CKE", "We", "gam", "CW", "ds"):
+        for key in ("CW", "gam", "ds"):
             self.arrays[key] = self.particulator.PairwiseStorage.empty(
                 self.particulator.n_sd // 2, dtype=float
             )
@@ -37,42 +42,42 @@ class Straub2010Nf:
                 self.particulator.n_sd // 2, dtype=float
             )
 
-    def __call__(self, nf, frag_size, u01, is_first_in_pair):
-        self.max_size.max(self.particulator.attributes["volume"], is_first_in_pair)
-        self.sum_of_volumes.sum(
-            self.particulator.attributes["volume"], is_first_in_pair
+        # the dimensionless numbers and CW=CKE * We
+        E = PairwiseExpression
+        self.pipeline = PairwisePipeline(
+            {
+                "max_size": E.max("volume"),
+                "sum_of_volumes": E.sum("volume"),
+                "ds": E.min("radius") * 2,
+                "Sc": E.ref("sum_of_volumes") ** (2 / 3)
+                * (self.const.PI * self.const.sgm_w * (6 / self.const.PI) ** (2 / 3)),
+                "CKE": E.divide_if_not_zero(
+                    E.multiply("volume"), E.ref("sum_of_volumes")
+                )
+                * E.distance("terminal velocity") ** 2
+                * (self.const.rho_w / 2),
+                "We": E.divide_if_not_zero(E.ref("CKE"), E.ref("Sc")),
+                "CW": E.ref("We") * E.ref("CKE") / si.uJ,
+                "gam": E.divide_if_not_zero(E.max("radius"), E.min("radius")),
+            },
+            outputs=("max_size", "sum_of_volumes", "ds", "CW", "gam"),
         )
-        self.arrays["ds"].min(self.particulator.attributes["radius"], is_first_in_pair)
-        self.arrays["ds"] *= 2
 
-        # compute the dimensionless numbers and CW=CKE * We
-        self.arrays["tmp"].sum(self.particulator.attributes["volume"], is_first_in_pair)
-        self.arrays["Sc"].fill(self.arrays["tmp"])
-        self.arrays["Sc"] **= 2 / 3
-        self.arrays["Sc"] *= (
-            self.const.PI * self.const.sgm_w * (6 / self.const.PI) ** (2 / 3)
-        )
-        self.arrays["tmp2"].distance(
-            self.particulator.attributes["terminal velocity"], is_first_in_pair
-        )
-        self.arrays["tmp2"] **= 2
-        self.arrays["CKE"].multiply(
-            self.particulator.attributes["volume"], is_first_in_pair
+    def __call__(self, nf, frag_size, u01, is_first_in_pair):
+        self.particulator.backend.pairwise_pipeline(
+            self.pipeline,
+            outputs={
+                "max_size": self.max_size,
+                "sum_of_volumes": self.sum_of_volumes,
+                **self.arrays,
+            },
+            attributes={
+                attr: self.particulator.attributes[attr]
+                for attr in ("volume", "radius", "terminal velocity")
+            },
+            pairwise={},
+            is_first_in_pair=is_first_in_pair,
         )
-        self.arrays["CKE"].divide_if_not_zero(self.arrays["tmp"])
-        self.arrays["CKE"] *= self.arrays["tmp2"]
-        self.arrays["CKE"] *= self.const.rho_w / 2
-
-        self.arrays["We"].fill(self.arrays["CKE"])
-        self.arrays["We"].divide_if_not_zero(self.arrays["Sc"])
-
-        self.arrays["CW"].fill(self.arrays["We"])
-        self.arrays["CW"] *= self.arrays["CKE"]
-        self.arrays["CW"] /= si.uJ
-
-        self.arrays["gam"].max(self.particulator.attributes["radius"], is_first_in_pair)
-        self.arrays["tmp"].min(self.particulator.attributes["radius"], is_first_in_pair)
-        self.arrays["gam"].divide_if_not_zero(self.arrays["tmp"])
 
         for key in ("Nr1", "Nr2", "Nr3", "Nr4", "Nrt"):
             self.straub_tmp[key] *= 0.0
@@ -21,15 +21,17 @@ from PySDM.dynamics.impl.random_generator_optimizer import RandomGeneratorOptimi
 from PySDM.dynamics.impl.random_generator_optimizer_nopair import (
     RandomGeneratorOptimizerNoPair,
 )
+from PySDM.dynamics.impl.random_streams import RANDOM_STREAMS
 from PySDM.physics import si
 
 # pylint: disable=too-many-lines
 
 DEFAULTS = namedtuple(
-    "_", ("dt_coal_range", "adaptive", "substeps", "max_multiplicity")
+    "_", ("dt_coal_range", "adaptive", "adaptive_loop", "substeps", "max_multiplicity")
 )(
     dt_coal_range=(0.1 * si.second, 100.0 * si.second),
     adaptive=True,
+    adaptive_loop="global",
     substeps=1,
     max_multiplicity=Multiplicities.MAX_VALUE // int(2e5),
 )
@@ -50,8 +52,18 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         dt_coal_range=DEFAULTS.dt_coal_range,
         enable_breakup: bool = True,
         warn_overflows: bool = True,
+        adaptive_loop: str = DEFAULTS.adaptive_loop,
+        random_substreams: bool = False,
     ):
+        """with `adaptive_loop="local"` (coalescence-only, adaptive), each cell
+        advances its own sequence of substeps within a single backend kernel instead
+        of the global loop over substeps sorting cells by the remaining time;
+        with `random_substreams=True`, the breakup process and fragment random numbers
+        are drawn from independent substreams (see
+        `PySDM.dynamics.impl.random_streams`) instead of from identically seeded
+        generators"""
         assert substeps == 1 or adaptive is False
+        assert adaptive_loop in ("global", "local")
 
         self.particulator = None
 
@@ -73,8 +85,11 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         assert dt_coal_range[0] > 0
         self.croupier = croupier
         self.optimized_random = optimized_random
+        self.random_substreams = random_substreams
         self.__substeps = substeps
         self.adaptive = adaptive
+        self.adaptive_loop = adaptive_loop
+        self.adaptive_loop_counter = 0
         self.stats_n_substep = None
         self.stats_dt_min = None
         self.dt_coal_range = tuple(dt_coal_range)
@@ -102,10 +117,21 @@ class Collision:  # pylint: disable=too-many-instance-attributes
             "dt_min": self.dt_coal_range[0],
             "seed": builder.formulae.seed,
         }
-        self.rnd_opt_coll = RandomGeneratorOptimizer(**rnd_args)
+        streams = (
+            RANDOM_STREAMS
+            if self.random_substreams
+            else RANDOM_STREAMS._make((0,) * len(RANDOM_STREAMS))
+        )
+        self.rnd_opt_coll = RandomGeneratorOptimizer(
+            **rnd_args, stream=streams.collision_pairs
+        )
         if self.enable_breakup:
-            self.rnd_opt_proc = RandomGeneratorOptimizerNoPair(**rnd_args)
-            self.rnd_opt_frag = RandomGeneratorOptimizerNoPair(**rnd_args)
+            self.rnd_opt_proc = RandomGeneratorOptimizerNoPair(
+                **rnd_args, stream=streams.breakup_process
+            )
+            self.rnd_opt_frag = RandomGeneratorOptimizerNoPair(
+                **rnd_args, stream=streams.breakup_fragment
+            )
 
         if self.particulator.n_sd < 2:
             raise ValueError("No one to collide with!")
@@ -114,7 +140,10 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         assert self.dt_coal_range[0] <= self.dt_coal_range[1]
 
         empty_args_pairwise = {"shape": self.particulator.n_sd // 2, "dtype": float}
-        empty_args_cellwise = {"shape": self.particulator.mesh.n_cell, "dtype": float}
+        empty_args_cellwise = {
+            "shape": self.particulator.mesh.n_cell,
+            "dtype": self.particulator.Storage.ACCUMULATOR,
+        }
         self.kernel_temp = self.particulator.PairwiseStorage.empty(
             **empty_args_pairwise
         )
@@ -134,6 +163,8 @@ class Collision:  # pylint: disable=too-many-instance-attributes
 
         self.rnd_opt_coll.register(builder)
         self.collision_kernel.register(builder)
+        if self.adaptive_loop == "local":
+            self.__check_cell_local_adaptive_loop()
 
         if self.croupier is None:
             self.croupier = self.particulator.backend.default_croupier
@@ -168,11 +199,57 @@ class Collision:  # pylint: disable=too-many-instance-attributes
                 *counter_args
             )
 
+    def __check_cell_local_adaptive_loop(self):
+        # pylint: disable=import-outside-toplevel
+        from PySDM.backends.numba import Numba
+
+        if not isinstance(self.particulator.backend, Numba):
+            raise ValueError("cell-local adaptive loop is implemented in Numba only")
+        if self.croupier not in (None, "local") or self.optimized_random:
+            raise ValueError(
+                "cell-local adaptive loop shuffles droplets within cells using its own"
+                " counter-based random numbers, hence requires the default croupier"
+                " and optimized_random=False"
+            )
+        if not self.adaptive or self.enable_breakup:
+            raise ValueError(
+                "cell-local adaptive loop requires adaptive coalescence without breakup"
+            )
+        pipeline = getattr(self.collision_kernel, "pipeline", None)
+        if (
+            pipeline is None
+            or "kernel" not in pipeline.outputs
+            or len(pipeline.pairwise) != 0
+            or getattr(self.collision_kernel, "table", None) is not None
+        ):
+            raise ValueError(
+                "cell-local adaptive loop requires a collision kernel defined with"
+                " a pairwise pipeline of particle attributes only"
+            )
+
     def __call__(self):
         if self.enable:
             if not self.adaptive:
                 for _ in range(self.__substeps):
                     self.step()
+            elif self.adaptive_loop == "local":
+                self.particulator.adaptive_sdm_cell_local(
+                    pipeline=self.collision_kernel.pipeline,
+                    kernel_attributes=self.collision_kernel.pipeline.attributes,
+                    gamma=self.gamma,
+                    coalescence_rate=self.coalescence_rate,
+                    collision_rate=self.collision_rate,
+                    collision_rate_deficit=self.collision_rate_deficit,
+                    stats_n_substep=self.stats_n_substep,
+                    stats_dt_min=self.stats_dt_min,
+                    dt_range=self.dt_coal_range,
+                    seed=self.rnd_opt_coll.seed,
+                    stream=self.rnd_opt_coll.stream,
+                    counter=self.adaptive_loop_counter,
+                )
+                self.adaptive_loop_counter += 1
+                if self.stats_dt_min.amin() == self.dt_coal_range[0]:
+                    warnings.warn("adaptive time-step reached dt_min")
             else:
                 self.dt_left[:] = self.particulator.dt
 
@@ -296,6 +373,7 @@ class Coalescence(Collision):
         substeps: int = DEFAULTS.substeps,
         adaptive: bool = DEFAULTS.adaptive,
         dt_coal_range=DEFAULTS.dt_coal_range,
+        adaptive_loop: str = DEFAULTS.adaptive_loop,
     ):
         breakup_efficiency = ConstEb(Eb=0)
         fragmentation_function = AlwaysN(n=1)
@@ -310,6 +388,7 @@ class Coalescence(Collision):
             adaptive=adaptive,
             dt_coal_range=dt_coal_range,
             enable_breakup=False,
+            adaptive_loop=adaptive_loop,
         )
 
 
@@ -325,6 +404,8 @@ class Breakup(Collision):
         adaptive: bool = DEFAULTS.adaptive,
         dt_coal_range=DEFAULTS.dt_coal_range,
         warn_overflows=True,
+        adaptive_loop: str = DEFAULTS.adaptive_loop,
+        random_substreams: bool = False,
     ):
         coalescence_efficiency = ConstEc(Ec=0.0)
         breakup_efficiency = ConstEb(Eb=1.0)
@@ -339,4 +420,6 @@ class Breakup(Collision):
             adaptive=adaptive,
             dt_coal_range=dt_coal_range,
             warn_overflows=warn_overflows,
+            adaptive_loop=adaptive_loop,
+            random_substreams=random_substreams,
         )
@@ -6,7 +6,8 @@ from PySDM.dynamics.collisions.collision_kernels.impl.parameterized import Param
 
 
 class Electric(Parameterized):  # pylint: disable=too-few-public-methods
-    def __init__(self):
+    def __init__(self, **kwargs):
         super().__init__(
-            (1, 1, -7, 1.78, -20.5, 1.73, 0.26, 1.47, 1, 0.82, -0.003, 4.4, 8)
+            (1, 1, -7, 1.78, -20.5, 1.73, 0.26, 1.47, 1, 0.82, -0.003, 4.4, 8),
+            **kwargs,
         )
@@ -4,15 +4,28 @@ Golovin kernel with analytic solution (see [Golovin 1963](http://mi.mathnet.ru/d
 import numpy as np
 from scipy import special
 
+from PySDM.backends.impl_common.pairwise_expression import (
+    PairwiseExpression,
+    PairwisePipeline,
+)
+
 
 class Golovin:
     def __init__(self, b):
         self.b = b
         self.particulator = None
+        self.pipeline = PairwisePipeline(
+            {"kernel": PairwiseExpression.sum("volume") * self.b}
+        )
 
     def __call__(self, output, is_first_in_pair):
-        output.sum(self.particulator.attributes["volume"], is_first_in_pair)
-        output *= self.b
+        self.particulator.backend.pairwise_pipeline(
+            self.pipeline,
+            outputs={"kernel": output},
+            attributes={"volume": self.particulator.attributes["volume"]},
+            pairwise={},
+            is_first_in_pair=is_first_in_pair,
+        )
 
     def register(self, builder):
         self.particulator = builder.particulator
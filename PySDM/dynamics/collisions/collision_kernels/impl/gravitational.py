@@ -1,15 +1,150 @@
-""" common parent class for gravitational collision kernels """
+""" common parent class for gravitational collision kernels; with `tabulated=True`
+the kernel (a function of the two radii only) is evaluated once in `register()`
+(using the terminal velocity approximation selected with
+`PySDM.builder.Builder.set_terminal_velocity()`) on a logarithmic radius grid
+spanning `table_r_range` (refined until the interpolation error at cell midpoints,
+relative to the largest kernel value for the larger of the two radii, is below
+`table_rtol`) and subsequently interpolated from the table
+in a single pass over pairs (radii outside of the range are clamped to it) """
+
+import warnings
+
+import numpy as np
+
+from PySDM.dynamics.terminal_velocity import Interpolation
+from PySDM.physics import constants as const
+
+DEFAULT_TABLE_R_RANGE = (0.1 * const.si.um, 2.5 * const.si.mm)
+MIN_TABLE_SIZE = 33
+MAX_TABLE_SIZE = 2049
 
 
 class Gravitational:  # pylint: disable=too-few-public-methods
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        tabulated: bool = False,
+        table_rtol: float = 1e-2,
+        table_r_range: tuple = DEFAULT_TABLE_R_RANGE,
+    ):
         self.particulator = None
-        self.pair_tmp = None
+        self.pipeline = None
+        self.tabulated = tabulated
+        self.table_rtol = table_rtol
+        self.table_r_range = table_r_range
+        self.table = None
+        self.table_error = None
 
     def register(self, builder):
         self.particulator = builder.particulator
         builder.request_attribute("radius")
-        builder.request_attribute("terminal velocity")
-        self.pair_tmp = self.particulator.PairwiseStorage.empty(
-            self.particulator.n_sd // 2, dtype=float
+        if self.tabulated:
+            self.table, self.table_error = self.make_table(
+                builder.terminal_velocity_params.get("approximation", Interpolation)
+            )
+        else:
+            builder.request_attribute("terminal velocity")
+
+    def __call__(self, output, is_first_in_pair):
+        if self.table is None:
+            self.evaluate(
+                output,
+                self.particulator.attributes["radius"],
+                self.particulator.attributes["terminal velocity"],
+                is_first_in_pair,
+            )
+        else:
+            self.particulator.backend.interpolate_pair_table(
+                output=output,
+                table=self.table,
+                log_x_range=np.log(self.table_r_range),
+                data_in=self.particulator.attributes["radius"],
+                is_first_in_pair=is_first_in_pair,
+            )
+
+    def evaluate(self, output, radius, terminal_velocity, is_first_in_pair):
+        """computes kernel values for pairs of particles with given radii and
+        terminal velocities into `output` (by default, evaluating `self.pipeline`
+        with `output` also available as the `"kernel"` pairwise input)"""
+        self.particulator.backend.pairwise_pipeline(
+            self.pipeline,
+            outputs={"kernel": output},
+            attributes={"radius": radius, "terminal velocity": terminal_velocity},
+            pairwise={"kernel": output},
+            is_first_in_pair=is_first_in_pair,
+        )
+
+    def _evaluate_at(self, radii, approximation):
+        """kernel values for pairs of radii given as an (n_pairs, 2) array"""
+        particulator = self.particulator
+        n_pairs = radii.shape[0]
+        idx = particulator.Index.identity_index(2 * n_pairs)
+        radius = particulator.IndexedStorage.from_ndarray(idx, radii.ravel())
+        terminal_velocity = particulator.IndexedStorage.empty(
+            idx, 2 * n_pairs, dtype=float
+        )
+        approximation(terminal_velocity, radius)
+        is_first_in_pair = particulator.PairIndicator(2 * n_pairs)
+        is_first_in_pair.indicator = particulator.Storage.from_ndarray(
+            np.arange(2 * n_pairs) % 2 == 0
+        )
+        output = particulator.PairwiseStorage.empty(n_pairs, dtype=float)
+        self.evaluate(output, radius, terminal_velocity, is_first_in_pair)
+        return output.to_ndarray(), radius, is_first_in_pair
+
+    def make_table(self, approximation_class=Interpolation):
+        """returns the flattened (square, symmetric) kernel table of the smallest
+        size meeting the accuracy target and the attained interpolation error
+        (with terminal velocities given by `approximation_class`)"""
+        approximation = approximation_class(particulator=self.particulator)
+        log_x_range = np.log(self.table_r_range)
+        size = MIN_TABLE_SIZE
+        while True:
+            log_r = np.linspace(*log_x_range, size)
+            i, j = np.tril_indices(size)
+            values, _, _ = self._evaluate_at(
+                np.exp(np.stack((log_r[i], log_r[j]), axis=1)), approximation
+            )
+            table = np.empty((size, size))
+            table[i, j] = values
+            table[j, i] = values
+
+            error = self._interpolation_error(table, log_r, approximation)
+            if error <= self.table_rtol or 2 * size - 1 > MAX_TABLE_SIZE:
+                break
+            size = 2 * size - 1
+
+        if error > self.table_rtol:
+            warnings.warn(
+                f"kernel table accuracy target not met ({error:.2g} > {self.table_rtol:.2g})"
+                f" with the maximal table size of {size}"
+            )
+        return self.particulator.Storage.from_ndarray(table.ravel()), error
+
+    def _interpolation_error(self, table, log_r, approximation):
+        """maximal interpolation error of `table` (with nodes at `log_r`) relative to
+        the largest kernel value for the larger of the two radii, checked at cell
+        midpoints (centroids of lower triangles in diagonal cells)"""
+        i, j = np.tril_indices(len(log_r) - 1)
+        d_log_r = log_r[1] - log_r[0]
+        points = np.exp(
+            np.stack(
+                (
+                    log_r[i] + np.where(i == j, 2 / 3, 1 / 2) * d_log_r,
+                    log_r[j] + np.where(i == j, 1 / 3, 1 / 2) * d_log_r,
+                ),
+                axis=1,
+            )
+        )
+        exact, radius, is_first_in_pair = self._evaluate_at(points, approximation)
+        interpolated = self.particulator.PairwiseStorage.empty(len(exact), dtype=float)
+        self.particulator.backend.interpolate_pair_table(
+            output=interpolated,
+            table=self.particulator.Storage.from_ndarray(table.ravel()),
+            log_x_range=(log_r[0], log_r[-1]),
+            data_in=radius,
+            is_first_in_pair=is_first_in_pair,
         )
+        scale = np.max(table, axis=1)[i + 1]
+        error = np.abs(interpolated.to_ndarray() - exact)
+        return np.max(error[scale > 0] / scale[scale > 0], initial=0)
@@ -1,31 +1,34 @@
 """ common parent class for collision kernels specified using Berry's parameterization """
 
 
+from PySDM.backends.impl_common.pairwise_expression import (
+    PairwiseExpression,
+    PairwisePipeline,
+)
 from PySDM.physics import constants as const
 
 from .gravitational import Gravitational
 
 
 class Parameterized(Gravitational):
-    def __init__(self, params):
-        super().__init__()
+    def __init__(self, params, **kwargs):
+        super().__init__(**kwargs)
         self.params = params
+        self.pipeline = PairwisePipeline(
+            {
+                "kernel": PairwiseExpression.pairwise("kernel") ** 2
+                * const.PI
+                * PairwiseExpression.max("radius") ** 2
+                * PairwiseExpression.distance("terminal velocity")
+            }
+        )
 
-    def __call__(self, output, is_first_in_pair):
+    def evaluate(self, output, radius, terminal_velocity, is_first_in_pair):
         self.particulator.backend.linear_collection_efficiency(
             params=self.params,
             output=output,
-            radii=self.particulator.attributes["radius"],
+            radii=radius,
             is_first_in_pair=is_first_in_pair,
             unit=const.si.um,
         )
-        output **= 2
-        output *= const.PI
-        self.pair_tmp.max(self.particulator.attributes["radius"], is_first_in_pair)
-        self.pair_tmp **= 2
-        output *= self.pair_tmp
-
-        self.pair_tmp.distance(
-            self.particulator.attributes["terminal velocity"], is_first_in_pair
-        )
-        output *= self.pair_tmp
+        super().evaluate(output, radius, terminal_velocity, is_first_in_pair)
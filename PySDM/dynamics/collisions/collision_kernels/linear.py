@@ -1,6 +1,10 @@
 """
 TODO #744
 """
+from PySDM.backends.impl_common.pairwise_expression import (
+    PairwiseExpression,
+    PairwisePipeline,
+)
 
 
 class Linear:
@@ -8,11 +12,18 @@ class Linear:
         self.a = a
         self.b = b
         self.particulator = None
+        self.pipeline = PairwisePipeline(
+            {"kernel": PairwiseExpression.sum("volume") * self.b + self.a}
+        )
 
     def __call__(self, output, is_first_in_pair):
-        output.sum_pair(self.particulator.attributes["volume"], is_first_in_pair)
-        output *= self.b
-        output += self.a
+        self.particulator.backend.pairwise_pipeline(
+            self.pipeline,
+            outputs={"kernel": output},
+            attributes={"volume": self.particulator.attributes["volume"]},
+            pairwise={},
+            is_first_in_pair=is_first_in_pair,
+        )
 
     def register(self, builder):
         self.particulator = builder.particulator
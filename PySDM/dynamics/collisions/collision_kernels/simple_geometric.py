@@ -1,26 +1,37 @@
 """
 basic geometric kernel
 """
+from PySDM.backends.impl_common.pairwise_expression import (
+    PairwiseExpression,
+    PairwisePipeline,
+)
 
 
 class SimpleGeometric:
     def __init__(self, C):
         self.particulator = None
-        self.pair_tmp = None
         self.C = C
+        self.pipeline = PairwisePipeline(
+            {
+                "kernel": self.C
+                * PairwiseExpression.sum("radius") ** 2
+                * PairwiseExpression.distance("area")
+            }
+        )
 
     def register(self, builder):
         self.particulator = builder.particulator
         builder.request_attribute("radius")
         builder.request_attribute("area")
-        self.pair_tmp = self.particulator.PairwiseStorage.empty(
-            self.particulator.n_sd // 2, dtype=float
-        )
 
     def __call__(self, output, is_first_in_pair):
-        output[:] = self.C
-        self.pair_tmp.sum(self.particulator.attributes["radius"], is_first_in_pair)
-        self.pair_tmp **= 2
-        output *= self.pair_tmp
-        self.pair_tmp.distance(self.particulator.attributes["area"], is_first_in_pair)
-        output *= self.pair_tmp
+        self.particulator.backend.pairwise_pipeline(
+            self.pipeline,
+            outputs={"kernel": output},
+            attributes={
+                "radius": self.particulator.attributes["radius"],
+                "area": self.particulator.attributes["area"],
+            },
+            pairwise={},
+            is_first_in_pair=is_first_in_pair,
+        )
@@ -1,6 +1,26 @@
 """
 bespoke condensational growth solver
-with implicit-in-particle-size integration and adaptive timestepping
+with implicit-in-particle-size integration and adaptive timestepping;
+the `schedule` argument controls how cells are distributed among threads:
+ - `"static"`: fixed strided assignment of cells to threads,
+ - `"dynamic"`: as above, but with cells ordered by the number of substeps
+   from the previous timestep,
+ - `"queue"`: threads pick cells from a shared work queue ordered by
+   an estimated cost (previous number of substeps times number of super-droplets
+   in a cell) with the most expensive cells dispatched first;
+with the `"queue"` schedule, time spent by each thread in the last call is available
+in `thread_busy_time` (if reported by the backend, `None` otherwise);
+with `lane_parallel=True`, all super-droplets within a cell are advanced together
+with bracketed iterations performed over arrays of droplets (using threads within
+the cell for single-cell runs, and yielding roots matching those of the default
+droplet-by-droplet solver to within `rtol_x`); with `warm_start=True`, the root
+finding is warm-started using per-droplet records of the ratio of the last accepted increment of the
+condensation coordinate to its explicit estimate and of the number of solver
+iterations taken (`droplet_history`, recorded regardless of the setting);
+with `predict_substeps=True`, the number of substeps (if `adaptive`) is predicted
+by a PI-type controller from the error estimates of the previous trial integrations
+and the change in theta and water vapour tendencies (`substep_history`), with
+the trial integrations performed only if the prediction is rejected
 """
 from collections import namedtuple
 
@@ -28,6 +48,9 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
         schedule: str = DEFAULTS.schedule,
         max_iters: int = 16,
         update_thd: bool = True,
+        lane_parallel: bool = False,
+        warm_start: bool = False,
+        predict_substeps: bool = False,
     ):
         self.particulator = None
         self.enable = True
@@ -36,7 +59,10 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
         self.rtol_thd = rtol_thd
 
         self.rh_max = None
+        self.mean_iterations = None
         self.success = None
+        self.droplet_history = {}
+        self.substep_history = {}
 
         self.__substeps = substeps
         self.adaptive = adaptive
@@ -44,8 +70,12 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
         self.dt_cond_range = dt_cond_range
         self.schedule = schedule
         self.max_iters = max_iters
+        self.lane_parallel = lane_parallel
+        self.warm_start = warm_start
+        self.predict_substeps = predict_substeps
 
         self.cell_order = None
+        self.thread_busy_time = None
 
         self.update_thd = update_thd
 
@@ -59,6 +89,9 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
             multiplier=2,
             RH_rtol=1e-7,
             max_iters=self.max_iters,
+            lane_parallel=self.lane_parallel,
+            warm_start=self.warm_start,
+            predict_substeps=self.predict_substeps,
         )
         builder.request_attribute("critical volume")
         builder.request_attribute("kappa")
@@ -77,6 +110,30 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
             self.particulator.mesh.n_cell, dtype=float
         )
         self.rh_max[:] = np.nan
+        self.mean_iterations = self.particulator.Storage.empty(
+            self.particulator.mesh.n_cell, dtype=float
+        )
+        self.mean_iterations[:] = np.nan
+        self.droplet_history["dx_ratio"] = self.particulator.Storage.empty(
+            self.particulator.n_sd, dtype=float
+        )
+        self.droplet_history["dx_ratio"][:] = np.nan
+        self.droplet_history["n_iters"] = self.particulator.Storage.empty(
+            self.particulator.n_sd, dtype=int
+        )
+        self.droplet_history["n_iters"][:] = 0
+        for key, dtype, value in (
+            ("error_ratio", float, np.nan),
+            ("error_ratio_prev", float, np.nan),
+            ("n_substeps", int, 0),
+            ("dthd_dt", float, np.nan),
+            ("dqv_dt", float, np.nan),
+            ("n_predicted", int, 0),
+        ):
+            self.substep_history[key] = self.particulator.Storage.empty(
+                self.particulator.mesh.n_cell, dtype=dtype
+            )
+            self.substep_history[key][:] = value
         self.success = self.particulator.Storage.empty(
             self.particulator.mesh.n_cell, dtype=bool
         )
@@ -87,18 +144,24 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
         if self.enable:
             if self.schedule == "dynamic":
                 self.cell_order = np.argsort(self.counters["n_substeps"])
+            elif self.schedule == "queue":
+                self.cell_order = np.argsort(-self.cell_cost(), kind="stable")
             elif self.schedule == "static":
                 pass
             else:
                 raise NotImplementedError()
 
-            self.particulator.condensation(
+            self.thread_busy_time = self.particulator.condensation(
                 rtol_x=self.rtol_x,
                 rtol_thd=self.rtol_thd,
                 counters=self.counters,
                 RH_max=self.rh_max,
+                mean_iterations=self.mean_iterations,
                 success=self.success,
                 cell_order=self.cell_order,
+                work_queue=self.schedule == "queue",
+                droplet_history=self.droplet_history,
+                substep_history=self.substep_history,
             )
             if not self.success.all():
                 raise RuntimeError("Condensation failed")
@@ -121,3 +184,10 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
                         int(self.particulator.dt / self.dt_cond_range[0]),
                     )
             self.particulator.attributes.mark_updated("volume")
+
+    def cell_cost(self):
+        """estimated relative cost of solving condensation in each cell:
+        number of substeps from the previous timestep times number of super-droplets"""
+        n_substeps = np.maximum(self.counters["n_substeps"].to_ndarray(), 1)
+        n_sd = np.diff(self.particulator.attributes.cell_start.to_ndarray())
+        return n_substeps * n_sd
@@ -4,13 +4,20 @@ particle displacement due to advection by the flow & sedimentation
 adaptive time-stepping controlled by comparing implicit-Euler (I)
 and explicit-Euler (E) maximal displacements with:
 rtol > |(I - E) / E|
-(see eqs 13-16 in [Arabas et al. 2015](https://doi.org/10.5194/gmd-8-1677-2015))
+(see eqs 13-16 in [Arabas et al. 2015](https://doi.org/10.5194/gmd-8-1677-2015));
+by default a single number of substeps is used in the whole domain, with
+`local_substeps` set, the number of substeps is chosen for each cell using
+the Courant numbers of the cell and of its neighbours and, with sedimentation,
+is further increased for each super-droplet so that it does not fall more than
+one cell per substep (see `PySDM.products.displacement.displacement_substeps`)
 """
 from collections import namedtuple
 
 import numpy as np
 
-DEFAULTS = namedtuple("_", ("rtol", "adaptive"))(rtol=1e-2, adaptive=True)
+DEFAULTS = namedtuple("_", ("rtol", "adaptive", "local_substeps"))(
+    rtol=1e-2, adaptive=True, local_substeps=False
+)
 
 
 class Displacement:  # pylint: disable=too-many-instance-attributes
@@ -20,6 +27,7 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         precipitation_counting_level_index: int = 0,
         adaptive=DEFAULTS.adaptive,
         rtol=DEFAULTS.rtol,
+        local_substeps=DEFAULTS.local_substeps,
     ):
         self.particulator = None
         self.enable_sedimentation = enable_sedimentation
@@ -34,10 +42,19 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         self.adaptive = adaptive
         self.rtol = rtol
         self._n_substeps = 1
+        self.local_substeps = local_substeps
+        self.n_substeps_field = None
+        self.n_substeps = None
 
     def register(self, builder):
         builder.request_attribute("terminal velocity")
         self.particulator = builder.particulator
+        if self.local_substeps:
+            # pylint: disable=import-outside-toplevel
+            from PySDM.backends.numba import Numba
+
+            if not isinstance(self.particulator.backend, Numba):
+                raise ValueError("local_substeps are implemented in Numba only")
         self.dimension = len(builder.particulator.environment.mesh.grid)
         self.grid = self.particulator.Storage.from_ndarray(
             np.array(builder.particulator.environment.mesh.grid, dtype=np.int64)
@@ -64,16 +81,36 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         self.displacement = self.particulator.Storage.from_ndarray(
             np.zeros((self.dimension, self.particulator.n_sd))
         )
-        self.temp = self.particulator.Storage.from_ndarray(
-            np.zeros((self.dimension, self.particulator.n_sd), dtype=np.int64)
-        )
+        if self.local_substeps:
+            self.n_substeps_field = self.particulator.Storage.from_ndarray(
+                np.ones(self.particulator.mesh.n_cell, dtype=np.int64)
+            )
+            self.n_substeps = self.particulator.Storage.from_ndarray(
+                np.zeros(self.particulator.n_sd, dtype=np.int64)
+            )
+        else:
+            self.temp = self.particulator.Storage.from_ndarray(
+                np.zeros((self.dimension, self.particulator.n_sd), dtype=np.int64)
+            )
 
     def upload_courant_field(self, courant_field):
         for i, component in enumerate(courant_field):
             self.courant[i].upload(component)
 
-        # note: to be improved, should make n_substeps variable in space as in cond/coal
-        if self.adaptive:
+        if self.local_substeps:
+            n_substeps_field = np.ones(self.particulator.mesh.grid, dtype=np.int64)
+            if self.adaptive:
+                for i, courant_component in enumerate(courant_field):
+                    n_substeps_field = np.maximum(
+                        n_substeps_field,
+                        self.__n_substeps_for_courant_difference(
+                            np.abs(np.diff(courant_component, axis=i))
+                        ),
+                    )
+                n_substeps_field = self.__maximum_over_neighbours(n_substeps_field)
+            self.n_substeps_field.upload(n_substeps_field.ravel())
+            self._n_substeps = int(np.amax(n_substeps_field))
+        elif self.adaptive:
             error_estimate = self.rtol
             self._n_substeps = 0.5
             while error_estimate >= self.rtol:
@@ -91,7 +128,44 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
                         else 1 / (1 / max_abs_delta_courant - 1),
                     )
 
+    def __n_substeps_for_courant_difference(self, abs_delta_courant):
+        """smallest power of two per cell for which the error estimate
+        (same as in the global variant) falls below `rtol`"""
+        n_substeps = np.ones(abs_delta_courant.shape, dtype=np.int64)
+        while True:
+            scaled = abs_delta_courant / n_substeps
+            with np.errstate(divide="ignore"):
+                error_estimate = np.where(scaled < 1, scaled / (1 - scaled), np.inf)
+            exceeded = error_estimate >= self.rtol
+            if not exceeded.any():
+                return n_substeps
+            n_substeps[exceeded] *= 2
+
+    def __maximum_over_neighbours(self, field):
+        """maximum over each cell and its neighbours (periodic in all but
+        the last, vertical, dimension) so that droplets advected into a neighbouring
+        cell within a timestep do not take too few substeps"""
+        for axis in range(self.dimension):
+            pad_width = [(0, 0)] * self.dimension
+            pad_width[axis] = (1, 1)
+            padded = np.pad(
+                field,
+                pad_width,
+                mode="edge" if axis == self.dimension - 1 else "wrap",
+            )
+            field = np.maximum.reduce(
+                [
+                    np.take(padded, range(shift, shift + field.shape[axis]), axis=axis)
+                    for shift in range(3)
+                ]
+            )
+        return field
+
     def __call__(self):
+        if self.local_substeps:
+            self.__displace_with_local_substeps()
+            return
+
         # TIP: not need all array only [idx[:sd_num]]
         cell_origin = self.particulator.attributes["cell origin"]
         position_in_cell = self.particulator.attributes["position in cell"]
@@ -115,6 +189,28 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         for key in ("position in cell", "cell origin", "cell id"):
             self.particulator.attributes.mark_updated(key)
 
+    def __displace_with_local_substeps(self):
+        self.particulator.displacement_with_local_substeps(
+            courant=self.courant,
+            grid=self.grid,
+            displacement=self.displacement,
+            n_substeps_field=self.n_substeps_field,
+            n_substeps=self.n_substeps,
+            enable_sedimentation=self.enable_sedimentation,
+            precipitation_counting_level_index=self.precipitation_counting_level_index,
+        )
+        self.precipitation_in_last_step = 0.0
+        if self.enable_sedimentation:
+            self.precipitation_in_last_step = self.particulator.remove_precipitated(
+                displacement=self.displacement,
+                precipitation_counting_level_index=self.precipitation_counting_level_index,
+            )
+        self.particulator.flag_out_of_column()
+        self.particulator.recalculate_cell_id()
+
+        for key in ("position in cell", "cell origin", "cell id"):
+            self.particulator.attributes.mark_updated(key)
+
     def calculate_displacement(
         self, displacement, courant, cell_origin, position_in_cell
     ):
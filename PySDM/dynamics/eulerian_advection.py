@@ -19,3 +19,15 @@ class EulerianAdvection:
             self.particulator.environment.get_thd(), reshape=True
         )
         self.solvers()
+
+    def get_state(self):
+        if hasattr(self.solvers, "wait"):
+            self.solvers.wait()
+        return {
+            "qv": self.particulator.environment.get_qv(),
+            "thd": self.particulator.environment.get_thd(),
+        }
+
+    def set_state(self, state):
+        self.particulator.environment.get_qv()[:] = state["qv"]
+        self.particulator.environment.get_thd()[:] = state["thd"]
@@ -5,13 +5,25 @@ from PySDM.backends.impl_common.freezing_attributes import (
     SingularAttributes,
     TimeDependentAttributes,
 )
+from PySDM.dynamics.impl.random_streams import RANDOM_STREAMS
 from PySDM.physics.heterogeneous_ice_nucleation_rate import Null
 
 
-class Freezing:
-    def __init__(self, *, singular=True, record_freezing_temperature=False, thaw=False):
+class Freezing:  # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self,
+        *,
+        singular=True,
+        record_freezing_temperature=False,
+        thaw=False,
+        random_substreams=False,
+    ):
+        """with `random_substreams=True` (time-dependent formulation), random numbers
+        are drawn from a substream independent of those used by other dynamics (see
+        `PySDM.dynamics.impl.random_streams`)"""
         assert not (record_freezing_temperature and singular)
         self.singular = singular
+        self.random_substreams = random_substreams
         self.record_freezing_temperature = record_freezing_temperature
         self.thaw = thaw
         self.enable = True
@@ -35,7 +47,9 @@ class Freezing:
                 self.particulator.n_sd, dtype=float
             )
             self.rng = self.particulator.Random(
-                self.particulator.n_sd, self.particulator.backend.formulae.seed
+                self.particulator.n_sd,
+                self.particulator.backend.formulae.seed,
+                RANDOM_STREAMS.freezing if self.random_substreams else 0,
             )
 
     def __call__(self):
@@ -48,6 +62,12 @@ class Freezing:
         if not self.enable:
             return
 
+        tracker = self.particulator.attributes.change_tracker
+        tracking = (
+            {}
+            if tracker is None
+            else {"droplet_epoch": tracker.droplet_epoch, "epoch": tracker.next_epoch()}
+        )
         if self.singular:
             self.particulator.backend.freeze_singular(
                 attributes=SingularAttributes(
@@ -60,6 +80,7 @@ class Freezing:
                 relative_humidity=self.particulator.environment["RH"],
                 cell=self.particulator.attributes["cell id"],
                 thaw=self.thaw,
+                **tracking,
             )
         else:
             self.rand.urand(self.rng)
@@ -83,8 +104,9 @@ class Freezing:
                     else None
                 ),
                 thaw=self.thaw,
+                **tracking,
             )
 
-        self.particulator.attributes.mark_updated("volume")
+        self.particulator.attributes.mark_updated("volume", tracked=True)
         if self.record_freezing_temperature:
             self.particulator.attributes.mark_updated("freezing temperature")
@@ -5,11 +5,12 @@ import math
 
 
 class RandomGeneratorOptimizer:  # pylint: disable=too-many-instance-attributes
-    def __init__(self, optimized_random, dt_min, seed):
+    def __init__(self, optimized_random, dt_min, seed, stream=0):
         self.particulator = None
         self.optimized_random = optimized_random
         self.dt_min = dt_min
         self.seed = seed
+        self.stream = stream
         self.substep = 0
         self.pairs_rand = None
         self.rand = None
@@ -28,7 +29,9 @@ class RandomGeneratorOptimizer:  # pylint: disable=too-many-instance-attributes
         self.rand = self.particulator.Storage.empty(
             self.particulator.n_sd // 2, dtype=float
         )
-        self.rnd = self.particulator.Random(self.particulator.n_sd + shift, self.seed)
+        self.rnd = self.particulator.Random(
+            self.particulator.n_sd + shift, self.seed, self.stream
+        )
 
     def reset(self):
         self.substep = 0
@@ -5,12 +5,13 @@ TODO #744
 import math
 
 
-class RandomGeneratorOptimizerNoPair:
-    def __init__(self, optimized_random, dt_min, seed):
+class RandomGeneratorOptimizerNoPair:  # pylint: disable=too-many-instance-attributes
+    def __init__(self, optimized_random, dt_min, seed, stream=0):
         self.particulator = None
         self.optimized_random = optimized_random
         self.dt_min = dt_min
         self.seed = seed
+        self.stream = stream
         self.substep = 0
         self.rand = None
         self.rnd = None
@@ -25,7 +26,9 @@ class RandomGeneratorOptimizerNoPair:
         self.rand = self.particulator.Storage.empty(
             self.particulator.n_sd // 2, dtype=float
         )
-        self.rnd = self.particulator.Random(self.particulator.n_sd + shift, self.seed)
+        self.rnd = self.particulator.Random(
+            self.particulator.n_sd + shift, self.seed, self.stream
+        )
 
     def reset(self):
         self.substep = 0
@@ -0,0 +1,18 @@
+"""
+identifiers of the independent random-number substreams used by dynamics
+ (all derived from `PySDM.formulae.Formulae.seed`, see `stream` argument of
+ the backends' `Random` classes); the substreams are opt-in (`random_substreams`
+ argument of `PySDM.dynamics.collisions.collision.Collision` and of
+ `PySDM.dynamics.freezing.Freezing`), by default all generators use the default
+ stream, i.e., are seeded with `PySDM.formulae.Formulae.seed` itself
+"""
+from collections import namedtuple
+
+RANDOM_STREAMS = namedtuple(
+    "_", ("collision_pairs", "breakup_process", "breakup_fragment", "freezing")
+)(
+    collision_pairs=0,
+    breakup_process=1,
+    breakup_fragment=2,
+    freezing=3,
+)
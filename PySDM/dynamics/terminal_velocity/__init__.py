@@ -2,4 +2,5 @@
 particle terminal velocity formulae
 """
 from PySDM.dynamics.terminal_velocity.gunn_and_kinzer import Interpolation
-from PySDM.dynamics.terminal_velocity.rogers_and_yau import RogersYau
+from PySDM.dynamics.terminal_velocity.lookup_table import LookupTable
+from PySDM.dynamics.terminal_velocity.rogers_and_yau import RogersYau, RogersYauTable
@@ -3,124 +3,126 @@
  terminal velocities used for both coalescence kernel evaluation as well as for particle
  displacement
 """
+from functools import lru_cache
+
 import numba
 import numpy as np
-from scipy.interpolate import Rbf
+from scipy.interpolate import PchipInterpolator
 
 from PySDM.backends.impl_numba import conf
+from PySDM.dynamics.terminal_velocity.lookup_table import LookupTable, radius_grid
 from PySDM.physics import constants as const
 
-
-class Interpolation:  # pylint: disable=too-few-public-methods
-    def __init__(self, particulator, small_r_limit=None):
-        self.particulator = particulator
-
-        """
-        Gunn & Kinzer 1949, Table 2
-        """
-        ir = (
-            np.array(
-                [
-                    0.078,
-                    0.1,
-                    0.2,
-                    0.3,
-                    0.4,
-                    0.5,
-                    0.6,
-                    0.7,
-                    0.8,
-                    0.9,
-                    1.0,
-                    1.2,
-                    1.4,
-                    1.6,
-                    1.8,
-                    2.0,
-                    2.2,
-                    2.4,
-                    2.6,
-                    2.8,
-                    3.0,
-                    3.2,
-                    3.4,
-                    3.6,
-                    3.8,
-                    4.0,
-                    4.2,
-                    4.4,
-                    4.6,
-                    4.8,
-                    5.0,
-                    5.2,
-                    5.4,
-                    5.6,
-                    5.8,
-                ]
-            )
-            * 1e-3
-            / 2
+FACTOR = 100000
+
+
+@lru_cache()
+def _table(small_r_limit):
+    """monotone (shape-preserving cubic) fit to Gunn & Kinzer 1949 Table 2 data,
+    with the small-radius end replaced by the `TpDependent` formula, and the last
+    measured velocity held beyond the data range; tabulated once per `small_r_limit`"""
+    # Gunn & Kinzer 1949, Table 2
+    ir = (
+        np.array(
+            [
+                0.078,
+                0.1,
+                0.2,
+                0.3,
+                0.4,
+                0.5,
+                0.6,
+                0.7,
+                0.8,
+                0.9,
+                1.0,
+                1.2,
+                1.4,
+                1.6,
+                1.8,
+                2.0,
+                2.2,
+                2.4,
+                2.6,
+                2.8,
+                3.0,
+                3.2,
+                3.4,
+                3.6,
+                3.8,
+                4.0,
+                4.2,
+                4.4,
+                4.6,
+                4.8,
+                5.0,
+                5.2,
+                5.4,
+                5.6,
+                5.8,
+            ]
         )
-        iu = (
-            np.array(
-                [
-                    18,
-                    27,
-                    72,
-                    117,
-                    162,
-                    206,
-                    247,
-                    287,
-                    327,
-                    367,
-                    403,
-                    464,
-                    517,
-                    565,
-                    609,
-                    649,
-                    690,
-                    727,
-                    757,
-                    782,
-                    806,
-                    826,
-                    844,
-                    860,
-                    872,
-                    883,
-                    892,
-                    898,
-                    903,
-                    907,
-                    909,
-                    912,
-                    914,
-                    916,
-                    917,
-                ]
-            )
-            / 100
+        * 1e-3
+        / 2
+    )
+    iu = (
+        np.array(
+            [
+                18,
+                27,
+                72,
+                117,
+                162,
+                206,
+                247,
+                287,
+                327,
+                367,
+                403,
+                464,
+                517,
+                565,
+                609,
+                649,
+                690,
+                727,
+                757,
+                782,
+                806,
+                826,
+                844,
+                860,
+                872,
+                883,
+                892,
+                898,
+                903,
+                907,
+                909,
+                912,
+                914,
+                916,
+                917,
+            ]
         )
+        / 100
+    )
 
-        rbf = Rbf(ir, iu)
-        self.factor = 100000
-        num = 6 * self.factor // 1000 + 1
-        space, step = np.linspace(0, 0.6 * const.si.cm, num, retstep=True)
-        u = np.empty(num)
-        u[:] = rbf(space)
-        u[0] = 0
-        approximation_small = TpDependent.make(only_small=True)
-        small_r_limit = small_r_limit or 40 * const.si.um
-        approximation_small(u[1:], space[1:], small_r_limit)
-        self.a = particulator.backend.Storage.from_ndarray(u)
-        b = np.append(np.diff(u), [u[-1] - u[-2]]) / step
-        self.b = particulator.backend.Storage.from_ndarray(b)
+    radius = radius_grid(FACTOR)
+    values = PchipInterpolator(ir, iu)(radius)
+    values[radius > ir[-1]] = iu[-1]
+    TpDependent.make(only_small=True, jit=False)(values[1:], radius[1:], small_r_limit)
+    values[0] = 0
+    values = np.maximum.accumulate(values)
+    return values
 
-    def __call__(self, output, radius):
-        self.particulator.backend.interpolation(
-            output=output, radius=radius, factor=self.factor, b=self.a, c=self.b
+
+class Interpolation(LookupTable):  # pylint: disable=too-few-public-methods
+    def __init__(self, particulator, small_r_limit=None):
+        super().__init__(
+            particulator,
+            values=_table(small_r_limit or 40 * const.si.um),
+            factor=FACTOR,
         )
 
 
@@ -135,11 +137,18 @@ class TpDependent:
         return self.approximation(output, radius, self.small_r_limit)
 
     @staticmethod
-    def make(only_small=False):
+    def make(only_small=False, jit=True):
+        """returns a (by default JIT-compiled) function evaluating the velocities
+        in place; `jit=False` skips compilation (e.g., for one-off tabulation)"""
         # pylint: disable=too-many-locals
         # TODO #348 T, p dependence
         # TODO #348 move constants to physics.constants
 
+        def njit(**flags):
+            if not jit:
+                return lambda function: function
+            return numba.njit(**{**conf.JIT_FLAGS, "cache": False, **flags})
+
         si = const.si
         cm = si.cm
         T = 293.15
@@ -157,7 +166,7 @@ class TpDependent:
 
         c4 = np.array([10.5035, 1.08750, -0.133245, -0.00659969])
 
-        @numba.njit(**{**conf.JIT_FLAGS, "cache": False, "parallel": False})
+        @njit(parallel=False)
         def f4(r):
             return (n0 / n) * (1 + 1.255 * l / r) / (1 + 1.255 * l0 / r)
 
@@ -174,7 +183,7 @@ class TpDependent:
             )
         )
 
-        @numba.njit(**{**conf.JIT_FLAGS, "cache": False, "parallel": False})
+        @njit(parallel=False)
         def f8(r):
             result = 1.058 * ec - 1.104 * es
             result *= (6.21 + np.log(r)) / 5.01
@@ -182,7 +191,7 @@ class TpDependent:
             result += 1
             return result
 
-        @numba.njit(**{**conf.JIT_FLAGS, "cache": False})
+        @njit()
         def terminal_velocity(values, radius, threshold):
             for i in numba.prange(len(values)):  # pylint: disable=not-an-iterable
                 if radius[i] < 0:
@@ -0,0 +1,60 @@
+"""
+terminal velocity tabulated on a uniform radius grid (with spacing of `1/factor`)
+ and linearly interpolated in a single backend pass - radii beyond the grid are assigned
+ the last tabulated value; optionally, only particles whose radius changed by more than
+ a given relative tolerance since the previous evaluation are updated
+"""
+import numpy as np
+
+from PySDM.physics import constants as const
+
+R_MAX = 0.6 * const.si.cm
+
+
+def radius_grid(factor):
+    """nodes of a uniform radius grid with spacing `1/factor` spanning [0, `R_MAX`]"""
+    return np.arange(int(R_MAX * factor) + 1) / factor
+
+
+class LookupTable:  # pylint: disable=too-few-public-methods
+    def __init__(self, particulator, values, factor):
+        assert np.all(np.diff(values) >= 0), "terminal velocity table is not monotone"
+        self.particulator = particulator
+        self.factor = factor
+        self.a = particulator.backend.Storage.from_ndarray(values)
+        self.b = particulator.backend.Storage.from_ndarray(
+            np.append(np.diff(values) * factor, 0)
+        )
+
+    def __call__(self, output, radius, *, radius_at_update=None, rtol=0):
+        """evaluates the table for all particles or (if `radius_at_update` is given)
+        only for those with `|radius - radius_at_update| > rtol * radius_at_update`
+        (or negative `radius_at_update`), storing their current radius in `radius_at_update`
+        """
+        if radius_at_update is None:
+            self.particulator.backend.interpolation(
+                output=output, radius=radius, factor=self.factor, b=self.a, c=self.b
+            )
+        else:
+            self.particulator.backend.interpolation_where_changed(
+                output=output,
+                radius=radius,
+                factor=self.factor,
+                b=self.a,
+                c=self.b,
+                radius_at_update=radius_at_update,
+                rtol=rtol,
+            )
+
+    def modified_since(self, output, radius, *, droplet_epoch, epoch):
+        """evaluates the table only for particles with `droplet_epoch > epoch`
+        (see `PySDM.impl.change_tracker.ChangeTracker`)"""
+        self.particulator.backend.interpolation_modified_since(
+            output=output,
+            radius=radius,
+            factor=self.factor,
+            b=self.a,
+            c=self.b,
+            droplet_epoch=droplet_epoch,
+            epoch=epoch,
+        )
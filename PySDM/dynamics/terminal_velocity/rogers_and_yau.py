@@ -1,8 +1,13 @@
 """
 Rogers & Yau, equations: (8.5), (8.6), (8.8)
 """
+import numpy as np
+
+from PySDM.dynamics.terminal_velocity.lookup_table import LookupTable, radius_grid
 from PySDM.physics import constants as const
 
+FACTOR = 1000000
+
 
 class RogersYau:  # pylint: disable=too-few-public-methods
     def __init__(
@@ -33,3 +38,30 @@ class RogersYau:  # pylint: disable=too-few-public-methods
             r1=self.small_r_limit,
             r2=self.medium_r_limit,
         )
+
+    def tabulate(self, radius: np.ndarray):
+        """host-side (numpy) evaluation of the formulae at given radii"""
+        return np.where(
+            radius < self.small_r_limit,
+            self.small_k * radius**2,
+            np.where(
+                radius < self.medium_r_limit,
+                self.medium_k * radius,
+                self.large_k * radius ** (1 / 2),
+            ),
+        )
+
+
+class RogersYauTable(LookupTable):  # pylint: disable=too-few-public-methods
+    """`RogersYau` formulae tabulated with 1 um spacing (linear interpolation smears
+    the discontinuities at the range limits over one grid cell and the velocity is held
+    constant beyond `PySDM.dynamics.terminal_velocity.lookup_table.R_MAX`)"""
+
+    def __init__(self, *, particulator, **kwargs):
+        super().__init__(
+            particulator,
+            values=RogersYau(particulator=particulator, **kwargs).tabulate(
+                radius_grid(FACTOR)
+            ),
+            factor=FACTOR,
+        )
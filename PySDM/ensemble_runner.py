@@ -0,0 +1,165 @@
+"""
+process-pool runner of simulation ensembles: each member is set up (from settings
+ returned by a user-supplied factory called with a member seed) and run in a worker
+ process by a simulation following the convention of the `Simulation` classes of
+ `PySDM_examples`, i.e., constructed with settings and a storage, and saving product
+ values with `storage.save(data, step, name)` at each of `settings.output_steps`
+ when `run()` is called; the runner passes a storage writing into shared-memory
+ buffers which are subsequently gathered by the parent process (without pickling
+ of the product arrays)
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from PySDM.formulae import Formulae
+
+
+class _SharedMemoryStorage:
+    """storage with the interface of the one used by `PySDM_examples` simulations,
+    keeping values for each of the output steps in shared-memory segments"""
+
+    def __init__(self):
+        self.output_steps = None
+        self.segments = {}
+        self.buffers = {}
+
+    def init(self, settings):
+        output_steps = tuple(int(step) for step in settings.output_steps)
+        if len(output_steps) == 0 or np.any(np.diff((0, *output_steps)) < 0):
+            raise ValueError("output_steps must be a non-empty non-decreasing sequence")
+        self.output_steps = output_steps
+
+    def save(self, data, step, name):
+        # pylint: disable=import-outside-toplevel
+        from multiprocessing import shared_memory  # Python >= 3.8
+
+        value = np.asarray(data)
+        if name not in self.buffers:
+            shape = (len(self.output_steps), *value.shape)
+            self.segments[name] = shared_memory.SharedMemory(
+                create=True,
+                size=max(1, int(np.prod(shape)) * value.dtype.itemsize),
+            )
+            self.buffers[name] = np.ndarray(
+                shape, dtype=value.dtype, buffer=self.segments[name].buf
+            )
+        self.buffers[name][self.output_steps.index(step)] = value
+
+    def layout(self):
+        return {
+            name: (self.segments[name].name, buffer.shape, buffer.dtype.str)
+            for name, buffer in self.buffers.items()
+        }
+
+    def close(self, unlink):
+        self.buffers.clear()
+        for segment in self.segments.values():
+            segment.close()
+            if unlink:
+                segment.unlink()
+
+
+def _run_member(simulation_factory, settings_factory, seed):
+    settings = settings_factory(seed)
+    storage = _SharedMemoryStorage()
+    try:
+        storage.init(settings)
+        simulation_factory(settings, storage).run()
+        layout = storage.layout()
+    except BaseException:
+        storage.close(unlink=True)
+        raise
+    storage.close(unlink=False)
+    return layout
+
+
+def _gather(layout, result, member, n_member):
+    # pylint: disable=import-outside-toplevel
+    from multiprocessing import shared_memory  # Python >= 3.8
+
+    for name, (segment_name, shape, dtype) in layout.items():
+        segment = shared_memory.SharedMemory(name=segment_name)
+        if result is not None:
+            if name not in result:
+                result[name] = np.empty((n_member, *shape), dtype=dtype)
+            result[name][member] = np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+        segment.close()
+        segment.unlink()
+
+
+class EnsembleRunner:  # pylint: disable=too-few-public-methods
+    def __init__(
+        self,
+        *,
+        simulation_factory: callable,
+        settings_factory: callable,
+        seeds: [list, tuple, np.ndarray],
+        max_workers: int = None,
+        mp_context=None,
+    ):
+        """`settings_factory(seed)` is expected to return settings for a given member
+        (with the seed passed to `PySDM.formulae.Formulae` and with `output_steps`),
+        `simulation_factory(settings, storage)` is expected to return a ready-to-run
+        simulation (e.g., one of the `PySDM_examples` ones, after `reinit()` if needed)
+        saving product values into the storage when `run()` is called; both factories
+        have to be picklable (e.g., module-level functions or classes); worker processes are
+        started with the "spawn" method by default as forking a process in which
+        Numba's parallel threading layer has been initialised is not safe"""
+        self.simulation_factory = simulation_factory
+        self.settings_factory = settings_factory
+        self.seeds = tuple(int(seed) for seed in seeds)
+        self.max_workers = max_workers
+        self.mp_context = mp_context or multiprocessing.get_context("spawn")
+
+    @staticmethod
+    def member_seeds(n_member: int, base_seed: int = None):
+        """returns a deterministic sequence of `n_member` distinct seeds derived from
+        `base_seed` (by default, from the seed of a default-constructed `Formulae`)"""
+        base_seed = Formulae().seed if base_seed is None else base_seed
+        return tuple(  # note: shifted by one as zero seed implies the default one
+            int(sequence.generate_state(1, dtype=np.uint32)[0]) + 1
+            for sequence in np.random.SeedSequence(base_seed).spawn(n_member)
+        )
+
+    def run(self):
+        """runs all members and returns a dictionary of product values with
+        arrays of shape `(n_member, len(settings.output_steps), *product_shape)`"""
+        if os.name == "posix":
+            # pylint: disable=import-outside-toplevel
+            from multiprocessing import resource_tracker  # Python >= 3.8
+
+            # workers inherit the tracker so that segments unlinked here are not
+            #  reported (and unlinked again) by trackers spawned by the workers
+            resource_tracker.ensure_running()
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=self.mp_context
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _run_member,
+                    self.simulation_factory,
+                    self.settings_factory,
+                    seed,
+                )
+                for seed in self.seeds
+            ]
+            result = {}
+            error = None
+            for member, future in enumerate(futures):
+                try:
+                    layout = future.result()
+                except Exception as exception:  # pylint: disable=broad-except
+                    error = error or exception
+                    continue
+                _gather(
+                    layout,
+                    result=None if error else result,
+                    member=member,
+                    n_member=len(futures),
+                )
+        if error is not None:
+            raise error
+        return result
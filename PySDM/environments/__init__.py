@@ -1,8 +1,12 @@
 """
 Classes representing particle environment:
 `PySDM.environments.box.Box`,
-`PySDM.environments.parcel.Parcel`, ...
+`PySDM.environments.kinematic_3d.Kinematic3D`,
+`PySDM.environments.parcel.Parcel`,
+`PySDM.environments.parcel_ensemble.ParcelEnsemble`, ...
 """
 from .box import Box
 from .kinematic_2d import Kinematic2D
+from .kinematic_3d import Kinematic3D
 from .parcel import Parcel
+from .parcel_ensemble import ParcelEnsemble
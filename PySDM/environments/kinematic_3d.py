@@ -0,0 +1,122 @@
+"""
+Three-dimensional prescribed-flow framework: velocity components given as functions
+of normalised coordinates are evaluated on an Arakawa-C staggered grid (see
+`PySDM.impl.arakawa_c`) to drive `PySDM.dynamics.displacement.Displacement`,
+while moisture and heat fields are prescribed (and can be modified between timesteps)
+"""
+
+import numpy as np
+
+from PySDM.environments.impl.moist import Moist
+from PySDM.impl.mesh import Mesh
+from PySDM.initialisation.equilibrate_wet_radii import (
+    default_rtol,
+    equilibrate_wet_radii,
+)
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+
+from ..impl import arakawa_c
+
+
+class Kinematic3D(Moist):
+    def __init__(
+        self,
+        *,
+        dt,
+        grid,
+        size,
+        rhod_of,
+        velocity_of,
+        thd_of,
+        qv_of,
+        mixed_phase=False,
+    ):
+        """`rhod_of`, `thd_of` and `qv_of` are functions of normalised height, while
+        each of the three `velocity_of` functions takes normalised x, y and z
+        coordinates (as arrays of staggered-grid face locations)"""
+        assert len(grid) == 3 and len(size) == 3 and len(velocity_of) == 3
+        super().__init__(dt, Mesh(grid, size), [], mixed_phase=mixed_phase)
+        self.rhod_of = rhod_of
+        self.velocity_of = velocity_of
+        self.thd = arakawa_c.make_field_of_zZ(grid, thd_of)
+        self.qv = arakawa_c.make_field_of_zZ(grid, qv_of)
+        self.formulae = None
+
+    def register(self, builder):
+        super().register(builder)
+        self.formulae = builder.particulator.formulae
+        rhod = builder.particulator.Storage.from_ndarray(
+            arakawa_c.make_rhod(self.mesh.grid, self.rhod_of).ravel()
+        )
+        self._values["current"]["rhod"] = rhod
+        self._tmp["rhod"] = rhod
+
+    @property
+    def dv(self):
+        return self.mesh.dv
+
+    def courant_field(self):
+        """Courant numbers of the prescribed flow on the Arakawa-C grid (to be passed
+        to `PySDM.dynamics.displacement.Displacement.upload_courant_field`)"""
+        return tuple(
+            self.velocity_of[dim](*arakawa_c.face_coords(self.mesh.grid, dim))
+            * self.dt
+            / (self.mesh.size[dim] / self.mesh.grid[dim])
+            for dim in range(3)
+        )
+
+    def init_attributes(
+        self,
+        *,
+        spatial_discretisation,
+        kappa,
+        dry_radius_spectrum,
+        rtol=default_rtol,
+        n_sd=None,
+        spectral_sampling=ConstantMultiplicity,
+    ):
+        super().sync()
+        self.notify()
+        n_sd = n_sd or self.particulator.n_sd
+        attributes = {}
+        with np.errstate(all="raise"):
+            positions = spatial_discretisation.sample(
+                backend=self.particulator.backend, grid=self.mesh.grid, n_sd=n_sd
+            )
+            (
+                attributes["cell id"],
+                attributes["cell origin"],
+                attributes["position in cell"],
+            ) = self.mesh.cellular_attributes(positions)
+            del positions
+
+            r_dry, n_per_kg = spectral_sampling(spectrum=dry_radius_spectrum).sample(
+                n_sd=n_sd, backend=self.particulator.backend
+            )
+
+            attributes["dry volume"] = self.formulae.trivia.volume(radius=r_dry)
+            attributes["kappa times dry volume"] = kappa * attributes["dry volume"]
+            if kappa == 0:
+                r_wet = r_dry
+            else:
+                r_wet = equilibrate_wet_radii(
+                    r_dry=r_dry,
+                    environment=self,
+                    kappa_times_dry_volume=attributes["kappa times dry volume"],
+                    rtol=rtol,
+                    cell_id=attributes["cell id"],
+                )
+            rhod = self["rhod"].to_ndarray()
+            cell_id = attributes["cell id"]
+            domain_volume = np.prod(np.array(self.mesh.size))
+
+        attributes["n"] = n_per_kg * rhod[cell_id] * domain_volume
+        attributes["volume"] = self.formulae.trivia.volume(radius=r_wet)
+
+        return attributes
+
+    def get_thd(self):
+        return self.thd
+
+    def get_qv(self):
+        return self.qv
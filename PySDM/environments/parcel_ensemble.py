@@ -0,0 +1,188 @@
+"""
+ensemble of independent zero-dimensional adiabatic parcels (differing in, e.g., updraft
+ velocity, initial thermodynamic state and aerosol) laid out as cells of a single
+ particulator, so that the dynamics and products are evaluated for all members at once
+"""
+import numpy as np
+
+from PySDM.environments.impl.moist import Moist
+from PySDM.environments.parcel import Parcel
+from PySDM.impl.mesh import Mesh
+from PySDM.initialisation.equilibrate_wet_radii import (
+    default_rtol,
+    equilibrate_wet_radii,
+)
+
+
+class ParcelEnsemble(Parcel):  # pylint: disable=too-many-instance-attributes
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        dt,
+        mass_of_dry_air: [float, np.ndarray],
+        p0: [float, np.ndarray],
+        q0: [float, np.ndarray],
+        T0: [float, np.ndarray],
+        w: [float, np.ndarray, callable],
+        z0: [float, np.ndarray] = 0,
+        mixed_phase=False,
+    ):
+        """all parameters are either scalars (shared by all members) or arrays
+        with one value per member; `w` may also be a callable returning the updraft
+        velocity (for all members) at a given time, or a list of such callables"""
+        n_member = np.broadcast(
+            mass_of_dry_air,
+            p0,
+            q0,
+            T0,
+            z0,
+            0 if callable(w) else np.asarray(w, dtype=object),
+        ).size
+
+        super().__init__(
+            dt=dt,
+            mass_of_dry_air=mass_of_dry_air,
+            p0=p0,
+            q0=q0,
+            T0=T0,
+            w=w,
+            z0=z0,
+            mixed_phase=mixed_phase,
+        )
+        self.mesh = Mesh(
+            grid=(n_member,),
+            size=(),
+            n_cell=n_member,
+            dv=np.nan,
+            n_dims=0,
+            strides=(-1,),
+        )
+
+        def broadcast(value):
+            return np.broadcast_to(np.asarray(value, dtype=float), (n_member,))
+
+        self.p0 = broadcast(p0)
+        self.q0 = broadcast(q0)
+        self.T0 = broadcast(T0)
+        self.z0 = broadcast(z0)
+        self.mass_of_dry_air = broadcast(mass_of_dry_air)
+
+        if callable(w):
+            self.w = w
+        else:
+            w = np.broadcast_to(np.asarray(w, dtype=object), (n_member,))
+            if any(callable(w_i) for w_i in w):
+                self.w = lambda t: np.asarray(
+                    [w_i(t) if callable(w_i) else w_i for w_i in w], dtype=float
+                )
+            else:
+                w = w.astype(float)
+                self.w = lambda _: w
+
+    @property
+    def n_member(self):
+        return self.mesh.n_cell
+
+    @property
+    def dv(self):
+        rhod_mean = (
+            self.get_predicted("rhod").to_ndarray() + self["rhod"].to_ndarray()
+        ) / 2
+        return self.formulae.trivia.volume_of_density_mass(
+            rhod_mean, self.mass_of_dry_air
+        )
+
+    def register(self, builder):
+        self.formulae = builder.particulator.formulae
+        pd0 = self.formulae.trivia.p_d(self.p0, self.q0)
+        rhod0 = self.formulae.state_variable_triplet.rhod_of_pd_T(pd0, self.T0)
+        self.mesh.dv = self.formulae.trivia.volume_of_density_mass(
+            rhod0, self.mass_of_dry_air
+        )
+
+        Moist.register(self, builder)
+
+        params = {
+            "qv": self.q0,
+            "thd": self.formulae.trivia.th_std(pd0, self.T0),
+            "rhod": rhod0,
+            "z": self.z0,
+            "t": np.zeros(self.n_member),
+        }
+        for var, value in params.items():
+            self[var].upload(value)
+
+        self.sync_parcel_vars()
+        Moist.sync(self)
+        self.notify()
+
+    def init_attributes(
+        self,
+        *,
+        n_in_dv: [list, np.ndarray],
+        kappa: [float, np.ndarray],
+        r_dry: [list, np.ndarray],
+        rtol=default_rtol,
+    ):
+        """`n_in_dv` and `r_dry` are sequences of arrays (one array per member),
+        `kappa` is either a scalar or an array with one value per member;
+        the returned attributes include the "cell id" mapping droplets to members"""
+        n_in_dv = [np.atleast_1d(n) for n in n_in_dv]
+        r_dry = [np.atleast_1d(r) for r in r_dry]
+        if not len(n_in_dv) == len(r_dry) == self.n_member:
+            raise ValueError("expecting one array of n_in_dv and r_dry per member")
+        kappa = np.broadcast_to(kappa, (self.n_member,))
+        cell_id = np.concatenate(
+            [
+                np.full(len(n), member, dtype=np.int64)
+                for member, n in enumerate(n_in_dv)
+            ]
+        )
+        r_dry = np.concatenate(r_dry)
+
+        attributes = {}
+        attributes["dry volume"] = self.formulae.trivia.volume(radius=r_dry)
+        attributes["kappa times dry volume"] = attributes["dry volume"] * kappa[cell_id]
+        attributes["n"] = np.concatenate(n_in_dv)
+        attributes["cell id"] = cell_id
+        r_wet = equilibrate_wet_radii(
+            r_dry=r_dry,
+            environment=self,
+            kappa_times_dry_volume=attributes["kappa times dry volume"],
+            cell_id=cell_id,
+            rtol=rtol,
+        )
+        attributes["volume"] = self.formulae.trivia.volume(radius=r_wet)
+        return attributes
+
+    def advance_parcel_vars(self):
+        dt = self.particulator.dt
+        T = self["T"].to_ndarray()
+        p = self["p"].to_ndarray()
+        t = self["t"].to_ndarray()
+
+        dz_dt = np.array(np.broadcast_to(self.w(t[0] + dt / 2), T.shape))  # "mid-point"
+        qv = self["qv"].to_ndarray() - self.dql / 2
+
+        dql_dz = self.dql / dz_dt / dt
+        lv = self.formulae.latent_heat.lv(T)
+        drho_dz = self.formulae.hydrostatics.drho_dz(
+            self.formulae.constants.g_std, p, T, qv, lv, dql_dz=dql_dz
+        )
+        drhod_dz = drho_dz
+
+        self.particulator.backend.explicit_euler(self._tmp["t"], dt, 1)
+        self.particulator.backend.explicit_euler(self._tmp["z"], dt, dz_dt)
+        self.particulator.backend.explicit_euler(
+            self._tmp["rhod"], dt, dz_dt * drhod_dz
+        )
+
+        self.mesh.dv = self.formulae.trivia.volume_of_density_mass(
+            (self._tmp["rhod"].to_ndarray() + self["rhod"].to_ndarray()) / 2,
+            self.mass_of_dry_air,
+        )
+
+    def sync_parcel_vars(self):
+        self.dql = self._tmp["qv"].to_ndarray() - self["qv"].to_ndarray()
+        for var in self.variables:
+            self._tmp[var][:] = self[var][:]
@@ -0,0 +1,184 @@
+""" streaming variant of `PySDM.exporters.netcdf_exporter.NetCDFExporter` in which
+ product values are copied into a ring of pre-allocated buffers at each output step
+ and written directly into a pre-sized netCDF file by a background thread
+ (with the number of buffers in flight bounded by `queue_depth`)
+"""
+import queue
+import struct
+import threading
+
+import numpy as np
+from scipy.io import netcdf_file
+
+from PySDM.exporters.netcdf_exporter import NetCDFExporter
+
+# external data types of the netCDF classic format (the file is big-endian)
+_NC_TYPES = {1: ">i1", 2: "S1", 3: ">i2", 4: ">i4", 5: ">f4", 6: ">f8"}
+
+
+def _variable_layouts(filename):  # pylint: disable=too-many-locals
+    """returns the offset (the "begin" field of the header, in bytes), data type
+    and shape of each variable of a netCDF classic-format file (CDF-1 or CDF-2,
+    as written by `scipy.io.netcdf_file`) by parsing the file header"""
+    with open(filename, "rb") as file:
+
+        def read(fmt):
+            return struct.unpack(fmt, file.read(struct.calcsize(fmt)))
+
+        def read_name():
+            (length,) = read(">i")
+            name = file.read(length).decode()
+            file.read(-length % 4)
+            return name
+
+        def skip_attributes():
+            _, n_attributes = read(">ii")
+            for _ in range(n_attributes):
+                read_name()
+                nc_type, n_values = read(">ii")
+                size = n_values * np.dtype(_NC_TYPES[nc_type]).itemsize
+                file.read(size + -size % 4)
+
+        magic = file.read(4)
+        if magic[:3] != b"CDF" or magic[3] not in (1, 2):
+            raise ValueError(f"{filename} is not a netCDF classic-format file")
+        offset_format = ">i" if magic[3] == 1 else ">q"
+        read(">i")  # number of records
+
+        _, n_dimensions = read(">ii")
+        lengths = []
+        for _ in range(n_dimensions):
+            read_name()
+            lengths.append(read(">i")[0])
+        skip_attributes()
+
+        layouts = {}
+        _, n_variables = read(">ii")
+        for _ in range(n_variables):
+            name = read_name()
+            (n_var_dimensions,) = read(">i")
+            shape = tuple(lengths[i] for i in read(f">{n_var_dimensions}i"))
+            skip_attributes()
+            nc_type, _ = read(">ii")
+            (begin,) = read(offset_format)
+            if 0 in shape:
+                raise NotImplementedError("record (unlimited) variables")
+            layouts[name] = (begin, np.dtype(_NC_TYPES[nc_type]), shape)
+    return layouts
+
+
+class NetCDFStreamExporter(
+    NetCDFExporter
+):  # pylint: disable=too-many-instance-attributes
+    def __init__(self, settings, simulator, filename, queue_depth=2):
+        super().__init__(
+            storage=None, settings=settings, simulator=simulator, filename=filename
+        )
+        assert queue_depth > 0
+        self.queue_depth = queue_depth
+        self.n_exported = 0
+        self.__targets = None
+        self.__ring = None
+        self.__free = None
+        self.__pending = None
+        self.__thread = None
+        self.__error = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def open(self):
+        """writes the file header (settings, dimensions, coordinates), allocates
+        the buffer ring and starts the writer thread"""
+        with netcdf_file(self.filename, mode="w") as ncdf:
+            self._write_settings(ncdf)
+            self._create_dimensions(ncdf)
+            self._create_variables(ncdf)
+            for name in self.__streamed_variables():
+                self.vars[name][:] = np.nan
+
+        self.vars = None
+
+        layouts = _variable_layouts(self.filename)
+        self.__targets = {
+            name: np.memmap(
+                self.filename,
+                dtype=layouts[name][1],
+                mode="r+",
+                offset=layouts[name][0],
+                shape=layouts[name][2],
+            )
+            for name in self.__streamed_variables()
+        }
+        self.__ring = [
+            {
+                name: np.empty(target.shape[1:], dtype=target.dtype)
+                for name, target in self.__targets.items()
+            }
+            for _ in range(self.queue_depth)
+        ]
+        self.__free = queue.Queue()
+        for slot in range(self.queue_depth):
+            self.__free.put(slot)
+        self.__pending = queue.Queue()
+        self.__thread = threading.Thread(target=self.__writer, daemon=True)
+        self.__thread.start()
+
+    def export(self):
+        """copies current product values into a free ring buffer (blocking if all
+        buffers are in flight) and queues it for writing at the next output step"""
+        self.__check_writer()
+        i = self.n_exported
+        if i >= len(self.settings.output_steps):
+            raise IndexError("number of exports exceeds len(settings.output_steps)")
+        slot = self.__free.get()
+        buffers = self.__ring[slot]
+        buffers["T"][...] = self.settings.output_steps[i] * self.settings.dt
+        for name, product in self.simulator.products.items():
+            buffers[name][...] = np.reshape(product.get(), buffers[name].shape)
+        self.__pending.put((slot, i))
+        self.n_exported += 1
+
+    def close(self):
+        """waits for all queued buffers to be written and stops the writer thread"""
+        if self.__thread is None:
+            return
+        self.__pending.put(None)
+        self.__thread.join()
+        self.__thread = None
+        for target in self.__targets.values():
+            target.flush()
+        self.__targets = None
+        self.__check_writer()
+
+    def run(self, controller):
+        """counterpart of `NetCDFExporter.run()`: as the data is written during the
+        simulation (see `export()`), only flushes and closes the stream"""
+        with controller:
+            controller.set_percent(0)
+            self.close()
+            controller.set_percent(1)
+
+    def __streamed_variables(self):
+        return ("T",) + tuple(self.simulator.products.keys())
+
+    def __writer(self):
+        while True:
+            item = self.__pending.get()
+            if item is None:
+                break
+            slot, i = item
+            try:
+                for name, target in self.__targets.items():
+                    target[i] = self.__ring[slot][name]
+            except Exception as error:  # pylint: disable=broad-except
+                self.__error = error
+            self.__free.put(slot)
+
+    def __check_writer(self):
+        if self.__error is not None:
+            raise RuntimeError("writing to netCDF file failed") from self.__error
@@ -71,10 +71,7 @@ class VTKExporter:
         for k in particulator.attributes.keys():
             if len(particulator.attributes[k].shape) != 1:
                 tmp = particulator.attributes[k].to_ndarray(raw=True)
-                tmp_dict = {
-                    k + "[" + str(i) + "]": tmp[i]
-                    for i in range(len(particulator.attributes[k].shape))
-                }
+                tmp_dict = {k + "[" + str(i) + "]": tmp[i] for i in range(tmp.shape[0])}
 
                 payload.update(tmp_dict)
             else:
@@ -100,9 +97,16 @@ class VTKExporter:
                 * (payload["cell origin[1]"] + payload["position in cell[1]"])
             )
             z = np.full_like(x, 0)
+        elif particulator.mesh.dimension == 3:
+            x, y, z = (
+                particulator.mesh.size[dim]
+                / particulator.mesh.grid[dim]
+                * (payload[f"cell origin[{dim}]"] + payload[f"position in cell[{dim}]"])
+                for dim in range(3)
+            )
         else:
             raise NotImplementedError(
-                "Only 2 dimensions array is supported at the moment."
+                "Only 2 and 3 dimensions arrays are supported at the moment."
             )
 
         pointsToVTK(path, x, y, z, data=payload)
@@ -121,19 +125,27 @@ class VTKExporter:
                 print("Exporting Products to vtk, path: " + path)
             payload = {}
 
-            if particulator.mesh.dimension != 2:
+            if particulator.mesh.dimension not in (2, 3):
                 raise NotImplementedError(
-                    "Only 2 dimensions data is supported at the moment."
+                    "Only 2 and 3 dimensions data is supported at the moment."
                 )
 
-            data_shape = (particulator.mesh.grid[1], particulator.mesh.grid[0], 1)
+            data_shape = (
+                (particulator.mesh.grid[1], particulator.mesh.grid[0], 1)
+                if particulator.mesh.dimension == 2
+                else particulator.mesh.grid
+            )
 
             for k in particulator.products.keys():
                 v = particulator.products[k].get()
 
                 if isinstance(v, np.ndarray):
                     if v.shape == particulator.mesh.grid:
-                        payload[k] = v[:, :, np.newaxis]
+                        payload[k] = (
+                            v[:, :, np.newaxis]
+                            if particulator.mesh.dimension == 2
+                            else v
+                        )
                     else:
                         if self.verbose:
                             print(
@@ -150,17 +162,26 @@ class VTKExporter:
                     if self.verbose:
                         print(f"{k} export is not possible", file=sys.stderr)
 
-            y, x, z = np.mgrid[
-                : particulator.mesh.grid[0] + 1, : particulator.mesh.grid[1] + 1, :1
-            ]
-            y = y * particulator.mesh.size[0] / particulator.mesh.grid[0]
-            x = x * particulator.mesh.size[1] / particulator.mesh.grid[1]
-            z = z * 1.0
-
-            gridToVTK(path, x, y, z, cellData=payload)
+            gridToVTK(path, *self._grid_nodes(particulator.mesh), cellData=payload)
         else:
             if self.verbose:
                 print("No products to export")
 
+    @staticmethod
+    def _grid_nodes(mesh):
+        """returns x, y and z coordinates of the nodes of a 2D or 3D mesh"""
+        if mesh.dimension == 2:
+            y, x, z = np.mgrid[: mesh.grid[0] + 1, : mesh.grid[1] + 1, :1]
+            y = y * mesh.size[0] / mesh.grid[0]
+            x = x * mesh.size[1] / mesh.grid[1]
+            z = z * 1.0
+            return x, y, z
+        return tuple(
+            nodes * mesh.size[dim] / mesh.grid[dim]
+            for dim, nodes in enumerate(
+                np.mgrid[tuple(slice(n + 1) for n in mesh.grid)]
+            )
+        )
+
     def add_leading_zeros(self, a):
         return "".join(["0" for i in range(self.num_len - len(str(a)))]) + str(a)
@@ -17,7 +17,7 @@ import pint
 from numba.core.errors import NumbaExperimentalFeatureWarning
 
 from PySDM import physics
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
 
 
 class Formulae:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
@@ -131,9 +131,15 @@ def _formula(func, constants, dimensional_analysis, **kw):
         )
 
     extras = func.__extras if hasattr(func, "__extras") else {}
-    exec(  # pylint:disable=exec-used
-        source, {"const": constants, "np": np, "math": math, **extras}, loc
-    )
+    namespace = {"const": constants, "np": np, "math": math, **extras}
+    if jit_cache.enabled():
+        loc = jit_cache.exec_source(
+            source,
+            comment=f"{func.__qualname__} {jit_cache.stable_key((constants, extras, kw))}",
+            namespace=namespace,
+        )
+    else:
+        exec(source, namespace, loc)  # pylint:disable=exec-used
 
     n_params = len(parameters_keys) - (1 if parameters_keys[0] in special_params else 0)
     function = getattr(loc["_"], func.__name__)
@@ -146,21 +152,26 @@ def _formula(func, constants, dimensional_analysis, **kw):
                 target="cpu",
                 nopython=True,
                 **{
-                    k: v
-                    for k, v in conf.JIT_FLAGS.items()
-                    if k not in ("parallel", "error_model")
+                    **{
+                        k: v
+                        for k, v in conf.JIT_FLAGS.items()
+                        if k not in ("parallel", "error_model")
+                    },
+                    "cache": jit_cache.enabled(),
                 },
             )
         )
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=NumbaExperimentalFeatureWarning)
             return vectorizer(function)
-    return numba.njit(
-        getattr(loc["_"], func.__name__),
-        **{
-            **conf.JIT_FLAGS,
-            **{"parallel": False, "inline": "always", "cache": False, **kw},
-        },
+    return jit_cache.enable(
+        numba.njit(
+            getattr(loc["_"], func.__name__),
+            **{
+                **conf.JIT_FLAGS,
+                **{"parallel": False, "inline": "always", "cache": False, **kw},
+            },
+        )
     )
 
 
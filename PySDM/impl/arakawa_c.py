@@ -8,9 +8,41 @@ def z_scalar_coord(grid):
     return np.linspace(1 / 2, grid[-1] - 1 / 2, grid[-1])
 
 
+def make_field_of_zZ(grid, value_of_zZ):
+    """values at cell centres of a grid of any dimensionality (with the last dimension
+    being the vertical one) of a given function of normalised height"""
+    return np.broadcast_to(
+        value_of_zZ(z_scalar_coord(grid) / grid[-1]).reshape(
+            (1,) * (len(grid) - 1) + (grid[-1],)
+        ),
+        tuple(grid),
+    ).copy()
+
+
 def make_rhod(grid, rhod_of_zZ):
-    return np.repeat(
-        rhod_of_zZ(z_scalar_coord(grid) / grid[-1]).reshape((1, grid[1])),
-        grid[0],
-        axis=0,
+    return make_field_of_zZ(grid, rhod_of_zZ)
+
+
+def face_coords(grid, dim):
+    """normalised (0...1) coordinates of the centres of cell faces normal
+    to `dim` (i.e., locations of the `dim` component of a staggered vector field)
+    as a tuple of arrays of shape `grid` extended by one in `dim`"""
+    return np.meshgrid(
+        *(
+            np.arange(grid[d] + 1) / grid[d]
+            if d == dim
+            else (np.arange(grid[d]) + 1 / 2) / grid[d]
+            for d in range(len(grid))
+        ),
+        indexing="ij",
     )
+
+
+def face_pairs(component, dim):
+    """views of the values of a staggered vector field `component` (normal to `dim`)
+    on the left and on the right faces of each cell"""
+    left = [slice(None)] * component.ndim
+    right = [slice(None)] * component.ndim
+    left[dim] = slice(None, -1)
+    right[dim] = slice(1, None)
+    return component[tuple(left)], component[tuple(right)]
@@ -0,0 +1,22 @@
+"""
+per-droplet change tracking (enabled with `PySDM.particulator.Particulator.track_changes`)
+ allowing derived attributes to be recomputed only for super-droplets modified since
+ their last evaluation
+"""
+
+
+class ChangeTracker:  # pylint: disable=too-few-public-methods
+    """keeps a global modification counter (`epoch`) and, for each super-droplet,
+    the epoch at which its attributes were last modified by a tracking-aware backend
+    routine (collisions, freezing); derived attributes remember the epoch of their last
+    evaluation and recompute only the droplets with a newer `droplet_epoch`, unless
+    any of their dependencies was modified as a whole in the meantime"""
+
+    def __init__(self, particulator):
+        self.epoch = 1
+        self.droplet_epoch = particulator.Storage.empty(particulator.n_sd, dtype=int)
+        self.droplet_epoch.fill(self.epoch)
+
+    def next_epoch(self):
+        self.epoch += 1
+        return self.epoch
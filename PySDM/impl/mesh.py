@@ -70,7 +70,8 @@ class Mesh:
         cell_origin = positions.astype(dtype=np.int64)
         position_in_cell = positions - np.floor(positions)
 
-        cell_id = np.empty(n_sd, dtype=np.int64)
-        cell_id[:] = np.dot(self.strides, cell_origin)
+        cell_id = np.zeros(n_sd, dtype=np.int64)
+        for dim in range(cell_origin.shape[0]):
+            cell_id += self.strides[0, dim] * cell_origin[dim]
 
         return cell_id, cell_origin, position_in_cell
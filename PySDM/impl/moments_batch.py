@@ -0,0 +1,133 @@
+"""
+single-pass evaluation of statistical moments requested by all registered
+ `PySDM.products.impl.moment_product.MomentProduct` instances: the specs declared
+ by products are registered at build time and all of them are computed at once
+ (with a single sweep over super-droplets) whenever particle state changes,
+ the products are then served rows of the cached result (specs not known upfront
+ are computed separately when first requested and join the batch afterwards)
+"""
+from collections import namedtuple
+
+import numpy as np
+
+MomentSpec = namedtuple(
+    "MomentSpec",
+    (
+        "attr",
+        "rank",
+        "filter_attr",
+        "filter_range",
+        "weighting_attribute",
+        "weighting_rank",
+        "skip_division_by_m0",
+    ),
+)
+
+
+class MomentsBatch:  # pylint: disable=too-many-instance-attributes
+    def __init__(self, particulator):
+        self.particulator = particulator
+        self.specs = []
+        self.__registered = set()
+        self.__rows = {}
+        self.__requested = set()
+        self.__epoch = None
+        self.__moment_0 = None
+        self.__moments = None
+        self.__host_moment_0 = None
+        self.__host_moments = None
+
+    def __current_epoch(self):
+        attributes = self.particulator.attributes
+        keys = {"n", "cell id"}
+        for spec in self.specs:
+            keys |= {spec.attr, spec.filter_attr, spec.weighting_attribute}
+        return (
+            self.particulator.n_steps,
+            attributes.super_droplet_count,
+            tuple(attributes.get_timestamp(key) for key in sorted(keys)),
+        )
+
+    def __storages(self, n_spec):
+        shape = (n_spec, self.particulator.mesh.n_cell)
+        dtype = self.particulator.Storage.ACCUMULATOR
+        return tuple(
+            self.particulator.Storage.empty(shape, dtype=dtype) for _ in range(2)
+        )
+
+    def __compute(self):
+        if self.__moments is None or self.__moments.shape[0] != len(self.specs):
+            self.__moment_0, self.__moments = self.__storages(len(self.specs))
+        self.particulator.batched_moments(
+            moment_0=self.__moment_0, moments=self.__moments, specs=self.specs
+        )
+        self.__host_moment_0 = self.__moment_0.to_ndarray()
+        self.__host_moments = self.__moments.to_ndarray()
+        self.__rows = {spec: row for row, spec in enumerate(self.specs)}
+
+    def __append(self, spec):
+        moment_0, moments = self.__storages(1)
+        self.particulator.batched_moments(
+            moment_0=moment_0, moments=moments, specs=(spec,)
+        )
+        self.__rows[spec] = len(self.specs)
+        self.specs.append(spec)
+        self.__host_moment_0 = np.concatenate(
+            (self.__host_moment_0, moment_0.to_ndarray())
+        )
+        self.__host_moments = np.concatenate(
+            (self.__host_moments, moments.to_ndarray())
+        )
+
+    def register(self, spec: MomentSpec):
+        """adds `spec` to the batch (to be computed with the others upon next `get()`)"""
+        self.__registered.add(spec)
+        if spec not in self.specs:
+            self.specs.append(spec)
+            self.__epoch = None
+
+    def get(self, spec: MomentSpec):
+        """returns the (cached) 0-th moment (for `spec.rank == 0`) or the
+        `spec.rank`-th moment as a host-side array with one value per cell"""
+        if self.__epoch is None or self.__epoch != self.__current_epoch():
+            if self.__epoch is not None:
+                self.specs = [
+                    s
+                    for s in self.specs
+                    if s in self.__registered or s in self.__requested
+                ]
+            self.__requested = set()
+            if spec not in self.specs:
+                self.specs.append(spec)
+            self.__compute()
+            self.__epoch = self.__current_epoch()
+        elif spec not in self.__rows:
+            self.__append(spec)
+            self.__epoch = self.__current_epoch()
+        self.__requested.add(spec)
+
+        row = self.__rows[spec]
+        if spec.rank == 0:  # TODO #217
+            return self.__host_moment_0[row]
+        return self.__host_moments[row]
+
+    @staticmethod
+    def make_spec(
+        *,
+        attr,
+        rank,
+        filter_attr="volume",
+        filter_range=(-np.inf, np.inf),
+        weighting_attribute="volume",
+        weighting_rank=0,
+        skip_division_by_m0=False,
+    ):
+        return MomentSpec(
+            attr=attr,
+            rank=rank,
+            filter_attr=filter_attr,
+            filter_range=tuple(float(x) for x in filter_range),
+            weighting_attribute=weighting_attribute,
+            weighting_rank=weighting_rank,
+            skip_division_by_m0=bool(skip_division_by_m0),
+        )
@@ -7,6 +7,10 @@ from typing import Dict
 import numpy as np
 
 from PySDM.attributes.impl.attribute import Attribute
+from PySDM.attributes.impl.base_attribute import BaseAttribute
+from PySDM.attributes.impl.derived_attribute import DerivedAttribute
+from PySDM.attributes.impl.fused_chain import FusedChain
+from PySDM.impl.change_tracker import ChangeTracker
 
 
 class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
@@ -20,6 +24,7 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
         cell_start,
         attributes: Dict[str, Attribute],
     ):
+        self.__backend = particulator.backend
         self.__valid_n_sd = particulator.n_sd
         self.healthy = True
         self.__healthy_memory = particulator.Storage.from_ndarray(np.full((1,), 1))
@@ -38,6 +43,9 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
         )
         self.__sorted = False
         self.__attributes = attributes
+        self.change_tracker = (
+            ChangeTracker(particulator) if particulator.track_changes else None
+        )
 
     @property
     def cell_start(self):
@@ -53,8 +61,20 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
         assert self.healthy
         return len(self.__idx)
 
-    def mark_updated(self, key):
+    def mark_updated(self, key, tracked=False):
+        """to be called after modifying attribute data; unless `tracked` is set
+        (indicating that the modified droplets were stamped in `change_tracker`),
+        the whole attribute is considered modified"""
         self.__attributes[key].mark_updated()
+        if self.change_tracker is not None and not tracked:
+            self.__attributes[key].full_update_epoch = self.change_tracker.next_epoch()
+
+    def invalidate(self):
+        """to be called after zeroing multiplicities outside of backend methods
+        (which flag it through the healthy memory themselves); the affected
+        super-droplets are removed upon the subsequent `sanitize()` call"""
+        self.healthy = False
+        self.__healthy_memory[:] = 0
 
     def sanitize(self):
         if not self.healthy:
@@ -103,6 +123,62 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
         )
         self.__sorted = True
 
+    def fragmentation(self):
+        """returns the fraction of neighbouring entries of the (cell-sorted) permutation
+        which do not point to neighbouring elements of the attribute storage
+        (zero right after `defragment()`, close to one after a global shuffle)"""
+        idx = self.__idx.to_ndarray()[: len(self.__idx)]
+        if len(idx) < 2:
+            return 0.0
+        return float(np.mean(np.diff(idx) != 1))
+
+    def defragment(self, droplet_storages=()):
+        """physically reorders the data of all attributes (and of the per-droplet
+        `droplet_storages`, e.g., state kept by dynamics, as well as of the storages
+        in `droplet_history` of attributes) into cell-sorted order
+        so that the permutation becomes identity"""
+        self.cell_start  # pylint: disable=pointless-statement
+        length = len(self.__idx)
+        storages = [self.__extensive_attribute_storage]
+        for key, attr in self.__attributes.items():
+            if key not in self.__extensive_keys:
+                storages.append(attr.data)
+            storages.extend(getattr(attr, "droplet_history", {}).values())
+        if self.change_tracker is not None:
+            storages.append(self.change_tracker.droplet_epoch)
+        storages.extend(droplet_storages)
+        for storage in storages:
+            if storage is not None:
+                self.__backend.permute_in_place(storage, self.__idx, length)
+        self.__idx.reset_index()
+
+    def per_droplet_chains(self, keys):
+        """returns `PySDM.attributes.impl.fused_chain.FusedChain`s evaluating the
+        derived attributes among `keys` (except those evaluated within other chains)
+        from base attributes, for use within kernels modifying the latter;
+        raises `ValueError` if any of them cannot be evaluated as such"""
+        unallocated = {
+            key for key, attr in self.__attributes.items() if attr.data is None
+        }
+        chains = []
+        for key in keys:
+            attr = self.__attributes[key]
+            if not isinstance(attr, DerivedAttribute):
+                continue
+            chain = FusedChain(attr, idx=self.__idx, transient=unallocated)
+            if not all(isinstance(arg, BaseAttribute) for arg in chain.inputs):
+                raise ValueError(
+                    f"attribute '{key}' is not a per-droplet function of base attributes"
+                )
+            chains.append(chain)
+        return [
+            chain
+            for chain in chains
+            if not any(
+                chain.leaf in other.members for other in chains if other is not chain
+            )
+        ]
+
     def get_extensive_attribute_storage(self):
         return self.__extensive_attribute_storage
 
@@ -111,3 +187,41 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
 
     def has_attribute(self, attr):
         return attr in self.__attributes
+
+    def get_timestamp(self, key):
+        """returns the timestamp of a given attribute (after updating it, if derived)"""
+        self.__attributes[key].update()
+        return self.__attributes[key].timestamp
+
+    def get_state(self):
+        """returns raw (i.e., non-permuted) copies of all non-derived attribute data
+        together with the permutation and cell-sorting bookkeeping"""
+        return {
+            "attributes": {
+                key: attr.data.to_ndarray(raw=True)
+                for key, attr in self.__attributes.items()
+                if isinstance(attr, BaseAttribute)
+            },
+            "idx": self.__idx.to_ndarray(),
+            "idx length": int(self.__idx.length),
+            "valid n_sd": int(self.__valid_n_sd),
+            "healthy": self.healthy,
+            "healthy memory": self.__healthy_memory.to_ndarray(),
+            "cell idx": self.cell_idx.to_ndarray(),
+            "cell start": self.__cell_start.to_ndarray(),
+            "sorted": self.__sorted,
+        }
+
+    def set_state(self, state):
+        """inverse of `get_state()`"""
+        for key, data in state["attributes"].items():
+            self.__attributes[key].data.upload(data)
+            self.mark_updated(key)
+        self.__idx.upload(state["idx"])
+        self.__idx.length = type(self.__idx.length)(state["idx length"])
+        self.__valid_n_sd = state["valid n_sd"]
+        self.healthy = state["healthy"]
+        self.__healthy_memory.upload(state["healthy memory"])
+        self.cell_idx.upload(state["cell idx"])
+        self.__cell_start.upload(state["cell start"])
+        self.__sorted = state["sorted"]
@@ -10,15 +10,33 @@ from PySDM.attributes.impl import (
     ExtensiveAttribute,
     MaximumAttribute,
 )
+from PySDM.attributes.impl.fused_chain import fuse_chains
 from PySDM.attributes.physics.multiplicities import Multiplicities
 from PySDM.impl.particle_attributes import ParticleAttributes
 
 
 class ParticleAttributesFactory:
     @staticmethod
-    def attributes(particulator, req_attr, attributes):
+    def _fuse_chains(particulator, req_attr, idx, requested):
+        """sets up fused chains of derived attributes (if enabled) returning
+        the names of the transient intermediates (not to be allocated)"""
+        if particulator.attribute_chain_fusion is None:
+            return ()
+        assert particulator.attribute_chain_fusion in ("persistent", "transient")
+        return fuse_chains(
+            req_attr,
+            idx=idx,
+            requested=requested,
+            transient_intermediates=particulator.attribute_chain_fusion == "transient",
+        )
+
+    @staticmethod
+    def attributes(particulator, req_attr, attributes, requested=()):
         # pylint: disable=too-many-locals
         idx = particulator.Index.identity_index(particulator.n_sd)
+        transient = ParticleAttributesFactory._fuse_chains(
+            particulator, req_attr, idx, requested
+        )
 
         extensive_attr = []
         maximum_attr = []
@@ -41,7 +59,10 @@ class ParticleAttributesFactory:
         )
 
         for attr in req_attr.values():
-            if isinstance(attr, (DerivedAttribute, DummyAttribute)):
+            if (
+                isinstance(attr, (DerivedAttribute, DummyAttribute))
+                and attr.name not in transient
+            ):
                 attr.allocate(idx)
             if isinstance(attr, DummyAttribute) and attr.name in attributes:
                 raise ValueError(
@@ -0,0 +1,206 @@
+"""
+opt-in profiler recording wall-time, call counts and operand sizes of every public
+ backend method call (and of the cell caretaker) together with per-dynamic timings,
+ see `PySDM.builder.Builder.set_profiler()`; on GPU backends, the timings of
+ asynchronously launched kernels reflect the launch overhead only
+
+the (possibly shared) backend is instrumented only within the `Profiler` context
+ (entered by the particulator for the duration of build and of each `run()` call),
+ upon exit, the original backend methods are restored
+"""
+import functools
+import inspect
+import json
+import time
+
+import numpy as np
+
+from PySDM.backends.impl_common.storage_utils import StorageBase
+from PySDM.impl.wall_timer import WallTimer
+
+_NOT_INSTRUMENTED = ("Storage", "Random", "formulae")
+_UNSET = object()
+
+
+def _nbytes(arg):
+    if isinstance(arg, StorageBase):
+        return int(np.prod(arg.shape)) * np.dtype(arg.dtype).itemsize
+    if isinstance(arg, np.ndarray):
+        return arg.nbytes
+    if isinstance(arg, (tuple, list)):
+        return sum(_nbytes(item) for item in arg)
+    return 0
+
+
+class _DynamicTimer(WallTimer):
+    def __init__(self, profiler, dynamic):
+        super().__init__()
+        self.profiler = profiler
+        self.dynamic = dynamic
+
+    def __enter__(self):
+        self.profiler.enter_dynamic(self.dynamic)
+        super().__enter__()
+
+    def __exit__(self, *_):
+        super().__exit__(*_)
+        self.profiler.exit_dynamic(self.start, self.time)
+
+
+class Profiler:  # pylint: disable=too-many-instance-attributes
+    def __init__(self):
+        self.particulator = None
+        self.stats = {}
+        self.events = []
+        self.origin = time.perf_counter()
+        self.__dynamic = None
+        self.__calls_in_dynamic = {}
+        self.__wrappers = {}
+        self.__originals = None
+
+    def register(self, builder):
+        self.particulator = builder.particulator
+        self.__wrappers = self.__instrument(self.particulator.backend)
+
+    def __enter__(self):
+        assert self.__originals is None
+        backend = self.particulator.backend
+        self.__originals = {
+            name: vars(backend).get(name, _UNSET) for name in self.__wrappers
+        }
+        for name, wrapper in self.__wrappers.items():
+            setattr(backend, name, wrapper)
+        return self
+
+    def __exit__(self, *_):
+        backend = self.particulator.backend
+        for name, original in self.__originals.items():
+            if original is _UNSET:
+                delattr(backend, name)
+            else:
+                setattr(backend, name, original)
+        self.__originals = None
+
+    def timer(self, dynamic):
+        """returns a `PySDM.impl.wall_timer.WallTimer` recording dynamic-level events"""
+        return _DynamicTimer(self, dynamic)
+
+    def enter_dynamic(self, dynamic):
+        self.__dynamic = dynamic
+        self.__calls_in_dynamic = {}
+
+    def exit_dynamic(self, start, duration):
+        self.__record(self.__dynamic, "dynamic", start, duration, 0, 0)
+        self.__dynamic = None
+
+    def __record(
+        self, name, category, start, duration, substep, nbytes
+    ):  # pylint: disable=too-many-arguments
+        if category == "kernel":
+            stats = self.stats.setdefault(name, {"calls": 0, "time": 0.0, "bytes": 0})
+            stats["calls"] += 1
+            stats["time"] += duration
+            stats["bytes"] += nbytes
+        self.events.append(
+            {
+                "name": name,
+                "category": category,
+                "dynamic": self.__dynamic,
+                "step": self.particulator.n_steps,
+                "substep": substep,
+                "start": start - self.origin,
+                "duration": duration,
+                "bytes": nbytes,
+            }
+        )
+
+    def __wrap(self, name, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            substep = self.__calls_in_dynamic.get(name, 0)
+            self.__calls_in_dynamic[name] = substep + 1
+            timer = WallTimer()
+            with timer:
+                result = method(*args, **kwargs)
+            self.__record(
+                name,
+                "kernel",
+                timer.start,
+                timer.time,
+                substep,
+                _nbytes(args) + _nbytes(tuple(kwargs.values())),
+            )
+            return result
+
+        return wrapper
+
+    def __wrap_factory(self, factory):
+        @functools.wraps(factory)
+        def wrapper(*args, **kwargs):
+            product = factory(*args, **kwargs)
+            scheme = getattr(product, "scheme", None)
+            name = factory.__name__[len("make_") :]
+            return self.__wrap(f"{name} ({scheme})" if scheme else name, product)
+
+        return wrapper
+
+    def __instrument(self, backend):
+        wrappers = {}
+        for name, member in inspect.getmembers(type(backend)):
+            if (
+                name.startswith("_")
+                or name in _NOT_INSTRUMENTED
+                or isinstance(member, property)
+            ):
+                continue
+            method = getattr(backend, name)
+            if not callable(method):
+                continue
+            if name == "make_cell_caretaker":
+                wrappers[name] = self.__wrap_factory(method)
+            elif not name.startswith("make_"):
+                wrappers[name] = self.__wrap(name, method)
+        return wrappers
+
+    def step_times(self, name):
+        """returns an array of per-step wall times spent in a given backend method
+        (or dynamic)"""
+        result = np.zeros(self.particulator.n_steps + 1)
+        for event in self.events:
+            if event["name"] == name:
+                result[event["step"]] += event["duration"]
+        return result[: self.particulator.n_steps]
+
+    def substep_times(self, name, step):
+        """returns a list of wall times of subsequent calls to a given backend method
+        within a given step (e.g., one per collision substep)"""
+        return [
+            event["duration"]
+            for event in self.events
+            if event["name"] == name and event["step"] == step
+        ]
+
+    def dump(self, path):
+        """writes the recorded events in the Chrome-trace JSON format
+        (loadable in chrome://tracing or https://ui.perfetto.dev)"""
+        trace = {
+            "traceEvents": [
+                {
+                    "name": event["name"],
+                    "cat": event["category"],
+                    "ph": "X",
+                    "ts": event["start"] * 1e6,
+                    "dur": event["duration"] * 1e6,
+                    "pid": 0,
+                    "tid": 0 if event["category"] == "dynamic" else 1,
+                    "args": {
+                        key: event[key]
+                        for key in ("dynamic", "step", "substep", "bytes")
+                    },
+                }
+                for event in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(trace, file)
@@ -0,0 +1,323 @@
+"""
+single-file, memory-mappable binary snapshot of the complete state of a
+ `PySDM.particulator.Particulator` (see `PySDM.particulator.Particulator.checkpoint()`
+ and `PySDM.builder.Builder.restore()`)
+
+file layout: magic bytes, little-endian uint64 header length, JSON header,
+ zero padding and a sequence of raw arrays, each starting at an `ALIGNMENT`-byte
+ boundary so that they can be accessed with `numpy.memmap` without copying
+"""
+import json
+import os
+import types
+
+import numba
+import numpy as np
+
+from PySDM.attributes.impl.attribute import Attribute
+from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_common.random_common import RandomCommon
+from PySDM.backends.impl_common.storage_utils import StorageBase
+
+MAGIC = b"PySDMsnp"
+VERSION = 1
+ALIGNMENT = 64
+
+_SKIPPED_FIELDS = ("particulator", "formulae")
+_SKIPPED = {"skipped": None}
+_CODE_TYPES = (
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.ModuleType,
+    type,
+    numba.core.dispatcher.Dispatcher,
+)
+
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _has_state(obj):
+    return callable(getattr(obj, "get_state", None)) and callable(
+        getattr(obj, "set_state", None)
+    )
+
+
+def _is_pysdm_object(obj):
+    return (
+        type(obj).__module__.startswith("PySDM")
+        and hasattr(obj, "__dict__")
+        and not isinstance(obj, (Attribute, BackendMethods))
+    )
+
+
+class _Encoder:
+    """turns (nested) PySDM objects into a JSON-serialisable tree
+    with all array data moved out to the `arrays` list; code (functions, classes,
+    JIT-compiled kernels) and objects already encoded elsewhere in the tree are
+    skipped, while any other value which cannot be encoded raises an error"""
+
+    def __init__(self, particulator):
+        self.particulator = particulator
+        self.arrays = []
+        self.visited = set()
+        self.path = []
+
+    def array(self, kind, data):
+        self.arrays.append(np.ascontiguousarray(data))
+        return {kind: len(self.arrays) - 1}
+
+    def __call__(self, obj):
+        # pylint: disable=too-many-return-statements
+        if obj is None or isinstance(obj, (bool, int, float, str)):
+            return {"value": obj}
+        if isinstance(obj, np.generic):
+            return {"value": obj.item()}
+        if isinstance(obj, StorageBase):
+            return self.array("storage", self.particulator.Storage.to_ndarray(obj))
+        if isinstance(obj, np.ndarray):
+            return self.array("ndarray", obj)
+
+        if isinstance(obj, tuple):
+            return {"tuple": self.sequence(obj)}
+        if isinstance(obj, _CODE_TYPES):
+            return _SKIPPED
+
+        if id(obj) in self.visited:
+            return _SKIPPED
+        self.visited.add(id(obj))
+
+        if isinstance(obj, dict):
+            return {"dict": self.items(obj.items())}
+        if isinstance(obj, list):
+            return {"list": self.sequence(obj)}
+        if isinstance(obj, RandomCommon) and not _has_state(obj):
+            raise NotImplementedError(
+                f"{self.where()}: state of {type(obj).__module__}.{type(obj).__name__}"
+                " random number generator cannot be saved"
+                " (checkpointing is not supported with this backend)"
+            )
+        if _has_state(obj):
+            return {"state": self.state(obj.get_state())}
+        if _is_pysdm_object(obj):
+            return {
+                "object": self.items(
+                    (key, value)
+                    for key, value in vars(obj).items()
+                    if key not in _SKIPPED_FIELDS
+                )
+            }
+        raise TypeError(f"{self.where()}: cannot save {type(obj)}")
+
+    def where(self):
+        return "snapshot of " + ".".join(self.path)
+
+    def items(self, items):
+        result = {}
+        for key, value in items:
+            if not isinstance(key, str):
+                raise TypeError(f"{self.where()}: cannot save non-string key {key!r}")
+            self.path.append(key)
+            result[key] = self(value)
+            self.path.pop()
+        return result
+
+    def sequence(self, items):
+        result = []
+        for i, item in enumerate(items):
+            self.path.append(str(i))
+            result.append(self(item))
+            self.path.pop()
+        return result
+
+    def state(self, state):
+        if isinstance(state, dict):
+            return {"dict": {key: self.state(value) for key, value in state.items()}}
+        if isinstance(state, np.ndarray):
+            return self.array("ndarray", state)
+        if isinstance(state, np.generic):
+            return {"value": state.item()}
+        if state is None or isinstance(state, (bool, int, float, str)):
+            return {"value": state}
+        raise TypeError(f"{self.where()}: cannot save state of type {type(state)}")
+
+
+class _Decoder:
+    """applies a tree produced by `_Encoder` onto a freshly built particulator,
+    overwriting storages in place wherever possible (to retain any aliasing)"""
+
+    def __init__(self, particulator, arrays):
+        self.particulator = particulator
+        self.arrays = arrays
+
+    def __call__(self, live, node, assign):
+        # pylint: disable=too-many-branches
+        ((kind, value),) = node.items()
+        if kind == "skipped":
+            pass
+        elif kind == "value":
+            assign(value)
+        elif kind == "storage":
+            data = self.arrays[value]
+            if isinstance(live, StorageBase) and tuple(live.shape) == data.shape:
+                live.upload(data)
+            else:
+                assign(self.particulator.Storage.from_ndarray(np.array(data)))
+        elif kind == "ndarray":
+            data = self.arrays[value]
+            if (
+                isinstance(live, np.ndarray)
+                and live.shape == data.shape
+                and live.dtype == data.dtype
+                and live.flags.writeable
+            ):
+                live[...] = data
+            else:
+                assign(np.array(data))
+        elif kind == "dict":
+            if not isinstance(live, dict):
+                live = {}
+                assign(live)
+            for key, item in value.items():
+                self(live.get(key), item, _setter(live, key))
+        elif kind in ("tuple", "list"):
+            items = list(live) if live is not None and len(live) == len(value) else []
+            items = items or [None] * len(value)
+            for i, item in enumerate(value):
+                self(items[i], item, _setter(items, i))
+            if isinstance(live, list) and len(live) == len(items):
+                live[:] = items
+            else:
+                assign(tuple(items) if kind == "tuple" else items)
+        elif kind == "state":
+            live.set_state(self.state(value))
+        elif kind == "object":
+            if live is None:
+                raise ValueError(
+                    "snapshot does not match the setup of the particulator being restored"
+                )
+            for key, item in value.items():
+                self(getattr(live, key, None), item, _attr_setter(live, key))
+        else:
+            raise NotImplementedError(kind)
+
+    def state(self, node):
+        ((kind, value),) = node.items()
+        if kind == "dict":
+            return {key: self.state(item) for key, item in value.items()}
+        if kind == "ndarray":
+            return self.arrays[value]
+        return value
+
+
+def _setter(container, key):
+    def fun(value):
+        container[key] = value
+
+    return fun
+
+
+def _attr_setter(obj, key):
+    def fun(value):
+        setattr(obj, key, value)
+
+    return fun
+
+
+def save(path, particulator):
+    """writes the state of `particulator` to a single binary file at `path`
+    (written to a temporary file first and then atomically moved into place)"""
+    encoder = _Encoder(particulator)
+    header = {
+        "version": VERSION,
+        "n_sd": particulator.n_sd,
+        "n_steps": particulator.n_steps,
+        "particles": encoder.state(particulator.attributes.get_state()),
+    }
+    encoder.path = ["environment"]
+    header["environment"] = encoder(particulator.environment)
+    for root in ("dynamics", "products"):
+        encoder.path = [root]
+        header[root] = encoder.items(getattr(particulator, root).items())
+
+    offset = 0
+    header["arrays"] = []
+    for array in encoder.arrays:
+        header["arrays"].append(
+            {"offset": offset, "dtype": array.dtype.str, "shape": array.shape}
+        )
+        offset = _aligned(offset + array.nbytes)
+    header_bytes = json.dumps(header).encode()
+    data_start = _aligned(len(MAGIC) + 8 + len(header_bytes))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(MAGIC)
+        file.write(len(header_bytes).to_bytes(8, "little"))
+        file.write(header_bytes)
+        for array, meta in zip(encoder.arrays, header["arrays"]):
+            file.write(b"\0" * (data_start + meta["offset"] - file.tell()))
+            file.write(array.tobytes())
+    os.replace(tmp_path, path)
+
+
+class Snapshot:
+    """read-only, memory-mapped view of a file written with `save()`"""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"'{path}' is not a PySDM snapshot file")
+            header_length = int.from_bytes(file.read(8), "little")
+            self.header = json.loads(file.read(header_length))
+        if self.header["version"] != VERSION:
+            raise ValueError(f"unsupported snapshot version: {self.header['version']}")
+        data_start = _aligned(len(MAGIC) + 8 + header_length)
+
+        self.arrays = []
+        for meta in self.header["arrays"]:
+            shape = tuple(meta["shape"])
+            if np.prod(shape, dtype=int) == 0:
+                array = np.empty(shape, dtype=meta["dtype"])
+            else:
+                array = np.memmap(
+                    path,
+                    dtype=meta["dtype"],
+                    mode="r",
+                    offset=data_start + meta["offset"],
+                    shape=shape,
+                )
+            self.arrays.append(array)
+
+    @property
+    def n_sd(self):
+        return self.header["n_sd"]
+
+    @property
+    def particles(self):
+        return _Decoder(None, self.arrays).state(self.header["particles"])
+
+    def restore(self, particulator):
+        """overwrites the state of a particulator built with the same setup
+        as the one the snapshot was taken from"""
+        if particulator.n_sd != self.n_sd:
+            raise ValueError(
+                f"snapshot was taken with n_sd={self.n_sd}"
+                f" (while particulator has n_sd={particulator.n_sd})"
+            )
+        decoder = _Decoder(particulator, self.arrays)
+        particulator.attributes.set_state(self.particles)
+        decoder(particulator.environment, self.header["environment"], _forbidden)
+        for root in ("dynamics", "products"):
+            live = getattr(particulator, root)
+            for key, node in self.header[root].items():
+                if key not in live:
+                    raise ValueError(f"'{key}' not found in particulator.{root}")
+                decoder(live[key], node, _forbidden)
+        particulator.n_steps = self.header["n_steps"]
+
+
+def _forbidden(_):
+    raise AssertionError()
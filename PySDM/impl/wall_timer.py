@@ -12,9 +12,11 @@ class WallTimer:
 
     def __init__(self):
         self.time = None
+        self.start = None
 
     def __enter__(self):
-        self.time = self.__clock()
+        self.start = self.__clock()
+        self.time = self.start
 
     def __exit__(self, *_):
         self.time *= -1
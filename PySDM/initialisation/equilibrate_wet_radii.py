@@ -4,6 +4,7 @@ Koehler-curve equilibrium in unsaturated conditions
 import numba
 import numpy as np
 
+from ..backends.impl_numba import jit_cache
 from ..backends.impl_numba.conf import JIT_FLAGS
 from ..backends.impl_numba.toms748 import toms748_solve
 from ..backends.impl_numba.warnings import warn
@@ -121,7 +122,7 @@ def equilibrate_wet_radii(
         return r_wet
 
     iters = np.empty_like(r_dry, dtype=int)
-    r_wet = r_wet_init_impl(
+    r_wet = jit_cache.enable(r_wet_init_impl)(
         r_dry=r_dry, iters=iters, T=T, RH=RH, cell_id=cell_id, kappa=kappa, rtol=rtol
     )
     assert (iters != max_iters).all() and (iters != -1).all()
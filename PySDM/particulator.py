@@ -1,13 +1,17 @@
 """
 The very class exposing `PySDM.particulator.Particulator.run()` method for launching simulations
 """
+from contextlib import nullcontext
+
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_common.bin_lookup import bin_lookup_parameters
 from PySDM.backends.impl_common.index import make_Index
 from PySDM.backends.impl_common.indexed_storage import make_IndexedStorage
 from PySDM.backends.impl_common.pair_indicator import make_PairIndicator
 from PySDM.backends.impl_common.pairwise_storage import make_PairwiseStorage
+from PySDM.impl import snapshot
 from PySDM.impl.particle_attributes import ParticleAttributes
 
 
@@ -26,7 +30,22 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
 
         self.n_steps = 0
 
+        # see `make_cell_caretaker()` of the backend (Numba supports "counting_sort",
+        #  "counting_sort_parallel" and "incremental"), to be set before building
         self.sorting_scheme = "default"
+        # attribute data are physically reordered by cell (see `defragment()`) every
+        #  `defragmentation_interval` steps (if non-zero) and whenever the fragmentation
+        #  of the permutation exceeds `defragmentation_threshold` (if not None)
+        self.defragmentation_interval = 0
+        self.defragmentation_threshold = None
+        # if set before building, droplets modified by collisions and freezing are
+        #  tracked so that derived attributes are recomputed only for these droplets
+        #  (see `PySDM.impl.change_tracker.ChangeTracker`)
+        self.track_changes = False
+        # if set before building to "persistent" or "transient", derived attributes being
+        #  per-droplet functions of their dependencies are evaluated in fused chains
+        #  (see `PySDM.attributes.impl.fused_chain`)
+        self.attribute_chain_fusion = None
         self.condensation_solver = None
 
         self.Index = make_Index(backend)  # pylint: disable=invalid-name
@@ -39,15 +58,53 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         )
 
         self.timers = {}
+        self.profiler = None
+        self.moments_batch = None
         self.null = self.Storage.empty(0, dtype=float)
 
     def run(self, steps):
-        for _ in range(steps):
-            for key, dynamic in self.dynamics.items():
-                with self.timers[key]:
-                    dynamic()
-            self.n_steps += 1
-            self._notify_observers()
+        with self.profiled():
+            for _ in range(steps):
+                for key, dynamic in self.dynamics.items():
+                    with self.timers[key]:
+                        dynamic()
+                self.n_steps += 1
+                if self._defragmentation_due():
+                    self.defragment()
+                self._notify_observers()
+
+    def profiled(self):
+        """returns a context within which backend method calls are recorded
+        by the profiler (a no-op one if no profiler was set)"""
+        return nullcontext() if self.profiler is None else self.profiler
+
+    def defragment(self):
+        """physically permutes all attribute storages (and per-droplet state
+        of dynamics kept in their `droplet_history`) into cell-sorted order,
+        resetting the permutation to identity for better memory locality"""
+        self.attributes.defragment(
+            droplet_storages=[
+                storage
+                for dynamic in self.dynamics.values()
+                for storage in getattr(dynamic, "droplet_history", {}).values()
+            ]
+        )
+
+    def _defragmentation_due(self):
+        if (
+            self.defragmentation_interval
+            and self.n_steps % self.defragmentation_interval == 0
+        ):
+            return True
+        if self.defragmentation_threshold is not None:
+            return self.attributes.fragmentation() > self.defragmentation_threshold
+        return False
+
+    def checkpoint(self, path):
+        """saves the complete simulation state (particle attributes, permutation,
+        environment, dynamics and products state incl. random number generators)
+        to a single memory-mappable file, see `PySDM.builder.Builder.restore()`"""
+        snapshot.save(path, self)
 
     def _notify_observers(self):
         reversed_order_so_that_environment_is_last = reversed(self.observers)
@@ -101,8 +158,21 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
             RH=self.environment.get_predicted("RH"),
         )
 
-    def condensation(self, *, rtol_x, rtol_thd, counters, RH_max, success, cell_order):
-        self.backend.condensation(
+    def condensation(
+        self,
+        *,
+        rtol_x,
+        rtol_thd,
+        counters,
+        RH_max,
+        mean_iterations,
+        success,
+        cell_order,
+        work_queue,
+        droplet_history,
+        substep_history,
+    ):
+        return self.backend.condensation(
             solver=self.condensation_solver,
             n_cell=self.mesh.n_cell,
             cell_start_arg=self.attributes.cell_start,
@@ -119,13 +189,18 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
             pqv=self.environment.get_predicted("qv"),
             kappa=self.attributes["kappa"],
             f_org=self.attributes["dry volume organic fraction"],
+            dx_ratio_last=droplet_history["dx_ratio"],
+            n_iters_last=droplet_history["n_iters"],
             rtol_x=rtol_x,
             rtol_thd=rtol_thd,
             v_cr=self.attributes["critical volume"],
             timestep=self.dt,
             counters=counters,
             cell_order=cell_order,
+            work_queue=work_queue,
             RH_max=RH_max,
+            mean_iterations=mean_iterations,
+            substep_history=substep_history,
             success=success,
             cell_id=self.attributes["cell id"],
         )
@@ -183,13 +258,85 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
                 coalescence_rate=coalescence_rate,
                 is_first_in_pair=is_first_in_pair,
             )
+        if self.attributes.change_tracker is not None:
+            self.backend.record_pair_changes(
+                droplet_epoch=self.attributes.change_tracker.droplet_epoch,
+                epoch=self.attributes.change_tracker.next_epoch(),
+                gamma=gamma,
+                idx=idx,
+                is_first_in_pair=is_first_in_pair,
+            )
         self.attributes.healthy = bool(
             self.attributes._ParticleAttributes__healthy_memory
         )
         self.attributes.sanitize()
-        self.attributes.mark_updated("n")
+        self.attributes.mark_updated("n", tracked=True)
         for key in self.attributes.get_extensive_attribute_keys():
-            self.attributes.mark_updated(key)
+            self.attributes.mark_updated(key, tracked=True)
+
+    def adaptive_sdm_cell_local(
+        self,
+        *,
+        pipeline,
+        kernel_attributes,
+        gamma,
+        coalescence_rate,
+        collision_rate,
+        collision_rate_deficit,
+        stats_n_substep,
+        stats_dt_min,
+        dt_range,
+        seed,
+        stream,
+        counter,
+    ):
+        """whole-timestep adaptive coalescence with each cell advancing its own
+        substep loop within a single backend kernel (collision kernel given as the
+        `kernel` output of a `PySDM.backends.impl_common.pairwise_expression.PairwisePipeline`
+        over `kernel_attributes`, derived ones being re-evaluated for coalesced
+        droplets, see `PySDM.impl.particle_attributes.ParticleAttributes.per_droplet_chains`)
+        """
+        # pylint: disable=too-many-locals
+        chains = self.attributes.per_droplet_chains(kernel_attributes)
+        cell_start = self.attributes.cell_start
+        tracker = self.attributes.change_tracker
+        self.backend.adaptive_sdm_cell_local(
+            pipeline=pipeline,
+            kernel_attributes={
+                name: self.attributes[name] for name in kernel_attributes
+            },
+            chains=chains,
+            multiplicity=self.attributes["n"],
+            idx=self.attributes._ParticleAttributes__idx,
+            attributes=self.attributes.get_extensive_attribute_storage(),
+            cell_start=cell_start,
+            gamma=gamma,
+            healthy=self.attributes._ParticleAttributes__healthy_memory,
+            coalescence_rate=coalescence_rate,
+            collision_rate=collision_rate,
+            collision_rate_deficit=collision_rate_deficit,
+            stats_n_substep=stats_n_substep,
+            stats_dt_min=stats_dt_min,
+            droplet_epoch=self.null if tracker is None else tracker.droplet_epoch,
+            epoch=0 if tracker is None else tracker.next_epoch(),
+            dt=self.dt,
+            dv=self.Storage.from_ndarray(
+                np.broadcast_to(np.asarray(self.mesh.dv, dtype=float), self.mesh.n_cell)
+            ),
+            dt_range=dt_range,
+            seed=seed,
+            stream=stream,
+            counter=counter,
+        )
+        self.attributes.healthy = bool(
+            self.attributes._ParticleAttributes__healthy_memory
+        )
+        self.attributes.sanitize()
+        self.attributes.mark_updated("n", tracked=True)
+        for key in self.attributes.get_extensive_attribute_keys():
+            self.attributes.mark_updated(key, tracked=True)
+        for chain in chains:
+            chain.mark_evaluated()
 
     def oxidation(
         self,
@@ -346,6 +493,45 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
             skip_division_by_m0=skip_division_by_m0,
         )
 
+    def batched_moments(self, *, moment_0, moments, specs):
+        """
+        Writes to subsequent rows of `moment_0` and `moments` the zero-th and the k-th
+        statistical moments defined by subsequent elements of `specs`
+        (see `PySDM.impl.moments_batch.MomentSpec`), computing all of them
+        within a single sweep over super-droplets.
+        """
+        if len(specs) == 0:
+            raise ValueError("empty specs passed")
+        names = []
+        for spec in specs:
+            for name in (spec.attr, spec.filter_attr, spec.weighting_attribute):
+                if name not in names:
+                    names.append(name)
+
+        self.backend.fused_moments(
+            moment_0=moment_0,
+            moments=moments,
+            multiplicity=self.attributes["n"],
+            attributes=tuple(self.attributes[name] for name in names),
+            cell_id=self.attributes["cell id"],
+            idx=self.attributes._ParticleAttributes__idx,
+            length=self.attributes.super_droplet_count,
+            attr_index=np.array([names.index(s.attr) for s in specs], dtype=np.int64),
+            ranks=np.array([s.rank for s in specs], dtype=float),
+            x_index=np.array(
+                [names.index(s.filter_attr) for s in specs], dtype=np.int64
+            ),
+            min_x=np.array([s.filter_range[0] for s in specs], dtype=float),
+            max_x=np.array([s.filter_range[1] for s in specs], dtype=float),
+            weighting_index=np.array(
+                [names.index(s.weighting_attribute) for s in specs], dtype=np.int64
+            ),
+            weighting_ranks=np.array([s.weighting_rank for s in specs], dtype=float),
+            skip_division_by_m0=np.array(
+                [s.skip_division_by_m0 for s in specs], dtype=bool
+            ),
+        )
+
     def spectrum_moments(
         self,
         *,
@@ -354,21 +540,36 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         attr,
         rank,
         attr_bins,
+        attr_bins_lookup=None,
         attr_name="volume",
         weighting_attribute="volume",
         weighting_rank=0,
     ):
-        attr_data = self.attributes[attr]
+        """
+        Writes to `moment_0` and `moments` the zero-th and the k-th statistical moments
+        of the attribute `attr` in each of the bins of `attr_name` defined by `attr_bins`.
+
+        Parameters:
+            rank: a moment rank or a tuple of ranks (with rows of `moments` holding
+                subsequent bins for the first rank, then for the second rank, etc.)
+            attr_bins_lookup: result of
+                `PySDM.backends.impl_common.bin_lookup.bin_lookup_parameters` for
+                `attr_bins` (evaluated if not given)
+        """
+        ranks = rank if isinstance(rank, tuple) else (rank,)
+        if attr_bins_lookup is None:
+            attr_bins_lookup = bin_lookup_parameters(attr_bins.to_ndarray())
         self.backend.spectrum_moments(
             moment_0=moment_0,
             moments=moments,
             multiplicity=self.attributes["n"],
-            attr_data=attr_data,
+            attr_data=self.attributes[attr],
             cell_id=self.attributes["cell id"],
             idx=self.attributes._ParticleAttributes__idx,
             length=self.attributes.super_droplet_count,
-            rank=rank,
+            ranks=self.backend.Storage.from_ndarray(np.array(ranks, dtype=float)),
             x_bins=attr_bins,
+            x_bins_lookup=attr_bins_lookup,
             x_attr=self.attributes[attr_name],
             weighting_attribute=self.attributes[weighting_attribute],
             weighting_rank=weighting_rank,
@@ -423,3 +624,35 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
                 position_in_cell=position_in_cell,
                 n_substeps=n_substeps,
             )
+
+    def displacement_with_local_substeps(
+        self,
+        *,
+        courant,
+        grid,
+        displacement,
+        n_substeps_field,
+        n_substeps,
+        enable_sedimentation,
+        precipitation_counting_level_index,
+    ):
+        self.backend.displacement_with_local_substeps(
+            courant=courant,
+            grid=grid,
+            cell_origin=self.attributes["cell origin"],
+            position_in_cell=self.attributes["position in cell"],
+            displacement=displacement,
+            idx=self.attributes._ParticleAttributes__idx,
+            length=self.attributes.super_droplet_count,
+            cell_id=self.attributes["cell id"],
+            n_substeps_field=n_substeps_field,
+            n_substeps=n_substeps,
+            enable_sedimentation=enable_sedimentation,
+            terminal_velocity=(
+                self.attributes["terminal velocity"]
+                if enable_sedimentation
+                else self.null
+            ),
+            dt_over_dz=self.dt / self.mesh.dz,
+            precipitation_counting_level_index=precipitation_counting_level_index,
+        )
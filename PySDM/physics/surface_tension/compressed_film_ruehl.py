@@ -73,12 +73,13 @@ class CompressedFilmRuehl:  # pylint: disable=too-few-public-methods
             f_surf, iters = toms748_solve(
                 minfun,
                 args,
-                *bracket,
+                bracket[0],
+                bracket[1],
                 minfun(bracket[0], *args),
                 minfun(bracket[1], *args),
                 rtol,
                 max_iters,
-                within_tolerance
+                within_tolerance,
             )
             assert iters != max_iters
 
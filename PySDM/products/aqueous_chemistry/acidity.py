@@ -34,17 +34,22 @@ class Acidity(MomentProduct):
         builder.request_attribute("conc_H")
         super().register(builder)
 
-    def _impl(self, **kwargs):
-        self._download_moment_to_buffer(
-            attr=self.attr,
-            rank=1,
-            filter_range=(
-                self.formulae.trivia.volume(self.radius_range[0]),
-                self.formulae.trivia.volume(self.radius_range[1]),
-            ),
-            weighting_attribute="volume",
-            weighting_rank=self.weighting_rank,
+    def requested_moments(self):
+        return (
+            {
+                "attr": self.attr,
+                "rank": 1,
+                "filter_range": (
+                    self.formulae.trivia.volume(self.radius_range[0]),
+                    self.formulae.trivia.volume(self.radius_range[1]),
+                ),
+                "weighting_attribute": "volume",
+                "weighting_rank": self.weighting_rank,
+            },
         )
+
+    def _impl(self, **kwargs):
+        self._download_moment_to_buffer(**self.requested_moments()[0])
         if self.attr == "conc_H":
             self.buffer[:] = self.formulae.trivia.H2pH(self.buffer[:])
         elif self.attr == "pH":
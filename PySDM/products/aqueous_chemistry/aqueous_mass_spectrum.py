@@ -49,7 +49,11 @@ class AqueousMassSpectrum(SpectrumMomentProduct):
             self._download_spectrum_moment_to_buffer(rank=0, bin_number=i)
             vals[:, i] *= self.buffer.ravel()
         d_log10_diameter = np.diff(np.log10(2 * self.dry_radius_bins_edges))
-        vals *= self.molar_mass / d_log10_diameter / self.particulator.mesh.dv
+        vals *= (
+            self.molar_mass
+            / d_log10_diameter
+            / np.reshape(self.particulator.mesh.dv, (-1, 1))
+        )
 
         if self.specific:
             self._download_to_buffer(self.particulator.environment["rhod"])
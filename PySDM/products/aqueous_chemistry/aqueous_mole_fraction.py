@@ -16,13 +16,15 @@ class AqueousMoleFraction(MomentProduct):
         super().register(builder)
         self.aqueous_chemistry = self.particulator.dynamics["AqueousChemistry"]
 
-    def _impl(self, **kwargs):
-        attr = "moles_" + self.key
+    def requested_moments(self):
+        return tuple({"attr": "moles_" + self.key, "rank": rank} for rank in (0, 1))
 
-        self._download_moment_to_buffer(attr=attr, rank=0)
+    def _impl(self, **kwargs):
+        conc_params, moles_params = self.requested_moments()
+        self._download_moment_to_buffer(**conc_params)
         conc = self.buffer.copy()
 
-        self._download_moment_to_buffer(attr=attr, rank=1)
+        self._download_moment_to_buffer(**moles_params)
         tmp = self.buffer.copy()
         tmp[:] *= conc
         tmp[:] *= DUMMY_SPECIFIC_GRAVITY * self.formulae.constants.Md
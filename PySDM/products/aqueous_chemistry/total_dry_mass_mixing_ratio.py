@@ -11,11 +11,15 @@ class TotalDryMassMixingRatio(MomentProduct):
         super().__init__(unit=unit, name=name)
         self.density = density
 
+    def requested_moments(self):
+        return tuple({"attr": "dry volume", "rank": rank} for rank in (1, 0))
+
     def _impl(self, **kwargs):
-        self._download_moment_to_buffer(attr="dry volume", rank=1)
+        volume_params, conc_params = self.requested_moments()
+        self._download_moment_to_buffer(**volume_params)
         self.buffer[:] *= self.density
         result = np.copy(self.buffer)
-        self._download_moment_to_buffer(attr="dry volume", rank=0)
+        self._download_moment_to_buffer(**conc_params)
         result[:] *= self.buffer
         self._download_to_buffer(self.particulator.environment["rhod"])
         result[:] /= self.particulator.mesh.dv
@@ -2,6 +2,8 @@
 products pertinent to the `PySDM.dynamics.condensation.Condensation` dynamic
 """
 from .activable_fraction import ActivableFraction
+from .condensation_iterations import CondensationMeanIterations
 from .condensation_timestep import CondensationTimestepMax, CondensationTimestepMin
 from .event_rates import ActivatingRate, DeactivatingRate, RipeningRate
 from .peak_supersaturation import PeakSupersaturation
+from .predicted_substeps import PredictedSubstepsFraction
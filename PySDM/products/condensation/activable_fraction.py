@@ -13,6 +13,9 @@ class ActivableFraction(MomentProduct):
         super().register(builder)
         builder.request_attribute("critical supersaturation")
 
+    def requested_moments(self):
+        return ({"attr": "volume", "rank": 0},)
+
     def _impl(self, **kwargs):
         s_max = kwargs["S_max"]
         self._download_moment_to_buffer(
@@ -22,6 +25,6 @@ class ActivableFraction(MomentProduct):
             filter_attr="critical supersaturation",
         )
         frac = self.buffer.copy()
-        self._download_moment_to_buffer(attr="volume", rank=0)
+        self._download_moment_to_buffer(**self.requested_moments()[0])
         frac /= self.buffer
         return frac
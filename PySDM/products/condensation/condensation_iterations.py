@@ -0,0 +1,33 @@
+"""
+mean number of root-finding iterations (evaluations of the implicit-scheme residual)
+per super-droplet per substep taken by the condensation solver, averaged over
+timesteps since last fetch (fetching a value resets the average)
+"""
+import numpy as np
+
+from PySDM.products.impl.product import Product
+
+
+class CondensationMeanIterations(Product):
+    def __init__(self, unit="dimensionless", name=None):
+        super().__init__(unit=unit, name=name)
+        self.condensation = None
+        self.sum = None
+        self.count = 0
+
+    def register(self, builder):
+        super().register(builder)
+        self.particulator.observers.append(self)
+        self.condensation = self.particulator.dynamics["Condensation"]
+        self.sum = np.zeros_like(self.buffer)
+
+    def _impl(self, **kwargs):
+        self.buffer[:] = self.sum[:] / self.count if self.count > 0 else np.nan
+        self.sum[:] = 0
+        self.count = 0
+        return self.buffer
+
+    def notify(self):
+        self._download_to_buffer(self.condensation.mean_iterations)
+        self.sum[:] += self.buffer[:]
+        self.count += 1
@@ -0,0 +1,34 @@
+"""
+fraction of timesteps in which the number of condensation substeps was predicted
+(see `predict_substeps` in `PySDM.dynamics.condensation.Condensation`) and hence
+the trial integrations were skipped, computed over timesteps since last fetch
+(fetching a value resets the count)
+"""
+import numpy as np
+
+from PySDM.products.impl.product import Product
+
+
+class PredictedSubstepsFraction(Product):
+    def __init__(self, unit="dimensionless", name=None):
+        super().__init__(unit=unit, name=name)
+        self.condensation = None
+        self.n_predicted = None
+        self.count = 0
+
+    def register(self, builder):
+        super().register(builder)
+        self.particulator.observers.append(self)
+        self.condensation = self.particulator.dynamics["Condensation"]
+        self.n_predicted = np.zeros_like(self.buffer)
+
+    def _impl(self, **kwargs):
+        self.buffer[:] = self.n_predicted[:] / self.count if self.count > 0 else np.nan
+        self.n_predicted[:] = 0
+        self.count = 0
+        return self.buffer
+
+    def notify(self):
+        self._download_to_buffer(self.condensation.substep_history["n_predicted"])
+        self.n_predicted[:] += self.buffer[:] > 0
+        self.count += 1
@@ -26,16 +26,21 @@ class AveragedTerminalVelocity(MomentProduct):
         builder.request_attribute(self.attr)
         super().register(builder)
 
-    def _impl(self, **kwargs):
-        self._download_moment_to_buffer(
-            attr=self.attr,
-            rank=1,
-            filter_range=(
-                self.formulae.trivia.volume(self.radius_range[0]),
-                self.formulae.trivia.volume(self.radius_range[1]),
-            ),
-            weighting_attribute="volume",
-            weighting_rank=self.weighting_rank,
+    def requested_moments(self):
+        return (
+            {
+                "attr": self.attr,
+                "rank": 1,
+                "filter_range": (
+                    self.formulae.trivia.volume(self.radius_range[0]),
+                    self.formulae.trivia.volume(self.radius_range[1]),
+                ),
+                "weighting_attribute": "volume",
+                "weighting_rank": self.weighting_rank,
+            },
         )
 
+    def _impl(self, **kwargs):
+        self._download_moment_to_buffer(**self.requested_moments()[0])
+
         return self.buffer
@@ -0,0 +1,32 @@
+"""
+number of substeps taken in each cell by the `PySDM.dynamics.displacement.Displacement`
+ dynamic with `local_substeps` enabled: the value chosen for the cell based on Courant
+ numbers or (with sedimentation) the largest number of substeps taken by any
+ of the super-droplets residing in the cell, if larger
+"""
+import numpy as np
+
+from PySDM.products.impl.product import Product
+
+
+class DisplacementSubsteps(Product):
+    def __init__(self, unit="dimensionless", name=None):
+        super().__init__(unit=unit, name=name)
+        self.displacement = None
+
+    def register(self, builder):
+        super().register(builder)
+        self.displacement = self.particulator.dynamics["Displacement"]
+        assert self.displacement.local_substeps
+
+    def _impl(self, **kwargs):
+        self._download_to_buffer(self.displacement.n_substeps_field)
+        if self.displacement.enable_sedimentation:
+            idx = self.particulator.attributes._ParticleAttributes__idx.to_ndarray()
+            idx = idx[: self.particulator.attributes.super_droplet_count]
+            np.maximum.at(
+                self.buffer.ravel(),
+                self.particulator.attributes["cell id"].to_ndarray(raw=True)[idx],
+                self.displacement.n_substeps.to_ndarray()[idx],
+            )
+        return self.buffer
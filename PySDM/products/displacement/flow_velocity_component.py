@@ -4,13 +4,14 @@ absolute values of Courant number on all edges of a cell)
 """
 import numpy as np
 
+from PySDM.impl import arakawa_c
 from PySDM.products.impl.product import Product
 
 
 class FlowVelocityComponent(Product):
     def __init__(self, component: int, name=None, unit="m/s"):
         super().__init__(unit=unit, name=name)
-        assert component in (0, 1)
+        assert component in (0, 1, 2)
         self.component = component
         self.displacement = None
         self.grid_step = np.nan
@@ -21,19 +22,13 @@ class FlowVelocityComponent(Product):
         self.displacement = self.particulator.dynamics["Displacement"]
         self.time_step = self.particulator.dt
         mesh = self.particulator.mesh
+        assert self.component < mesh.dimension
         self.grid_step = mesh.size[self.component] / mesh.grid[self.component]
 
     def _impl(self, **kwargs):
-        courant_component = self.displacement.courant[self.component].to_ndarray()
-        if self.component == 0:
-            self.buffer[:] = 0.5 * (
-                courant_component[:-1, :] + courant_component[1:, :]
-            )
-        elif self.component == 1:
-            self.buffer[:] = 0.5 * (
-                courant_component[:, :-1] + courant_component[:, 1:]
-            )
-        else:
-            raise NotImplementedError()
+        left, right = arakawa_c.face_pairs(
+            self.displacement.courant[self.component].to_ndarray(), self.component
+        )
+        self.buffer[:] = 0.5 * (left + right)
         self.buffer[:] *= self.grid_step / self.time_step
         return self.buffer
@@ -4,6 +4,7 @@ absolute values of Courant number on all edges of a cell)
 """
 import numpy as np
 
+from PySDM.impl import arakawa_c
 from PySDM.products.impl.product import Product
 
 
@@ -19,14 +20,8 @@ class MaxCourantNumber(Product):
     def _impl(self, **kwargs):
         self.buffer[:] = 0
 
-        field = tuple(
-            abs(component.to_ndarray()) for component in self.displacement.courant
-        )
-        self.buffer[:] = np.maximum(
-            self.buffer, np.maximum(field[0][:-1, :], field[0][1:, :])
-        )
-        self.buffer[:] = np.maximum(
-            self.buffer, np.maximum(field[1][:, :-1], field[1][:, 1:])
-        )
+        for dim, component in enumerate(self.displacement.courant):
+            left, right = arakawa_c.face_pairs(abs(component.to_ndarray()), dim)
+            self.buffer[:] = np.maximum(self.buffer, np.maximum(left, right))
 
         return self.buffer
@@ -12,6 +12,9 @@ class CoolingRate(MomentProduct):
         builder.request_attribute("cooling rate")
         super().register(builder)
 
+    def requested_moments(self):
+        return ({"attr": "cooling rate", "rank": 1},)
+
     def _impl(self, **kwargs):
-        self._download_moment_to_buffer(attr="cooling rate", rank=1)
+        self._download_moment_to_buffer(**self.requested_moments()[0])
         return self.buffer
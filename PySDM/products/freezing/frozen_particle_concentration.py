@@ -28,13 +28,18 @@ class FrozenParticleConcentration(ConcentrationProduct):
         super().register(builder)
         builder.request_attribute("wet to critical volume ratio")
 
-    def _impl(self, **kwargs):
-        self._download_moment_to_buffer(
-            attr="volume",
-            rank=0,
-            filter_attr="wet to critical volume ratio",
-            filter_range=self.__filter_range,
+    def requested_moments(self):
+        return (
+            {
+                "attr": "volume",
+                "rank": 0,
+                "filter_attr": "wet to critical volume ratio",
+                "filter_range": self.__filter_range,
+            },
         )
+
+    def _impl(self, **kwargs):
+        self._download_moment_to_buffer(**self.requested_moments()[0])
         return super()._impl(**kwargs)
 
 
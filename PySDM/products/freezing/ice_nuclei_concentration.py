@@ -23,13 +23,18 @@ class IceNucleiConcentration(ConcentrationProduct):
             False: "immersed surface area",
         }[singular]
 
-    def _impl(self, **kwargs):
-        self._download_moment_to_buffer(
-            attr="volume",
-            rank=0,
-            filter_attr=self.__filter_attr,
-            filter_range=self.__nonzero_filter_range,
+    def requested_moments(self):
+        return (
+            {
+                "attr": "volume",
+                "rank": 0,
+                "filter_attr": self.__filter_attr,
+                "filter_range": self.__nonzero_filter_range,
+            },
         )
+
+    def _impl(self, **kwargs):
+        self._download_moment_to_buffer(**self.requested_moments()[0])
         return super()._impl(**kwargs)
 
 
@@ -11,15 +11,18 @@ class IceWaterContent(MomentProduct):
         super().__init__(unit=unit, name=name)
         self.specific = specific
 
-    def _impl(self, **kwargs):
-        self._download_moment_to_buffer(
-            attr="volume", rank=1, filter_range=(-np.inf, 0)
+    def requested_moments(self):
+        return tuple(
+            {"attr": "volume", "rank": rank, "filter_range": (-np.inf, 0)}
+            for rank in (1, 0)
         )
+
+    def _impl(self, **kwargs):
+        volume_params, conc_params = self.requested_moments()
+        self._download_moment_to_buffer(**volume_params)
         result = self.buffer.copy()
 
-        self._download_moment_to_buffer(
-            attr="volume", rank=0, filter_range=(-np.inf, 0)
-        )
+        self._download_moment_to_buffer(**conc_params)
         conc = self.buffer
 
         result[:] *= -self.formulae.constants.rho_i * conc / self.particulator.mesh.dv
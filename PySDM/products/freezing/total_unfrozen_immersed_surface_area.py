@@ -10,15 +10,22 @@ class TotalUnfrozenImmersedSurfaceArea(MomentProduct):
     def __init__(self, unit="m^2", name=None):
         super().__init__(unit=unit, name=name)
 
+    def requested_moments(self):
+        return tuple(
+            {
+                "attr": "immersed surface area",
+                "rank": rank,
+                "filter_attr": "volume",
+                "filter_range": (0, np.inf),
+            }
+            for rank in (1, 0)
+        )
+
     def _impl(self, **kwargs):
-        params = {
-            "attr": "immersed surface area",
-            "filter_attr": "volume",
-            "filter_range": (0, np.inf),
-        }
-        self._download_moment_to_buffer(**params, rank=1)
+        area_params, conc_params = self.requested_moments()
+        self._download_moment_to_buffer(**area_params)
         result = np.copy(self.buffer)
-        self._download_moment_to_buffer(**params, rank=0)
+        self._download_moment_to_buffer(**conc_params)
         result[:] *= self.buffer
         # TODO #599 per volume / per gridbox ?
         return result
@@ -2,6 +2,7 @@
 Housekeeping products: time, parcel displacement, super-particle counts, wall-time timers...
 """
 from .dynamic_wall_time import DynamicWallTime
+from .kernel_wall_time import KernelWallTime
 from .parcel_displacement import ParcelDisplacement
 from .super_droplet_count_per_gridbox import SuperDropletCountPerGridbox
 from .time import Time
@@ -0,0 +1,25 @@
+"""
+wall-time spent in a given backend method (fetching a value resets the counter),
+ registering the product enables `PySDM.impl.profiler.Profiler`
+"""
+from PySDM.impl.profiler import Profiler
+from PySDM.products.impl.product import Product
+
+
+class KernelWallTime(Product):
+    def __init__(self, kernel, name=None, unit="s"):
+        super().__init__(name=name, unit=unit)
+        self.kernel = kernel
+        self.total = 0
+
+    def register(self, builder):
+        super().register(builder)
+        if self.particulator.profiler is None:
+            builder.set_profiler(Profiler())
+        self.shape = ()
+
+    def _impl(self, **kwargs):
+        stats = self.particulator.profiler.stats.get(self.kernel, {"time": 0})
+        result = stats["time"] - self.total
+        self.total = stats["time"]
+        return result
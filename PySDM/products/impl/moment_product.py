@@ -7,19 +7,12 @@ from PySDM.products.impl.product import Product
 
 
 class MomentProduct(Product, ABC):
-    def __init__(self, name, unit):
-        super().__init__(name=name, unit=unit)
-        self.moment_0 = None
-        self.moments = None
-
-    def register(self, builder):
-        super().register(builder)
-        self.moment_0 = self.particulator.Storage.empty(
-            self.particulator.mesh.n_cell, dtype=float
-        )
-        self.moments = self.particulator.Storage.empty(
-            (1, self.particulator.mesh.n_cell), dtype=float
-        )
+    def requested_moments(self) -> tuple:
+        """returns keyword arguments of `_download_moment_to_buffer()` calls made
+        by `_impl()` which are known upfront (i.e., after registration), the moments
+        are registered with `PySDM.impl.moments_batch.MomentsBatch` at build time
+        so that all of them are computed in a single pass from the first output on"""
+        return ()
 
     def _download_moment_to_buffer(
         self,
@@ -32,17 +25,15 @@ class MomentProduct(Product, ABC):
         weighting_rank=0,
         skip_division_by_m0=False,
     ):
-        self.particulator.moments(
-            moment_0=self.moment_0,
-            moments=self.moments,
-            specs={attr: (rank,)},
-            attr_name=filter_attr,
-            attr_range=filter_range,
+        spec = self.particulator.moments_batch.make_spec(
+            attr=attr,
+            rank=rank,
+            filter_attr=filter_attr,
+            filter_range=filter_range,
             weighting_attribute=weighting_attribute,
             weighting_rank=weighting_rank,
             skip_division_by_m0=skip_division_by_m0,
         )
-        if rank == 0:  # TODO #217
-            self._download_to_buffer(self.moment_0)
-        else:
-            self._download_to_buffer(self.moments[0, :])
+        self.buffer[...] = self.particulator.moments_batch.get(spec).reshape(
+            self.buffer.shape
+        )
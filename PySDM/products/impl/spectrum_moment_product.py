@@ -4,6 +4,7 @@ common code for products computing **binned** statistical moments
 """
 from abc import ABC
 
+from PySDM.backends.impl_common.bin_lookup import bin_lookup_parameters
 from PySDM.products.impl.product import Product
 
 
@@ -11,17 +12,22 @@ class SpectrumMomentProduct(ABC, Product):
     def __init__(self, name, unit, attr_unit):
         super().__init__(name=name, unit=unit)
         self.attr_bins_edges = None
+        self.attr_bins_lookup = None
         self.attr_unit = attr_unit
         self.moment_0 = None
         self.moments = None
+        self.ranks = ()
 
     def register(self, builder):
         super().register(builder)
+        self.attr_bins_lookup = bin_lookup_parameters(self.attr_bins_edges.to_ndarray())
         self.moment_0 = self.particulator.Storage.empty(
-            (len(self.attr_bins_edges) - 1, self.particulator.mesh.n_cell), dtype=float
+            (len(self.attr_bins_edges) - 1, self.particulator.mesh.n_cell),
+            dtype=self.particulator.Storage.ACCUMULATOR,
         )
         self.moments = self.particulator.Storage.empty(
-            (len(self.attr_bins_edges) - 1, self.particulator.mesh.n_cell), dtype=float
+            (len(self.attr_bins_edges) - 1, self.particulator.mesh.n_cell),
+            dtype=self.particulator.Storage.ACCUMULATOR,
         )
         _ = self._parse_unit(self.attr_unit)
 
@@ -34,12 +40,21 @@ class SpectrumMomentProduct(ABC, Product):
         weighting_attribute="volume",
         weighting_rank=0,
     ):
+        """computes spectral moments of `attr` of a given rank
+        (or of several ranks at once if `rank` is a tuple)"""
+        self.ranks = rank if isinstance(rank, tuple) else (rank,)
+        shape = (len(self.ranks) * self.moment_0.shape[0], self.moment_0.shape[1])
+        if self.moments.shape != shape:
+            self.moments = self.particulator.Storage.empty(
+                shape, dtype=self.particulator.Storage.ACCUMULATOR
+            )
         self.particulator.spectrum_moments(
             moment_0=self.moment_0,
             moments=self.moments,
             attr=attr,
-            rank=rank,
+            rank=self.ranks,
             attr_bins=self.attr_bins_edges,
+            attr_bins_lookup=self.attr_bins_lookup,
             attr_name=filter_attr,
             weighting_attribute=weighting_attribute,
             weighting_rank=weighting_rank,
@@ -49,4 +64,5 @@ class SpectrumMomentProduct(ABC, Product):
         if rank == 0:  # TODO #217
             self._download_to_buffer(self.moment_0[bin_number, :])
         else:
-            self._download_to_buffer(self.moments[bin_number, :])
+            row = self.ranks.index(rank) * self.moment_0.shape[0] + bin_number
+            self._download_to_buffer(self.moments[row, :])
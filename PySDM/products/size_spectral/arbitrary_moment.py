@@ -16,10 +16,13 @@ def make_arbitrary_moment_product(**kwargs):
             self.attr = kwargs["attr"]
             self.rank = kwargs["rank"]
 
-        def _impl(self, **kwargs):
-            self._download_moment_to_buffer(
-                attr=self.attr, rank=self.rank, skip_division_by_m0=True
+        def requested_moments(self):
+            return (
+                {"attr": self.attr, "rank": self.rank, "skip_division_by_m0": True},
             )
+
+        def _impl(self, **kwargs):
+            self._download_moment_to_buffer(**self.requested_moments()[0])
             return self.buffer
 
     return ArbitraryMoment
@@ -33,18 +33,17 @@ class EffectiveRadius(MomentProduct):
             np.nan,
         )
 
+    def requested_moments(self):
+        return tuple(
+            {"attr": "volume", "rank": rank, "filter_range": self.volume_range}
+            for rank in (2 / 3, 1)
+        )
+
     def _impl(self, **kwargs):
         tmp = np.empty_like(self.buffer)
-        self._download_moment_to_buffer(
-            attr="volume",
-            rank=2 / 3,
-            filter_range=self.volume_range,
-        )
+        area_params, volume_params = self.requested_moments()
+        self._download_moment_to_buffer(**area_params)
         tmp[:] = self.buffer[:]
-        self._download_moment_to_buffer(
-            attr="volume",
-            rank=1,
-            filter_range=self.volume_range,
-        )
+        self._download_moment_to_buffer(**volume_params)
         EffectiveRadius.__get_impl(self.buffer, tmp)
         return self.buffer
@@ -8,7 +8,10 @@ class MeanRadius(MomentProduct):
     def __init__(self, name=None, unit="m"):
         super().__init__(name=name, unit=unit)
 
+    def requested_moments(self):
+        return ({"attr": "volume", "rank": 1 / 3},)
+
     def _impl(self, **kwargs):
-        self._download_moment_to_buffer(attr="volume", rank=1 / 3)
+        self._download_moment_to_buffer(**self.requested_moments()[0])
         self.buffer[:] /= self.formulae.constants.PI_4_3 ** (1 / 3)
         return self.buffer
@@ -20,15 +20,20 @@ class ParticleConcentration(ConcentrationProduct):
         self.radius_range = radius_range
         super().__init__(name=name, unit=unit, specific=specific, stp=stp)
 
-    def _impl(self, **kwargs):
-        self._download_moment_to_buffer(
-            attr="volume",
-            rank=0,
-            filter_range=(
-                self.formulae.trivia.volume(self.radius_range[0]),
-                self.formulae.trivia.volume(self.radius_range[1]),
-            ),
+    def requested_moments(self):
+        return (
+            {
+                "attr": "volume",
+                "rank": 0,
+                "filter_range": (
+                    self.formulae.trivia.volume(self.radius_range[0]),
+                    self.formulae.trivia.volume(self.radius_range[1]),
+                ),
+            },
         )
+
+    def _impl(self, **kwargs):
+        self._download_moment_to_buffer(**self.requested_moments()[0])
         return super()._impl(**kwargs)
 
 
@@ -42,7 +42,7 @@ class ParticleSizeSpectrum(SpectrumMomentProduct, ABC):
             vals[:, i] = self.buffer.ravel()
 
         if self.normalise_by_dv:
-            vals[:] /= self.particulator.mesh.dv
+            vals[:] /= np.reshape(self.particulator.mesh.dv, (-1, 1))
 
         self._download_to_buffer(self.particulator.environment["rhod"])
         rhod = self.buffer.ravel()
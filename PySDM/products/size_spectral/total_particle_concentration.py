@@ -8,6 +8,9 @@ class TotalParticleConcentration(ConcentrationProduct):
     def __init__(self, name=None, unit="m^-3", stp=False):
         super().__init__(name=name, unit=unit, specific=False, stp=stp)
 
+    def requested_moments(self):
+        return ({"attr": "volume", "rank": 0},)
+
     def _impl(self, **kwargs):
-        self._download_moment_to_buffer(attr="volume", rank=0)
+        self._download_moment_to_buffer(**self.requested_moments()[0])
         return super()._impl(**kwargs)
@@ -8,6 +8,9 @@ class TotalParticleSpecificConcentration(ConcentrationProduct):
     def __init__(self, name=None, unit="kg^-1"):
         super().__init__(name=name, unit=unit, stp=False, specific=True)
 
+    def requested_moments(self):
+        return ({"attr": "volume", "rank": 0},)
+
     def _impl(self, **kwargs):
-        self._download_moment_to_buffer(attr="volume", rank=0)
+        self._download_moment_to_buffer(**self.requested_moments()[0])
         return super()._impl(**kwargs)
@@ -18,15 +18,23 @@ class WaterMixingRatio(MomentProduct):
         self.volume_range = self.formulae.trivia.volume(np.asarray(self.radius_range))
         self.radius_range = None
 
-    def _impl(self, **kwargs):  # TODO #217
-        self._download_moment_to_buffer(
-            attr="volume", rank=0, filter_range=self.volume_range, filter_attr="volume"
+    def requested_moments(self):
+        return tuple(
+            {
+                "attr": "volume",
+                "rank": rank,
+                "filter_range": self.volume_range,
+                "filter_attr": "volume",
+            }
+            for rank in (0, 1)
         )
+
+    def _impl(self, **kwargs):  # TODO #217
+        conc_params, volume_params = self.requested_moments()
+        self._download_moment_to_buffer(**conc_params)
         conc = self.buffer.copy()
 
-        self._download_moment_to_buffer(
-            attr="volume", rank=1, filter_range=self.volume_range, filter_attr="volume"
-        )
+        self._download_moment_to_buffer(**volume_params)
         result = self.buffer.copy()
         result[:] *= self.formulae.constants.rho_w
         result[:] *= conc
@@ -0,0 +1,99 @@
+import time
+
+import numpy as np
+from matplotlib import pyplot as plt
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import Coalescence, Displacement
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Kinematic2D
+from PySDM.impl.mesh import Mesh
+from PySDM.physics import si
+
+GRID = (32, 32)
+SIZE = (1.6 * si.km, 1.6 * si.km)
+N_STEPS = 10
+
+
+def courant_field():
+    stream_function = np.zeros((GRID[0] + 1, GRID[1] + 1))
+    stream_function[:, 1:-1] = np.random.default_rng(44).uniform(
+        -0.05, 0.05, (GRID[0] + 1, GRID[1] - 1)
+    )
+    stream_function[-1] = stream_function[0]
+    return -np.diff(stream_function, axis=1), np.diff(stream_function, axis=0)
+
+
+def make_particulator(n_sd, defragmentation_interval):
+    rng = np.random.default_rng(55)
+    positions = rng.uniform(0, 1, (2, n_sd)) * np.reshape(GRID, (2, 1))
+    cell_id, cell_origin, position_in_cell = Mesh(GRID, SIZE).cellular_attributes(
+        positions
+    )
+    builder = Builder(n_sd=n_sd, backend=CPU())
+    builder.set_environment(
+        Kinematic2D(dt=1 * si.s, grid=GRID, size=SIZE, rhod_of=lambda zZ: 1 + 0 * zZ)
+    )
+    displacement = Displacement(adaptive=False)
+    builder.add_dynamic(displacement)
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)))
+    builder.particulator.defragmentation_interval = defragmentation_interval
+    particulator = builder.build(
+        attributes={
+            "n": rng.integers(1, 1000, n_sd).astype(float),
+            "volume": rng.uniform(1, 10, n_sd) * si.um**3,
+            "cell id": cell_id,
+            "cell origin": cell_origin,
+            "position in cell": position_in_cell,
+        }
+    )
+    displacement.upload_courant_field(courant_field())
+    return particulator
+
+
+def main():
+    n_sd = (2**20, 2**22, 2**23)
+    moments_specs = {"volume": (0, 1, 2, 3)}
+
+    times = {}
+    for interval in (0, 5):
+        key = f"defragmentation_interval={interval}"
+        times[key] = {"step": [], "moments": []}
+        for sd in n_sd:
+            particulator = make_particulator(sd, interval)
+            if interval:
+                particulator.defragment()
+            particulator.run(1)
+            start = time.perf_counter()
+            particulator.run(N_STEPS)
+            times[key]["step"].append((time.perf_counter() - start) / N_STEPS)
+            start = time.perf_counter()
+            moment_0 = particulator.Storage.empty(particulator.mesh.n_cell, dtype=float)
+            moments = particulator.Storage.empty(
+                (len(moments_specs["volume"]), particulator.mesh.n_cell), dtype=float
+            )
+            for _ in range(N_STEPS):
+                particulator.moments(
+                    moment_0=moment_0, moments=moments, specs=moments_specs
+                )
+            times[key]["moments"].append((time.perf_counter() - start) / N_STEPS)
+            print(
+                f"{key} {sd=}: {times[key]['step'][-1]:.3f} s/step,"
+                f" {times[key]['moments'][-1]:.4f} s/moments"
+            )
+
+    _, axs = plt.subplots(1, 2, figsize=(10, 4))
+    for key, value in times.items():
+        for ax, what in zip(axs, ("step", "moments")):
+            ax.plot(n_sd, value[what], marker="o", label=key)
+            ax.set_ylabel(f"wall time per {what} [s]")
+    for ax in axs:
+        ax.set_xlabel("number of super-droplets")
+        ax.loglog()
+        ax.legend()
+    plt.savefig("defragmentation_benchmark.pdf", format="pdf")
+
+
+if __name__ == "__main__":
+    main()
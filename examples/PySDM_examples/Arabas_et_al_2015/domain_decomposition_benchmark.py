@@ -0,0 +1,111 @@
+import time
+
+import numpy as np
+from matplotlib import pyplot as plt
+from PySDM_examples.Arabas_et_al_2015 import Settings
+from PySDM_examples.Szumowski_et_al_1998.fields import (
+    nondivergent_vector_field_2d,
+    x_vec_coord,
+    z_vec_coord,
+)
+
+from PySDM import Builder, DomainDecomposition, Formulae
+from PySDM.backends import CPU
+from PySDM.dynamics import Coalescence, Displacement
+from PySDM.environments import Kinematic2D
+from PySDM.impl.mesh import Mesh
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+from PySDM.products import SuperDropletCountPerGridbox, WallTime
+
+N_STEPS = 100
+
+
+def courant_field(settings):
+    advector = nondivergent_vector_field_2d(
+        settings.grid, settings.size, settings.dt, settings.stream_function, t=0
+    )
+    g_factor_vec = (
+        settings.rhod_of_zZ(zZ=x_vec_coord(settings.grid)[-1]),
+        settings.rhod_of_zZ(zZ=z_vec_coord(settings.grid)[-1]),
+    )
+    return tuple(component / g for component, g in zip(advector, g_factor_vec))
+
+
+def global_attributes(settings):
+    rng = np.random.default_rng(settings.formulae.seed)
+    positions = rng.uniform(0, 1, (2, settings.n_sd)) * np.reshape(
+        settings.grid, (2, 1)
+    )
+    cell_id, cell_origin, position_in_cell = Mesh(
+        settings.grid, settings.size
+    ).cellular_attributes(positions)
+    r_dry, n_per_kg = ConstantMultiplicity(
+        settings.spectrum_per_mass_of_dry_air
+    ).sample(n_sd=settings.n_sd)
+    rhod = settings.rhod_of_zZ(zZ=(cell_origin[1] + 0.5) / settings.grid[1])
+    return {
+        "n": n_per_kg * rhod * np.prod(np.array(settings.size)),
+        "volume": settings.formulae.trivia.volume(radius=r_dry),
+        "cell id": cell_id,
+        "cell origin": cell_origin,
+        "position in cell": position_in_cell,
+    }
+
+
+def slab_simulation(n_sd_per_gridbox, slab):
+    settings = Settings(Formulae(seed=44))
+    settings.n_sd_per_gridbox = n_sd_per_gridbox
+    builder = Builder(
+        n_sd=2 * settings.n_sd // slab.n_slab, backend=CPU(settings.formulae)
+    )
+    builder.set_environment(
+        Kinematic2D(
+            dt=settings.dt,
+            grid=slab.grid,
+            size=slab.size,
+            rhod_of=settings.rhod_of_zZ,
+        )
+    )
+    displacement = Displacement(enable_sedimentation=True, adaptive=False)
+    builder.add_dynamic(displacement)
+    builder.add_dynamic(Coalescence(collision_kernel=settings.kernel, adaptive=False))
+    particulator = builder.build(
+        attributes=slab.select_attributes(
+            global_attributes(settings), n_sd=builder.particulator.n_sd
+        ),
+        products=(SuperDropletCountPerGridbox(), WallTime(name="wall time")),
+    )
+    displacement.upload_courant_field(slab.vector_field(courant_field(settings)))
+    return particulator
+
+
+def main():
+    grid = Settings(Formulae()).grid
+    size = Settings(Formulae()).size
+    n_slabs = (1, 2, 4, 8, 16)
+    times = []
+    for n_slab in n_slabs:
+        start = time.perf_counter()
+        DomainDecomposition(
+            simulation_factory=slab_simulation,
+            settings=32,
+            n_slab=n_slab,
+            grid=grid,
+            size=size,
+            output_steps=(N_STEPS,),
+            reductions={"wall time": np.max},
+        ).run()
+        times.append(time.perf_counter() - start)
+        print(f"{n_slab=}: {times[-1]:.2f} s")
+
+    plt.plot(n_slabs, times[0] / np.asarray(times), marker="o", label="measured")
+    plt.plot(n_slabs, n_slabs, linestyle="--", label="ideal")
+    plt.xlabel("number of processes")
+    plt.ylabel("speedup")
+    plt.legend()
+    plt.loglog()
+    plt.savefig("domain_decomposition_benchmark.pdf", format="pdf")
+
+
+if __name__ == "__main__":
+    main()
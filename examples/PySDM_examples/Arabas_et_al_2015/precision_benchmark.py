@@ -0,0 +1,86 @@
+from functools import partial
+
+import numpy as np
+from matplotlib import pyplot as plt
+from PySDM_examples.Arabas_et_al_2015 import Settings
+from PySDM_examples.Szumowski_et_al_1998 import Simulation, Storage
+
+from PySDM import Formulae
+from PySDM.backends import CPU
+from PySDM.products import WallTime
+
+
+def main():
+    settings = Settings(Formulae())
+
+    settings.grid = (25, 25)
+    settings.simulation_time = settings.dt * 100
+    settings.output_interval = settings.dt * 10
+    settings.processes = {
+        "particle advection": True,
+        "fluid advection": True,
+        "coalescence": True,
+        "condensation": False,
+        "sedimentation": True,
+        "freezing": False,
+        "breakup": False,
+    }
+
+    n_sd = (16, 32, 64, 128)
+
+    n_steps = settings.simulation_time / settings.dt
+    times = {}
+    throughput = {}
+    memory = {}
+    for double_precision in (True, False):
+        key = f"{double_precision=}"
+        times[key] = []
+        throughput[key] = []
+        memory[key] = []
+        for i, sd in enumerate((n_sd[0], *n_sd)):
+            settings.n_sd_per_gridbox = sd
+            storage = Storage()
+            simulation = Simulation(
+                settings,
+                storage,
+                None,
+                partial(CPU, double_precision=double_precision),
+            )
+            simulation.reinit(products=[WallTime()])
+            simulation.run()
+            if i == 0:  # warm-up run (JIT compilation)
+                continue
+            # skipping the first record which covers the initialisation
+            times[key].append(np.sum(storage.load("wall time")[1:]))
+            throughput[key].append(
+                simulation.particulator.n_sd * n_steps / times[key][-1]
+            )
+            memory[key].append(
+                sum(
+                    attribute.nbytes
+                    for attribute in simulation.particulator.attributes.get_state()[
+                        "attributes"
+                    ].values()
+                )
+            )
+            print(
+                f"{key} {sd=}: {times[key][-1]:.2f} s,"
+                f" {throughput[key][-1]:.3g} super-droplet steps/s,"
+                f" {memory[key][-1]} B"
+            )
+
+    _, axs = plt.subplots(1, 2, figsize=(10, 4))
+    for key in times:
+        axs[0].plot(n_sd, throughput[key], marker="o", label=key)
+        axs[1].plot(n_sd, memory[key], marker="o", label=key)
+    axs[0].set_ylabel("throughput [super-droplet steps / s]")
+    axs[1].set_ylabel("attribute storage [B]")
+    for ax in axs:
+        ax.set_xlabel("super-droplets per gridbox")
+        ax.loglog()
+        ax.legend()
+    plt.savefig("precision_benchmark.pdf", format="pdf")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.environments import Box
+from PySDM.physics import si
+
+N_SD = 64
+DERIVED = ("terminal velocity", "area", "kappa", "dry radius")
+
+
+def make_particulator(backend, fusion, requested=DERIVED):
+    builder = Builder(N_SD, backend)
+    builder.set_environment(Box(dt=1 * si.s, dv=1 * si.m**3))
+    builder.particulator.attribute_chain_fusion = fusion
+    for attribute in requested:
+        builder.request_attribute(attribute)
+    volume = np.logspace(-18, -9, N_SD)
+    return builder.build(
+        attributes={
+            "n": np.ones(N_SD),
+            "volume": volume,
+            "dry volume": volume / 10,
+            "kappa times dry volume": np.linspace(0.1, 1.2, N_SD) * volume / 10,
+        },
+        products=(),
+    )
+
+
+class TestFusedChain:
+    @staticmethod
+    @pytest.mark.parametrize("fusion", ("persistent", "transient"))
+    def test_fused_evaluation_matches_attribute_by_attribute_one(backend_class, fusion):
+        # arrange
+        reference = make_particulator(backend_class(), fusion=None)
+        sut = make_particulator(backend_class(), fusion=fusion)
+
+        for _ in range(2):
+            # act
+            for particulator in (reference, sut):
+                volume = particulator.attributes["volume"]
+                volume.data[:] = volume.to_ndarray(raw=True) * 2
+                particulator.attributes.mark_updated("volume")
+
+            # assert
+            for key in DERIVED + ("radius",):
+                np.testing.assert_allclose(
+                    sut.attributes[key].to_ndarray(raw=True),
+                    reference.attributes[key].to_ndarray(raw=True),
+                    rtol=1e-6,
+                )
+
+    @staticmethod
+    def test_transient_intermediates_allocated_on_demand(backend_class):
+        # arrange
+        sut = make_particulator(
+            backend_class(), fusion="transient", requested=("terminal velocity",)
+        )
+        attributes = sut.attributes._ParticleAttributes__attributes
+
+        # act
+        terminal_velocity = sut.attributes["terminal velocity"].to_ndarray()
+
+        # assert
+        assert attributes["radius"].data is None
+        assert attributes["terminal velocity"].fused_chain.members == [
+            attributes["radius"],
+            attributes["terminal velocity"],
+        ]
+        assert (np.diff(terminal_velocity) > 0).all()
+        np.testing.assert_allclose(
+            sut.attributes["radius"].to_ndarray(),
+            (np.logspace(-18, -9, N_SD) * 3 / 4 / np.pi) ** (1 / 3),
+            rtol=1e-6,
+        )
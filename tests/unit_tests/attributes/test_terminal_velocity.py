@@ -2,7 +2,7 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
-from PySDM.dynamics.terminal_velocity import Interpolation, RogersYau
+from PySDM.dynamics.terminal_velocity import Interpolation, RogersYau, RogersYauTable
 from PySDM.physics import constants as const
 from tests.unit_tests.dummy_particulator import DummyParticulator
 
@@ -37,3 +37,70 @@ def test_approximation(backend_class, plot=False):
         plt.plot(r, u)
         plt.grid()
         plt.show()
+
+
+def test_interpolation_beyond_table_range(backend_class):
+    # arrange
+    r = np.asarray([-1, 0, 1, 3, 6, 10, 1000]) * const.si.mm
+    particulator = DummyParticulator(backend_class, n_sd=len(r))
+    output = particulator.backend.Storage.empty(len(r), float)
+
+    # act
+    Interpolation(particulator)(output, particulator.backend.Storage.from_ndarray(r))
+
+    # assert
+    u = output.to_ndarray()
+    assert u[0] == u[1] == 0
+    assert (np.diff(u[1:]) >= 0).all()
+    np.testing.assert_allclose(u[-3:], 9.17)
+
+
+def test_rogers_yau_table(backend_class):
+    # arrange
+    r = np.linspace(1, 5000, 111) * const.si.um
+    particulator = DummyParticulator(backend_class, n_sd=len(r))
+    radius = particulator.backend.Storage.from_ndarray(r)
+    expected = particulator.backend.Storage.empty(len(r), float)
+    actual = particulator.backend.Storage.empty(len(r), float)
+
+    # act
+    RogersYau(particulator=particulator)(expected, radius)
+    RogersYauTable(particulator=particulator)(actual, radius)
+
+    # assert
+    np.testing.assert_allclose(actual.to_ndarray(), expected.to_ndarray(), rtol=1e-3)
+
+
+def test_interpolation_where_changed(backend_class):
+    # arrange
+    rtol = 1e-3
+    r = np.asarray([10, 100, 1000]) * const.si.um
+    particulator = DummyParticulator(backend_class, n_sd=len(r))
+    sut = Interpolation(particulator)
+    output = particulator.backend.Storage.empty(len(r), float)
+    radius_at_update = particulator.backend.Storage.empty(len(r), float)
+    radius_at_update.fill(-1.0)
+    sut(
+        output,
+        particulator.backend.Storage.from_ndarray(r),
+        radius_at_update=radius_at_update,
+        rtol=rtol,
+    )
+    u0 = output.to_ndarray()
+
+    # act
+    r_new = r * np.asarray([1, 1 + rtol / 2, 1 + 2 * rtol])
+    sut(
+        output,
+        particulator.backend.Storage.from_ndarray(r_new),
+        radius_at_update=radius_at_update,
+        rtol=rtol,
+    )
+
+    # assert
+    expected = particulator.backend.Storage.empty(len(r), float)
+    sut(expected, particulator.backend.Storage.from_ndarray(r_new))
+    u = output.to_ndarray()
+    assert u[0] == u0[0] and u[1] == u0[1]
+    assert u[2] == expected.to_ndarray()[2] and u[2] > u0[2]
+    np.testing.assert_allclose(radius_at_update.to_ndarray(), [r[0], r[1], r_new[2]])
@@ -5,7 +5,7 @@ from PySDM.backends.impl_common.index import make_Index
 from PySDM.backends.impl_common.indexed_storage import make_IndexedStorage
 
 
-class TestIndex:  # pylint: disable=too-few-public-methods
+class TestIndex:
     @staticmethod
     def test_remove_zero_n_or_flagged(backend_class):
         # Arrange
@@ -25,3 +25,16 @@ class TestIndex:  # pylint: disable=too-few-public-methods
         assert (
             backend.Storage.to_ndarray(data)[idx.to_ndarray()[: len(idx)]] > 0
         ).all()
+
+    @staticmethod
+    def test_permute_in_place(backend_class):
+        # Arrange
+        backend = backend_class()
+        permutation = make_Index(backend).from_ndarray(np.asarray([2, 0, 3, 1]))
+        data = backend.Storage.from_ndarray(np.asarray([[0.0, 1, 2, 3], [4, 5, 6, 7]]))
+
+        # Act
+        backend.permute_in_place(data, permutation, length=3)
+
+        # Assert
+        np.testing.assert_array_equal(data.to_ndarray(), [[2.0, 0, 3, 3], [6, 4, 7, 7]])
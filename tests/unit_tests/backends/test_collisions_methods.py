@@ -206,7 +206,12 @@ class TestCollisionMethods:
     @staticmethod
     @pytest.mark.parametrize(
         "backend_class, scheme",
-        ((CPU, "counting_sort"), (CPU, "counting_sort_parallel"), (GPU, "default")),
+        (
+            (CPU, "counting_sort"),
+            (CPU, "counting_sort_parallel"),
+            (CPU, "incremental"),
+            (GPU, "default"),
+        ),
     )
     def test_cell_caretaker(backend_class, scheme):
         # Arrange
@@ -235,3 +240,42 @@ class TestCollisionMethods:
 
         # Assert
         assert all(cell_start.to_ndarray()[:] == np.array([0, 3]))
+
+    @staticmethod
+    @pytest.mark.parametrize("migrated_fraction", (0, 0.02, 0.5))
+    def test_incremental_cell_caretaker(migrated_fraction):
+        # Arrange
+        backend = CPU()
+        n_sd, n_cell = 1000, 50
+        rng = np.random.default_rng(seed=44)
+        cell_id_data = rng.integers(0, n_cell, size=n_sd)
+
+        _idx = make_Index(backend).identity_index(n_sd)
+        cell_id = make_IndexedStorage(backend).from_ndarray(_idx, cell_id_data)
+        cell_idx = make_Index(backend).identity_index(n_cell)
+        cell_start = backend.Storage.from_ndarray(np.zeros(n_cell + 1, dtype=np.int64))
+        sut = backend.make_cell_caretaker(
+            _idx.shape, _idx.dtype, len(cell_start), scheme="incremental"
+        )
+        sut(cell_id, cell_idx, cell_start, _idx)
+
+        migrants = rng.choice(n_sd, size=int(migrated_fraction * n_sd), replace=False)
+        cell_id_data[migrants] = (
+            cell_id_data[migrants] + rng.choice((-7, -1, 1, 7), size=len(migrants))
+        ) % n_cell
+        cell_id.upload(cell_id_data)
+
+        # Act
+        sut(cell_id, cell_idx, cell_start, _idx)
+
+        # Assert
+        assert sut.n_migrated == (-1 if migrated_fraction > 0.05 else len(migrants))
+        np.testing.assert_array_equal(
+            cell_start.to_ndarray(),
+            np.concatenate(
+                ((0,), np.cumsum(np.bincount(cell_id_data, minlength=n_cell)))
+            ),
+        )
+        idx = _idx.to_ndarray()
+        assert sorted(idx) == list(range(n_sd))
+        assert (np.diff(cell_id_data[idx]) >= 0).all()
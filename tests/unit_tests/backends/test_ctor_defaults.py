@@ -17,3 +17,5 @@ class TestCtorDefaults:
     def test_cpu_ctor_defaults():
         signature = inspect.signature(CPU.__init__)
         assert signature.parameters["formulae"].default is None
+        assert signature.parameters["double_precision"].default is True
+        assert signature.parameters["counter_based_random"].default is False
@@ -0,0 +1,112 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import os
+import pathlib
+import subprocess
+import sys
+
+import numba  # pylint: disable=unused-import  # (used in skipif condition)
+import pytest
+
+import PySDM
+from PySDM import Formulae
+from PySDM.backends.impl_numba import jit_cache
+
+STARTUP_SCRIPT = """
+import time
+t0 = time.perf_counter()
+import numpy as np
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.products import ParticleConcentration
+
+builder = Builder(n_sd=8, backend=CPU(Formulae()))
+builder.set_environment(Box(dt=1, dv=1))
+builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1.5e3)))
+particulator = builder.build(
+    attributes={"n": np.full(8, 100.0), "volume": np.full(8, 1e-18)},
+    products=(ParticleConcentration(),),
+)
+particulator.run(1)
+for product in particulator.products.values():
+    product.get()
+print(time.perf_counter() - t0)
+"""
+
+
+def _run(script, cache_dir):
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(pathlib.Path(PySDM.__file__).parent.parent),
+        "PYSDM_JIT_CACHE_DIR": str(cache_dir),
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        env=env,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return result.stdout.strip().split("\n")[-1]
+
+
+class TestJitCache:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "formulae_kwargs",
+        (
+            {},
+            {"fastmath": False},
+            {"condensation_coordinate": "VolumeLogarithm"},
+            {"constants": {"rho_w": 1001}},
+        ),
+    )
+    def test_stable_key_is_deterministic_across_processes(formulae_kwargs, tmp_path):
+        # arrange
+        script = (
+            "import hashlib\n"
+            "from PySDM import Formulae\n"
+            "from PySDM.backends.impl_numba import jit_cache\n"
+            f"formulae = Formulae(**{formulae_kwargs!r})\n"
+            "physics = {k: v for k, v in vars(formulae).items() if k != 'seed'}\n"
+            "key = repr(jit_cache.stable_key(physics))\n"
+            "print(hashlib.sha256(key.encode()).hexdigest())\n"
+        )
+
+        # act
+        keys = {_run(script, tmp_path) for _ in range(2)}
+
+        # assert
+        assert len(keys) == 1
+
+    @staticmethod
+    def test_stable_key_differs_for_different_formulae():
+        # arrange
+        formulae = (
+            Formulae(),
+            Formulae(fastmath=False),
+            Formulae(saturation_vapour_pressure="AugustRocheMagnus"),
+        )
+
+        # act
+        keys = [
+            repr(jit_cache.stable_key(f.saturation_vapour_pressure.pvs_Celsius))
+            for f in formulae
+        ]
+
+        # assert
+        assert len(set(keys)) == len(formulae)
+
+    @staticmethod
+    @pytest.mark.skipif("numba.config.DISABLE_JIT")
+    def test_cold_vs_warm_startup(tmp_path):
+        # act
+        cold = float(_run(STARTUP_SCRIPT, tmp_path))
+        warm = float(_run(STARTUP_SCRIPT, tmp_path))
+
+        # assert
+        print(f"cold start: {cold:.2f} s, warm start: {warm:.2f} s")
+        assert any(tmp_path.rglob("*.nbi"))
+        assert warm < cold / 2
@@ -3,6 +3,13 @@ import numpy as np
 import pytest
 
 from PySDM import Formulae
+from PySDM.backends.impl_common.bin_lookup import (
+    BISECTION,
+    LINEAR_SCAN,
+    LOGARITHMIC,
+    UNIFORM,
+    bin_lookup_parameters,
+)
 
 
 @pytest.mark.parametrize(
@@ -45,3 +52,60 @@ def test_moments_range(backend_class, min_x, max_x, value, expected):
 
     # Assert
     assert moment_0.to_ndarray()[:] == moments.to_ndarray()[:] == expected
+
+
+@pytest.mark.parametrize(
+    "x_bins, scheme",
+    (
+        (np.linspace(0, 10, 11), UNIFORM),
+        (np.logspace(-2, 1, 31), LOGARITHMIC),
+        (np.logspace(-2, 1, 31) ** 3, LOGARITHMIC),
+        (np.linspace(0.1, 2, 20) ** 3, BISECTION),
+        (np.linspace(10, 0, 11), LINEAR_SCAN),
+    ),
+)
+# pylint: disable=too-many-locals
+def test_spectrum_moments_bin_lookup(backend_class, x_bins, scheme):
+    # Arrange
+    backend = backend_class(Formulae())
+    n_sd = 1000
+    x = np.concatenate(
+        (
+            np.random.default_rng(seed=44).uniform(-1, 1100, n_sd - len(x_bins)),
+            x_bins,
+        )
+    )
+    n_bins = len(x_bins) - 1
+    ranks = (1, 2)
+    lookup = bin_lookup_parameters(x_bins)
+    moment_0 = backend.Storage.empty((n_bins, 1), dtype=float)
+    moments = backend.Storage.empty((len(ranks) * n_bins, 1), dtype=float)
+
+    # Act
+    backend.spectrum_moments(
+        moment_0=moment_0,
+        moments=moments,
+        multiplicity=backend.Storage.from_ndarray(np.ones(n_sd, dtype=np.int64)),
+        attr_data=backend.Storage.from_ndarray(x),
+        cell_id=backend.Storage.from_ndarray(np.zeros(n_sd, dtype=np.int64)),
+        idx=backend.Storage.from_ndarray(np.arange(n_sd)),
+        length=n_sd,
+        ranks=backend.Storage.from_ndarray(np.asarray(ranks, dtype=float)),
+        x_bins=backend.Storage.from_ndarray(x_bins),
+        x_bins_lookup=lookup,
+        x_attr=backend.Storage.from_ndarray(x),
+        weighting_attribute=backend.Storage.from_ndarray(x),
+        weighting_rank=0,
+    )
+
+    # Assert
+    assert lookup[0] == scheme
+    expected_0 = np.zeros(n_bins)
+    expected = np.zeros((len(ranks), n_bins))
+    for k in range(n_bins):
+        in_bin = (x_bins[k] <= x) & (x < x_bins[k + 1])
+        expected_0[k] = np.count_nonzero(in_bin)
+        for r, rank in enumerate(ranks):
+            expected[r, k] = np.mean(x[in_bin] ** rank) if expected_0[k] else 0
+    np.testing.assert_array_equal(moment_0.to_ndarray()[:, 0], expected_0)
+    np.testing.assert_allclose(moments.to_ndarray()[:, 0], expected.ravel(), rtol=1e-6)
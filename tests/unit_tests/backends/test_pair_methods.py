@@ -6,7 +6,13 @@ import pytest
 
 from PySDM.backends import CPU
 from PySDM.backends.impl_common.index import make_Index
+from PySDM.backends.impl_common.indexed_storage import make_IndexedStorage
 from PySDM.backends.impl_common.pair_indicator import make_PairIndicator
+from PySDM.backends.impl_common.pairwise_expression import (
+    PairwiseExpression,
+    PairwisePipeline,
+)
+from PySDM.backends.impl_common.pairwise_storage import make_PairwiseStorage
 
 
 class TestPairMethods:
@@ -122,3 +128,54 @@ class TestPairMethods:
 
         # assert
         assert not is_first_in_pair.indicator[length - 1]
+
+    @staticmethod
+    def test_pairwise_pipeline(backend_class):
+        # arrange
+        backend = backend_class(double_precision=True)
+        E = PairwiseExpression
+        pipeline = PairwisePipeline(
+            {
+                "sum": E.sum("x"),
+                "ratio": E.divide_if_not_zero(E.min("y"), E.min("x")) ** 2,
+                "in_place": E.pairwise("in_place") * E.distance("y")
+                - E.multiply("x") / E.ref("sum")
+                + 1,
+            },
+            outputs=("ratio", "in_place"),
+        )
+        idx = make_Index(backend).from_ndarray(np.asarray([4, 0, 1, 2, 3, 5]))
+        idx.length = 5
+        attributes = {
+            "x": make_IndexedStorage(backend).from_ndarray(
+                idx, np.asarray([1.0, 2.0, 0.0, 4.0, 4.0, 666.0])
+            ),
+            "y": make_IndexedStorage(backend).from_ndarray(
+                idx, np.asarray([3.0, 5.0, 7.0, 11.0, 13.0, 666.0])
+            ),
+        }
+        is_first_in_pair = make_PairIndicator(backend)(6)
+        is_first_in_pair.indicator = backend.Storage.from_ndarray(
+            np.asarray([False, True, False, True, False, True])
+        )
+        ratio = make_PairwiseStorage(backend).from_ndarray(np.full(3, 44.0))
+        in_place = make_PairwiseStorage(backend).from_ndarray(
+            np.asarray([2.0, 3.0, 44.0])
+        )
+
+        # act
+        backend.pairwise_pipeline(
+            pipeline,
+            outputs={"ratio": ratio, "in_place": in_place},
+            attributes=attributes,
+            pairwise={"in_place": in_place},
+            is_first_in_pair=is_first_in_pair,
+        )
+
+        # assert
+        np.testing.assert_allclose(
+            ratio.to_ndarray(), [3.0**2, 7.0**2, 0], rtol=1e-15
+        )
+        np.testing.assert_allclose(
+            in_place.to_ndarray(), [2 * 2 - 2 / 3 + 1, 3 * 4 - 0 + 1, 0], rtol=1e-15
+        )
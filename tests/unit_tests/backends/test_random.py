@@ -0,0 +1,100 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numba
+import numpy as np
+import pytest
+
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.random import CounterBasedRandom, Random, philox4x32
+from PySDM.dynamics.impl.random_streams import RANDOM_STREAMS
+
+N = 1001
+SEED = 44
+
+
+@pytest.mark.parametrize(
+    "word, expected",
+    (  # known-answer tests from the Random123 library
+        (0, (0x6627E8D5, 0xE169C58D, 0xBC57AC4C, 0x9B00DBD8)),
+        (0xFFFFFFFF, (0x408F276D, 0x41C83B0E, 0xA20BC7C6, 0x6D5451FD)),
+    ),
+)
+def test_philox4x32_known_answers(word, expected):
+    assert philox4x32(*(np.uint64(word),) * 6) == expected
+
+
+def draw(random_class, n_calls=2, seed=SEED, stream=0):
+    backend = CPU()
+    storage = backend.Storage.empty(N, dtype=float)
+    rng = random_class(N, seed, stream)
+    result = []
+    for _ in range(n_calls):
+        storage.urand(rng)
+        result.append(storage.to_ndarray())
+    return np.asarray(result)
+
+
+@pytest.mark.parametrize("random_class", (Random, CounterBasedRandom))
+class TestRandom:
+    @staticmethod
+    def test_uniform_in_unit_interval(random_class):
+        values = draw(random_class, n_calls=100)
+        assert (values >= 0).all() and (values < 1).all()
+        np.testing.assert_allclose(values.mean(), 0.5, atol=0.01)
+        assert (values[0] != values[1]).all()
+
+    @staticmethod
+    def test_reproducible(random_class):
+        np.testing.assert_array_equal(draw(random_class), draw(random_class))
+
+    @staticmethod
+    @pytest.mark.parametrize("streams", ((0, 1), (RANDOM_STREAMS.breakup_process, 2)))
+    def test_substreams_independent(random_class, streams):
+        values = [draw(random_class, stream=stream) for stream in streams]
+        assert abs(np.corrcoef(values[0].ravel(), values[1].ravel())[0, 1]) < 0.1
+        assert (values[0] != values[1]).all()
+
+    @staticmethod
+    def test_state_roundtrip(random_class):
+        storage = CPU().Storage.empty(N, dtype=float)
+        rng = random_class(N, SEED)
+        storage.urand(rng)
+        state = rng.get_state()
+        storage.urand(rng)
+        expected = storage.to_ndarray()
+
+        rng.set_state(state)
+        storage.urand(rng)
+
+        np.testing.assert_array_equal(storage.to_ndarray(), expected)
+
+
+def test_default_stream_matches_numpy_generator():
+    np.testing.assert_array_equal(
+        draw(Random, n_calls=1)[0], np.random.default_rng(SEED).uniform(0, 1, N)
+    )
+
+
+@pytest.mark.skipif(
+    numba.config.NUMBA_NUM_THREADS < 2,  # pylint: disable=no-member
+    reason="requires multiple threads",
+)
+def test_counter_based_independent_of_thread_count():
+    # arrange
+    n_threads = numba.get_num_threads()
+
+    # act
+    try:
+        numba.set_num_threads(1)
+        serial = draw(CounterBasedRandom)
+        numba.set_num_threads(n_threads)
+        parallel = draw(CounterBasedRandom)
+    finally:
+        numba.set_num_threads(n_threads)
+
+    # assert
+    np.testing.assert_array_equal(serial, parallel)
+
+
+def test_counter_based_random_backend_flag():
+    assert CPU(counter_based_random=True).Random is CounterBasedRandom
+    assert CPU().Random is Random
@@ -0,0 +1,187 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import (
+    AmbientThermodynamics,
+    Coalescence,
+    Condensation,
+    Displacement,
+)
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box, Kinematic2D, Parcel
+from PySDM.impl.mesh import Mesh
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+from PySDM.initialisation.spectra import Lognormal
+from PySDM.physics import si
+from PySDM.products import ParticleVolumeVersusRadiusLogarithmSpectrum
+
+N_SD = 2**10
+RADIUS_BINS = np.logspace(np.log10(1 * si.um), np.log10(1 * si.mm), 32)
+
+
+def run(backend):
+    builder = Builder(n_sd=N_SD, backend=backend)
+    builder.set_environment(Box(dt=1 * si.s, dv=1 * si.m**3))
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)))
+    rng = np.random.default_rng(44)
+    particulator = builder.build(
+        attributes={
+            "n": np.full(N_SD, 2**23),
+            "volume": rng.exponential(30.531 * si.um**3, N_SD),
+        },
+        products=(
+            ParticleVolumeVersusRadiusLogarithmSpectrum(
+                radius_bins_edges=RADIUS_BINS, name="dv/dlnr"
+            ),
+        ),
+    )
+    particulator.run(10)
+    return particulator
+
+
+def run_condensation(backend, n_steps=100):
+    env = Parcel(
+        dt=1 * si.s,
+        mass_of_dry_air=1 * si.kg,
+        p0=1000 * si.hPa,
+        q0=22 * si.g / si.kg,
+        T0=300 * si.K,
+        w=1 * si.m / si.s,
+    )
+    builder = Builder(n_sd=64, backend=backend)
+    builder.set_environment(env)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation())
+    r_dry, n_in_dv = ConstantMultiplicity(
+        Lognormal(norm_factor=1e8 / si.kg, m_mode=50 * si.nm, s_geom=1.5)
+    ).sample(n_sd=64)
+    particulator = builder.build(
+        attributes=env.init_attributes(n_in_dv=n_in_dv, kappa=0.5, r_dry=r_dry)
+    )
+    particulator.run(n_steps)
+    return particulator
+
+
+def run_displacement(backend, n_steps=10):
+    grid = (8, 8)
+    stream_function = np.zeros((grid[0] + 1, grid[1] + 1))
+    stream_function[:, 1:-1] = np.random.default_rng(44).uniform(
+        -0.3, 0.3, (grid[0] + 1, grid[1] - 1)
+    )
+    stream_function[-1] = stream_function[0]
+    positions = np.random.default_rng(55).uniform(0, 1, (2, N_SD)) * np.reshape(
+        grid, (2, 1)
+    )
+    cell_id, cell_origin, position_in_cell = Mesh(
+        grid, (1 * si.km, 1 * si.km)
+    ).cellular_attributes(positions)
+
+    builder = Builder(n_sd=N_SD, backend=backend)
+    builder.set_environment(
+        Kinematic2D(
+            dt=1 * si.s,
+            grid=grid,
+            size=(1 * si.km, 1 * si.km),
+            rhod_of=lambda zZ: 1 + 0 * zZ,
+        )
+    )
+    displacement = Displacement(adaptive=False)
+    builder.add_dynamic(displacement)
+    particulator = builder.build(
+        attributes={
+            "n": np.ones(N_SD),
+            "volume": np.full(N_SD, si.um**3),
+            "cell id": cell_id,
+            "cell origin": cell_origin,
+            "position in cell": position_in_cell,
+        }
+    )
+    displacement.upload_courant_field(
+        (-np.diff(stream_function, axis=1), np.diff(stream_function, axis=0))
+    )
+    particulator.run(n_steps)
+    return particulator
+
+
+class TestSinglePrecision:
+    @staticmethod
+    def test_storage_dtypes():
+        assert CPU.Storage.FLOAT is np.float64
+        assert CPU().Storage.FLOAT is np.float64
+        assert CPU(double_precision=False).Storage.FLOAT is np.float32
+        assert CPU(double_precision=False).Storage.ACCUMULATOR is np.float64
+
+    @staticmethod
+    def test_accumulators_in_double_precision():
+        # act
+        particulator = run(CPU(double_precision=False))
+
+        # assert
+        assert particulator.attributes["volume"].data.dtype == np.float32
+        assert particulator.dynamics["Collision"].dt_left.dtype == np.float64
+        assert particulator.products["dv/dlnr"].get().dtype == np.float64
+
+    @staticmethod
+    def test_results_close_to_double_precision():
+        # act
+        single = run(CPU(double_precision=False))
+        double = run(CPU())
+
+        # assert
+        np.testing.assert_allclose(
+            single.products["dv/dlnr"].get(),
+            double.products["dv/dlnr"].get(),
+            rtol=0.05,
+            atol=1e-3 * np.amax(double.products["dv/dlnr"].get()),
+        )
+
+    @staticmethod
+    def test_condensation_close_to_double_precision():
+        # act
+        single = run_condensation(CPU(double_precision=False))
+        double = run_condensation(CPU())
+
+        # assert
+        assert single.attributes["volume"].data.dtype == np.float32
+        assert (
+            single.attributes["volume"].to_ndarray()
+            > single.attributes["critical volume"].to_ndarray()
+        ).any()
+        for var in ("RH", "thd", "qv"):
+            np.testing.assert_allclose(
+                single.environment[var].to_ndarray(),
+                double.environment[var].to_ndarray(),
+                rtol=1e-4,
+            )
+        np.testing.assert_allclose(
+            single.attributes["volume"].to_ndarray(),
+            double.attributes["volume"].to_ndarray(),
+            rtol=1e-3,
+        )
+
+    @staticmethod
+    def test_displacement_close_to_double_precision():
+        # act
+        single = run_displacement(CPU(double_precision=False))
+        double = run_displacement(CPU())
+
+        # assert
+        position_in_cell = single.attributes["position in cell"].to_ndarray()
+        assert position_in_cell.dtype == np.float32
+        assert ((position_in_cell >= 0) & (position_in_cell < 1)).all()
+        np.testing.assert_array_equal(
+            single.attributes["cell id"].to_ndarray(),
+            np.dot(
+                single.mesh.strides, single.attributes["cell origin"].to_ndarray()
+            ).ravel(),
+        )
+        positions = {
+            key: particulator.attributes["cell origin"].to_ndarray()
+            + particulator.attributes["position in cell"].to_ndarray()
+            for key, particulator in (("single", single), ("double", double))
+        }
+        distance = np.abs(positions["single"] - positions["double"])
+        distance[0] = np.minimum(distance[0], single.mesh.grid[0] - distance[0])
+        np.testing.assert_array_less(distance, 1e-4)
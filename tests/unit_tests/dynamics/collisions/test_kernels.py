@@ -4,7 +4,14 @@ import pytest
 
 from PySDM import Builder
 from PySDM.backends import CPU
-from PySDM.dynamics.collisions.collision_kernels import Golovin, SimpleGeometric
+from PySDM.dynamics.collisions.collision_kernels import (
+    Electric,
+    Geometric,
+    Golovin,
+    Hydrodynamic,
+    SimpleGeometric,
+)
+from PySDM.dynamics.terminal_velocity import RogersYau
 from PySDM.environments import Box
 from PySDM.formulae import Formulae
 
@@ -42,7 +49,7 @@ class TestKernels:
 
         _PairwiseStorage = builder.particulator.PairwiseStorage
         _Indicator = builder.particulator.PairIndicator
-        output = _PairwiseStorage.from_ndarray(np.zeros_like(volume))
+        output = _PairwiseStorage.from_ndarray(np.zeros(volume.size // 2))
         is_first_in_pair = _Indicator(length=volume.size)
         is_first_in_pair.indicator = builder.particulator.Storage.from_ndarray(
             np.asarray([True, False])
@@ -52,9 +59,9 @@ class TestKernels:
 
         # assert
         if C > 0.0:
-            np.testing.assert_array_less([0.0, 0.0], output.to_ndarray())
+            np.testing.assert_array_less([0.0], output.to_ndarray())
         else:
-            np.testing.assert_array_equal([0.0, 0.0], output.to_ndarray())
+            np.testing.assert_array_equal([0.0], output.to_ndarray())
 
     @staticmethod
     @pytest.mark.parametrize("volume", (np.array([1.0, 2.0]), np.array([1.0, 1.0])))
@@ -69,7 +76,7 @@ class TestKernels:
 
         _PairwiseStorage = builder.particulator.PairwiseStorage
         _Indicator = builder.particulator.PairIndicator
-        output = _PairwiseStorage.from_ndarray(np.zeros_like(volume))
+        output = _PairwiseStorage.from_ndarray(np.zeros(volume.size // 2))
         is_first_in_pair = _Indicator(length=volume.size)
         is_first_in_pair.indicator = builder.particulator.Storage.from_ndarray(
             np.asarray([True, False])
@@ -80,6 +87,80 @@ class TestKernels:
 
         # assert
         if volume[0] == volume[1]:
-            np.testing.assert_array_equal([0.0, 0.0], output.to_ndarray())
+            np.testing.assert_array_equal([0.0], output.to_ndarray())
         else:
-            np.testing.assert_array_less([0.0, 0.0], output.to_ndarray())
+            np.testing.assert_array_less([0.0], output.to_ndarray())
+
+    @staticmethod
+    @pytest.mark.parametrize("kernel_class", (Geometric, Hydrodynamic, Electric))
+    @pytest.mark.parametrize("table_rtol", (1e-2, 2e-3))
+    def test_tabulated_gravitational_kernels(backend_class, kernel_class, table_rtol):
+        # arrange
+        n_sd = 256
+        radius = np.exp(
+            np.random.default_rng(44).uniform(np.log(1e-6), np.log(2e-3), n_sd)
+        )
+        output = {}
+        for tabulated in (False, True):
+            builder = Builder(backend=backend_class(), n_sd=n_sd)
+            sut = kernel_class(tabulated=tabulated, table_rtol=table_rtol)
+            sut.register(builder)
+            builder.set_environment(Box(dv=None, dt=None))
+            particulator = builder.build(
+                attributes={
+                    "volume": builder.formulae.trivia.volume(radius=radius),
+                    "n": np.ones(n_sd),
+                }
+            )
+            output[tabulated] = particulator.PairwiseStorage.empty(
+                n_sd // 2, dtype=float
+            )
+            is_first_in_pair = particulator.PairIndicator(length=n_sd)
+            is_first_in_pair.indicator = particulator.Storage.from_ndarray(
+                np.arange(n_sd) % 2 == 0
+            )
+
+            # act
+            sut(output[tabulated], is_first_in_pair=is_first_in_pair)
+
+        # assert
+        assert sut.table_error <= table_rtol
+        expected = output[False].to_ndarray()
+        np.testing.assert_allclose(
+            output[True].to_ndarray(), expected, atol=table_rtol * expected.max()
+        )
+        assert "terminal velocity" not in particulator.attributes.keys()
+
+    @staticmethod
+    def test_tabulated_gravitational_kernel_uses_selected_terminal_velocity():
+        # arrange
+        output = {}
+        for tabulated in (True, False):
+            builder = Builder(backend=CPU(), n_sd=2)
+            builder.set_terminal_velocity(approximation=RogersYau)
+            sut = Geometric(tabulated=tabulated, table_rtol=0.1)
+            sut.register(builder)
+            builder.set_environment(Box(dv=None, dt=None))
+            if tabulated:
+                size = int(np.sqrt(len(sut.table)))
+                radius = np.exp(np.linspace(*np.log(sut.table_r_range), size))
+                radius = radius[[size // 2, size // 4]]
+            particulator = builder.build(
+                attributes={
+                    "volume": builder.formulae.trivia.volume(radius=radius),
+                    "n": np.ones(2),
+                }
+            )
+            output[tabulated] = particulator.PairwiseStorage.empty(1, dtype=float)
+            is_first_in_pair = particulator.PairIndicator(length=2)
+            is_first_in_pair.indicator = particulator.Storage.from_ndarray(
+                np.asarray([True, False])
+            )
+
+            # act
+            sut(output[tabulated], is_first_in_pair=is_first_in_pair)
+
+        # assert
+        np.testing.assert_allclose(
+            output[True].to_ndarray(), output[False].to_ndarray(), rtol=1e-6
+        )
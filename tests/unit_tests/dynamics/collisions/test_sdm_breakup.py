@@ -856,6 +856,32 @@ class TestSDMBreakup:
             ),
         }[flag]()
 
+    @staticmethod
+    @pytest.mark.parametrize("random_substreams", (False, True))
+    def test_random_substreams_opt_in(random_substreams, backend_class):
+        # Arrange
+        breakup = Breakup(
+            collision_kernel=ConstantK(1 * si.cm**3 / si.s),
+            fragmentation_function=AlwaysN(4),
+            random_substreams=random_substreams,
+        )
+        builder = Builder(2, backend_class(Formulae(fragmentation_function="AlwaysN")))
+        builder.set_environment(Box(dv=1 * si.cm**3, dt=1 * si.s))
+        builder.add_dynamic(breakup)
+
+        # Act
+        builder.build(
+            attributes={"n": np.ones(2), "volume": np.full(2, si.um**3)}, products=()
+        )
+
+        # Assert
+        streams = {
+            breakup.rnd_opt_coll.stream,
+            breakup.rnd_opt_proc.stream,
+            breakup.rnd_opt_frag.stream,
+        }
+        assert streams == ({0, 1, 2} if random_substreams else {0})
+
 
 def get_smaller_of_pairs(is_first_in_pair, n_init):
     return np.where(
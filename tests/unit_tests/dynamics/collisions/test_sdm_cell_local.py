@@ -0,0 +1,139 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU, GPU
+from PySDM.dynamics import Breakup, Coalescence
+from PySDM.dynamics.collisions.breakup_fragmentations import AlwaysN
+from PySDM.dynamics.collisions.collision_kernels import Geometric, Golovin
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+from PySDM.initialisation.spectra import Exponential
+from PySDM.physics import si
+
+from ...dummy_environment import DummyEnvironment
+
+N_SD = 2**12
+GRID = (4, 4)
+
+
+def make_particulator(dynamic, seed=44, backend_class=CPU):
+    builder = Builder(N_SD, backend_class(Formulae(seed=seed)))
+    builder.set_environment(
+        DummyEnvironment(timestep=100 * si.s, grid=GRID, size=(100 * si.m, 100 * si.m))
+    )
+    builder.add_dynamic(dynamic)
+    spectrum = Exponential(
+        norm_factor=2**23 / si.m**3, scale=4 * np.pi / 3 * (30.531 * si.um) ** 3
+    )
+    volume, n_per_m3 = ConstantMultiplicity(spectrum).sample(N_SD)
+    cell_id = np.arange(N_SD) % (GRID[0] * GRID[1])
+    return builder.build(
+        attributes={
+            "volume": volume,
+            "n": n_per_m3 * builder.particulator.mesh.dv,
+            "cell id": cell_id,
+            "cell origin": np.array([cell_id // GRID[1], cell_id % GRID[1]]),
+            "position in cell": np.full((2, N_SD), 0.5),
+        },
+        products=(),
+    )
+
+
+def per_cell(particulator, values):
+    return np.bincount(
+        particulator.attributes["cell id"].to_ndarray(),
+        weights=values,
+        minlength=GRID[0] * GRID[1],
+    )
+
+
+class TestSDMCellLocal:
+    @staticmethod
+    @pytest.mark.parametrize("kernel", (lambda: Golovin(b=1.5e3 / si.s), Geometric))
+    def test_cell_local_loop_conserves_mass_and_matches_global_one(kernel):
+        # arrange
+        particulators = {
+            loop: make_particulator(
+                Coalescence(collision_kernel=kernel(), adaptive_loop=loop)
+            )
+            for loop in ("global", "local")
+        }
+        sut = particulators["local"]
+        mass = {}
+        for loop, particulator in particulators.items():
+            attributes = particulator.attributes
+            mass[loop] = per_cell(
+                particulator,
+                attributes["n"].to_ndarray() * attributes["volume"].to_ndarray(),
+            )
+
+        # act
+        for particulator in particulators.values():
+            particulator.run(3)
+
+        # assert
+        n_sd = {}
+        concentration = {}
+        for loop, particulator in particulators.items():
+            attributes = particulator.attributes
+            np.testing.assert_allclose(
+                per_cell(
+                    particulator,
+                    attributes["n"].to_ndarray() * attributes["volume"].to_ndarray(),
+                ),
+                mass[loop],
+                rtol=1e-10,
+            )
+            n_sd[loop] = attributes.super_droplet_count
+            concentration[loop] = attributes["n"].to_ndarray().sum()
+        assert n_sd["local"] == N_SD
+        np.testing.assert_allclose(
+            concentration["local"], concentration["global"], rtol=0.05
+        )
+        np.testing.assert_array_equal(
+            sut.dynamics["Collision"].stats_n_substep.to_ndarray() >= 3, True
+        )
+        if "radius" in sut.attributes:
+            np.testing.assert_allclose(
+                sut.attributes["radius"].to_ndarray(),
+                (sut.attributes["volume"].to_ndarray() * 3 / 4 / np.pi) ** (1 / 3),
+                rtol=1e-10,
+            )
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "dynamic",
+        (
+            lambda: Coalescence(
+                collision_kernel=Geometric(), adaptive=False, adaptive_loop="local"
+            ),
+            lambda: Coalescence(
+                collision_kernel=Geometric(tabulated=True), adaptive_loop="local"
+            ),
+            lambda: Breakup(
+                collision_kernel=Golovin(b=1 / si.s),
+                fragmentation_function=AlwaysN(n=2),
+                adaptive_loop="local",
+            ),
+            lambda: Coalescence(
+                collision_kernel=Geometric(), croupier="global", adaptive_loop="local"
+            ),
+            lambda: Coalescence(
+                collision_kernel=Geometric(),
+                optimized_random=True,
+                adaptive_loop="local",
+            ),
+        ),
+    )
+    def test_unsupported_setups_rejected(dynamic):
+        with pytest.raises(ValueError):
+            make_particulator(dynamic())
+
+    @staticmethod
+    def test_non_numba_backends_rejected():
+        with pytest.raises(ValueError, match="Numba"):
+            make_particulator(
+                Coalescence(collision_kernel=Geometric(), adaptive_loop="local"),
+                backend_class=GPU,
+            )
@@ -0,0 +1,89 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel, ParcelEnsemble
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+from PySDM.initialisation.spectra import Lognormal
+from PySDM.physics import si
+
+N_SD = 64
+RTOL_X = 1e-6
+ENV_PARAMS = {
+    "dt": 1 * si.s,
+    "mass_of_dry_air": 1 * si.kg,
+    "p0": 1000 * si.hPa,
+    "T0": 300 * si.K,
+    "w": 1 * si.m / si.s,
+}
+
+
+def assert_roots_close(actual, desired):
+    """both roots lie within `RTOL_X` of the exact one in the condensation
+    coordinate (default: logarithm of volume)"""
+    np.testing.assert_allclose(np.log(actual), np.log(desired), rtol=2 * RTOL_X)
+
+
+def run(*, lane_parallel, n_member, n_steps, q0=22 * si.g / si.kg):
+    if n_member == 1:
+        env = Parcel(q0=q0, **ENV_PARAMS)
+    else:
+        env = ParcelEnsemble(
+            q0=np.linspace(20, 22, n_member) * si.g / si.kg, **ENV_PARAMS
+        )
+    builder = Builder(n_sd=N_SD * n_member, backend=CPU())
+    builder.set_environment(env)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation(rtol_x=RTOL_X, lane_parallel=lane_parallel))
+    r_dry, n_in_dv = ConstantMultiplicity(
+        Lognormal(norm_factor=1e8 / si.kg, m_mode=50 * si.nm, s_geom=1.5)
+    ).sample(n_sd=N_SD)
+    if n_member != 1:
+        r_dry, n_in_dv = [r_dry] * n_member, [n_in_dv] * n_member
+    particulator = builder.build(
+        attributes=env.init_attributes(n_in_dv=n_in_dv, kappa=0.5, r_dry=r_dry)
+    )
+    particulator.run(n_steps)
+    return particulator
+
+
+@pytest.mark.parametrize("n_member", (1, 3))
+def test_lane_parallel_solver_yields_roots_within_tolerance(n_member):
+    # arrange
+    expected = run(lane_parallel=False, n_member=n_member, n_steps=1)
+
+    # act
+    sut = run(lane_parallel=True, n_member=n_member, n_steps=1)
+
+    # assert
+    assert_roots_close(
+        sut.attributes["volume"].to_ndarray(),
+        expected.attributes["volume"].to_ndarray(),
+    )
+
+
+def test_lane_parallel_solver_yields_close_thermodynamics_through_activation():
+    # arrange
+    expected = run(lane_parallel=False, n_member=1, n_steps=50, q0=23 * si.g / si.kg)
+
+    # act
+    sut = run(lane_parallel=True, n_member=1, n_steps=50, q0=23 * si.g / si.kg)
+
+    # assert
+    assert (
+        sut.attributes["volume"].to_ndarray()
+        > sut.attributes["critical volume"].to_ndarray()
+    ).any()
+    for var in ("RH", "thd", "qv"):
+        np.testing.assert_allclose(
+            sut.environment[var].to_ndarray(),
+            expected.environment[var].to_ndarray(),
+            rtol=10 * RTOL_X,
+        )
+    assert_roots_close(
+        sut.attributes["volume"].to_ndarray(),
+        expected.attributes["volume"].to_ndarray(),
+    )
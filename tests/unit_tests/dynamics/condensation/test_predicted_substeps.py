@@ -0,0 +1,72 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+from PySDM.initialisation.spectra import Lognormal
+from PySDM.physics import si
+from PySDM.products import AmbientRelativeHumidity, PredictedSubstepsFraction
+
+N_SD = 64
+N_STEPS = 100
+
+
+def make_particulator(predict_substeps):
+    env = Parcel(
+        dt=1 * si.s,
+        mass_of_dry_air=1 * si.kg,
+        p0=1000 * si.hPa,
+        q0=22 * si.g / si.kg,
+        T0=300 * si.K,
+        w=1 * si.m / si.s,
+    )
+    builder = Builder(n_sd=N_SD, backend=CPU())
+    builder.set_environment(env)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation(predict_substeps=predict_substeps))
+    r_dry, n_in_dv = ConstantMultiplicity(
+        Lognormal(norm_factor=1e8 / si.kg, m_mode=50 * si.nm, s_geom=1.5)
+    ).sample(n_sd=N_SD)
+    return builder.build(
+        attributes=env.init_attributes(n_in_dv=n_in_dv, kappa=0.5, r_dry=r_dry),
+        products=(
+            PredictedSubstepsFraction(name="predicted"),
+            AmbientRelativeHumidity(name="RH"),
+        ),
+    )
+
+
+@pytest.mark.parametrize("predict_substeps", (False, True))
+def test_predicted_substeps_fraction(predict_substeps):
+    # arrange
+    particulator = make_particulator(predict_substeps)
+
+    # act
+    particulator.run(N_STEPS)
+
+    # assert
+    fraction = particulator.products["predicted"].get()
+    if predict_substeps:
+        assert 0.5 < fraction[0] < 1
+    else:
+        assert fraction[0] == 0
+    assert np.isnan(particulator.products["predicted"].get()).all()
+
+
+def test_predicted_substeps_match_trial_integrations():
+    # arrange
+    particulators = {flag: make_particulator(flag) for flag in (False, True)}
+    RH = {flag: [] for flag in particulators}
+
+    # act
+    for _ in range(N_STEPS):
+        for flag, particulator in particulators.items():
+            particulator.run(1)
+            RH[flag].append(particulator.products["RH"].get()[0])
+
+    # assert
+    np.testing.assert_allclose(RH[True], RH[False], rtol=5e-4)
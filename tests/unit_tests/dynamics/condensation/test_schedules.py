@@ -0,0 +1,92 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numba
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import ParcelEnsemble
+from PySDM.physics import si
+
+N_MEMBER = 8
+N_SD_PER_MEMBER = 4
+N_STEPS = 10
+
+
+def run(schedule):
+    env = ParcelEnsemble(
+        dt=1 * si.s,
+        mass_of_dry_air=1 * si.mg,
+        p0=1000 * si.hPa,
+        q0=np.linspace(10, 14, N_MEMBER) * si.g / si.kg,
+        T0=290 * si.K,
+        w=np.linspace(0.1, 2, N_MEMBER) * si.m / si.s,
+    )
+    builder = Builder(n_sd=N_MEMBER * N_SD_PER_MEMBER, backend=CPU())
+    builder.set_environment(env)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation(schedule=schedule))
+    r_dry = [np.logspace(-8, -6, N_SD_PER_MEMBER) * si.m] * N_MEMBER
+    particulator = builder.build(
+        attributes=env.init_attributes(
+            n_in_dv=[np.full(N_SD_PER_MEMBER, 1e3)] * N_MEMBER,
+            kappa=0.5,
+            r_dry=r_dry,
+        )
+    )
+    particulator.run(N_STEPS)
+    return particulator
+
+
+@pytest.mark.parametrize("schedule", ("dynamic", "queue"))
+def test_schedules_yield_results_equal_to_static(schedule):
+    # arrange
+    expected = run("static")
+
+    # act
+    particulator = run(schedule)
+
+    # assert
+    for attribute in ("volume", "n"):
+        np.testing.assert_array_equal(
+            particulator.attributes[attribute].to_ndarray(),
+            expected.attributes[attribute].to_ndarray(),
+        )
+    np.testing.assert_array_equal(
+        particulator.environment["thd"].to_ndarray(),
+        expected.environment["thd"].to_ndarray(),
+    )
+
+
+def test_queue_schedule_orders_cells_by_cost():
+    # arrange
+    particulator = run("queue")
+    condensation = particulator.dynamics["Condensation"]
+    cost = condensation.cell_cost()
+
+    # act
+    particulator.run(1)
+
+    # assert
+    assert condensation.cell_order.shape == (N_MEMBER,)
+    assert (np.diff(cost[condensation.cell_order]) <= 0).all()
+
+
+def test_thread_busy_time_reported_for_queue_schedule():
+    # act
+    particulator = run("queue")
+
+    # assert
+    busy_time = particulator.dynamics["Condensation"].thread_busy_time
+    assert busy_time.shape == (min(numba.get_num_threads(), N_MEMBER),)
+    assert (busy_time > 0).all()
+
+
+@pytest.mark.parametrize("schedule", ("static", "dynamic"))
+def test_thread_busy_time_not_measured_for_other_schedules(schedule):
+    # act
+    particulator = run(schedule)
+
+    # assert
+    assert particulator.dynamics["Condensation"].thread_busy_time is None
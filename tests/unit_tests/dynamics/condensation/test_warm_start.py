@@ -0,0 +1,77 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+from PySDM.initialisation.spectra import Lognormal
+from PySDM.physics import si
+from PySDM.products import CondensationMeanIterations
+
+N_SD = 64
+N_STEPS = 30
+RTOL_X = 1e-6
+
+
+def make_particulator(lane_parallel, warm_start=True):
+    env = Parcel(
+        dt=1 * si.s,
+        mass_of_dry_air=1 * si.kg,
+        p0=1000 * si.hPa,
+        q0=22 * si.g / si.kg,
+        T0=300 * si.K,
+        w=1 * si.m / si.s,
+    )
+    builder = Builder(n_sd=N_SD, backend=CPU())
+    builder.set_environment(env)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(
+        Condensation(rtol_x=RTOL_X, lane_parallel=lane_parallel, warm_start=warm_start)
+    )
+    r_dry, n_in_dv = ConstantMultiplicity(
+        Lognormal(norm_factor=1e8 / si.kg, m_mode=50 * si.nm, s_geom=1.5)
+    ).sample(n_sd=N_SD)
+    return builder.build(
+        attributes=env.init_attributes(n_in_dv=n_in_dv, kappa=0.5, r_dry=r_dry),
+        products=(CondensationMeanIterations(name="iterations"),),
+    )
+
+
+@pytest.mark.parametrize("lane_parallel", (False, True))
+def test_warm_start_reduces_iteration_count(lane_parallel):
+    # arrange
+    warm = make_particulator(lane_parallel)
+    cold = make_particulator(lane_parallel, warm_start=False)
+
+    # act
+    for _ in range(N_STEPS):
+        warm.run(1)
+        cold.run(1)
+
+    # assert
+    assert warm.products["iterations"].get() < cold.products["iterations"].get()
+    x = warm.formulae.condensation_coordinate.x
+    np.testing.assert_allclose(
+        x(warm.attributes["volume"].to_ndarray()),
+        x(cold.attributes["volume"].to_ndarray()),
+        rtol=2 * RTOL_X,
+    )
+
+
+def test_mean_iterations_product_resets_on_fetch():
+    # arrange
+    particulator = make_particulator(lane_parallel=False)
+    product = particulator.products["iterations"]
+
+    # act
+    particulator.run(1)
+    first = product.get().copy()
+    second = product.get().copy()
+
+    # assert
+    assert first.shape == (1,)
+    assert first[0] >= 2
+    assert np.isnan(second).all()
@@ -0,0 +1,143 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU, GPU
+from PySDM.dynamics import Displacement
+from PySDM.environments import Kinematic2D
+from PySDM.products import DisplacementSubsteps
+
+GRID = (8, 6)
+N_SD = 256
+SIZE = (8, 6)
+
+
+def make_particulator(
+    *, local_substeps, enable_sedimentation=False, volume=1e-18, backend_class=CPU
+):
+    builder = Builder(n_sd=N_SD, backend=backend_class())
+    builder.set_environment(
+        Kinematic2D(dt=1, grid=GRID, size=SIZE, rhod_of=lambda x: x * 0 + 1)
+    )
+    builder.add_dynamic(
+        Displacement(
+            local_substeps=local_substeps, enable_sedimentation=enable_sedimentation
+        )
+    )
+    positions = (
+        np.random.default_rng(seed=44).uniform(low=(0, 1), high=GRID, size=(N_SD, 2)).T
+    )
+    (
+        cell_id,
+        cell_origin,
+        position_in_cell,
+    ) = builder.particulator.mesh.cellular_attributes(positions)
+    return builder.build(
+        attributes={
+            "n": np.ones(N_SD),
+            "volume": np.full(N_SD, volume),
+            "cell id": cell_id,
+            "cell origin": cell_origin,
+            "position in cell": position_in_cell,
+        },
+        products=(DisplacementSubsteps(),) if local_substeps else (),
+    )
+
+
+def shear_column_courant_field(column):
+    courant_x = np.zeros((GRID[0] + 1, GRID[1]))
+    courant_z = np.zeros((GRID[0], GRID[1] + 1))
+    courant_x[column + 1, :] = np.linspace(0.05, 0.3, GRID[1])
+    return courant_x, courant_z
+
+
+class TestLocalSubsteps:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "courant_field",
+        (
+            (
+                np.linspace(0, 0.4, GRID[0] + 1)
+                .repeat(GRID[1])
+                .reshape(GRID[0] + 1, -1),
+                np.full((GRID[0], GRID[1] + 1), -0.1),
+            ),
+            (np.full((GRID[0] + 1, GRID[1]), 0.3), np.zeros((GRID[0], GRID[1] + 1))),
+        ),
+    )
+    def test_same_as_global_substeps_for_uniform_courant_differences(courant_field):
+        # arrange
+        particulators = {
+            local_substeps: make_particulator(local_substeps=local_substeps)
+            for local_substeps in (False, True)
+        }
+
+        # act
+        for particulator in particulators.values():
+            particulator.dynamics["Displacement"].upload_courant_field(courant_field)
+            particulator.run(2)
+
+        # assert
+        for attribute in ("cell origin", "position in cell", "cell id"):
+            np.testing.assert_allclose(
+                particulators[True].attributes[attribute].to_ndarray(raw=True),
+                particulators[False].attributes[attribute].to_ndarray(raw=True),
+                rtol=1e-10,
+            )
+
+    @staticmethod
+    def test_substeps_taken_only_around_strong_courant_differences():
+        # arrange
+        column = 3
+        particulator = make_particulator(local_substeps=True)
+        sut = particulator.dynamics["Displacement"]
+
+        # act
+        sut.upload_courant_field(shear_column_courant_field(column))
+        particulator.run(1)
+        n_substeps = particulator.products["displacement substeps"].get()
+
+        # assert
+        assert sut._n_substeps == np.amax(n_substeps) > 1
+        quiet = np.full(GRID, True)
+        quiet[column - 1 : column + 3, :] = False
+        np.testing.assert_array_equal(n_substeps[quiet], 1)
+        assert (n_substeps[column : column + 2, -1] > 1).all()
+
+    @staticmethod
+    def test_sedimentation_substeps_and_precipitation():
+        # arrange
+        particulator = make_particulator(
+            local_substeps=True, enable_sedimentation=True, volume=1e-9
+        )
+        sut = particulator.dynamics["Displacement"]
+        terminal_velocity = particulator.attributes["terminal velocity"].to_ndarray(
+            raw=True
+        )
+        total_volume = particulator.attributes["volume"].to_ndarray().sum()
+
+        # act
+        sut.upload_courant_field(shear_column_courant_field(column=0))
+        cell_field = sut.n_substeps_field.to_ndarray()
+        cell_id = particulator.attributes["cell id"].to_ndarray(raw=True)
+        particulator.run(1)
+
+        # assert
+        sedimentation_substeps = np.ceil(terminal_velocity / (SIZE[1] / GRID[1]))
+        assert (sedimentation_substeps > 1).all()
+        np.testing.assert_array_equal(
+            sut.n_substeps.to_ndarray(),
+            np.maximum(cell_field[cell_id], sedimentation_substeps),
+        )
+        assert sut.precipitation_in_last_step > 0
+        np.testing.assert_allclose(
+            particulator.attributes["volume"].to_ndarray().sum()
+            + sut.precipitation_in_last_step,
+            total_volume,
+        )
+
+    @staticmethod
+    def test_non_numba_backends_rejected():
+        with pytest.raises(ValueError, match="Numba"):
+            make_particulator(local_substeps=True, backend_class=GPU)
@@ -0,0 +1,114 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import Displacement
+from PySDM.environments import Kinematic3D
+from PySDM.initialisation.sampling import spatial_sampling
+from PySDM.initialisation.spectra import Lognormal
+from PySDM.physics import si
+from PySDM.products import FlowVelocityComponent, MaxCourantNumber
+
+GRID = (5, 4, 3)
+SIZE = (500 * si.m, 400 * si.m, 300 * si.m)
+N_SD = 2**10
+DT = 10 * si.s
+
+
+def make_particulator(*, local_substeps=False):
+    builder = Builder(n_sd=N_SD, backend=CPU())
+    env = Kinematic3D(
+        dt=DT,
+        grid=GRID,
+        size=SIZE,
+        rhod_of=lambda zZ: 1 - 0.1 * zZ,
+        velocity_of=(
+            lambda x, y, z: np.sin(np.pi * z),
+            lambda x, y, z: 0.5 + 0 * x,
+            lambda x, y, z: -np.sin(np.pi * z) * np.cos(np.pi * x),
+        ),
+        thd_of=lambda zZ: 300 + 0 * zZ,
+        qv_of=lambda zZ: 0.01 - 0.002 * zZ,
+    )
+    builder.set_environment(env)
+    builder.add_dynamic(Displacement(local_substeps=local_substeps))
+    attributes = env.init_attributes(
+        spatial_discretisation=spatial_sampling.Pseudorandom(),
+        kappa=0,
+        dry_radius_spectrum=Lognormal(
+            norm_factor=1e8 / si.mg, m_mode=1 * si.um, s_geom=1.4
+        ),
+    )
+    particulator = builder.build(
+        attributes=attributes,
+        products=(
+            MaxCourantNumber(),
+            *(FlowVelocityComponent(component=dim, name=f"u{dim}") for dim in range(3)),
+        ),
+    )
+    particulator.dynamics["Displacement"].upload_courant_field(env.courant_field())
+    return particulator
+
+
+class TestKinematic3D:
+    @staticmethod
+    @pytest.mark.parametrize("local_substeps", (False, True))
+    def test_displacement_keeps_cell_attributes_consistent(local_substeps):
+        # arrange
+        particulator = make_particulator(local_substeps=local_substeps)
+        position = {}
+
+        # act
+        for step in (0, 3):
+            particulator.run(step)
+            position[step] = particulator.attributes["cell origin"].to_ndarray(
+                raw=True
+            ) + particulator.attributes["position in cell"].to_ndarray(raw=True)
+
+        # assert
+        attributes = particulator.attributes
+        cell_origin = attributes["cell origin"].to_ndarray(raw=True)
+        np.testing.assert_array_equal(
+            attributes["cell id"].to_ndarray(raw=True),
+            np.ravel_multi_index(tuple(cell_origin), GRID),
+        )
+        assert (position[3] != position[0]).any()
+        assert (position[3] >= 0).all()
+        assert (position[3] < np.array(GRID)[:, np.newaxis]).all()
+        assert attributes.super_droplet_count == N_SD
+
+    @staticmethod
+    def test_products_have_3d_shapes():
+        # arrange
+        particulator = make_particulator()
+
+        # act
+        max_courant = particulator.products["max courant number"].get().copy()
+        flow = {dim: particulator.products[f"u{dim}"].get().copy() for dim in range(3)}
+
+        # assert
+        assert max_courant.shape == GRID
+        assert (max_courant > 0).all()
+        for dim in range(3):
+            assert flow[dim].shape == GRID
+        np.testing.assert_allclose(flow[1], 0.5)
+        assert (flow[0] > 0).all()
+
+    @staticmethod
+    def test_fields_vary_with_height_only():
+        # arrange
+        particulator = make_particulator()
+        env = particulator.environment
+
+        # act
+        rhod = env["rhod"].to_ndarray().reshape(GRID)
+
+        # assert
+        for field in (rhod, env.get_qv()):
+            assert field.shape == GRID
+            np.testing.assert_array_equal(
+                field, np.broadcast_to(field[:1, :1, :], GRID)
+            )
+            assert (np.diff(field, axis=-1) < 0).all()
@@ -0,0 +1,124 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder, products
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel, ParcelEnsemble
+from PySDM.physics import si
+
+MEMBERS = {
+    "w": (
+        0.5 * si.m / si.s,
+        1 * si.m / si.s,
+        lambda t: 2 * si.m / si.s * (t < 10) + 0.5 * si.m / si.s,
+    ),
+    "T0": (300 * si.K, 290 * si.K, 285 * si.K),
+    "p0": (1000 * si.hPa, 950 * si.hPa, 900 * si.hPa),
+    "q0": (20 * si.g / si.kg, 12 * si.g / si.kg, 10 * si.g / si.kg),
+    "mass_of_dry_air": (1 * si.mg, 2 * si.mg, 0.5 * si.mg),
+    "kappa": (0.5, 1.28, 0.1),
+    "r_dry": (
+        np.logspace(-8, -6, 4) * si.m,
+        np.logspace(-8.5, -6.5, 3) * si.m,
+        np.logspace(-7, -6, 5) * si.m,
+    ),
+}
+N_STEPS = 20
+DT = 1 * si.s
+RADIUS_BINS = np.logspace(-8, -4, 10) * si.m
+
+
+def _products():
+    return (
+        products.AmbientRelativeHumidity(name="RH"),
+        products.AmbientTemperature(name="T"),
+        products.ParcelDisplacement(name="z"),
+        products.PeakSupersaturation(name="S_max"),
+        products.ActivatingRate(name="activating"),
+        products.DeactivatingRate(name="deactivating"),
+        products.ParticleConcentration(name="n", radius_range=(0.5 * si.um, np.inf)),
+        products.ParticleSizeSpectrumPerVolume(
+            name="spectrum", radius_bins_edges=RADIUS_BINS
+        ),
+    )
+
+
+def _run(env, attributes):
+    n_sd = np.concatenate([np.atleast_1d(r) for r in attributes["r_dry"]]).size
+    builder = Builder(n_sd=n_sd, backend=CPU())
+    builder.set_environment(env)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation())
+    particulator = builder.build(
+        attributes=env.init_attributes(**attributes), products=_products()
+    )
+    output = {name: [] for name in particulator.products}
+    for _ in range(N_STEPS):
+        particulator.run(1)
+        for name, product in particulator.products.items():
+            output[name].append(product.get().copy())
+    return {name: np.asarray(values) for name, values in output.items()}
+
+
+@pytest.mark.parametrize("n_member", (1, 3))
+def test_parcel_ensemble_matches_individual_parcels(n_member):
+    # arrange
+    members = {key: values[:n_member] for key, values in MEMBERS.items()}
+    n_in_dv = [np.full(len(r_dry), 1e3 / si.mg) for r_dry in members["r_dry"]]
+    env_params = {
+        key: members[key] for key in ("w", "T0", "p0", "q0", "mass_of_dry_air")
+    }
+
+    # act
+    individual = [
+        _run(
+            Parcel(dt=DT, **{key: values[i] for key, values in env_params.items()}),
+            {
+                "n_in_dv": n_in_dv[i] * members["mass_of_dry_air"][i],
+                "kappa": members["kappa"][i],
+                "r_dry": members["r_dry"][i],
+            },
+        )
+        for i in range(n_member)
+    ]
+    ensemble = _run(
+        ParcelEnsemble(dt=DT, **env_params),
+        {
+            "n_in_dv": [
+                n * mass for n, mass in zip(n_in_dv, members["mass_of_dry_air"])
+            ],
+            "kappa": np.asarray(members["kappa"]),
+            "r_dry": members["r_dry"],
+        },
+    )
+
+    # assert
+    if n_member == 3:
+        assert (ensemble["activating"].reshape(N_STEPS, n_member)[:, 2] > 0).any()
+    for name, values in ensemble.items():
+        values = values.reshape(N_STEPS, n_member, -1)
+        for i in range(n_member):
+            np.testing.assert_allclose(
+                values[:, i],
+                individual[i][name].reshape(N_STEPS, -1),
+                rtol=1e-9,
+            )
+
+
+def test_parcel_ensemble_broadcasts_scalar_parameters():
+    # arrange
+    env = ParcelEnsemble(
+        dt=DT,
+        mass_of_dry_air=1 * si.mg,
+        p0=np.asarray((1000, 900)) * si.hPa,
+        q0=10 * si.g / si.kg,
+        T0=290 * si.K,
+        w=1 * si.m / si.s,
+    )
+
+    # assert
+    assert env.n_member == 2
+    assert env.mesh.n_cell == 2
+    np.testing.assert_array_equal(env.T0, (290 * si.K, 290 * si.K))
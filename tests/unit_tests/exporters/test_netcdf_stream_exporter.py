@@ -0,0 +1,180 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+from scipy.io import netcdf_file
+
+from PySDM.backends import CPU
+from PySDM.exporters import NetCDFStreamExporter
+from PySDM.exporters.netcdf_stream_exporter import _variable_layouts
+from PySDM.physics import si
+from PySDM.products import (
+    NumberSizeSpectrum,
+    ParticleConcentration,
+    SuperDropletCountPerGridbox,
+)
+
+from ..dummy_particulator import DummyParticulator
+
+GRID = (3, 4)
+
+
+class Settings:  # pylint: disable=too-few-public-methods
+    dt = 1 * si.s
+    grid = GRID
+    size = (300 * si.m, 400 * si.m)
+    output_steps = (0, 1, 2, 3, 4)
+
+    def __dir__(self):
+        return ("dt", "grid", "size")
+
+
+class Controller:
+    def __init__(self):
+        self.percents = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        pass
+
+    def set_percent(self, value):
+        self.percents.append(value)
+
+
+def make_particulator(backend_class):
+    n_sd = 24
+    particulator = DummyParticulator(backend_class, n_sd=n_sd, grid=GRID)
+    particulator.build(
+        attributes={
+            "n": np.arange(1, n_sd + 1),
+            "volume": np.linspace(1, 2, n_sd) * si.um**3,
+            "cell id": np.arange(n_sd) % np.prod(GRID),
+        },
+        products=(
+            ParticleConcentration(),
+            SuperDropletCountPerGridbox(),
+            NumberSizeSpectrum(radius_bins_edges=np.asarray((0, 1 * si.um, 1 * si.m))),
+        ),
+    )
+    return particulator
+
+
+class TestNetCDFStreamExporter:
+    @staticmethod
+    @pytest.mark.parametrize("queue_depth", (1, 3))
+    def test_streamed_values_match_products(backend_class, tmp_path, queue_depth):
+        # arrange
+        particulator = make_particulator(backend_class)
+        filename = str(tmp_path / "stream.nc")
+        expected = {name: [] for name in particulator.products}
+
+        # act
+        with NetCDFStreamExporter(
+            Settings(), particulator, filename, queue_depth=queue_depth
+        ) as sut:
+            for _ in Settings.output_steps:
+                sut.export()
+                for name, product in particulator.products.items():
+                    expected[name].append(
+                        np.reshape(product.get(), product.shape or 1).copy()
+                    )
+                particulator.attributes["n"][:] += 1
+                particulator.attributes.mark_updated("n")
+
+        # assert
+        with netcdf_file(filename, mode="r", mmap=False) as ncdf:
+            np.testing.assert_allclose(
+                ncdf.variables["T"][:], np.asarray(Settings.output_steps) * Settings.dt
+            )
+            assert ncdf.variables["number size spectrum"].dimensions == (
+                "T",
+                "X",
+                "Z",
+                "number size spectrum_bin_left_edges",
+            )
+            for name, values in expected.items():
+                np.testing.assert_allclose(
+                    ncdf.variables[name][:], np.asarray(values), rtol=1e-6
+                )
+
+    @staticmethod
+    def test_unwritten_output_steps_are_nans(tmp_path):
+        # arrange
+        particulator = make_particulator(CPU)
+        filename = str(tmp_path / "stream.nc")
+
+        # act
+        with NetCDFStreamExporter(Settings(), particulator, filename) as sut:
+            sut.export()
+
+        # assert
+        with netcdf_file(filename, mode="r", mmap=False) as ncdf:
+            values = ncdf.variables["super droplet count per gridbox"][:]
+            assert np.isfinite(values[0]).all()
+            assert np.isnan(values[1:]).all()
+
+    @staticmethod
+    def test_too_many_exports(tmp_path):
+        # arrange
+        particulator = make_particulator(CPU)
+        filename = str(tmp_path / "stream.nc")
+
+        # act & assert
+        with NetCDFStreamExporter(Settings(), particulator, filename) as sut:
+            for _ in Settings.output_steps:
+                sut.export()
+            with pytest.raises(IndexError):
+                sut.export()
+
+    @staticmethod
+    def test_run_flushes_and_closes(tmp_path):
+        # arrange
+        particulator = make_particulator(CPU)
+        filename = str(tmp_path / "stream.nc")
+        controller = Controller()
+        sut = NetCDFStreamExporter(Settings(), particulator, filename)
+        sut.open()
+        for _ in Settings.output_steps:
+            sut.export()
+
+        # act
+        sut.run(controller)
+
+        # assert
+        assert controller.percents == [0, 1]
+        with netcdf_file(filename, mode="r", mmap=False) as ncdf:
+            assert np.isfinite(
+                ncdf.variables["super droplet count per gridbox"][:]
+            ).all()
+
+    @staticmethod
+    @pytest.mark.parametrize("version", (1, 2))
+    def test_variable_layouts_parsed_from_header(tmp_path, version):
+        # arrange
+        filename = str(tmp_path / "layouts.nc")
+        expected = {
+            "a": np.arange(6, dtype=">f4").reshape(2, 3),
+            "b": np.arange(5, dtype=">f8"),
+            "c": np.arange(3, dtype=">i2"),
+        }
+        with netcdf_file(filename, mode="w", version=version) as ncdf:
+            ncdf.title = "odd length"
+            ncdf.sizes = np.arange(3, dtype=np.int16)
+            for name, length in (("X", 2), ("Y", 3), ("Z", 5)):
+                ncdf.createDimension(name, length)
+            for name, dims in (("a", ("X", "Y")), ("b", ("Z",)), ("c", ("Y",))):
+                variable = ncdf.createVariable(name, expected[name].dtype, dims)
+                variable.units = "m"
+                variable[:] = expected[name]
+
+        # act
+        layouts = _variable_layouts(filename)
+
+        # assert
+        assert layouts.keys() == expected.keys()
+        for name, (offset, dtype, shape) in layouts.items():
+            np.testing.assert_array_equal(
+                np.memmap(filename, dtype=dtype, mode="r", offset=offset, shape=shape),
+                expected[name],
+            )
@@ -0,0 +1,79 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Geometric
+from PySDM.environments import Box
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+from PySDM.initialisation.spectra import Exponential
+from PySDM.physics import si
+
+N_SD = 256
+DV = 1e6 * si.m**3
+
+
+def make_particulator(backend, track_changes):
+    builder = Builder(N_SD, backend)
+    builder.set_environment(Box(dt=10 * si.s, dv=DV))
+    builder.add_dynamic(Coalescence(collision_kernel=Geometric()))
+    builder.particulator.track_changes = track_changes
+    spectrum = Exponential(
+        norm_factor=2**23 / si.m**3, scale=4 * np.pi / 3 * (30.531 * si.um) ** 3
+    )
+    volume, n_per_m3 = ConstantMultiplicity(spectrum).sample(N_SD)
+    return builder.build(
+        attributes={"volume": volume, "n": n_per_m3 * DV},
+        products=(),
+    )
+
+
+class TestChangeTracker:
+    @staticmethod
+    def test_tracked_collisions_match_full_recalculation(backend_class):
+        # arrange
+        untracked = make_particulator(backend_class(), track_changes=False)
+        sut = make_particulator(backend_class(), track_changes=True)
+
+        for _ in range(5):
+            # act
+            untracked.run(1)
+            sut.run(1)
+
+            # assert
+            for key in ("n", "volume", "radius", "terminal velocity"):
+                np.testing.assert_allclose(
+                    sut.attributes[key].to_ndarray(raw=True),
+                    untracked.attributes[key].to_ndarray(raw=True),
+                    rtol=1e-6,
+                )
+        assert sut.attributes.change_tracker.epoch > 1
+        for key in ("radius", "terminal velocity"):
+            derived = sut.attributes._ParticleAttributes__attributes[key]
+            assert derived.full_update_epoch == 0
+        assert untracked.attributes.change_tracker is None
+
+    @staticmethod
+    @pytest.mark.parametrize("tracked", (True, False))
+    def test_partial_recalculation_unless_marked_as_a_whole(backend_class, tracked):
+        # arrange
+        sut = make_particulator(backend_class(), track_changes=True)
+        attributes = sut.attributes
+        radius = attributes["radius"].to_ndarray(raw=True)
+        volume = attributes["volume"]
+        droplet_epoch = attributes.change_tracker.droplet_epoch
+
+        # act
+        volume.data[:] = volume.to_ndarray(raw=True) * 8
+        droplet_epoch[:] = np.where(
+            np.arange(N_SD) % 2 == 0, attributes.change_tracker.next_epoch(), 0
+        )
+        attributes.mark_updated("volume", tracked=tracked)
+
+        # assert
+        np.testing.assert_allclose(
+            attributes["radius"].to_ndarray(raw=True),
+            np.where((np.arange(N_SD) % 2 == 0) | (not tracked), 2 * radius, radius),
+            rtol=1e-6,
+        )
@@ -1,6 +1,8 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
 import numpy as np
+import pytest
 
+from PySDM.impl.moments_batch import MomentSpec
 from PySDM.initialisation.discretise_multiplicities import discretise_multiplicities
 from PySDM.initialisation.sampling.spectral_sampling import Linear
 from PySDM.initialisation.spectra.lognormal import Lognormal
@@ -121,3 +123,116 @@ class TestMaths:
 
         # Assert
         np.testing.assert_array_almost_equal(actual, expected)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "specs",
+        (
+            (MomentSpec("volume", 1, "volume", (-np.inf, np.inf), "volume", 0, False),),
+            (
+                MomentSpec(
+                    "volume", 0, "volume", (-np.inf, np.inf), "volume", 0, False
+                ),
+                MomentSpec("volume", 2, "volume", (1e-6, 3e-6), "volume", 0, False),
+                MomentSpec("temperature", 1, "volume", (0, 2e-6), "volume", 0, True),
+                MomentSpec(
+                    "temperature", 2, "temperature", (285, 295), "volume", 0, False
+                ),
+            ),
+        ),
+    )
+    def test_batched_moments_match_individual_moments(backend_class, specs):
+        # Arrange
+        n_sd = 32
+        v, n = Linear(Lognormal(100000, 2e-6, 1.2)).sample(n_sd)
+        T = np.linspace(280, 300, n_sd)
+        particulator = DummyParticulator(backend_class, n_sd)
+        particulator.build(
+            {
+                "n": discretise_multiplicities(n),
+                "volume": v,
+                "temperature": T,
+                "heat": T * v,
+            }
+        )
+        batch_moment_0 = particulator.backend.Storage.empty((len(specs), 1), float)
+        batch_moments = particulator.backend.Storage.empty((len(specs), 1), float)
+        moment_0 = particulator.backend.Storage.empty((1,), dtype=float)
+        moments = particulator.backend.Storage.empty((1, 1), dtype=float)
+
+        # Act
+        particulator.batched_moments(
+            moment_0=batch_moment_0, moments=batch_moments, specs=specs
+        )
+
+        # Assert
+        # note: atomic additions on GPU accumulate in arbitrary order
+        rtol = max(1e-12, 32 * np.finfo(particulator.backend.Storage.FLOAT).eps)
+        for k, spec in enumerate(specs):
+            particulator.moments(
+                moment_0=moment_0,
+                moments=moments,
+                specs={spec.attr: (spec.rank,)},
+                attr_name=spec.filter_attr,
+                attr_range=spec.filter_range,
+                weighting_attribute=spec.weighting_attribute,
+                weighting_rank=spec.weighting_rank,
+                skip_division_by_m0=spec.skip_division_by_m0,
+            )
+            np.testing.assert_allclose(
+                batch_moment_0.to_ndarray()[k], moment_0.to_ndarray(), rtol=rtol
+            )
+            np.testing.assert_allclose(
+                batch_moments.to_ndarray()[k], moments.to_ndarray()[0], rtol=rtol
+            )
+
+    @staticmethod
+    def test_moments_batch_recomputes_after_attribute_update(backend_class):
+        # Arrange
+        n_sd = 8
+        particulator = DummyParticulator(backend_class, n_sd)
+        particulator.build({"n": np.ones(n_sd), "volume": np.linspace(1, 2, n_sd)})
+        batch = particulator.moments_batch
+        mean = batch.make_spec(attr="volume", rank=1)
+        total = batch.make_spec(attr="volume", rank=1, skip_division_by_m0=True)
+
+        # Act
+        before = batch.get(mean)[0], batch.get(total)[0]
+        volume = particulator.attributes["volume"]
+        volume.upload(2 * volume.to_ndarray(raw=True))
+        particulator.attributes.mark_updated("volume")
+        after = batch.get(mean)[0], batch.get(total)[0]
+
+        # Assert
+        assert batch.specs == [mean, total]
+        np.testing.assert_allclose(before, (1.5, 12))
+        np.testing.assert_allclose(after, (3, 24))
+
+    @staticmethod
+    def test_moments_batch_computes_registered_specs_in_one_sweep(backend_class):
+        # Arrange
+        n_sd = 8
+        particulator = DummyParticulator(backend_class, n_sd)
+        particulator.build({"n": np.ones(n_sd), "volume": np.linspace(1, 2, n_sd)})
+        batch = particulator.moments_batch
+        specs = [batch.make_spec(attr="volume", rank=rank) for rank in (0, 1, 2)]
+        for spec in specs:
+            batch.register(spec)
+
+        calls = []
+        batched_moments = particulator.batched_moments
+
+        def counting_batched_moments(**kwargs):
+            calls.append(tuple(kwargs["specs"]))
+            batched_moments(**kwargs)
+
+        particulator.batched_moments = counting_batched_moments
+
+        # Act
+        values = [batch.get(spec)[0] for spec in specs]
+
+        # Assert
+        assert calls == [tuple(specs)]
+        np.testing.assert_allclose(
+            values[1:], (1.5, np.mean(np.linspace(1, 2, n_sd) ** 2))
+        )
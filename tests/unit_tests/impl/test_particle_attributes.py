@@ -117,6 +117,85 @@ class TestParticleAttributes:
             np.array(cell_start), sut._ParticleAttributes__cell_start.to_ndarray()
         )
 
+    @staticmethod
+    @pytest.mark.parametrize(
+        "backend_cls", (CPU, pytest.param(GPU, marks=pytest.mark.xfail(strict=True)))
+    )  # TODO #330
+    def test_defragment(backend_cls):
+        # Arrange
+        n_sd = 6
+        particulator = DummyParticulator(backend_cls, n_sd=n_sd, grid=(3, 1))
+        particulator.build(
+            attributes={
+                "n": np.arange(1, n_sd + 1),
+                "volume": np.linspace(1, 2, n_sd),
+                "cell id": np.array([2, 0, 1, 0, 2, 1]),
+            }
+        )
+        sut = particulator.attributes
+        droplet_state = particulator.Storage.from_ndarray(np.arange(n_sd) * 10.0)
+        sut.permutation(
+            particulator.Storage.from_ndarray(np.linspace(0.9, 0.1, n_sd)), local=False
+        )
+        expected = {key: sut[key].to_ndarray() for key in ("n", "volume", "cell id")}
+        expected_droplet_state = droplet_state.to_ndarray()[
+            sut._ParticleAttributes__idx.to_ndarray()
+        ]
+
+        # Act
+        sut.defragment(droplet_storages=(droplet_state,))
+
+        # Assert
+        np.testing.assert_array_equal(
+            sut._ParticleAttributes__idx.to_ndarray(), np.arange(n_sd)
+        )
+        np.testing.assert_array_equal(
+            sut["cell id"].to_ndarray(raw=True), [0, 0, 1, 1, 2, 2]
+        )
+        assert sut.fragmentation() == 0
+        np.testing.assert_array_equal(sut.cell_start.to_ndarray(), [0, 2, 4, 6])
+        for key, value in expected.items():
+            np.testing.assert_array_equal(
+                np.sort(sut[key].to_ndarray()), np.sort(value)
+            )
+        np.testing.assert_array_equal(
+            droplet_state.to_ndarray() // 10, sut["n"].to_ndarray() - 1
+        )
+        np.testing.assert_array_equal(
+            np.sort(droplet_state.to_ndarray()), np.sort(expected_droplet_state)
+        )
+
+    @staticmethod
+    def test_defragment_permutes_droplet_history_of_attributes():
+        # Arrange
+        n_sd = 6
+        particulator = DummyParticulator(CPU, n_sd=n_sd, grid=(3, 1))
+        particulator.set_terminal_velocity(rtol=0)
+        particulator.request_attribute("terminal velocity")
+        particulator.build(
+            attributes={
+                "n": np.ones(n_sd),
+                "volume": np.linspace(1, 2, n_sd) * 1e-15,
+                "cell id": np.array([2, 0, 1, 0, 2, 1]),
+            }
+        )
+        sut = particulator.attributes
+        sut["terminal velocity"]  # pylint: disable=pointless-statement
+        sut.permutation(
+            particulator.Storage.from_ndarray(np.linspace(0.9, 0.1, n_sd)), local=False
+        )
+
+        # Act
+        sut.defragment()
+
+        # Assert
+        np.testing.assert_array_equal(
+            particulator.req_attr["terminal velocity"]
+            .droplet_history["radius"]
+            .to_ndarray(),
+            sut["radius"].to_ndarray(raw=True),
+        )
+
     @staticmethod
     def test_recalculate_cell_id(backend_class):
         # Arrange
@@ -0,0 +1,110 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import json
+
+import numpy as np
+
+from PySDM import Builder
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.impl.profiler import Profiler
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+from PySDM.initialisation.spectra import Exponential
+from PySDM.physics import si
+from PySDM.products import KernelWallTime
+
+N_SD = 32
+DV = 1e6 * si.m**3
+KERNEL = "collision_coalescence"
+
+
+def make_particulator(backend, profiler=None):
+    builder = Builder(N_SD, backend)
+    builder.set_environment(Box(dt=10 * si.s, dv=DV))
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)))
+    if profiler is not None:
+        builder.set_profiler(profiler)
+    spectrum = Exponential(
+        norm_factor=2**23 / si.m**3, scale=4 * np.pi / 3 * (30.531 * si.um) ** 3
+    )
+    volume, n_per_m3 = ConstantMultiplicity(spectrum).sample(N_SD)
+    return builder.build(
+        attributes={"volume": volume, "n": n_per_m3 * DV},
+        products=(KernelWallTime(kernel=KERNEL),),
+    )
+
+
+class TestProfiler:
+    @staticmethod
+    def test_kernel_stats_and_product(backend_class):
+        # arrange
+        n_steps = 3
+        particulator = make_particulator(backend_class())
+
+        # act
+        particulator.run(n_steps)
+        value = particulator.products["kernel wall time"].get()
+
+        # assert
+        stats = particulator.profiler.stats
+        assert stats[KERNEL]["calls"] >= n_steps
+        assert stats[KERNEL]["bytes"] > 0
+        assert any(name.startswith("cell_caretaker") for name in stats)
+        assert value == stats[KERNEL]["time"] > 0
+        assert particulator.products["kernel wall time"].get() == 0
+
+    @staticmethod
+    def test_step_and_substep_times(backend_class):
+        # arrange
+        n_steps = 2
+        profiler = Profiler()
+        particulator = make_particulator(backend_class(), profiler)
+
+        # act
+        particulator.run(n_steps)
+
+        # assert
+        step_times = profiler.step_times(KERNEL)
+        assert step_times.shape == (n_steps,)
+        assert (step_times > 0).all()
+        assert profiler.step_times("Collision").sum() >= step_times.sum()
+        np.testing.assert_allclose(
+            sum(profiler.substep_times(KERNEL, 0)), step_times[0]
+        )
+
+    @staticmethod
+    def test_chrome_trace_dump(backend_class, tmp_path):
+        # arrange
+        profiler = Profiler()
+        particulator = make_particulator(backend_class(), profiler)
+        particulator.run(1)
+        path = tmp_path / "trace.json"
+
+        # act
+        profiler.dump(str(path))
+
+        # assert
+        with open(path, encoding="utf-8") as file:
+            trace = json.load(file)
+        events = trace["traceEvents"]
+        assert len(events) == len(profiler.events)
+        assert {"dynamic", "kernel"} == {event["cat"] for event in events}
+        assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+
+    @staticmethod
+    def test_backend_restored_outside_of_profiled_scope(backend_class):
+        # arrange
+        backend = backend_class()
+        methods_before = dict(vars(backend))
+        profiler = Profiler()
+        profiled = make_particulator(backend, profiler)
+        other = make_particulator(backend)
+
+        # act
+        profiled.run(1)
+        n_events = len(profiler.events)
+        other.run(1)
+
+        # assert
+        assert vars(backend) == methods_before
+        assert len(profiler.events) == n_events
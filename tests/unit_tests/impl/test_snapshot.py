@@ -0,0 +1,143 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.backends.impl_common.random_common import RandomCommon
+from PySDM.dynamics import AmbientThermodynamics, Coalescence, Condensation
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box, Parcel
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+from PySDM.initialisation.spectra import Exponential
+from PySDM.physics import si
+
+N_SD = 64
+DV = 1e6 * si.m**3
+
+
+def box_setup(backend, **_):
+    builder = Builder(N_SD, backend)
+    builder.set_environment(Box(dt=10 * si.s, dv=DV))
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)))
+
+    def attributes():
+        spectrum = Exponential(
+            norm_factor=2**23 / si.m**3, scale=4 * np.pi / 3 * (30.531 * si.um) ** 3
+        )
+        volume, n_per_m3 = ConstantMultiplicity(spectrum).sample(N_SD)
+        return {"volume": volume, "n": n_per_m3 * DV}
+
+    return builder, attributes
+
+
+def parcel_setup(backend, **_):
+    builder = Builder(N_SD, backend)
+    env = Parcel(
+        dt=1 * si.s,
+        mass_of_dry_air=1 * si.mg,
+        p0=1000 * si.hPa,
+        q0=20 * si.g / si.kg,
+        T0=300 * si.K,
+        w=2 * si.m / si.s,
+    )
+    builder.set_environment(env)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation())
+
+    def attributes():
+        return env.init_attributes(
+            n_in_dv=np.full(N_SD, 1e3),
+            kappa=0.5,
+            r_dry=np.logspace(-8, -6, N_SD) * si.m,
+        )
+
+    return builder, attributes
+
+
+class StatelessRandom(RandomCommon):  # pylint: disable=too-few-public-methods
+    def __call__(self, storage):
+        storage[:] = 0.5
+
+
+class TestSnapshot:
+    @staticmethod
+    @pytest.mark.parametrize("setup", (box_setup, parcel_setup))
+    def test_restart_is_bit_reproducible(backend_class, setup, tmp_path):
+        # arrange
+        if backend_class is not CPU and setup is parcel_setup:
+            pytest.skip("condensation not available on GPU")
+        path = str(tmp_path / "snapshot.bin")
+        n_steps = 3
+
+        builder, attributes = setup(backend_class())
+        particulator = builder.build(attributes=attributes())
+        particulator.run(n_steps)
+        particulator.checkpoint(path)
+        particulator.run(n_steps)
+
+        # act
+        builder, _ = setup(backend_class())
+        restored = builder.restore(path)
+        restored.run(n_steps)
+
+        # assert
+        assert restored.n_steps == particulator.n_steps
+        for attr in ("n", "volume"):
+            np.testing.assert_array_equal(
+                restored.attributes[attr].to_ndarray(),
+                particulator.attributes[attr].to_ndarray(),
+            )
+        for var in getattr(restored.environment, "variables", ()):
+            np.testing.assert_array_equal(
+                restored.environment[var].to_ndarray(),
+                particulator.environment[var].to_ndarray(),
+            )
+
+    @staticmethod
+    def test_restore_rejects_other_files(tmp_path):
+        # arrange
+        path = tmp_path / "not_a_snapshot.bin"
+        path.write_bytes(b"\0" * 128)
+        builder, _ = box_setup(CPU())
+
+        # act & assert
+        with pytest.raises(ValueError):
+            builder.restore(str(path))
+
+    @staticmethod
+    def test_restore_rejects_n_sd_mismatch(tmp_path):
+        # arrange
+        path = str(tmp_path / "snapshot.bin")
+        builder, attributes = box_setup(CPU())
+        builder.build(attributes=attributes()).checkpoint(path)
+
+        builder = Builder(N_SD // 2, CPU())
+        builder.set_environment(Box(dt=10 * si.s, dv=DV))
+
+        # act & assert
+        with pytest.raises(ValueError):
+            builder.restore(path)
+
+    @staticmethod
+    def test_checkpoint_rejects_random_generator_without_state(tmp_path):
+        # arrange
+        builder, attributes = box_setup(CPU())
+        particulator = builder.build(attributes=attributes())
+        rnd_opt = particulator.dynamics["Collision"].rnd_opt_coll
+        rnd_opt.rnd = StatelessRandom(rnd_opt.rnd.size, seed=44)
+
+        # act & assert
+        with pytest.raises(NotImplementedError, match="StatelessRandom"):
+            particulator.checkpoint(str(tmp_path / "snapshot.bin"))
+
+    @staticmethod
+    def test_checkpoint_rejects_unsupported_values(tmp_path):
+        # arrange
+        builder, attributes = box_setup(CPU())
+        particulator = builder.build(attributes=attributes())
+        particulator.dynamics["Collision"].lock = object()
+
+        # act & assert
+        with pytest.raises(TypeError, match="dynamics.Collision.lock"):
+            particulator.checkpoint(str(tmp_path / "snapshot.bin"))
@@ -19,6 +19,7 @@ from PySDM.products import (
     FrozenParticleConcentration,
     FrozenParticleSpecificConcentration,
     GaseousMoleFraction,
+    KernelWallTime,
     NumberSizeSpectrum,
     ParticleSizeSpectrumPerMass,
     ParticleSizeSpectrumPerVolume,
@@ -37,6 +38,7 @@ _ARGUMENTS = {
     GaseousMoleFraction: {"key": "O3"},
     FreezableSpecificConcentration: {"temperature_bins_edges": (0, 300)},
     DynamicWallTime: {"dynamic": "Condensation"},
+    KernelWallTime: {"kernel": "moments"},
     ParticleSizeSpectrumPerVolume: {"radius_bins_edges": (0, np.inf)},
     ParticleVolumeVersusRadiusLogarithmSpectrum: {"radius_bins_edges": (0, np.inf)},
     RadiusBinnedNumberAveragedTerminalVelocity: {"radius_bin_edges": (0, np.inf)},
@@ -0,0 +1,306 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder, DomainDecomposition
+from PySDM.backends import CPU
+from PySDM.domain_decomposition import Slab
+from PySDM.dynamics import Coalescence, Displacement, EulerianAdvection
+from PySDM.dynamics.collisions.collision_kernels import ConstantK
+from PySDM.environments import Kinematic2D
+from PySDM.impl.mesh import Mesh
+from PySDM.physics import si
+from PySDM.products import (
+    MeanRadius,
+    ParticleConcentration,
+    SuperDropletCountPerGridbox,
+    Time,
+)
+
+GRID = (7, 4)
+SIZE = (700 * si.m, 400 * si.m)
+N_SD = 200
+OUTPUT_STEPS = (0, 2, 5)
+REDUCTIONS = {"t": np.mean}
+
+
+def rhod_of(zZ):
+    return 1 + 0 * zZ
+
+
+def courant_field():
+    """non-divergent, periodic in x and with no flow through top and bottom"""
+    stream_function = np.zeros((GRID[0] + 1, GRID[1] + 1))
+    stream_function[:, 1:-1] = np.random.default_rng(44).uniform(
+        -0.1, 0.1, (GRID[0] + 1, GRID[1] - 1)
+    )
+    stream_function[-1] = stream_function[0]
+    return -np.diff(stream_function, axis=1), np.diff(stream_function, axis=0)
+
+
+def global_attributes():
+    rng = np.random.default_rng(55)
+    positions = rng.uniform(0, 1, (2, N_SD)) * np.reshape(GRID, (2, 1))
+    cell_id, cell_origin, position_in_cell = Mesh(GRID, SIZE).cellular_attributes(
+        positions
+    )
+    return {
+        "n": rng.integers(1, 1000, N_SD).astype(float),
+        "volume": rng.uniform(1, 10, N_SD) * si.um**3,
+        "cell id": cell_id,
+        "cell origin": cell_origin,
+        "position in cell": position_in_cell,
+    }
+
+
+def uniform_courant_field():
+    """half a cell per timestep in x, no vertical flow"""
+    return np.full((GRID[0] + 1, GRID[1]), 0.5), np.zeros((GRID[0], GRID[1] + 1))
+
+
+def paired_attributes():
+    """two super-droplets per gridbox, one of which is moved to the neighbouring
+    gridbox at each timestep by `uniform_courant_field()`, hence every gridbox
+    contains exactly one (colliding) pair whenever `Coalescence` is run"""
+    rng = np.random.default_rng(66)
+    n_cell = np.prod(GRID)
+    positions = np.stack(
+        (
+            np.repeat(np.arange(GRID[0]), 2 * GRID[1]) + np.tile((0.25, 0.75), n_cell),
+            np.tile(np.repeat(np.arange(GRID[1]), 2), GRID[0]) + 0.5,
+        )
+    )
+    cell_id, cell_origin, position_in_cell = Mesh(GRID, SIZE).cellular_attributes(
+        positions
+    )
+    return {
+        "n": rng.permutation(np.arange(1, 2 * n_cell + 1) * 1e6),
+        "volume": rng.uniform(1, 10, 2 * n_cell) * si.um**3,
+        "cell id": cell_id,
+        "cell origin": cell_origin,
+        "position in cell": position_in_cell,
+    }
+
+
+def make_particulator(
+    *, grid, size, courant, attributes, collisions=False, eulerian_advection=False
+):
+    builder = Builder(n_sd=attributes["n"].size, backend=CPU())
+    builder.set_environment(
+        Kinematic2D(dt=1 * si.s, grid=grid, size=size, rhod_of=rhod_of)
+    )
+    displacement = Displacement(adaptive=False)
+    builder.add_dynamic(displacement)
+    if collisions:
+        # kernel large enough for gamma to be always capped by the multiplicity ratio
+        builder.add_dynamic(
+            Coalescence(
+                collision_kernel=ConstantK(a=1e3 * si.m**3 / si.s), adaptive=False
+            )
+        )
+    if eulerian_advection:
+        builder.add_dynamic(EulerianAdvection(solvers=lambda: None))
+    particulator = builder.build(
+        attributes=attributes,
+        products=(
+            SuperDropletCountPerGridbox(name="n_sd"),
+            ParticleConcentration(name="n"),
+            MeanRadius(name="r"),
+            Time(name="t"),
+        ),
+    )
+    displacement.upload_courant_field(courant)
+    return particulator
+
+
+def slab_simulation(n_sd, slab):
+    return make_particulator(
+        grid=slab.grid,
+        size=slab.size,
+        courant=slab.vector_field(courant_field()),
+        attributes=slab.select_attributes(global_attributes(), n_sd=n_sd),
+    )
+
+
+def slab_simulation_with_collisions(n_sd, slab):
+    return make_particulator(
+        grid=slab.grid,
+        size=slab.size,
+        courant=slab.vector_field(uniform_courant_field()),
+        attributes=slab.select_attributes(paired_attributes(), n_sd=n_sd),
+        collisions=True,
+    )
+
+
+def slab_simulation_with_eulerian_advection(n_sd, slab):
+    return make_particulator(
+        grid=slab.grid,
+        size=slab.size,
+        courant=slab.vector_field(courant_field()),
+        attributes=slab.select_attributes(global_attributes(), n_sd=n_sd),
+        eulerian_advection=True,
+    )
+
+
+def _run_single_domain(particulator):
+    expected = {name: [] for name in particulator.products}
+    for step in OUTPUT_STEPS:
+        particulator.run(step - particulator.n_steps)
+        for name, product in particulator.products.items():
+            expected[name].append(np.asarray(product.get()).copy())
+    return {name: np.asarray(values) for name, values in expected.items()}
+
+
+@pytest.mark.parametrize("n_slab", (1, 3))
+def test_domain_decomposition_matches_single_domain_run(n_slab):
+    # arrange
+    sut = DomainDecomposition(
+        simulation_factory=slab_simulation,
+        settings=N_SD,
+        n_slab=n_slab,
+        grid=GRID,
+        size=SIZE,
+        output_steps=OUTPUT_STEPS,
+        reductions=REDUCTIONS,
+    )
+    expected = _run_single_domain(
+        make_particulator(
+            grid=GRID,
+            size=SIZE,
+            courant=courant_field(),
+            attributes=global_attributes(),
+        )
+    )
+
+    # act
+    output = sut.run()
+
+    # assert
+    assert output.keys() == expected.keys()
+    for name, values in expected.items():
+        np.testing.assert_allclose(output[name], values, rtol=1e-12)
+    assert np.sum(output["n_sd"][-1]) == N_SD
+    assert not np.array_equal(output["n_sd"][0], output["n_sd"][-1])
+
+
+@pytest.mark.parametrize("n_slab", (1, 3))
+def test_domain_decomposition_with_collisions_matches_single_domain_run(n_slab):
+    # arrange
+    n_sd = 2 * np.prod(GRID)
+    sut = DomainDecomposition(
+        simulation_factory=slab_simulation_with_collisions,
+        settings=n_sd,
+        n_slab=n_slab,
+        grid=GRID,
+        size=SIZE,
+        output_steps=OUTPUT_STEPS,
+        reductions=REDUCTIONS,
+    )
+    expected = _run_single_domain(
+        make_particulator(
+            grid=GRID,
+            size=SIZE,
+            courant=uniform_courant_field(),
+            attributes=paired_attributes(),
+            collisions=True,
+        )
+    )
+
+    # act
+    output = sut.run()
+
+    # assert
+    for name, values in expected.items():
+        np.testing.assert_allclose(output[name], values, rtol=1e-12)
+    np.testing.assert_array_equal(output["n_sd"], 2)
+    assert (np.diff(np.sum(output["n"], axis=(1, 2))) < 0).all()
+
+
+@pytest.mark.parametrize("n_slab", (1, 2, 3, 7))
+def test_slabs_cover_domain(n_slab):
+    # arrange
+    slabs = [
+        Slab(index=index, n_slab=n_slab, grid=GRID, size=SIZE)
+        for index in range(n_slab)
+    ]
+    field = np.arange(np.prod(GRID)).reshape(GRID)
+
+    # act
+    interiors = [slab.interior(slab.scalar_field(field)) for slab in slabs]
+
+    # assert
+    np.testing.assert_array_equal(np.concatenate(interiors), field)
+    for slab in slabs:
+        assert slab.grid == (slab.n_x + 2, GRID[1])
+        np.testing.assert_array_equal(
+            [component.shape for component in slab.vector_field(courant_field())],
+            [(slab.grid[0] + 1, GRID[1]), (slab.grid[0], GRID[1] + 1)],
+        )
+    assert (
+        sum(
+            np.count_nonzero(slab.select_attributes(global_attributes(), N_SD)["n"])
+            for slab in slabs
+        )
+        == N_SD
+    )
+
+
+@pytest.mark.parametrize("reduction", (np.sum, np.max))
+def test_non_field_products_reduced_across_slabs(reduction):
+    # arrange
+    n_slab = 3
+    sut = DomainDecomposition(
+        simulation_factory=slab_simulation,
+        settings=N_SD,
+        n_slab=n_slab,
+        grid=GRID,
+        size=SIZE,
+        output_steps=OUTPUT_STEPS,
+        reductions={"t": reduction},
+    )
+
+    # act
+    output = sut.run()
+
+    # assert
+    np.testing.assert_allclose(
+        output["t"],
+        reduction(np.full((n_slab, len(OUTPUT_STEPS)), OUTPUT_STEPS), axis=0),
+    )
+
+
+def test_non_field_products_without_reduction_rejected():
+    # arrange
+    sut = DomainDecomposition(
+        simulation_factory=slab_simulation,
+        settings=N_SD,
+        n_slab=2,
+        grid=GRID,
+        size=SIZE,
+        output_steps=OUTPUT_STEPS,
+    )
+
+    # act & assert
+    with pytest.raises(ValueError, match="'t' is not a field"):
+        sut.run()
+
+
+def test_eulerian_advection_rejected():
+    # arrange
+    sut = DomainDecomposition(
+        simulation_factory=slab_simulation_with_eulerian_advection,
+        settings=N_SD,
+        n_slab=2,
+        grid=GRID,
+        size=SIZE,
+        output_steps=OUTPUT_STEPS,
+    )
+
+    # act & assert
+    with pytest.raises(NotImplementedError, match="EulerianAdvection"):
+        sut.run()
+
+
+def test_slabs_narrower_than_halo_rejected():
+    with pytest.raises(ValueError):
+        Slab(index=0, n_slab=4, grid=GRID, size=SIZE, halo=2)
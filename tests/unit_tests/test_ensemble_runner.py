@@ -0,0 +1,137 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,too-few-public-methods
+import numpy as np
+import pytest
+
+from PySDM import Builder, EnsembleRunner, Formulae
+from PySDM.backends import CPU
+from PySDM.environments import Box
+from PySDM.physics import si
+from PySDM.products import ParticleConcentration, SuperDropletCountPerGridbox, Time
+
+N_SD = 16
+OUTPUT_STEPS = (0, 1, 3)
+
+
+class Settings:
+    def __init__(self, seed, output_steps=OUTPUT_STEPS):
+        self.formulae = Formulae(seed=seed)
+        self.output_steps = output_steps
+
+
+class Simulation:
+    def __init__(self, settings, storage):
+        self.settings = settings
+        self.storage = storage
+        builder = Builder(n_sd=N_SD, backend=CPU(formulae=settings.formulae))
+        builder.set_environment(Box(dt=1 * si.s, dv=1 * si.m**3))
+        rng = np.random.default_rng(settings.formulae.seed)
+        self.particulator = builder.build(
+            attributes={
+                "n": rng.integers(1, 100, N_SD).astype(float),
+                "volume": rng.uniform(1, 10, N_SD) * si.um**3,
+            },
+            products=(
+                ParticleConcentration(name="n_a", radius_range=(0, 1.5 * si.um)),
+                SuperDropletCountPerGridbox(name="n_sd"),
+                Time(name="t"),
+            ),
+        )
+
+    def run(self):
+        for step in self.settings.output_steps:
+            self.particulator.run(step - self.particulator.n_steps)
+            for name, product in self.particulator.products.items():
+                self.storage.save(product.get(), step, name)
+
+
+class ListStorage:
+    def __init__(self):
+        self.data = {}
+
+    def save(self, data, _, name):
+        self.data.setdefault(name, []).append(np.asarray(data).copy())
+
+
+def failing_simulation(settings, _):
+    raise ValueError(f"seed: {settings.formulae.seed}")
+
+
+def invalid_output_steps_settings(seed):
+    return Settings(seed, output_steps=(2, 1))
+
+
+def _run_serially(seeds):
+    output = {}
+    for seed in seeds:
+        storage = ListStorage()
+        Simulation(Settings(seed), storage).run()
+        for name, values in storage.data.items():
+            output.setdefault(name, []).extend(values)
+    return {
+        name: np.reshape(values, (len(seeds), len(OUTPUT_STEPS), -1))
+        for name, values in output.items()
+    }
+
+
+@pytest.fixture(name="seeds", scope="module")
+def seeds_fixture():
+    return EnsembleRunner.member_seeds(3, base_seed=44)
+
+
+def test_ensemble_runner_matches_serial_runs(seeds):
+    # arrange
+    sut = EnsembleRunner(
+        simulation_factory=Simulation,
+        settings_factory=Settings,
+        seeds=seeds,
+        max_workers=2,
+    )
+
+    # act
+    output = sut.run()
+
+    # assert
+    expected = _run_serially(seeds)
+    assert output.keys() == expected.keys()
+    for name, values in output.items():
+        assert values.shape[:2] == (len(seeds), len(OUTPUT_STEPS))
+        np.testing.assert_array_equal(
+            values.reshape(expected[name].shape), expected[name]
+        )
+    np.testing.assert_array_equal(output["t"][0], np.asarray(OUTPUT_STEPS) * si.s)
+    assert not np.array_equal(output["n_a"][0], output["n_a"][1])
+
+
+def test_member_seeds_are_deterministic_and_distinct(seeds):
+    assert EnsembleRunner.member_seeds(3, base_seed=44) == seeds
+    assert len(set(seeds)) == len(seeds)
+    assert EnsembleRunner.member_seeds(3, base_seed=45) != seeds
+    assert all(Formulae(seed=seed).seed == seed for seed in seeds)
+
+
+def test_ensemble_runner_propagates_member_failures():
+    # arrange
+    sut = EnsembleRunner(
+        simulation_factory=failing_simulation,
+        settings_factory=Settings,
+        seeds=(1, 2),
+        max_workers=1,
+    )
+
+    # act & assert
+    with pytest.raises(ValueError, match="seed: 1"):
+        sut.run()
+
+
+def test_ensemble_runner_rejects_invalid_output_steps():
+    # arrange
+    sut = EnsembleRunner(
+        simulation_factory=Simulation,
+        settings_factory=invalid_output_steps_settings,
+        seeds=(1,),
+        max_workers=1,
+    )
+
+    # act & assert
+    with pytest.raises(ValueError, match="output_steps"):
+        sut.run()
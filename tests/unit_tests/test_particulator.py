@@ -1,8 +1,13 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM.backends import CPU
+
 from .dummy_particulator import DummyParticulator
 
 
-class TestParticulator:  # pylint: disable=too-few-public-methods
+class TestParticulator:
     @staticmethod
     def test_observer(backend_class):
         class Observer:  # pylint: disable=too-few-public-methods
@@ -21,3 +26,28 @@ class TestParticulator:  # pylint: disable=too-few-public-methods
         particulator.run(steps)
 
         assert observer.steps == steps
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "interval, threshold, defragmented",
+        ((0, None, False), (2, None, True), (3, None, False), (0, 0.5, True)),
+    )
+    def test_defragmentation_policy(interval, threshold, defragmented):
+        # arrange
+        n_sd = 100
+        particulator = DummyParticulator(CPU, n_sd)
+        particulator.build(attributes={"n": np.ones(n_sd), "volume": np.ones(n_sd)})
+        particulator.attributes.permutation(
+            particulator.Storage.from_ndarray(
+                np.random.default_rng(44).uniform(size=n_sd)
+            ),
+            local=False,
+        )
+        particulator.defragmentation_interval = interval
+        particulator.defragmentation_threshold = threshold
+
+        # act
+        particulator.run(2)
+
+        # assert
+        assert (particulator.attributes.fragmentation() == 0) == defragmented